@@ -0,0 +1,93 @@
+"""
+Benchmark the array versions of the mileage converters in :py:mod:`pyrcs.converter` against
+applying the scalar converters with :py:meth:`pandas.Series.map`.
+
+The data is a synthetic column of (ELR) mileages of the size of the records of an asset system
+(one million rows by default), in each of the forms that the converters take.
+The outputs of both approaches are also checked to be equal.
+
+Usage::
+
+    python benchmarks/bench_converter.py [--rows 1000000] [--repeat 3]
+"""
+
+import argparse
+import functools
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyrcs.converter import kilometer_to_yard, kilometers_to_yards, mile_chain_to_mileage, \
+    mile_chains_to_mileages, mileage_str_to_num, mileage_strs_to_nums, mileage_to_mile_chain, \
+    mileage_to_yard, mileages_to_mile_chains, mileages_to_yards, shift_mileage_by_yard, \
+    shift_mileages_by_yard, yard_to_mileage, yards_to_mileages  # noqa: E402
+
+
+def _make_data(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+
+    miles = rng.integers(0, 300, n_rows)
+    yards = rng.integers(0, 1760, n_rows)
+    chains = rng.integers(0, 80, n_rows)
+
+    data = {
+        'yards': pd.Series(miles * 1760 + yards),
+        'mileages': pd.Series([f'{m}.{y:04d}' for m, y in zip(miles, yards)]),
+        'mile_chains': pd.Series([f'{m}.{c:02d}' for m, c in zip(miles, chains)]),
+        'km': pd.Series(np.round(rng.random(n_rows) * 500, 3)),
+    }
+
+    return data
+
+
+def _time_function(func, data, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(data)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings), result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--rows', type=int, default=1000000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    data = _make_data(args.rows)
+
+    benchmarks = {
+        'yards_to_mileages': (yard_to_mileage, yards_to_mileages, data['yards']),
+        'mileages_to_yards': (mileage_to_yard, mileages_to_yards, data['mileages']),
+        'mile_chains_to_mileages': (
+            mile_chain_to_mileage, mile_chains_to_mileages, data['mile_chains']),
+        'mileages_to_mile_chains': (
+            mileage_to_mile_chain, mileages_to_mile_chains, data['mileages']),
+        'mileage_strs_to_nums': (mileage_str_to_num, mileage_strs_to_nums, data['mileages']),
+        'shift_mileages_by_yard': (
+            functools.partial(shift_mileage_by_yard, shift_yards=220),
+            functools.partial(shift_mileages_by_yard, shift_yards=220), data['mileages']),
+        'kilometers_to_yards': (kilometer_to_yard, kilometers_to_yards, data['km']),
+    }
+
+    print(f"{'function':<26} {'Series.map':>12} {'array':>12} {'speed-up':>10}  equal")
+
+    for label, (scalar_func, func, data) in benchmarks.items():
+        map_time, expected = _time_function(lambda x: x.map(scalar_func), data, args.repeat)
+        array_time, result = _time_function(func, data, args.repeat)
+
+        equal = expected.astype(object).equals(result.astype(object))
+        print(f"{label:<26} {map_time:>10.3f} s {array_time:>10.3f} s "
+              f"{map_time / array_time:>9.1f}x  {equal}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark the time it takes to import :py:mod:`pyrcs`.
+
+Each statement is run in a fresh interpreter, so that nothing is cached in ``sys.modules``.
+
+Usage::
+
+    python benchmarks/bench_import.py [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    'import pyrcs': "import pyrcs",
+    'pyrcs.converter': "import pyrcs; pyrcs.converter.mileage_to_yard('0.0396')",
+    'pyrcs.LocationIdentifiers': "import pyrcs; pyrcs.LocationIdentifiers",
+    'all submodules': "import pyrcs; [getattr(pyrcs, x) for x in pyrcs.__all__]",
+}
+
+#: Third-party modules that should not be loaded by a bare ``import pyrcs``.
+HEAVY_MODULES = ('pandas', 'numpy', 'bs4', 'requests', 'dateutil', 'pyhelpers')
+
+
+def _time_statement(statement, repeat):
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True, cwd=root_dir)
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    baseline = statistics.median(_time_statement("pass", args.repeat))
+    print(f"{'interpreter start-up':<28} {baseline * 1000:8.1f} ms")
+
+    for label, statement in STATEMENTS.items():
+        median = statistics.median(_time_statement(statement, args.repeat))
+        print(f"{label:<28} {median * 1000:8.1f} ms  (+{(median - baseline) * 1000:.1f} ms)")
+
+    check = f"import sys, pyrcs; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    loaded = subprocess.run(
+        [sys.executable, '-c', check], check=True, capture_output=True, text=True).stdout.strip()
+    print(f"\nHeavy modules loaded by `import pyrcs`: {loaded}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""
+Benchmark the vectorised cleansing of the data of location codes in
+:py:mod:`pyrcs.line_data.loc_id` against the row-by-row (or group-by-group) implementations
+that they replace.
+
+The data is a synthetic table of the size of the full CRS, NLC, TIPLOC and STANOX codes
+(about 60,000 rows), of which a share of the cells has multiple alternatives and notes.
+The outputs of both implementations are also checked to be equal.
+
+Usage::
+
+    python benchmarks/bench_loc_id.py [--rows 60000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import warnings
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyrcs.line_data.loc_id import _count_sep, _fill_location_names, _fix_exceptional_cases, \
+    _parse_code_note, _parse_code_notes, _parse_mult_alt_codes, _parse_stanox_note, \
+    _split_dat_and_note, _stanox_note  # noqa: E402
+
+CODE_COLS = ['Location', 'CRS', 'NLC', 'TIPLOC', 'STANME', 'STANOX']
+
+
+# == Row-by-row implementations (for reference) ====================================================
+
+
+def _parse_mult_alt_codes_rowwise(data):
+    df = data.copy()
+    df = _fix_exceptional_cases(df)
+
+    r_n_counts = df[CODE_COLS].map(_count_sep)
+    r_n_counts_ = r_n_counts.mul(-1).add(r_n_counts.max(axis=1), axis='index')
+
+    for col in CODE_COLS:
+        for i in df.index:
+            d = r_n_counts_.loc[i, col]
+            val = df.loc[i, col]
+            if d > 0:
+                if '\r\n' in val:
+                    if col == 'Location':
+                        df.loc[i, col] = val + ''.join(['\r\n' + val.split('\r\n')[-1]] * d)
+                    else:
+                        df.loc[i, col] = val + ''.join(['\r\n'] * d)
+                elif '\r' in val:
+                    if col == 'Location':
+                        df.loc[i, col] = val + ''.join(['\r' + val.split('\r')[-1]] * d)
+                    else:
+                        df.loc[i, col] = val + ''.join(['\r'] * d)
+                else:
+                    if col == 'Location':
+                        df.loc[i, col] = '\n'.join([val] * (d + 1))
+                    else:
+                        df.loc[i, col] = val + ''.join(['\n'] * d)
+
+    df[CODE_COLS] = df[CODE_COLS].map(_split_dat_and_note)
+
+    df = df.explode(CODE_COLS, ignore_index=True)
+
+    temp = df.select_dtypes(['object'])
+    df[temp.columns] = temp.apply(lambda x_: x_.str.strip())
+
+    return df
+
+
+def _parse_code_notes_rowwise(data):
+    df = data.copy()
+
+    for col in ['CRS', 'NLC', 'TIPLOC', 'STANME', 'STANOX']:
+        df[[col, col + '_Note']] = pd.DataFrame(
+            df[col].map(_parse_code_note).to_list(), index=df.index)
+
+    # noinspection SpellCheckingInspection
+    df['STANOX'] = df['STANOX'].str.replace('NANAN', '')
+    df[['STANOX', 'STANOX_Note']] = pd.DataFrame(
+        df['STANOX'].map(_stanox_note).to_list(), index=df.index)
+
+    return df
+
+
+def _fill_location_names_rowwise(data):
+    df = data.copy()
+    code_cols = CODE_COLS[1:]
+
+    for col in code_cols:
+        df[col] = df[col].replace(r'^\s*$', pd.NA, regex=True)
+
+    with pd.option_context('future.no_silent_downcasting', True):
+        df[code_cols] = df.groupby('Location', sort=False)[code_cols].transform(
+            lambda x: x.ffill().bfill())
+
+    df[code_cols] = df[code_cols].astype(object).fillna('')
+
+    return df
+
+
+def _parse_code_notes_vectorised(data):
+    df = data.copy()
+
+    _parse_code_notes(df)
+    _parse_stanox_note(df)
+
+    return df
+
+
+# == Synthetic data ================================================================================
+
+
+def _make_codes_data(n_rows, seed=0):
+    rng = random.Random(seed)
+
+    def _code(k, n_alts, sep, base=16):
+        codes = [f'{rng.randrange(base ** k):0{k}{"X" if base == 16 else "d"}}'
+                 for _ in range(n_alts)]
+        return sep.join(codes)
+
+    records = []
+    for i in range(n_rows):
+        # Most rows have a single set of codes, and the others have some alternatives
+        n_alts = 1 if rng.random() < 0.9 else rng.randint(2, 3)
+        sep = rng.choice(['\r\n', '\r\n', '\r', '\n'])
+
+        location = f'Location {i}' if n_alts == 1 or sep == '\n' else sep.join(
+            f'Location {i} ({j})' for j in range(rng.randint(1, n_alts)))
+        records.append([
+            location,
+            _code(3, rng.randint(1, n_alts), sep) + rng.choice(['✖Earlier code'] + [''] * 49),
+            _code(6, n_alts, sep) + rng.choice([' [Old code]'] + [''] * 49),
+            _code(7, rng.randint(1, n_alts), sep),
+            _code(9, n_alts, sep),
+            _code(5, n_alts, sep, base=10) + rng.choice(['*', ' (note)', ''] + [''] * 17),
+        ])
+
+    return pd.DataFrame(records, columns=CODE_COLS)
+
+
+def _make_fill_data(codes_data, seed=0):
+    rng = random.Random(seed)
+
+    fill_data = codes_data.copy()
+    # Give about a third of the rows the location name of an earlier row
+    locations = fill_data['Location'].to_list()
+    for i in range(1, len(locations)):
+        if rng.random() < 1 / 3:
+            locations[i] = locations[rng.randrange(i)]
+    fill_data['Location'] = locations
+    # and blank out some of the codes
+    for col in CODE_COLS[1:]:
+        blank = [rng.random() < 0.3 for _ in range(len(fill_data))]
+        fill_data.loc[blank, col] = rng.choice(['', ' '])
+
+    return fill_data
+
+
+def _time_function(func, data, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(data)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings), result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--rows', type=int, default=60000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    warnings.simplefilter('ignore')  # e.g. deprecation warnings of pandas
+
+    data = _make_codes_data(args.rows)
+
+    codes_data = _parse_mult_alt_codes(data)  # The input of the parsing of the notes
+
+    # The input of the filling of the codes: some locations are listed more than once, with some
+    # of their codes given in only one of the rows
+    fill_data = _make_fill_data(codes_data)
+
+    benchmarks = {
+        '_parse_mult_alt_codes': (_parse_mult_alt_codes_rowwise, _parse_mult_alt_codes, data),
+        '_parse_code_notes (+STANOX)': (
+            _parse_code_notes_rowwise, _parse_code_notes_vectorised, codes_data),
+        '_fill_location_names': (
+            _fill_location_names_rowwise, _fill_location_names, fill_data),
+    }
+
+    print(f"{'function':<28} {'row-by-row':>12} {'vectorised':>12} {'speed-up':>10}  equal")
+
+    for label, (rowwise_func, func, data) in benchmarks.items():
+        rowwise_time, expected = _time_function(rowwise_func, data, args.repeat)
+        vectorised_time, result = _time_function(func, data, args.repeat)
+
+        equal = expected.astype(object).equals(result.astype(object))
+        print(f"{label:<28} {rowwise_time:>10.3f} s {vectorised_time:>10.3f} s "
+              f"{rowwise_time / vectorised_time:>9.1f}x  {equal}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark the throughput (rows/sec) of :py:func:`pyrcs.parser.parse_table` with
+``parser='html.parser'`` and with the lxml-backed fast path (``parser='lxml.html'``).
+
+The pages are either the raw responses saved in a cache directory of
+:py:class:`pyrcs.transport.ResponseCache` (e.g. the tables of location identifiers and stations),
+or HTML files saved from the web pages; if neither is given, a synthetic page is used.
+The parsed tables of both paths are also checked to be identical.
+
+Usage::
+
+    python benchmarks/bench_parse_table.py [--cache-dir DIR] [FILE ...] [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyrcs.parser import parse_table  # noqa: E402
+from pyrcs.transport import ResponseCache  # noqa: E402
+
+PARSERS = ('html.parser', 'lxml.html')
+
+
+def _make_synthetic_page(n_rows=5000):
+    rows = []
+    for i in range(n_rows):
+        if i % 10 == 1:  # The location of the previous row spans this row
+            rows.append(
+                f'<tr><td>L{i:02X}</td><td>&nbsp;</td><td>{i:06d}</td><td>Alternative</td></tr>')
+            continue
+        rowspan = ' rowspan="2"' if i % 10 == 0 else ''
+        rows.append(
+            f'<tr><td{rowspan}>Location {i} <em>(note)</em></td><td>L{i:02X}</td>'
+            f'<td><span class="r">no CRS?</span></td><td>{i:06d}</td>'
+            f'<td>Line 1\r\nLine 2 <a href="#n{i}">note</a></td></tr>')
+
+    content = (
+        '<html><body><table><thead><tr><th>Location</th><th>CRS</th><th>NLC</th><th>STANOX</th>'
+        f'<th>Notes</th></tr></thead><tbody>{"".join(rows)}</tbody></table>'
+        '<p class="update">Last update: 1 May 2024</p></body></html>')
+
+    return content.encode('utf-8')
+
+
+def _load_pages(cache_dir, filenames):
+    pages = {}
+
+    if cache_dir:
+        cache = ResponseCache(cache_dir=cache_dir)
+        for url in cache.urls():
+            pages[url] = cache.load(url).content
+
+    for filename in filenames:
+        with open(filename, mode='rb') as f:
+            pages[filename] = f.read()
+
+    if not pages:
+        pages['(synthetic page)'] = _make_synthetic_page()
+
+    for label, content in pages.items():
+        source = requests.Response()
+        source.status_code, source._content = 200, content
+        pages[label] = source
+
+    return pages
+
+
+def _count_rows(tables):
+    if isinstance(tables, tuple):  # A single table
+        tables = [tables]
+    return sum(len(records) for _, records in tables)
+
+
+def _time_parser(source, parser, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tables, _ = parse_table(source, parser=parser)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings), tables
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('filenames', nargs='*', metavar='FILE')
+    arg_parser.add_argument('--cache-dir', default=None)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    pages = _load_pages(args.cache_dir, args.filenames)
+
+    total_rows, total_time = 0, dict.fromkeys(PARSERS, 0.0)
+
+    print(f"{'page':<48} {'rows':>7} " + " ".join(f"{p + ' rows/s':>20}" for p in PARSERS))
+
+    for label, source in pages.items():
+        results = {parser: _time_parser(source, parser, args.repeat) for parser in PARSERS}
+
+        tables = [tables for _, tables in results.values()]
+        n_rows = _count_rows(tables[0])
+        if n_rows == 0:
+            continue
+
+        rates = []
+        for parser, (median, _) in results.items():
+            total_time[parser] += median
+            rates.append(f"{n_rows / median:>20,.0f}")
+        total_rows += n_rows
+
+        identical = "" if all(x == tables[0] for x in tables[1:]) else "  (outputs differ!)"
+        print(f"{label[-48:]:<48} {n_rows:>7} " + " ".join(rates) + identical)
+
+    if total_rows:
+        rates = " ".join(f"{total_rows / total_time[p]:>20,.0f}" for p in PARSERS)
+        print(f"{'total':<48} {total_rows:>7} " + rates)
+        speed_up = total_time[PARSERS[0]] / total_time[PARSERS[1]]
+        print(f"\nSpeed-up of '{PARSERS[1]}' over '{PARSERS[0]}': {speed_up:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
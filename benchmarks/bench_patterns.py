@@ -0,0 +1,80 @@
+"""
+Micro-benchmark the (regex-heavy) helpers for parsing the data, which are called for every row
+or cell of the tables, e.g. hundreds of thousands of times when the data for all the initial
+letters A-Z is collected.
+
+Each helper is timed (in microseconds per call) on a set of typical inputs, which cover the
+branches of the helper. Run this on two revisions to compare them.
+
+Usage::
+
+    python benchmarks/bench_patterns.py [--number 2000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyrcs.line_data.elr_mileage import _parse_node, _parse_non_float_str_mileage, \
+    _uncouple_elr_mileage  # noqa: E402
+from pyrcs.line_data.loc_id import _parse_code_note, _parse_raw_location_name, \
+    _stanox_note  # noqa: E402
+from pyrcs.other_assets.station import _parse_owner_and_operator  # noqa: E402
+from pyrcs.other_assets.tunnel import Tunnels  # noqa: E402
+from pyrcs.parser import _join_td_text  # noqa: E402
+
+HELPERS = {
+    '_parse_raw_location_name': (_parse_raw_location_name, [
+        'Abbey Wood', 'Abercynon (formerly Abercynon South)', 'Ayr [unknown feature]',
+        'Ashford International [domestic portion]', 'Aberdeen (Guild Street)',
+        'Acton Main Line ✖Earlier code', 'Alnmouth STANOX 12345',
+    ]),
+    '_parse_code_note': (_parse_code_note, [
+        '860260', '860260✖Earlier code', '860260 [Old Code]', 'ABC (Note)', '',
+    ]),
+    '_stanox_note': (_stanox_note, [
+        '12345', '12345*', '12345 Main Line', '12345* (formerly 54321)', '-',
+    ]),
+    '_parse_non_float_str_mileage': (lambda m: _parse_non_float_str_mileage([m]), [
+        '(10.22)', '≈10.22', '10.22/ 10.26', '10.22 + private portion', '10.22†', '1,234',
+    ]),
+    '_parse_node': (_parse_node, [
+        'Acton Wells Junction with BCH1 (0.00) and NEM2 (8.71)', 'Acton Canal Wharf',
+        'Hampstead Road Junction with LRS (0.20)',
+    ]),
+    '_uncouple_elr_mileage': (_uncouple_elr_mileage, [
+        'DNT', 'ECM5 (44.64)', 'ECM5 [Alternative]', 'ECM5 (71.41km)', None, 'Bletchley',
+    ]),
+    'Tunnels._parse_length': (Tunnels._parse_length, [
+        '', 'Unknown', '1m 182y', 'formerly 0m236y', 'c0m 11ch', '0.325km (0m 356y)',
+        "0m 48yd- (['0m 58yd'])",
+    ]),
+    '_parse_owner_and_operator': (_parse_owner_and_operator, [
+        'Network Rail', 'Network Rail / British Rail', 'Network Rail\rRailtrack',
+    ]),
+    '_join_td_text': (lambda text: _join_td_text(text, sep=' / '), [
+        ['Location A', '/\r\nLocation B'], ['Location A'], ['A\n', 'B', '\t\tC'],
+    ]),
+}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--number', type=int, default=2000)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print(f"{'helper':<32} {'inputs':>6} {'µs/call':>10}")
+
+    for label, (func, inputs) in HELPERS.items():
+        timer = timeit.Timer(lambda: [func(x) for x in inputs])  # noqa: B023
+        best = min(timer.repeat(repeat=args.repeat, number=args.number))
+        per_call = best / (args.number * len(inputs)) * 1e6
+        print(f"{label:<32} {len(inputs):>6} {per_call:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
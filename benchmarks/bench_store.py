@@ -0,0 +1,125 @@
+"""
+Benchmark the columnar storage of data in :py:mod:`pyrcs._store` (i.e. Parquet and Feather)
+against pickle files, for the data of location codes of all the initial letters (A-Z).
+
+The data is a synthetic table for each initial letter, of the size of the CRS, NLC, TIPLOC and
+STANOX codes (about 60,000 rows in total), stored as the dictionaries that the collection
+of the codes saves. For each format, the disk size of the files and the time to load all
+the files and concatenate the tables are reported; the loaded data is also checked to be equal.
+
+Usage::
+
+    python benchmarks/bench_store.py [--rows 60000] [--repeat 3]
+"""
+
+import argparse
+import os
+import pickle
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyrcs._store import load_columnar, save_columnar  # noqa: E402
+
+
+def _make_data(n_rows, seed=0):
+    rng = random.Random(seed)
+
+    def _code(n, alphabet=string.ascii_uppercase):
+        return ''.join(rng.choices(alphabet, k=n))
+
+    data = {}
+    for initial in string.ascii_uppercase:
+        n = n_rows // 26
+        codes = pd.DataFrame({
+            'Location': [f'{initial}{_code(8).lower()} {_code(5).lower()}' for _ in range(n)],
+            'CRS': [_code(3) if rng.random() < 0.2 else '' for _ in range(n)],
+            'CRS_Note': ['' for _ in range(n)],
+            'NLC': [_code(6, string.digits) for _ in range(n)],
+            'NLC_Note': ['' for _ in range(n)],
+            'TIPLOC': [_code(7) for _ in range(n)],
+            'TIPLOC_Note': ['' for _ in range(n)],
+            'STANME': [_code(9) for _ in range(n)],
+            'STANME_Note': ['' for _ in range(n)],
+            'STANOX': [_code(5, string.digits) for _ in range(n)],
+            'STANOX_Note': ['' for _ in range(n)],
+        })
+        data[initial] = {initial: codes, 'Additional notes': None, 'Last updated date': '2024-01-01'}
+
+    return data
+
+
+def _save_pickle(data, path_to_file):
+    with open(path_to_file, mode='wb') as f:
+        pickle.dump(data, f)
+
+
+def _load_pickle(path_to_file, columns=None):
+    with open(path_to_file, mode='rb') as f:
+        data = pickle.load(f)
+
+    return data
+
+
+def _load_all(load, paths, columns=None):
+    data = [load(path, columns=columns) for path in paths]
+    return pd.concat([d[x] for d, x in zip(data, string.ascii_uppercase)], ignore_index=True)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--rows', type=int, default=60000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    data = _make_data(args.rows)
+
+    formats = {
+        'pickle': (".pkl", _save_pickle, _load_pickle),
+        'parquet': (".parquet", save_columnar, load_columnar),
+        'feather': (".feather", save_columnar, load_columnar),
+    }
+
+    print(f"{'format':<10} {'size':>10} {'load all':>10} {'load 2 cols':>12}  equal")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        expected = None
+
+        for fmt, (ext, save, load) in formats.items():
+            fmt_dir = os.path.join(data_dir, fmt)
+            os.makedirs(fmt_dir)
+
+            paths = []
+            for initial, dat in data.items():
+                path_to_file = os.path.join(fmt_dir, initial.lower() + ext)
+                save(dat, path_to_file)
+                paths.append(path_to_file)
+
+            size = sum(os.path.getsize(os.path.join(fmt_dir, x)) for x in os.listdir(fmt_dir))
+
+            timings, timings_ = [], []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = _load_all(load, paths)
+                timings.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                _load_all(load, paths, columns=['Location', 'STANOX'])
+                timings_.append(time.perf_counter() - start)
+
+            if expected is None:
+                expected = result
+
+            print(f"{fmt:<10} {size / 2 ** 20:>7.2f} MB {statistics.median(timings):>8.3f} s "
+                  f"{statistics.median(timings_):>10.3f} s  {result.equals(expected)}")
+
+
+if __name__ == '__main__':
+    main()
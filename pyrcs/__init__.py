@@ -3,15 +3,19 @@ Package initialisation.
 """
 
 import datetime
+import importlib
 import json
 import pkgutil
+import typing
 
-from . import collector, converter, line_data, other_assets, parser, utils
-from .collector import LineData, OtherAssets
-from .line_data import Bridges, ELRMileages, Electrification, LOR, LineNames, LocationIdentifiers, \
-    TrackDiagrams
-from .other_assets import Buzzer, Depots, Features, HabdWild, SignalBoxes, Stations, Telegraph, \
-    Tunnels, Viaducts, WaterTroughs
+if typing.TYPE_CHECKING:
+    from . import cache, collector, converter, line_data, mileage, other_assets, parser, \
+        profiler, transport, utils
+    from .collector import LineData, OtherAssets
+    from .line_data import Bridges, ELRMileages, Electrification, LOR, LineNames, \
+        LocationIdentifiers, TrackDiagrams
+    from .other_assets import Buzzer, Depots, Features, HabdWild, SignalBoxes, Stations, \
+        Telegraph, Tunnels, Viaducts, WaterTroughs
 
 metadata = json.loads(pkgutil.get_data(__name__, "data/.metadata").decode())
 
@@ -30,9 +34,13 @@ __copyright__ = f'2019-{datetime.datetime.now().year}, {__author__}'
 __first_release__ = metadata['First release']
 
 __all__ = [
+    'cache',
     'collector',
     'converter',
+    'mileage',
     'parser',
+    'profiler',
+    'transport',
     'utils',
     'line_data',
     'other_assets',
@@ -56,3 +64,47 @@ __all__ = [
     'Telegraph',
     'Buzzer',
 ]
+
+# The submodules and classes are imported on first access (PEP 562), so that `import pyrcs` does
+# not pull in heavy dependencies (e.g. pandas, bs4 and requests) until they are actually needed.
+_SUBMODULES = {
+    'cache', 'collector', 'converter', 'mileage', 'parser', 'profiler', 'transport', 'utils',
+    'line_data', 'other_assets'}
+
+_CLASSES = {
+    'LineData': 'collector',
+    'OtherAssets': 'collector',
+    'Electrification': 'line_data',
+    'ELRMileages': 'line_data',
+    'LineNames': 'line_data',
+    'LocationIdentifiers': 'line_data',
+    'LOR': 'line_data',
+    'TrackDiagrams': 'line_data',
+    'Bridges': 'line_data',
+    'SignalBoxes': 'other_assets',
+    'Tunnels': 'other_assets',
+    'Viaducts': 'other_assets',
+    'Stations': 'other_assets',
+    'Depots': 'other_assets',
+    'Features': 'other_assets',
+    'HabdWild': 'other_assets',
+    'WaterTroughs': 'other_assets',
+    'Telegraph': 'other_assets',
+    'Buzzer': 'other_assets',
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name in _CLASSES:
+        cls = getattr(importlib.import_module(f'.{_CLASSES[name]}', __name__), name)
+        globals()[name] = cls  # Cache it so that this function is bypassed next time
+        return cls
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
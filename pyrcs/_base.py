@@ -4,21 +4,80 @@ saving, loading and fetching data from files. It standardises file naming conven
 handles directory management and supports verbose logging for debugging.
 """
 
+import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
 import copy
+import functools
 import inspect
 import os
+import string
 
 import pandas as pd
 import requests
 from pyhelpers._cache import _print_failure_message
 from pyhelpers.dirs import cd, validate_dir
-from pyhelpers.ops import confirmed, fake_requests_headers
+from pyhelpers.ops import confirmed
 from pyhelpers.store import load_data, save_data
 
-from .parser import get_catalogue, get_introduction, get_last_updated_date
+from . import _store
+from .cache import _copy, data_cache
+from .parser import ParsedDocument, _count_parse_workers, get_catalogue, get_document, \
+    get_introduction, get_last_updated_date, peek_last_updated_date, sharing_documents
+from .profiler import _count_rows, profile_stage
+from .transport import ais_page_modified, get_async_transport, is_page_modified, \
+    load_validators, recording_validators, reusing_modified_pages, save_validators, \
+    sharing_async_transport
 from .utils import cd_data, format_confirmation_prompt, get_collect_verbosity_for_fetch, \
-    homepage_url, print_collection_message, print_connection_warning, \
-    print_instance_connection_error, print_void_collection_message
+    homepage_url, is_homepage_connectable, print_collection_message, print_connection_warning, \
+    print_instance_connection_error, print_unmodified_source_message, print_void_collection_message
+
+#: A placeholder for web content (e.g. the catalogue) that has not yet been retrieved.
+_NOT_LOADED = object()
+
+#: Changes found by an incremental update in the current context (see `incremental_update()`).
+_update_report = contextvars.ContextVar('update_report', default=None)
+
+
+def _name_dataset(data_name, initial=None):
+    """
+    Names a dataset (e.g. in the records of :func:`~pyrcs.profiler.profiling`).
+
+    :param data_name: The name of the data.
+    :type data_name: str | None
+    :param initial: The initial letter of the data, if the data is organised by initial letters.
+    :type initial: str | None
+    :return: The name of the dataset, e.g. ``'CRS, NLC, TIPLOC and STANOX codes (A)'``.
+    :rtype: str | None
+    """
+
+    return f'{data_name} ({initial})' if initial else data_name
+
+
+@contextlib.contextmanager
+def incremental_update():
+    """
+    Updates the data incrementally within the context.
+
+    When the data is fetched with ``update=True``, the last update date shown on each web page
+    from which it was collected is compared with the one stored in the local backup, and only
+    the data whose pages have been updated since is collected again. For a cluster whose pages
+    are organised by initial letters (A-Z), each page is checked (and collected) separately.
+
+    :return: A list that records, for each page checked, the name of the data, the initial letter
+        (``None`` for data that is not organised by initial letters), the stored and the remote
+        last update dates, and whether the page has been collected.
+    :rtype: typing.Generator[list[dict], None, None]
+    """
+
+    report = []
+    token = _update_report.set(report)
+
+    try:
+        yield report
+    finally:
+        _update_report.reset(token)
 
 
 class _Base:
@@ -36,7 +95,7 @@ class _Base:
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
     def __init__(self, data_dir=None, content_type=None, data_category="", data_cluster=None,
-                 update=False, verbose=True):
+                 update=False, verbose=True, lazy=False):
         """
         :param data_dir: Path to the directory where the data is stored; defaults to ``None``.
         :type data_dir: str | None
@@ -55,6 +114,11 @@ class _Base:
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer the connection check and the retrieval of the catalogue,
+            introductory text and last updated date until they are first accessed;
+            defaults to ``False``. With ``lazy=True``, reading data from local backup files
+            requires no network access at all.
+        :type lazy: bool
 
         :ivar dict | None catalogue: Dictionary containing catalogue data
             (if ``content_type='catalogue'``).
@@ -62,6 +126,7 @@ class _Base:
         :ivar str last_updated_date: The date when the data was last updated.
         :ivar str data_dir: The path to the directory containing the data.
         :ivar str current_data_dir: The specific directory being used for the current operation.
+        :ivar bool lazy: Whether the web content is retrieved on first access.
 
         **Examples**::
 
@@ -71,33 +136,144 @@ class _Base:
             'Railway Codes and other data'
             >>> _b.URL
             'http://www.railwaycodes.org.uk/'
+            >>> _b = _Base(lazy=True)  # No requests are made until the content is accessed
+            >>> _b.lazy
+            True
         """
 
-        print_connection_warning(verbose=verbose)
+        self._content_type, self._update, self._verbose = content_type, update, verbose
+        self._catalogue, self._introduction, self._last_updated_date = (_NOT_LOADED,) * 3
 
-        self.catalogue, self.introduction = None, None
+        self.lazy = lazy
 
-        verbose_ = True if verbose == 2 else False
+        # Initialise the data directory for storing or retrieving data
+        self.data_dir, self.current_data_dir = self._setup_data_dir(
+            data_dir=data_dir, category=data_category, cluster=data_cluster)
 
-        if isinstance(content_type, str):
-            content_type_ = content_type.lower()
+        if not self.lazy:
+            print_connection_warning(verbose=verbose)
 
-            if content_type_.startswith('cat'):  # Get the catalogue of the data
-                self.catalogue = get_catalogue(url=self.URL, update=update, verbose=verbose_)
+            with sharing_documents():  # The main page is requested and parsed only once
+                self._catalogue = self._get_catalogue()
+                self._introduction = self._get_introduction()
+                self._last_updated_date = self._get_last_updated_date()
 
-            elif content_type_.startswith('intro'):  # Get the introductory text of the data
-                self.introduction = get_introduction(url=self.URL, verbose=verbose_)
+    def _requires_content(self, prefix):
+        """
+        Checks whether ``content_type`` (given at instantiation) requests a certain type of content.
 
-        elif content_type:  # Get both the catalogue and introductory text of the data
-            self.catalogue = get_catalogue(url=self.URL, update=update, verbose=verbose_)
+        :param prefix: Prefix of the content type, e.g. ``'cat'`` or ``'intro'``.
+        :type prefix: str
+        :return: Whether the content of the given type is requested.
+        :rtype: bool
+        """
 
-            self.introduction = get_introduction(url=self.URL, verbose=verbose_)
+        if isinstance(self._content_type, str):
+            return self._content_type.lower().startswith(prefix)
 
-        self.last_updated_date = get_last_updated_date(url=self.URL)
+        # Get both the catalogue and introductory text of the data if `content_type` is truthy
+        return bool(self._content_type)
 
-        # Initialise the data directory for storing or retrieving data
-        self.data_dir, self.current_data_dir = self._setup_data_dir(
-            data_dir=data_dir, category=data_category, cluster=data_cluster)
+    def _get_catalogue(self):
+        """
+        Retrieves the catalogue of the data (if requested by ``content_type``).
+
+        Subclasses with a catalogue of their own override this method.
+
+        :return: The catalogue of the data, or ``None`` if it is not requested.
+        :rtype: dict | None
+        """
+
+        if self._requires_content('cat'):
+            return get_catalogue(url=self.URL, update=self._update, verbose=self._verbose == 2)
+
+        return None
+
+    def _get_introduction(self):
+        """
+        Retrieves the introductory text of the data (if requested by ``content_type``).
+
+        :return: The introductory text of the data, or ``None`` if it is not requested.
+        :rtype: str | None
+        """
+
+        if self._requires_content('intro'):
+            return get_introduction(url=self.URL, verbose=self._verbose == 2)
+
+        return None
+
+    def _get_last_updated_date(self):
+        """
+        Retrieves the date when the data was last updated.
+
+        :return: The date when the data was last updated.
+        :rtype: str | None
+        """
+
+        return get_last_updated_date(url=self.URL)
+
+    @property
+    def catalogue(self):
+        """
+        The catalogue of the data, which is retrieved on first access if ``lazy=True``.
+        """
+
+        if self._catalogue is _NOT_LOADED:
+            self._catalogue = self._get_catalogue()
+
+        return self._catalogue
+
+    @catalogue.setter
+    def catalogue(self, value):
+        self._catalogue = value
+
+    async def _aget_catalogue(self):
+        """
+        Gets the catalogue of the data asynchronously.
+
+        It is the awaitable counterpart of :attr:`~pyrcs._base._Base.catalogue`; if the catalogue
+        is not yet loaded (with ``lazy=True``), it is retrieved in a worker thread so as not to
+        block the event loop.
+
+        :return: The catalogue of the data.
+        :rtype: dict | None
+        """
+
+        if self._catalogue is _NOT_LOADED:
+            self._catalogue = await asyncio.to_thread(self._get_catalogue)
+
+        return self._catalogue
+
+    @property
+    def introduction(self):
+        """
+        The introductory text of the data, which is retrieved on first access if ``lazy=True``.
+        """
+
+        if self._introduction is _NOT_LOADED:
+            self._introduction = self._get_introduction()
+
+        return self._introduction
+
+    @introduction.setter
+    def introduction(self, value):
+        self._introduction = value
+
+    @property
+    def last_updated_date(self):
+        """
+        The date when the data was last updated, which is retrieved on first access
+        if ``lazy=True``.
+        """
+
+        if self._last_updated_date is _NOT_LOADED:
+            self._last_updated_date = self._get_last_updated_date()
+
+        return self._last_updated_date
+
+    @last_updated_date.setter
+    def last_updated_date(self, value):
+        self._last_updated_date = value
 
     def _setup_data_dir(self, data_dir, category, cluster=None, **kwargs):
         # noinspection PyShadowingNames
@@ -302,12 +478,123 @@ class _Base:
             >>> _b._collect_data_from_source("test_data_name", method=_b._fallback_data)
         """
 
+        target_url, fallback_data = self._resolve_source_url(
+            data_name=data_name, url=url, initial=initial, additional_fields=additional_fields,
+            confirmation_required=confirmation_required, confirmation_prompt=confirmation_prompt,
+            verbose=verbose, raise_error=raise_error)
+
+        if not target_url:
+            return fallback_data
+
+        # Fetch and process
+        try:
+            with profile_stage('collect', dataset=_name_dataset(data_name, initial)) as stage:
+                # Network request
+                source = get_document(target_url)
+                source.raise_for_status()  # Raises HTTPError for bad responses
+
+                # Execute Parsing Method
+                data = self._parse_source(
+                    method, source=source, data_name=data_name, initial=initial,
+                    verbose=verbose, **kwargs)
+
+                stage['rows'] = _count_rows(data)
+
+            return data
+
+        except requests.RequestException as e:  # Handle network/HTTP errors
+            print_instance_connection_error(verbose=verbose, e=e, raise_error=raise_error)
+            return fallback_data
+
+        except Exception as e:  # Handle parsing/method errors
+            _print_failure_message(e, "Failed. Error:", verbose=verbose, raise_error=raise_error)
+            return fallback_data
+
+    async def _acollect_data_from_source(self, data_name, method, url=None, initial=None,
+                                         additional_fields=None, confirmation_required=True,
+                                         confirmation_prompt=None, verbose=False,
+                                         raise_error=False, **kwargs):
+        """
+        Collects and parses data from a specified source webpage asynchronously.
+
+        It is the awaitable counterpart of :meth:`~pyrcs._base._Base._collect_data_from_source`,
+        which takes the same parameters. The web page is requested through the shared
+        asynchronous transport (see :func:`~pyrcs.transport.get_async_transport`), and
+        ``method`` is run in a worker thread so as not to block the event loop. A coroutine
+        function ``method`` (e.g. one that requests other web pages) is awaited instead.
+
+        :return: The data returned by ``method``, or a dictionary containing fallback values
+            (e.g. ``{key: None}``) on failure.
+        :rtype: pandas.DataFrame | dict | None
+
+        **Examples**::
+
+            >>> from pyrcs._base import _Base
+            >>> import asyncio
+            >>> _b = _Base()
+            >>> _b.catalogue = {'A': 'https://github.com/mikeqfu/pyrcs'}
+            >>> asyncio.run(
+            ...     _b._acollect_data_from_source("test_data_name", method=_b._fallback_data))
+        """
+
+        if url is None:  # The catalogue (if not yet loaded) is retrieved without blocking
+            await self._aget_catalogue()
+
+        target_url, fallback_data = self._resolve_source_url(
+            data_name=data_name, url=url, initial=initial, additional_fields=additional_fields,
+            confirmation_required=confirmation_required, confirmation_prompt=confirmation_prompt,
+            verbose=verbose, raise_error=raise_error)
+
+        if not target_url:
+            return fallback_data
+
+        try:
+            async with sharing_async_transport():  # Also shared by the follow-up requests
+                with profile_stage('collect', dataset=_name_dataset(data_name, initial)) as stage:
+                    source = ParsedDocument(await get_async_transport().get(target_url))
+                    source.raise_for_status()
+
+                    if inspect.iscoroutinefunction(method):
+                        data = await self._parse_source(
+                            method, source=source, data_name=data_name, initial=initial,
+                            verbose=verbose, **kwargs)
+                    else:
+                        data = await asyncio.to_thread(
+                            self._parse_source, method, source=source, data_name=data_name,
+                            initial=initial, verbose=verbose, **kwargs)
+
+                    stage['rows'] = _count_rows(data)
+
+            return data
+
+        except requests.RequestException as e:
+            print_instance_connection_error(verbose=verbose, e=e, raise_error=raise_error)
+            return fallback_data
+
+        except Exception as e:
+            _print_failure_message(e, "Failed. Error:", verbose=verbose, raise_error=raise_error)
+            return fallback_data
+
+    def _resolve_source_url(self, data_name, url=None, initial=None, additional_fields=None,
+                            confirmation_required=True, confirmation_prompt=None, verbose=False,
+                            raise_error=False):
+        """
+        Confirms the collection of data and resolves the URL of its source web page.
+
+        See :meth:`~pyrcs._base._Base._collect_data_from_source` for the parameters.
+
+        :return: The URL of the source web page (or ``None`` if it cannot be resolved or the
+            collection is cancelled) and the fallback data (``None`` if cancelled).
+        :rtype: tuple
+        :raises ValueError: If the URL cannot be resolved and ``raise_error=True``.
+        """
+
         # Confirmation step
         prompt = self._format_confirmation_message(
             data_name=data_name, confirmation_prompt=confirmation_prompt, initial=initial)
 
         if not confirmed(prompt=prompt, confirmation_required=confirmation_required):
-            return None
+            return None, None
 
         print_collection_message(
             data_name=data_name, initial=initial, verbose=verbose,
@@ -330,37 +617,32 @@ class _Base:
                 raise ValueError(err_msg)
             elif verbose:
                 print(err_msg)
-            return fallback_data
 
-        # Fetch and process
-        try:
-            # Network request
-            source = requests.get(url=target_url, headers=fake_requests_headers(), timeout=30)
-            source.raise_for_status()  # Raises HTTPError for bad responses
+        return target_url, fallback_data
 
-            # Dynamic argument injection
-            collector_kwargs = kwargs.copy()
-            collector_kwargs.update({'source': source, 'verbose': verbose})
+    @staticmethod
+    def _parse_source(method, source, data_name=None, initial=None, verbose=False, **kwargs):
+        """
+        Calls a parsing method on a web page, injecting the arguments it requires.
 
-            # Inspect the collector method to see if it requires extra arguments
-            params = inspect.signature(method).parameters
-            if 'data_name' in params:
-                collector_kwargs['data_name'] = data_name
-            if 'initial' in params:
-                collector_kwargs['initial'] = initial
+        See :meth:`~pyrcs._base._Base._collect_data_from_source` for the parameters.
 
-            # Execute Parsing Method
-            data = method(**collector_kwargs)
+        :return: The data returned by ``method``.
+        :rtype: pandas.DataFrame | dict | None
+        """
 
-            return data
+        # Dynamic argument injection
+        collector_kwargs = kwargs.copy()
+        collector_kwargs.update({'source': source, 'verbose': verbose})
 
-        except requests.RequestException as e:  # Handle network/HTTP errors
-            print_instance_connection_error(verbose=verbose, e=e, raise_error=raise_error)
-            return fallback_data
+        # Inspect the collector method to see if it requires extra arguments
+        params = inspect.signature(method).parameters
+        if 'data_name' in params:
+            collector_kwargs['data_name'] = data_name
+        if 'initial' in params:
+            collector_kwargs['initial'] = initial
 
-        except Exception as e:  # Handle parsing/method errors
-            _print_failure_message(e, "Failed. Error:", verbose=verbose, raise_error=raise_error)
-            return fallback_data
+        return method(**collector_kwargs)
 
     def _make_file_pathname(self, data_name, ext=".pkl", data_dir=None, sub_dir=None, **kwargs):
         """
@@ -436,7 +718,9 @@ class _Base:
         :type sub_dir: str | list | None
         :param verbose: Whether to print detailed information to the console; defaults to ``False``.
         :type verbose: bool | int
-        :param kwargs: [Optional] Additional parameters passed to `pyhelpers.store.save_data()`_.
+        :param kwargs: [Optional] Additional parameters passed to `pyhelpers.store.save_data()`_
+            (or to :func:`~pyrcs._store.save_columnar` if ``ext`` is ``".parquet"`` or
+            ``".feather"``).
 
         .. _`pyhelpers.store.save_data()`:
             https://pyhelpers.readthedocs.io/en/latest/_generated/pyhelpers.store.save_data.html
@@ -469,14 +753,238 @@ class _Base:
             path_to_file = self._make_file_pathname(
                 data_name=data_name, ext=file_ext, data_dir=dump_dir, sub_dir=sub_dir)
 
-            save_data(data=data, path_to_file=path_to_file, verbose=(verbose == 2), **kwargs)
+            with profile_stage('save_data') as stage:
+                if _store.is_columnar(path_to_file):
+                    _store.save_columnar(
+                        data=data, path_to_file=path_to_file, verbose=(verbose == 2), **kwargs)
+                else:
+                    save_data(
+                        data=data, path_to_file=path_to_file, verbose=(verbose == 2), **kwargs)
+
+                if os.path.isfile(path_to_file):
+                    stage['bytes'] = os.path.getsize(path_to_file)
 
         else:
             print_void_collection_message(data_name=data_name, verbose=verbose)
 
+    @staticmethod
+    def _get_mtime(path_to_file):
+        # For a columnar format, the data may also be (re)collected into the pickle file
+        paths = [_store.stored_pathname(path_to_file)]
+        if _store.is_columnar(path_to_file):
+            paths.append(_store.pickle_pathname(path_to_file))
+
+        mtimes = [os.stat(x).st_mtime_ns for x in paths if os.path.isfile(x)]
+
+        return max(mtimes) if mtimes else None
+
+    @staticmethod
+    def _is_data_file(path_to_file):
+        """
+        Checks whether a data file exists (or, for a columnar format, can be made from
+        the pickle file of the same data).
+
+        :param path_to_file: Pathname of the data file.
+        :type path_to_file: str
+        :return: Whether the data can be loaded from the file.
+        :rtype: bool
+        """
+
+        if os.path.isfile(_store.stored_pathname(path_to_file)):
+            return True
+
+        return _store.is_columnar(path_to_file) and os.path.isfile(
+            _store.pickle_pathname(path_to_file))
+
+    @staticmethod
+    def _load_data_file(path_to_file, columns=None, verbose=False):
+        """
+        Loads data from a file, which is of a columnar format (i.e. Parquet or Feather) or any
+        other format supported by `pyhelpers.store.load_data()`_.
+
+        If a file of a columnar format does not exist yet, or the pickle file of the same data
+        (e.g. written by a collection) is newer, it is first made from the pickle file, so that
+        a package data directory can be switched to the format without collecting the data again.
+
+        :param path_to_file: Pathname of the data file.
+        :type path_to_file: str
+        :param columns: Names of the columns of the dataframes to load; defaults to ``None``
+            (i.e. all columns).
+        :type columns: list | None
+        :param verbose: Whether to print detailed information to the console; defaults to ``False``.
+        :type verbose: bool | int
+        :return: The data.
+        :rtype: typing.Any
+
+        .. _`pyhelpers.store.load_data()`:
+            https://pyhelpers.readthedocs.io/en/latest/_generated/pyhelpers.store.load_data.html
+        """
+
+        if not _store.is_columnar(path_to_file):
+            data = load_data(path_to_file, verbose=(verbose == 2))
+            return _store.select_columns(data, columns=columns)
+
+        path_to_pickle = _store.pickle_pathname(path_to_file)
+        path_to_json = _store.stored_pathname(path_to_file)
+
+        if os.path.isfile(path_to_pickle) and (
+                not os.path.isfile(path_to_json) or
+                os.stat(path_to_pickle).st_mtime_ns > os.stat(path_to_json).st_mtime_ns):
+            data = load_data(path_to_pickle, verbose=(verbose == 2))
+            _store.save_columnar(data=data, path_to_file=path_to_file, verbose=(verbose == 2))
+
+        return _store.load_columnar(path_to_file, columns=columns, verbose=(verbose == 2))
+
+    def _cache_key(self, path_to_file):
+        # The key (without the columns) of the cached data of a file (see pyrcs.cache)
+        return self.__class__.__name__, os.path.abspath(path_to_file)
+
+    def _load_cached_data_file(self, path_to_file, columns=None, verbose=False):
+        """
+        Loads data from a file (see :meth:`~pyrcs._base._Base._load_data_file`), or from the cache
+        of the data loaded before (see :py:mod:`pyrcs.cache`) if the file has not been modified
+        since.
+
+        :param path_to_file: Pathname of the data file.
+        :type path_to_file: str
+        :param columns: Names of the columns of the dataframes to load; defaults to ``None``
+            (i.e. all columns).
+        :type columns: list | None
+        :param verbose: Whether to print detailed information to the console; defaults to ``False``.
+        :type verbose: bool | int
+        :return: (A copy of) the data.
+        :rtype: typing.Any
+        """
+
+        key = self._cache_key(path_to_file) + (None if columns is None else tuple(columns),)
+        mtime = self._get_mtime(path_to_file)
+
+        data = data_cache.get(key, mtime=mtime)
+
+        if data is None:
+            data = self._load_data_file(path_to_file, columns=columns, verbose=verbose)
+
+            # The file may be (re)written while it is loaded, e.g. made from the pickle file
+            if self._get_mtime(path_to_file) == mtime and data_cache.put(key, data, mtime=mtime):
+                data = _copy(data)
+
+        return data
+
+    def _save_validators(self, path_to_file, page_validators, mtime=None):
+        """
+        Saves the validators of the web pages from which a data file has just been collected.
+
+        The validators are saved only if the data file has been (re)written since ``mtime``,
+        so that they never describe web pages whose data failed to be stored.
+
+        :param path_to_file: Pathname of the data file.
+        :type path_to_file: str
+        :param page_validators: Validators recorded by
+            :func:`~pyrcs.transport.recording_validators`.
+        :type page_validators: dict
+        :param mtime: Modification time (in nanoseconds) of the data file before the collection;
+            defaults to ``None``.
+        :type mtime: int | None
+        """
+
+        mtime_ = self._get_mtime(path_to_file)
+
+        if page_validators and mtime_ is not None and mtime_ != mtime:
+            save_validators(path_to_file, page_validators)
+
+    @staticmethod
+    def _is_source_modified(path_to_file):
+        """
+        Checks whether any web page from which a data file was collected has been modified
+        since, by sending conditional requests with the validators stored next to the file.
+
+        :param path_to_file: Pathname of the data file.
+        :type path_to_file: str
+        :return: Whether any of the web pages has been modified (or cannot be checked).
+        :rtype: bool
+        """
+
+        validators = load_validators(path_to_file)
+
+        if not validators:
+            return True
+
+        try:
+            return any(is_page_modified(url, v) for url, v in validators.items())
+        except requests.RequestException:  # Leave it to the collection to handle the error
+            return True
+
+    def _is_source_updated(self, path_to_file, data_name):
+        """
+        Checks whether the data in a file needs to be collected again for an update.
+
+        Within :func:`~pyrcs._base.incremental_update`, the last update dates of the web pages
+        from which the data was collected are compared with the one stored in the file, and
+        the result is recorded in the report; otherwise, the web pages are checked with
+        conditional requests (see :meth:`~pyrcs._base._Base._is_source_modified`).
+
+        :param path_to_file: Pathname of the data file.
+        :type path_to_file: str
+        :param data_name: The name of the data (used in the report).
+        :type data_name: str
+        :return: Whether the data needs to be collected again.
+        :rtype: bool
+        """
+
+        report = _update_report.get()
+
+        if report is None:
+            return self._is_source_modified(path_to_file)
+
+        data = self._load_cached_data_file(path_to_file)
+        stored_date = data.get(self.KEY_TO_LAST_UPDATED_DATE) if isinstance(data, dict) else None
+
+        remote_dates = [peek_last_updated_date(url) for url in load_validators(path_to_file)] \
+            if stored_date else []
+        remote_date = max(remote_dates) if remote_dates and None not in remote_dates else None
+
+        updated = remote_date is None or stored_date is None or remote_date > stored_date
+
+        report.append({
+            'Data': data_name,
+            'Initial': None,
+            'Stored date': stored_date,
+            'Remote date': remote_date,
+            'Updated': updated,
+        })
+
+        return updated
+
+    @staticmethod
+    async def _ais_source_modified(path_to_file):
+        """
+        Checks whether any web page from which a data file was collected has been modified
+        asynchronously (see :meth:`~pyrcs._base._Base._is_source_modified`).
+
+        :param path_to_file: Pathname of the data file.
+        :type path_to_file: str
+        :return: Whether any of the web pages has been modified (or cannot be checked).
+        :rtype: bool
+        """
+
+        validators = load_validators(path_to_file)
+
+        if not validators:
+            return True
+
+        try:
+            async with sharing_async_transport():
+                for url, v in validators.items():
+                    if await ais_page_modified(url, v):
+                        return True
+        except requests.RequestException:
+            return True
+
+        return False
+
     def _fetch_data_from_file(self, data_name, method, ext=".pkl", update=False, dump_dir=None,
                               verbose=False, raise_error=False, data_dir=None, sub_dir=None,
-                              save_data_kwargs=None, **kwargs):
+                              save_data_kwargs=None, columns=None, **kwargs):
         # noinspection PyShadowingNames
         """
         Fetches data from a stored file or generates it using the specified ``method``.
@@ -486,6 +994,13 @@ class _Base:
         ``method`` is called to generate the data, which can then be optionally saved to a specified
         directory (``dump_dir``).
 
+        When ``update=True`` and the file exists, the web pages from which it was collected are
+        first checked with conditional requests, using the validators (ETag, Last-Modified and
+        body hash) stored next to the file; if none of them has been modified, the existing data
+        is loaded from the file instead of being collected and parsed again. Within
+        :func:`~pyrcs._base.incremental_update`, their last update dates are compared instead
+        (see :meth:`~pyrcs._base._Base._is_source_updated`).
+
         :param data_name: A unique identifier for the data, used to determine the filename.
         :type data_name: str
         :param method: A callable method that generates the data if the file does not exist
@@ -513,6 +1028,10 @@ class _Base:
         :param save_data_kwargs: [Optional] Additional parameters for the
             :func:`pyrcs.utils.save_data_to_file` function; defaults to ``None``.
         :type save_data_kwargs: dict | None
+        :param columns: Names of the columns of the dataframes to load from the file; for
+            a columnar format (i.e. ``ext=".parquet"`` or ``ext=".feather"``), the other columns
+            are not read at all; defaults to ``None`` (i.e. all columns).
+        :type columns: list | None
         :param kwargs: [Optional] Additional parameters passed to ``method`` when generating data.
         :return: The fetched or generated data;
             returns ``None`` if an error occurs and  ``raise_error=False``.
@@ -543,18 +1062,110 @@ class _Base:
             path_to_file = self._make_file_pathname(
                 data_name=data_name, ext=ext, data_dir=data_dir, sub_dir=sub_dir)
 
-            if os.path.isfile(path_to_file) and not update:  # Attempt to load existing data
-                data = load_data(path_to_file, verbose=(verbose == 2))
+            if update:  # The cached data is not used (but is replaced if the file is loaded)
+                data_cache.invalidate(self._cache_key(path_to_file))
 
-            else:
-                verbose_ = get_collect_verbosity_for_fetch(data_dir=dump_dir, verbose=verbose)
+            # The responses of the web pages found modified are reused by the collection
+            with reusing_modified_pages():
+                if self._is_data_file(path_to_file) and not update:  # Load the existing data
+                    data = self._load_cached_data_file(
+                        path_to_file, columns=columns, verbose=verbose)
+
+                elif self._is_data_file(path_to_file) and not self._is_source_updated(
+                        path_to_file, data_name=data_name):
+                    print_unmodified_source_message(data_name=data_name, verbose=verbose)
+                    data = self._load_cached_data_file(
+                        path_to_file, columns=columns, verbose=verbose)
+
+                else:
+                    verbose_ = get_collect_verbosity_for_fetch(data_dir=dump_dir, verbose=verbose)
+
+                    kwargs.update({'confirmation_required': False, 'verbose': verbose_})
+
+                    mtime = self._get_mtime(path_to_file)
+
+                    report = _update_report.get() if update else None
+                    if report is not None and not self._is_data_file(path_to_file):
+                        report.append({  # The data is collected for the first time
+                            'Data': data_name,
+                            'Initial': None,
+                            'Stored date': None,
+                            'Remote date': None,
+                            'Updated': True,
+                        })
+
+                    token = _update_report.set(None)  # The data is collected as a full update
+                    try:
+                        with recording_validators() as page_validators:
+                            if isinstance(method, str):
+                                data = getattr(self, method)(**kwargs)
+                            else:
+                                data = method(**kwargs)
+                    finally:
+                        _update_report.reset(token)
+
+                    self._save_validators(path_to_file, page_validators, mtime=mtime)
+
+            if dump_dir:
+                self._save_data_to_file(
+                    data=data, data_name=data_name, ext=ext, dump_dir=dump_dir, sub_dir=sub_dir,
+                    verbose=verbose, **(save_data_kwargs or {}))
+
+            return data
+
+        except Exception as e:
+            _print_failure_message(e=e, prefix="Error:", verbose=verbose, raise_error=raise_error)
+
+    async def _afetch_data_from_file(self, data_name, method, ext=".pkl", update=False,
+                                     dump_dir=None, verbose=False, raise_error=False,
+                                     data_dir=None, sub_dir=None, save_data_kwargs=None,
+                                     columns=None, **kwargs):
+        """
+        Fetches data from a stored file or generates it using the specified ``method``
+        asynchronously.
+
+        It is the awaitable counterpart of :meth:`~pyrcs._base._Base._fetch_data_from_file`,
+        which takes the same parameters, except that ``method`` must be a coroutine function
+        (or the name of one).
+
+        :return: The fetched or generated data;
+            returns ``None`` if an error occurs and  ``raise_error=False``.
+        :rtype: dict | None
+        """
+
+        try:
+            path_to_file = self._make_file_pathname(
+                data_name=data_name, ext=ext, data_dir=data_dir, sub_dir=sub_dir)
+
+            if update:  # The cached data is not used (but is replaced if the file is loaded)
+                data_cache.invalidate(self._cache_key(path_to_file))
 
-                kwargs.update({'confirmation_required': False, 'verbose': verbose_})
+            # The responses of the web pages found modified are reused by the collection
+            with reusing_modified_pages():
+                if self._is_data_file(path_to_file) and not update:
+                    data = self._load_cached_data_file(
+                        path_to_file, columns=columns, verbose=verbose)
+
+                elif self._is_data_file(path_to_file) and not await self._ais_source_modified(
+                        path_to_file):
+                    print_unmodified_source_message(data_name=data_name, verbose=verbose)
+                    data = self._load_cached_data_file(
+                        path_to_file, columns=columns, verbose=verbose)
 
-                if isinstance(method, str):
-                    data = getattr(self, method)(**kwargs)
                 else:
-                    data = method(**kwargs)
+                    verbose_ = get_collect_verbosity_for_fetch(data_dir=dump_dir, verbose=verbose)
+
+                    kwargs.update({'confirmation_required': False, 'verbose': verbose_})
+
+                    mtime = self._get_mtime(path_to_file)
+
+                    with recording_validators() as page_validators:
+                        if isinstance(method, str):
+                            data = await getattr(self, method)(**kwargs)
+                        else:
+                            data = await method(**kwargs)
+
+                    self._save_validators(path_to_file, page_validators, mtime=mtime)
 
             if dump_dir:
                 self._save_data_to_file(
@@ -565,3 +1176,373 @@ class _Base:
 
         except Exception as e:
             _print_failure_message(e=e, prefix="Error:", verbose=verbose, raise_error=raise_error)
+
+    @staticmethod
+    def _map_initials(method, max_workers=4, **kwargs):
+        """
+        Calls a fetch method for each initial letter (A-Z), with bounded concurrency.
+
+        :param method: The method for fetching the data of a given initial letter.
+        :type method: typing.Callable
+        :param max_workers: Maximum number of initial letters whose data is fetched concurrently;
+            if ``max_workers=1``, the data is fetched one initial letter after another;
+            defaults to ``4``. Within :func:`~pyrcs.parser.parsing_in_processes`, it is raised
+            to the number of worker processes, so that all of them can be kept busy.
+        :type max_workers: int
+        :param kwargs: [Optional] Additional parameters passed to ``method``.
+        :return: A list of the data for the initial letters, in alphabetical order.
+        :rtype: list
+        """
+
+        if max_workers == 1:
+            return [method(initial=x, **kwargs) for x in string.ascii_lowercase]
+
+        max_workers = max(max_workers, _count_parse_workers())
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [  # Run each call in a copy of the current context (e.g. of an update)
+                executor.submit(contextvars.copy_context().run, method, initial=x, **kwargs)
+                for x in string.ascii_lowercase]
+
+        return [future.result() for future in futures]
+
+    def _get_url_by_initial(self, initial):
+        """
+        Gets the URL of the web page of the data for a given initial letter.
+
+        :param initial: The initial letter (e.g. ``'A'``).
+        :type initial: str
+        :return: The URL of the web page, or ``None`` if it is not available.
+        :rtype: str | None
+        """
+
+        return self.catalogue.get(initial)
+
+    def _update_by_initial(self, initial, method, data_name, report, verbose=False):
+        """
+        Updates the data for a given initial letter only if its web page has been updated
+        since the data was last collected (see :func:`~pyrcs._base.incremental_update`).
+
+        :param initial: The initial letter (e.g. ``'a'``, ``'z'``).
+        :type initial: str
+        :param method: The method for fetching the data of a given initial letter.
+        :type method: typing.Callable
+        :param data_name: The name of the data (used in the report).
+        :type data_name: str
+        :param report: The list to which the result of the check is appended.
+        :type report: list
+        :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+        :type verbose: bool | int
+        :return: The (updated) data for the initial letter.
+        :rtype: dict | None
+        """
+
+        initial_ = initial.upper()
+
+        path_to_file = self._make_file_pathname(data_name=initial, sub_dir="a-z", mkdir=False)
+
+        if self._is_data_file(path_to_file):
+            data = method(initial=initial, update=False, verbose=False)
+            stored_date = data.get(self.KEY_TO_LAST_UPDATED_DATE) if data else None
+
+            url = self._get_url_by_initial(initial_)
+            remote_date = peek_last_updated_date(url) if url else None
+
+            updated = (
+                data is None or data.get(initial_) is None or
+                remote_date is None or stored_date is None or remote_date > stored_date)
+
+        else:  # The page has not been collected before (and is collected below)
+            data, stored_date, remote_date, updated = None, None, None, True
+
+        if updated:
+            token = _update_report.set(None)  # The page is collected as a full update
+            try:
+                data = method(initial=initial, update=True, verbose=verbose)
+            finally:
+                _update_report.reset(token)
+
+        report.append({
+            'Data': data_name,
+            'Initial': initial_,
+            'Stored date': stored_date,
+            'Remote date': remote_date,
+            'Updated': updated,
+        })
+
+        return data
+
+    def _fetch_by_initials(self, method, data_name, update=False, dump_dir=None, verbose=False,
+                           max_workers=4):
+        """
+        Fetches data of a cluster whose pages are organised by initial letters (A-Z).
+
+        The pages are fetched with bounded concurrency (see also the politeness limit of
+        :class:`~pyrcs.transport.HTTPTransport`). If no data is available for any of the initial
+        letters when ``update=True`` (e.g. when the connection is lost), the data is fetched from
+        the local backup instead.
+
+        Within :func:`~pyrcs._base.incremental_update`, only the pages that have been updated
+        since the data was last collected are collected again when ``update=True``.
+
+        :param method: The method for fetching the data of a given initial letter
+            (e.g. :meth:`~pyrcs.line_data.loc_id.LocationIdentifiers.fetch_loc_id`), which must
+            accept the parameters ``initial``, ``update`` and ``verbose``.
+        :type method: typing.Callable
+        :param data_name: The name of the data (used in messages).
+        :type data_name: str
+        :param update: Whether to check for updates to the package data; defaults to ``False``.
+        :type update: bool
+        :param dump_dir: Path to a directory where the data file will be saved;
+            defaults to ``None``.
+        :type dump_dir: str | os.PathLike | None
+        :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+        :type verbose: bool | int
+        :param max_workers: Maximum number of initial letters whose data is fetched concurrently;
+            defaults to ``4``.
+        :type max_workers: int
+        :return: A list of the data (dictionaries) for the initial letters, in alphabetical order.
+        :rtype: list[dict]
+        """
+
+        verbose_1 = get_collect_verbosity_for_fetch(data_dir=dump_dir, verbose=verbose)
+        # The connection is checked only for an update; the stored data is read with no requests
+        verbose_2 = verbose_1 if not update or is_homepage_connectable() else False
+
+        report = _update_report.get()
+
+        if update and report is not None:
+            update_by_initial = functools.partial(
+                self._update_by_initial, method=method, data_name=data_name, report=report)
+            data_sets = self._map_initials(
+                update_by_initial, max_workers=max_workers, verbose=verbose_2)
+        else:
+            data_sets = self._map_initials(
+                method, max_workers=max_workers, update=update, verbose=verbose_2)
+
+        if all(d[x] is None for d, x in zip(data_sets, string.ascii_uppercase)):
+            if update:
+                print_instance_connection_error(verbose=verbose)
+                print_void_collection_message(data_name=data_name, verbose=verbose)
+
+            data_sets = self._map_initials(
+                method, max_workers=max_workers, update=False, verbose=verbose_1)
+
+        return data_sets
+
+    async def _afetch_by_initials(self, method, data_name, update=False, dump_dir=None,
+                                  verbose=False):
+        """
+        Fetches data of a cluster whose pages are organised by initial letters (A-Z)
+        asynchronously.
+
+        It is the awaitable counterpart of :meth:`~pyrcs._base._Base._fetch_by_initials`, except
+        that ``method`` must be a coroutine function and the pages of all the initial letters are
+        requested concurrently (subject to the politeness limit of
+        :class:`~pyrcs.transport.AsyncHTTPTransport`).
+
+        :return: A list of the data (dictionaries) for the initial letters, in alphabetical order.
+        :rtype: list[dict]
+        """
+
+        verbose_1 = get_collect_verbosity_for_fetch(data_dir=dump_dir, verbose=verbose)
+        verbose_2 = verbose_1 if not update or await asyncio.to_thread(is_homepage_connectable) \
+            else False
+
+        # The pages of all the initial letters are requested through one transport
+        async with sharing_async_transport():
+            data_sets = await asyncio.gather(
+                *(method(initial=x, update=update, verbose=verbose_2)
+                  for x in string.ascii_lowercase))
+
+        if all(d[x] is None for d, x in zip(data_sets, string.ascii_uppercase)):
+            if update:
+                print_instance_connection_error(verbose=verbose)
+                print_void_collection_message(data_name=data_name, verbose=verbose)
+
+            data_sets = await asyncio.gather(
+                *(method(initial=x, update=False, verbose=verbose_1)
+                  for x in string.ascii_lowercase))
+
+        return list(data_sets)
+
+    def _get_initials_mtimes(self, data_dir=None):
+        """
+        Gets the modification times of the stored data files of the initial letters (A-Z).
+
+        :param data_dir: The directory of the data files; defaults to ``None``
+            (i.e. the default data directory).
+        :type data_dir: str | os.PathLike | None
+        :return: The modification times (in nanoseconds) of the files, in alphabetical order,
+            with ``None`` for the initial letters whose data is not stored.
+        :rtype: list
+        """
+
+        return [
+            self._get_mtime(self._make_file_pathname(
+                data_name=x, data_dir=data_dir, sub_dir="a-z", mkdir=False))
+            for x in string.ascii_lowercase]
+
+    def _load_merged_initials(self, verbose=False):
+        """
+        Loads the merged data of all the initial letters (A-Z), as kept in memory or saved by
+        :meth:`~pyrcs._base._Base._save_merged_initials`, if it is up to date.
+
+        :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+        :type verbose: bool | int
+        :return: The merged data, or ``None`` if it is not kept or the data file of any of
+            the initial letters has been modified since it was merged.
+        :rtype: dict | None
+        """
+
+        path_to_file = self._make_file_pathname(
+            data_name="all-initials", sub_dir="a-z", mkdir=False)
+
+        mtimes = self._get_initials_mtimes()
+
+        if None in mtimes:
+            return None
+
+        data = data_cache.get(self._cache_key(path_to_file) + ('merged',), mtime=tuple(mtimes))
+
+        if data is not None or not os.path.isfile(path_to_file):
+            return data
+
+        try:
+            merged = self._load_cached_data_file(path_to_file, verbose=verbose)
+        except Exception:  # e.g. a truncated file, which is then written again
+            return None
+
+        if merged.get('Modification times') != mtimes:
+            return None
+
+        return merged['Data']
+
+    def _save_merged_initials(self, data, mtimes, write=False, verbose=False):
+        """
+        Keeps the merged data of all the initial letters (A-Z) in memory (see
+        :py:mod:`pyrcs.cache`), and optionally saves it next to their data files, along with
+        the modification times of the files, so that it can be loaded in one go (instead of
+        loading and merging the data of each initial letter) until any of them is modified.
+
+        The data is not kept unless the data files of all the initial letters are stored.
+
+        :param data: The merged data, e.g. returned by
+            :meth:`~pyrcs.line_data.loc_id.LocationIdentifiers.fetch_loc_id` with ``initial=None``.
+        :type data: dict
+        :param mtimes: The modification times of the data files of the initial letters before
+            their data was loaded (see :meth:`~pyrcs._base._Base._get_initials_mtimes`).
+        :type mtimes: list
+        :param write: Whether to save the merged data to a file as well; defaults to ``False``.
+        :type write: bool
+        :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+        :type verbose: bool | int
+        """
+
+        if None in mtimes:
+            return None
+
+        path_to_file = self._make_file_pathname(
+            data_name="all-initials", sub_dir="a-z", mkdir=False)
+
+        data_cache.put(
+            self._cache_key(path_to_file) + ('merged',), _copy(data), mtime=tuple(mtimes))
+
+        if write:
+            try:
+                save_data(
+                    data={'Modification times': mtimes, 'Data': data}, path_to_file=path_to_file,
+                    verbose=(verbose == 2))
+            except OSError:  # e.g. the data directory is read-only
+                pass
+
+    def _fetch_merged_initials(self, method, merge, data_name, update=False, dump_dir=None,
+                               verbose=False, max_workers=4):
+        """
+        Fetches the merged data of a cluster whose pages are organised by initial letters (A-Z).
+
+        When ``update=False``, the merged data kept (or saved) by a previous call is loaded,
+        unless the data file of any of the initial letters has been modified since; otherwise,
+        the data of each initial letter is fetched (see
+        :meth:`~pyrcs._base._Base._fetch_by_initials`) and merged, and the merged data is kept in
+        memory for the next call. It is also saved to a file only after an update (with the
+        modification times of the data files as written by the update) or when ``dump_dir`` is
+        given, so that merely reading the data writes nothing to the package data directory.
+
+        :param method: The method for fetching the data of a given initial letter.
+        :type method: typing.Callable
+        :param merge: The method for merging the list of the data of the initial letters
+            (e.g. :meth:`~pyrcs.line_data.loc_id.LocationIdentifiers._merge_loc_id`).
+        :type merge: typing.Callable
+        :param data_name: The name of the data (used in messages).
+        :type data_name: str
+        :param update: Whether to check for updates to the package data; defaults to ``False``.
+        :type update: bool
+        :param dump_dir: Path to a directory where the data file will be saved;
+            defaults to ``None``.
+        :type dump_dir: str | os.PathLike | None
+        :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+        :type verbose: bool | int
+        :param max_workers: Maximum number of initial letters whose data is fetched concurrently;
+            defaults to ``4``.
+        :type max_workers: int
+        :return: The merged data of all the initial letters.
+        :rtype: dict
+        """
+
+        if not update:
+            data = self._load_merged_initials(verbose=verbose)
+            if data is not None:
+                return data
+
+        mtimes = self._get_initials_mtimes()
+
+        data_sets = self._fetch_by_initials(
+            method, data_name=data_name, update=update, dump_dir=dump_dir, verbose=verbose,
+            max_workers=max_workers)
+
+        data = merge(data_sets)
+
+        if update:  # The data files of the initial letters may have been written since
+            mtimes = self._get_initials_mtimes()
+
+        if all(x is not None for x in data_sets):  # The data of every initial letter is fetched
+            self._save_merged_initials(
+                data, mtimes=mtimes, write=update or bool(dump_dir), verbose=verbose)
+
+        return data
+
+    async def _afetch_merged_initials(self, method, merge, data_name, update=False,
+                                      dump_dir=None, verbose=False):
+        """
+        Fetches the merged data of a cluster whose pages are organised by initial letters (A-Z)
+        asynchronously.
+
+        It is the awaitable counterpart of :meth:`~pyrcs._base._Base._fetch_merged_initials`,
+        except that ``method`` must be a coroutine function
+        (see :meth:`~pyrcs._base._Base._afetch_by_initials`).
+
+        :return: The merged data of all the initial letters.
+        :rtype: dict
+        """
+
+        if not update:
+            data = self._load_merged_initials(verbose=verbose)
+            if data is not None:
+                return data
+
+        mtimes = self._get_initials_mtimes()
+
+        data_sets = await self._afetch_by_initials(
+            method, data_name=data_name, update=update, dump_dir=dump_dir, verbose=verbose)
+
+        data = merge(data_sets)
+
+        if update:  # The data files of the initial letters may have been written since
+            mtimes = self._get_initials_mtimes()
+
+        if all(x is not None for x in data_sets):  # The data of every initial letter is fetched
+            self._save_merged_initials(
+                data, mtimes=mtimes, write=update or bool(dump_dir), verbose=verbose)
+
+        return data
@@ -0,0 +1,125 @@
+"""
+Provides the precompiled regular expressions used by the helpers for parsing the data.
+
+These helpers are applied to every row (or cell) of the tables; when all the data (e.g. for all
+the initial letters A-Z) is collected, they are called hundreds of thousands of times. Compiling
+the patterns once, at import, saves both the compilation (or the lookup of :py:mod:`re`'s cache)
+and the rebuilding of the patterns on every call.
+"""
+
+import re
+
+# == Web pages =====================================================================================
+
+# Line breaks (with an optional leading '/') within the text of a table cell
+TD_LINE_BREAK = re.compile(r'/?\r?\n')
+
+# Line breaks in the headers of a table
+TH_LINE_BREAK = re.compile(r'\n?\r+\n?')
+
+# Line breaks of any style (i.e. '\r\n', '\r' or '\n')
+LINE_BREAK = re.compile(r'\r\n|[\r\n]')
+
+# == Location identifiers ==========================================================================
+
+# A location name followed by a note in brackets, e.g. 'Abercynon (formerly Abercynon South)'
+LOC_NAME_WITH_NOTE = re.compile(r'^(.*?)\s*[(\[](.+)[)\]]$', re.DOTALL)
+
+# Keywords that identify the content of the brackets as a note of the location name
+LOC_NAME_NOTE_KEYWORDS = re.compile(
+    '|'.join([
+        'originally', 'formerly', 'later', 'presumed', 'was', 'reopened',
+        'portion', 'see', 'unknown feature', 'definition unknown', 'now deleted', 'now',
+    ]),
+    re.IGNORECASE)
+
+# Leading/trailing non-alphanumeric characters of a note, e.g. '["(' or ')"]'
+NOTE_NOISE = re.compile(r'^[^a-zA-Z0-9]+|[^a-zA-Z0-9]+$')
+
+# A note in brackets following a code, e.g. '860260 [Old Code]'
+CODE_NOTE = re.compile(r'(?<=[\[(])[\w,? ]+(?=[)\]])')
+CODE_NOTE_TEXT = re.compile(r'[\w ,]+(?= [\[(\'])')
+
+# The usual forms of STANOX, e.g. '12345', '12345*' (pseudo STANOX) or '12345 Main Line';
+# their ``.pattern`` (rather than the compiled pattern) is used for column-level matching,
+# which can then be done by pyarrow (if available) rather than cell by cell
+STANOX = re.compile(r'\d{5}$')
+PSEUDO_STANOX = re.compile(r'\d{5}\*$')
+STANOX_WITH_NOTE = re.compile(r'^(\d{5}) (\w.*)')
+
+# The irregular forms of STANOX, e.g. '12345* (formerly 54321)'
+STANOX_TEXT = re.compile(r'[\w *,]+(?= [\[(\'])')
+STANOX_NOTE = re.compile(r'(?<=[\[(\'])[\w, ]+.(?=[)\]\'])')
+
+# Separators of the entries on the pages of notes (e.g. of CRS)
+NOTE_ENTRY_SEP = re.compile(r'\t+|,+')
+
+# == ELRs and mileages =============================================================================
+
+MILES_CHAINS = re.compile(r'\d+\.\d+')
+
+# e.g. '10.22/ 10.26'
+ALT_MILES_CHAINS = re.compile(r'\d+\.\d+/\s?\d+\.\d+')
+
+# Separators of miles and chains other than '.', e.g. in '1,234' or '1 234'
+MILES_CHAINS_SEP = re.compile(r'[ ,]')
+
+# A node with connections, e.g. 'Acton Wells Junction with BCH1 (0.00) and NEM2 (8.71)'
+NODE_WITH_CONNECTION = re.compile(
+    r'\w+.*( \(\d+\.\d+\))?(/| and \w+)? with ([A-Z]).*(\d)?( \(\d+\.\d+\))?')
+NODE_NAME = re.compile(r'\w+.*(?= with)')
+CONNECTED_NODE = re.compile(r'(?<= with )[^*]+')
+
+# e.g. 'ECM5 (44.64)/ NEM1 (1.27)'
+CONNECTED_NODE_PAIR = re.compile(r'[A-Z]{3}\d?( \(\d+\.\d+\))? ?/ ?[A-Z]{3}\d?( \(\d+\.\d+\))?')
+
+LINK_COLUMN = re.compile(r'^(Link_\d)')
+
+ELR = re.compile(r'[A-Z]{3}(\d)?')
+
+# The forms of a connected node, e.g. 'DNT', 'ECM5 (44.64)', 'ECM5 [...]' or 'ECM5 (71.41km)'
+ELR_OR_NAME = re.compile(r'([A-Z]{3}(\d)?$)|((\w\s?)*\w$)')
+ELR_OR_NAME_WITH_MILEAGE = re.compile(r'([A-Z]{3}(\d)?$)|(([\w\s&]?)*(\s\(\d+\.\d+\))?$)')
+ELR_WITH_NOTE = re.compile(r'[A-Z]{3}(\d)?(\s\(\d+.\d+\))?\s\[.*?]$')
+ELR_WITH_KM = re.compile(r'[A-Z]{3}(\d)?\s\(\d+\.\d+km\)')
+MILES_CHAINS_IN_BRACKETS = re.compile(r'\d+.\d+\)')
+
+# The mileages given in miles and chains or in kilometres in the tables of e.g. stations and HABDs,
+# e.g. '11m 43ch' or '24.458km'
+MILEAGE_TEXT_MILES_CHAINS = re.compile(r'^(\d+)m\s*(\d+)ch$')
+MILEAGE_TEXT_KM = re.compile(r'^(\d+(?:\.\d+)?)km$')
+
+# == Tunnels =======================================================================================
+
+DIGITS = re.compile(r'\d+')
+
+UNKNOWN_LENGTH = re.compile(r'[Uu]nknown')
+
+# e.g. "0m 48yd- (['0m 58yd'])"
+LENGTH_RANGE = re.compile(r'\d+m \d+yd?(- | to )?.*\d+m \d+yd?.*')
+
+# e.g. '1m 182y', 'formerly 0m236y' or 'c0m 11ch'
+LENGTH_MILES_YARDS = re.compile(r'(formerly )?c?≈?\d+m ?\d+(?:yd?|ch)')
+LENGTH_IN_CHAINS = re.compile(r'.*\d+ch$')
+APPROXIMATE_LENGTH = re.compile(r'^c.*|^≈')
+LENGTH_IN_YARDS = re.compile(r'\d+y$')
+LENGTH_IN_YARDS_NOTE = re.compile(r'(?<=\dy).*$')
+FORMER_LENGTH = re.compile(r'^(formerly).*')
+LENGTH_WITH_NOTE = re.compile(r'.*(?:yd?|ch)\s*(.+)$')
+LENGTH_NOTE = re.compile(r'(?:yd?|ch)\s*(.+)$')
+
+# e.g. '0.325km (0m 356y)'
+LENGTH_KM_MILES_YARDS = re.compile(r'\d+\.\d+km(\r)? .*(\[\')?\(\d+m \d+yd?\).*')
+LENGTH_IN_BRACKETS = re.compile(r'(?<=\()\d+.*(?=\))')
+LENGTH_KM_NOTE = re.compile(r'.+(?= (\[\')?\()')
+
+# == Stations ======================================================================================
+
+# Markers of approximate coordinates, e.g. 'c.' or '≈'
+APPROXIMATE_COORDINATE = re.compile(r'(c\.)|≈')
+
+# e.g. 'Heathrow Junction [sometimes referred to as Heathrow Interchange]'
+STATION_NOTE = re.compile(r' \[(.*)](✖.*)?')
+
+# Separators of (former) owners/operators
+OWNER_OPERATOR_SEP = re.compile(r' / |\r')
@@ -0,0 +1,310 @@
+"""
+Stores the data in columnar files, i.e. `Parquet`_ or `Feather`_ (with `pyarrow`_).
+
+The data of a file is often a (nested) dictionary of dataframes, strings and dates. Each dataframe
+is written to a file of its own, e.g. ``a.0.parquet``, and the rest of the data (with references
+to the dataframes) to a JSON file next to them, e.g. ``a.parquet.json``, which is written last.
+The dataframes can then be read back (memory-mapped) without unpickling, and only the columns
+that are needed. Feather files are written uncompressed, so that they are the fastest to load,
+whereas Parquet files are compressed (with `zstd`), so that they are the smallest.
+
+.. _`Parquet`: https://parquet.apache.org/
+.. _`Feather`: https://arrow.apache.org/docs/python/feather.html
+.. _`pyarrow`: https://arrow.apache.org/docs/python/
+"""
+
+import base64
+import contextlib
+import json
+import os
+import pickle
+
+import pandas as pd
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.ipc
+    import pyarrow.parquet
+    import pyarrow.types
+except ImportError:  # pyarrow is optional; see save_columnar()
+    pyarrow = None
+
+#: The file extensions of the columnar formats.
+COLUMNAR_EXTS = {'.parquet': 'parquet', '.feather': 'feather'}
+
+
+def is_columnar(path_to_file):
+    """
+    Checks whether a data file is of a columnar format (by its extension).
+
+    :param path_to_file: Pathname of a data file.
+    :type path_to_file: str | os.PathLike
+    :return: Whether the extension is one of :py:data:`~pyrcs._store.COLUMNAR_EXTS`.
+    :rtype: bool
+    """
+
+    return os.path.splitext(path_to_file)[1].lower() in COLUMNAR_EXTS
+
+
+def stored_pathname(path_to_file):
+    """
+    Gets the pathname of the file whose existence (and modification time) marks the stored data.
+
+    :param path_to_file: Pathname of a data file.
+    :type path_to_file: str | os.PathLike
+    :return: Pathname of the JSON file of the data (if of a columnar format) or of the data file.
+    :rtype: str
+
+    **Examples**::
+
+        >>> from pyrcs._store import stored_pathname
+        >>> stored_pathname('pyrcs/data/line-data/crs-nlc-tiploc-stanox/a-z/a.parquet')
+        'pyrcs/data/line-data/crs-nlc-tiploc-stanox/a-z/a.parquet.json'
+        >>> stored_pathname('pyrcs/data/line-data/crs-nlc-tiploc-stanox/a-z/a.pkl')
+        'pyrcs/data/line-data/crs-nlc-tiploc-stanox/a-z/a.pkl'
+    """
+
+    path_to_file = os.fspath(path_to_file)
+
+    return path_to_file + ".json" if is_columnar(path_to_file) else path_to_file
+
+
+def pickle_pathname(path_to_file):
+    """
+    Gets the pathname of the pickle file of the same data as a data file.
+
+    :param path_to_file: Pathname of a data file, e.g. ``'a.parquet'``.
+    :type path_to_file: str | os.PathLike
+    :return: Pathname of the pickle file, e.g. ``'a.pkl'``.
+    :rtype: str
+    """
+
+    return os.path.splitext(os.fspath(path_to_file))[0] + ".pkl"
+
+
+def _frame_pathname(path_to_file, i):
+    # e.g. 'a.0.parquet' for the first dataframe of 'a.parquet'
+    stem, ext = os.path.splitext(path_to_file)
+    return f"{stem}.{i}{ext}"
+
+
+def _encode(obj, frames):
+    # The data as JSON, in which each dataframe is replaced by its position in `frames`
+    if isinstance(obj, pd.DataFrame):
+        frames.append(obj)
+        return {'__frame__': len(frames) - 1}
+
+    if isinstance(obj, dict):
+        if all(isinstance(k, str) for k in obj):
+            return {'__dict__': {k: _encode(v, frames) for k, v in obj.items()}}
+        return {'__items__': [[_encode(k, frames), _encode(v, frames)] for k, v in obj.items()]}
+
+    if isinstance(obj, list):
+        return [_encode(x, frames) for x in obj]
+
+    if isinstance(obj, tuple):
+        return {'__tuple__': [_encode(x, frames) for x in obj]}
+
+    if obj is None or type(obj) in {str, int, float, bool}:
+        return obj
+
+    # Any other object (e.g. a date or a series) is pickled
+    return {'__pickle__': base64.b64encode(pickle.dumps(obj)).decode('ascii')}
+
+
+def _decode(obj, frames):
+    if isinstance(obj, list):
+        return [_decode(x, frames) for x in obj]
+
+    if not isinstance(obj, dict):
+        return obj
+
+    (key, value), = obj.items()
+
+    if key == '__frame__':
+        return frames[value]
+    if key == '__dict__':
+        return {k: _decode(v, frames) for k, v in value.items()}
+    if key == '__items__':
+        return {_decode(k, frames): _decode(v, frames) for k, v in value}
+    if key == '__tuple__':
+        return tuple(_decode(x, frames) for x in value)
+
+    return pickle.loads(base64.b64decode(value))
+
+
+def _write_frame(frame, path_to_file, fmt, **kwargs):
+    # Write a dataframe in the columnar format; those that cannot be converted to Arrow
+    # (e.g. with mixed types or duplicate column names) or would not be read back the same
+    # (e.g. with lists in the cells, which would be read back as arrays) are pickled instead
+    try:
+        table = pyarrow.Table.from_pandas(frame, preserve_index=None)
+        if any(pyarrow.types.is_nested(x.type) for x in table.schema):
+            raise TypeError("Nested data")
+    except (pyarrow.ArrowException, TypeError, ValueError):
+        path_to_file = os.path.splitext(path_to_file)[0] + ".pkl"
+        frame.to_pickle(path_to_file)
+        return path_to_file
+
+    if fmt == 'parquet':
+        pyarrow.parquet.write_table(table, path_to_file, **{'compression': 'zstd', **kwargs})
+    else:
+        pyarrow.feather.write_feather(
+            table, path_to_file, **{'compression': 'uncompressed', **kwargs})
+
+    return path_to_file
+
+
+def _read_frame(path_to_file, columns=None):
+    # Read a dataframe (memory-mapped), with only the given columns (if any) and its index
+    if path_to_file.endswith(".pkl"):
+        frame = pd.read_pickle(path_to_file)
+        return frame if columns is None else frame[[x for x in frame.columns if x in columns]]
+
+    if columns is not None:
+        if path_to_file.endswith(".parquet"):
+            schema = pyarrow.parquet.read_schema(path_to_file, memory_map=True)
+        else:
+            schema = pyarrow.ipc.open_file(pyarrow.memory_map(path_to_file)).schema
+        index_columns = (schema.pandas_metadata or {}).get('index_columns', [])
+        columns = [x for x in schema.names if x in columns or x in index_columns]
+
+    if path_to_file.endswith(".parquet"):
+        table = pyarrow.parquet.read_table(path_to_file, columns=columns, memory_map=True)
+    else:
+        table = pyarrow.feather.read_table(path_to_file, columns=columns, memory_map=True)
+
+    return table.to_pandas()
+
+
+def _print_message(action, path_to_file, verbose):
+    if verbose:
+        print(f'{action} "{os.path.relpath(path_to_file)}" ... ', end="")
+
+
+def save_columnar(data, path_to_file, verbose=False, **kwargs):
+    """
+    Saves data in a columnar format (i.e. Parquet or Feather, by the extension of the pathname).
+
+    :param data: The data, e.g. a dataframe or a (nested) dictionary of dataframes.
+    :type data: pandas.DataFrame | dict | list
+    :param path_to_file: Pathname of the data file, e.g. ``'a.parquet'`` or ``'a.feather'``.
+    :type path_to_file: str | os.PathLike
+    :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+    :type verbose: bool | int
+    :param kwargs: [Optional] Additional parameters passed to `pyarrow.parquet.write_table()`_
+        or `pyarrow.feather.write_feather()`_.
+
+    .. _`pyarrow.parquet.write_table()`:
+        https://arrow.apache.org/docs/python/generated/pyarrow.parquet.write_table.html
+    .. _`pyarrow.feather.write_feather()`:
+        https://arrow.apache.org/docs/python/generated/pyarrow.feather.write_feather.html
+    """
+
+    if pyarrow is None:
+        raise ImportError(
+            "Saving data as Parquet or Feather requires the package 'pyarrow' to be installed.")
+
+    path_to_file = os.fspath(path_to_file)
+    fmt = COLUMNAR_EXTS[os.path.splitext(path_to_file)[1].lower()]
+    _print_message("Saving", path_to_file, verbose)
+
+    os.makedirs(os.path.dirname(path_to_file) or ".", exist_ok=True)
+
+    frames = []
+    metadata = {'format': fmt, 'data': _encode(data, frames)}
+
+    frame_files = [
+        _write_frame(frame, _frame_pathname(path_to_file, i), fmt=fmt, **kwargs)
+        for i, frame in enumerate(frames)]
+    metadata['frames'] = [os.path.basename(x) for x in frame_files]
+
+    path_to_json = stored_pathname(path_to_file)
+    old_frame_files = _load_metadata(path_to_json).get('frames', [])
+
+    with open(path_to_json, mode='w', encoding='utf-8') as f:
+        json.dump(metadata, f)
+
+    # Remove the files of the dataframes that were stored previously but are no longer used
+    for filename in set(old_frame_files) - set(metadata['frames']):
+        with contextlib.suppress(OSError):
+            os.remove(os.path.join(os.path.dirname(path_to_file), filename))
+
+    if verbose:
+        print("Done.")
+
+
+def _load_metadata(path_to_json):
+    try:
+        with open(path_to_json, mode='r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_columnar(path_to_file, columns=None, verbose=False):
+    """
+    Loads data saved in a columnar format (see :func:`~pyrcs._store.save_columnar`).
+
+    :param path_to_file: Pathname of the data file, e.g. ``'a.parquet'`` or ``'a.feather'``.
+    :type path_to_file: str | os.PathLike
+    :param columns: Names of the columns of the dataframes to load (the other columns are not
+        read at all); defaults to ``None`` (i.e. all columns).
+    :type columns: list | None
+    :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+    :type verbose: bool | int
+    :return: The data.
+    :rtype: pandas.DataFrame | dict | list
+    """
+
+    if pyarrow is None:
+        raise ImportError(
+            "Loading data from Parquet or Feather requires the package 'pyarrow' to be installed.")
+
+    path_to_file = os.fspath(path_to_file)
+    _print_message("Loading", path_to_file, verbose)
+
+    path_to_json = stored_pathname(path_to_file)
+    with open(path_to_json, mode='r', encoding='utf-8') as f:
+        metadata = json.load(f)
+
+    columns_ = None if columns is None else set(columns)
+    frames = [
+        _read_frame(os.path.join(os.path.dirname(path_to_file), x), columns=columns_)
+        for x in metadata['frames']]
+
+    data = _decode(metadata['data'], frames)
+
+    if verbose:
+        print("Done.")
+
+    return data
+
+
+def select_columns(data, columns=None):
+    """
+    Selects the given columns of the dataframes in the data, as is done when loading the data
+    with :func:`~pyrcs._store.load_columnar`.
+
+    :param data: The data, e.g. a dataframe or a (nested) dictionary of dataframes.
+    :type data: pandas.DataFrame | dict | list | typing.Any
+    :param columns: Names of the columns to select; defaults to ``None`` (i.e. all columns).
+    :type columns: list | None
+    :return: The data with only the given columns of the dataframes.
+    :rtype: pandas.DataFrame | dict | list | typing.Any
+    """
+
+    if columns is None:
+        return data
+
+    if isinstance(data, pd.DataFrame):
+        return data[[x for x in data.columns if x in columns]]
+
+    if isinstance(data, dict):
+        return {k: select_columns(v, columns) for k, v in data.items()}
+
+    if isinstance(data, (list, tuple)):
+        return type(data)(select_columns(x, columns) for x in data)
+
+    return data
@@ -5,11 +5,13 @@ import time
 from pyhelpers.ops import confirmed
 
 from .collector import LineData, OtherAssets
-from .parser import get_site_map
+from .parser import get_site_map, parsing_in_processes
+from .transport import reparsing
 from .utils import is_homepage_connectable, print_connection_warning
 
 
-def _update_prepacked_data(verbose=False, interval=5, **kwargs):
+def _update_prepacked_data(verbose=False, interval=5, reparse=False, parse_in_processes=False,
+                           **kwargs):
     # noinspection PyUnresolvedReferences
     """
     Updates pre-packed data.
@@ -18,6 +20,15 @@ def _update_prepacked_data(verbose=False, interval=5, **kwargs):
     :type verbose: bool | int
     :param interval: A time gap (in seconds) between updating different classes; defaults to ``5``.
     :type interval: int or float
+    :param reparse: Whether to rebuild the data from the cached raw responses
+        (see :class:`~pyrcs.transport.ResponseCache`) without any network traffic;
+        defaults to ``False``.
+    :type reparse: bool
+    :param parse_in_processes: Whether to parse the web pages of the data organised by initial
+        letters (A-Z) in a pool of worker processes (see
+        :func:`~pyrcs.parser.parsing_in_processes`); if it is an integer, it is the number of
+        the worker processes; defaults to ``False``.
+    :type parse_in_processes: bool | int
 
     **Examples**::
 
@@ -25,6 +36,16 @@ def _update_prepacked_data(verbose=False, interval=5, **kwargs):
         >>> _update_prepacked_data(verbose=True)
     """
 
+    if reparse:
+        with reparsing():
+            return _update_prepacked_data(
+                verbose=verbose, interval=0, parse_in_processes=parse_in_processes, **kwargs)
+
+    if parse_in_processes:
+        max_workers = None if parse_in_processes is True else parse_in_processes
+        with parsing_in_processes(max_workers=max_workers):
+            return _update_prepacked_data(verbose=verbose, interval=interval, **kwargs)
+
     if not is_homepage_connectable():
         print_connection_warning(verbose=verbose)
         print("Unable to update the data.")
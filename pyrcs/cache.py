@@ -0,0 +1,308 @@
+"""
+Caches the data loaded from the data files in memory, so that the data fetched repeatedly
+(e.g. the mileage files of the same ELRs, or the codes of all locations) is loaded from
+the files only once in a process.
+
+The cached data is dropped when its file is modified (or when the data is fetched with
+``update=True``), and the data that has been used least recently is dropped when the total
+(estimated) size of the cached data exceeds the size of the cache
+(see :func:`~pyrcs.cache.set_cache_size`). The data is returned as copies, so that the cached
+data cannot be modified by the callers.
+"""
+
+import collections
+import sys
+import threading
+
+import pandas as pd
+
+#: The default size (in bytes) of the cache.
+DEFAULT_CACHE_SIZE = 256 * 2 ** 20
+
+#: Statistics of a cache (see :meth:`~pyrcs.cache.DataCache.info`).
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'entries', 'size', 'max_size'])
+
+
+def _estimate_size(data):
+    """
+    Estimates the size (in bytes) of data in memory.
+
+    The sizes of the objects (e.g. strings) in the columns of a dataframe are estimated from
+    a sample of (about 100 of) them, since measuring every one of them would take about as long
+    as loading the dataframe from a file.
+
+    :param data: The data, e.g. a dataframe or a (nested) dictionary of dataframes.
+    :type data: typing.Any
+    :return: The estimated size of the data.
+    :rtype: int
+    """
+
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        frame = data.to_frame() if isinstance(data, pd.Series) else data
+        size = int(frame.memory_usage(index=True, deep=False).sum())
+
+        for i in range(frame.shape[1]):
+            column = frame.iloc[:, i]
+            if column.dtype == object and len(column) > 0:
+                sample = column.iloc[::max(1, len(column) // 100)]
+                size += sum(sys.getsizeof(x) for x in sample) * len(column) // len(sample)
+
+        return size
+
+    if isinstance(data, dict):
+        return sys.getsizeof(data) + sum(
+            _estimate_size(k) + _estimate_size(v) for k, v in data.items())
+
+    if isinstance(data, (list, tuple)):
+        return sys.getsizeof(data) + sum(_estimate_size(x) for x in data)
+
+    return sys.getsizeof(data)
+
+
+def _copy(data):
+    """
+    Copies the dataframes (and the containers of them) in data; other objects (e.g. strings,
+    which are immutable) are not copied.
+
+    :param data: The data, e.g. a dataframe or a (nested) dictionary of dataframes.
+    :type data: typing.Any
+    :return: A copy of the data.
+    :rtype: typing.Any
+    """
+
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.copy()
+
+    if isinstance(data, dict):
+        return {k: _copy(v) for k, v in data.items()}
+
+    if isinstance(data, list):
+        return [_copy(x) for x in data]
+
+    if isinstance(data, tuple):
+        return tuple(_copy(x) for x in data)
+
+    return data
+
+
+class DataCache:
+    """
+    A thread-safe cache of data loaded from files, with least-recently-used eviction.
+
+    Each entry is stored with the modification time of its file, and is valid only while
+    the file has not been modified since.
+    """
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        """
+        :param max_size: Maximum total (estimated) size (in bytes) of the cached data;
+            if ``max_size=0``, nothing is cached; defaults to
+            :py:data:`~pyrcs.cache.DEFAULT_CACHE_SIZE` (i.e. 256 MiB).
+        :type max_size: int
+
+        :ivar int max_size: Maximum total size of the cached data.
+        :ivar int hits: Number of times that data is found in the cache.
+        :ivar int misses: Number of times that data is not found in the cache (or is outdated).
+        :ivar int evictions: Number of entries dropped to keep within the size of the cache.
+
+        **Examples**::
+
+            >>> from pyrcs.cache import DataCache
+            >>> import pandas as pd
+            >>> cache = DataCache()
+            >>> cache.put(('Example', 'example.pkl'), pd.DataFrame({'a': [1, 2]}), mtime=1)
+            True
+            >>> cache.get(('Example', 'example.pkl'), mtime=1)
+               a
+            0  1
+            1  2
+            >>> cache.get(('Example', 'example.pkl'), mtime=2) is None  # The file is modified
+            True
+            >>> cache.info()
+            CacheInfo(hits=1, misses=1, evictions=0, entries=0, size=0, max_size=268435456)
+        """
+
+        self.max_size = max_size
+
+        self.hits = self.misses = self.evictions = 0
+
+        self._entries = collections.OrderedDict()  # key -> (mtime, data, size)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _pop(self, key):
+        _, _, size = self._entries.pop(key)
+        self._size -= size
+
+    def get(self, key, mtime):
+        """
+        Gets (a copy of) the cached data of a file.
+
+        :param key: The key of the data, e.g. the class fetching the data and the pathname
+            of its file.
+        :type key: typing.Hashable
+        :param mtime: The current modification time of the file.
+        :type mtime: int | float | None
+        :return: A copy of the cached data, or ``None`` if it is not cached or the file has
+            been modified since it was cached.
+        :rtype: typing.Any
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or mtime is None or entry[0] != mtime:
+                if entry is not None:
+                    self._pop(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            data = entry[1]
+
+        return _copy(data)
+
+    def put(self, key, data, mtime):
+        """
+        Caches the data of a file, dropping the least recently used data if needed.
+
+        The data is cached as it is, so it should not be modified by the caller afterwards.
+        Data that is larger than the cache is not cached at all.
+
+        :param key: The key of the data (see :meth:`~pyrcs.cache.DataCache.get`).
+        :type key: typing.Hashable
+        :param data: The data loaded from the file.
+        :type data: typing.Any
+        :param mtime: The modification time of the file from which the data is loaded.
+        :type mtime: int | float | None
+        :return: Whether the data is cached.
+        :rtype: bool
+        """
+
+        if mtime is None or data is None or self.max_size <= 0:
+            return False
+
+        size = _estimate_size(data)
+
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+            if size > self.max_size:
+                return False
+
+            self._entries[key] = (mtime, data, size)
+            self._size += size
+
+            self._evict()
+
+        return True
+
+    def _evict(self):
+        while self._size > self.max_size and self._entries:
+            self._pop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, key=None):
+        """
+        Drops the cached data whose key is, or starts with, a given key.
+
+        :param key: The key (e.g. ``(class_name, path_to_file)``), or the first items of
+            the keys (as a tuple), of the data to drop; defaults to ``None`` (i.e. all data).
+        :type key: typing.Hashable | None
+        """
+
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._size = 0
+                return None
+
+            for k in list(self._entries):
+                if k == key or (
+                        isinstance(k, tuple) and isinstance(key, tuple) and k[:len(key)] == key):
+                    self._pop(k)
+
+    def resize(self, max_size):
+        """
+        Changes the size of the cache, dropping the least recently used data if needed.
+
+        :param max_size: Maximum total (estimated) size (in bytes) of the cached data.
+        :type max_size: int
+        """
+
+        with self._lock:
+            self.max_size = max_size
+            evictions = self.evictions
+            self._evict()
+            self.evictions = evictions  # Not counted as evictions due to the use of the cache
+
+    def info(self):
+        """
+        Gets the statistics of the cache.
+
+        :return: The numbers of hits, misses and evictions, the number of entries,
+            the total (estimated) size of the cached data and the size of the cache.
+        :rtype: CacheInfo
+        """
+
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits, misses=self.misses, evictions=self.evictions,
+                entries=len(self._entries), size=self._size, max_size=self.max_size)
+
+
+#: The cache of the data loaded by the classes of the package.
+data_cache = DataCache()
+
+
+def cache_info():
+    """
+    Gets the statistics of the cache of the data loaded from the data files.
+
+    :return: The numbers of hits, misses and evictions, the number of entries,
+        the total (estimated) size of the cached data and the size of the cache.
+    :rtype: CacheInfo
+
+    **Examples**::
+
+        >>> from pyrcs.cache import cache_info
+        >>> from pyrcs.line_data import ELRMileages
+        >>> em = ELRMileages()
+        >>> _ = em.fetch_mileage_file('AAM')
+        >>> _ = em.fetch_mileage_file('AAM')
+        >>> info = cache_info()
+        >>> info.hits, info.misses
+        (1, 1)
+    """
+
+    return data_cache.info()
+
+
+def clear_cache():
+    """
+    Drops all the data from the cache of the data loaded from the data files.
+    """
+
+    data_cache.invalidate()
+
+
+def set_cache_size(max_size):
+    """
+    Sets the size of the cache of the data loaded from the data files.
+
+    :param max_size: Maximum total (estimated) size (in bytes) of the cached data;
+        if ``max_size=0``, no data is cached.
+    :type max_size: int
+
+    **Examples**::
+
+        >>> from pyrcs.cache import set_cache_size, cache_info
+        >>> set_cache_size(64 * 2 ** 20)
+        >>> cache_info().max_size
+        67108864
+    """
+
+    data_cache.resize(max_size)
@@ -8,18 +8,56 @@ Collects data of railway codes.
     `other assets <http://www.railwaycodes.org.uk/otherassetsmenu.shtm>`_.
 """
 
+import importlib
+import threading
 import time
 
+import pandas as pd
 from pyhelpers.ops import confirmed
 
-from .line_data import Bridges, ELRMileages, Electrification, LOR, LineNames, LocationIdentifiers, \
-    TrackDiagrams
-from .other_assets import Buzzer, Depots, Features, HabdWild, SignalBoxes, Stations, Telegraph, \
-    Tunnels, Viaducts, WaterTroughs
+from ._base import _update_report, incremental_update
 from .parser import get_category_menu
+from .transport import is_reparsing, reparsing
 from .utils import is_homepage_connectable, print_connection_warning, print_instance_connection_error
 
 
+class _Collector:
+    """
+    A descriptor that creates an instance of a collector class on first access.
+
+    The class is imported from its module (e.g. ``'.line_data'``) only when it is first accessed.
+    The instance is then stored in the owner instance's ``__dict__``, so that it is created only
+    once and subsequent access bypasses the descriptor.
+    """
+
+    def __init__(self, module, class_name):
+        """
+        :param module: Name of the module (relative to the package) of the collector class.
+        :type module: str
+        :param class_name: Name of the collector class.
+        :type class_name: str
+        """
+
+        self.module = module
+        self.class_name = class_name
+
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        with self._lock:  # So that concurrent first access creates only one instance
+            if self.name not in instance.__dict__:
+                cls = getattr(importlib.import_module(self.module, __package__), self.class_name)
+                instance.__dict__[self.name] = cls(**instance.cls_init_kwargs)
+
+            return instance.__dict__[self.name]
+
+
 class _Base:
     #: The name of the data.
     NAME: str = 'Railway Codes and other data'
@@ -34,10 +72,75 @@ class _Base:
 
         self.cls_init_kwargs = {'update': update, 'verbose': verbose}
 
+        # Discard any previously created collectors so that they are re-created on next access
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, _Collector):
+                self.__dict__.pop(name, None)
+
         self.catalogue = get_category_menu(
             self.NAME, update=update, confirmation_required=False, verbose=verbose,
             raise_error=raise_error)
 
+    @staticmethod
+    def _make_pause(interval):
+        """
+        Makes a function that pauses between the updating of different classes.
+
+        Within an incremental update (see :func:`~pyrcs._base.incremental_update`), no pause is
+        made if no page has been collected again since the last one.
+
+        :param interval: A time gap (in seconds) of each pause.
+        :type interval: int | float
+        :return: The function that pauses.
+        :rtype: typing.Callable
+        """
+
+        report = _update_report.get()
+        checked = [0]  # The number of the pages checked (in the report) before the last pause
+
+        def pause():
+            if report is not None:
+                recollected = any(x['Updated'] for x in report[checked[0]:])
+                checked[0] = len(report)
+
+                if not recollected:
+                    return
+
+            time.sleep(interval)
+
+        return pause
+
+    @staticmethod
+    def _summarise_update(report, verbose=False):
+        """
+        Summarises the pages checked by an incremental update.
+
+        :param report: Records of the pages checked
+            (see :func:`~pyrcs._base.incremental_update`).
+        :type report: list[dict]
+        :param verbose: Whether to print the updated pages to the console; defaults to ``False``.
+        :type verbose: bool | int
+        :return: A report of the pages checked.
+        :rtype: pandas.DataFrame
+        """
+
+        columns = ['Data', 'Initial', 'Stored date', 'Remote date', 'Updated']
+        update_report = pd.DataFrame(report, columns=columns).sort_values(
+            ['Data', 'Initial'], ignore_index=True)
+
+        if verbose:
+            updated = update_report[update_report['Updated']]
+
+            if updated.empty:
+                print("\nNo pages have been updated.")
+            else:
+                print("\nUpdated pages:")
+                for data_name, initials in updated.groupby('Data')['Initial']:
+                    initials_ = ', '.join(initials.dropna())  # None for data not organised by A-Z
+                    print(f"  {data_name}: {initials_}" if initials_ else f"  {data_name}")
+
+        return update_report
+
 
 class LineData(_Base):
     """
@@ -50,6 +153,15 @@ class LineData(_Base):
     #: The name of the data.
     NAME: str = 'Line data'
 
+    # Relevant classes (each of which is instantiated on first access)
+    ELRMileages = _Collector('.line_data', 'ELRMileages')
+    Electrification = _Collector('.line_data', 'Electrification')
+    LocationIdentifiers = _Collector('.line_data', 'LocationIdentifiers')
+    LOR = _Collector('.line_data', 'LOR')
+    LineNames = _Collector('.line_data', 'LineNames')
+    TrackDiagrams = _Collector('.line_data', 'TrackDiagrams')
+    Bridges = _Collector('.line_data', 'Bridges')
+
     def __init__(self, update=False, verbose=True, raise_error=False):
         """
         :param update: Whether to check for updates to the catalogue; defaults to ``False``.
@@ -73,6 +185,10 @@ class LineData(_Base):
             An instance of the :class:`~trk_diagr.TrackDiagrams` class.
         :ivar Bridges Bridges: An instance of the :py:class:`~bridge.Bridges` class.
 
+        .. note::
+
+            The instances of the relevant classes are created only when they are first accessed.
+
         **Examples**::
 
             >>> from pyrcs import LineData
@@ -115,16 +231,8 @@ class LineData(_Base):
 
         super().__init__(update=update, verbose=verbose, raise_error=raise_error)
 
-        # Relevant classes
-        self.ELRMileages = ELRMileages(**self.cls_init_kwargs)
-        self.Electrification = Electrification(**self.cls_init_kwargs)
-        self.LocationIdentifiers = LocationIdentifiers(**self.cls_init_kwargs)
-        self.LOR = LOR(**self.cls_init_kwargs)
-        self.LineNames = LineNames(**self.cls_init_kwargs)
-        self.TrackDiagrams = TrackDiagrams(**self.cls_init_kwargs)
-        self.Bridges = Bridges(**self.cls_init_kwargs)
-
-    def update(self, confirmation_required=True, verbose=False, interval=5, init_update=False):
+    def update(self, confirmation_required=True, verbose=False, interval=5, init_update=False,
+               reparse=False, incremental=False):
         """
         Updates the pre-packed `line data`_.
 
@@ -136,11 +244,23 @@ class LineData(_Base):
         :param verbose: Whether to print relevant information to the console; defaults to ``False``.
         :type verbose: bool | int
         :param interval: A time gap (in seconds) between the updating of different classes,
-            defaults to ``5``
+            defaults to ``5``; with ``incremental=True``, it is skipped after a class of which
+            no page has been collected again.
         :type interval: int or float
         :param init_update: Whether to update the data for each subclass when being instantiated,
             defaults to ``False``
         :type init_update: bool
+        :param reparse: Whether to rebuild the data from the cached raw responses
+            (see :class:`~pyrcs.transport.ResponseCache`) without any network traffic;
+            defaults to ``False``.
+        :type reparse: bool
+        :param incremental: Whether to collect again only the data whose web pages have been
+            updated since it was last collected, by comparing their last update dates
+            (see :func:`~pyrcs._base.incremental_update`); defaults to ``False``.
+        :type incremental: bool
+        :return: When ``incremental=True``, a report of the pages checked, including their stored
+            and remote last update dates and whether they have been collected again.
+        :rtype: pandas.DataFrame | None
 
         **Examples**::
 
@@ -149,7 +269,21 @@ class LineData(_Base):
             >>> ld.update(verbose=True)
         """
 
-        if not self.connected:
+        if reparse:
+            with reparsing():
+                return self.update(
+                    confirmation_required=confirmation_required, verbose=verbose, interval=0,
+                    init_update=init_update, incremental=incremental)
+
+        if incremental:
+            with incremental_update() as report:
+                self.update(
+                    confirmation_required=confirmation_required, verbose=verbose,
+                    interval=interval, init_update=init_update)
+
+            return self._summarise_update(report, verbose=verbose)
+
+        if not (self.connected or is_reparsing()):
             print_instance_connection_error(verbose=verbose)
 
         else:
@@ -159,25 +293,26 @@ class LineData(_Base):
                     self.__init__(update=init_update)
 
                 update_args = {'update': True, 'verbose': verbose}
+                pause = self._make_pause(interval)
 
                 # ELR and mileages
                 print(f"\n{self.ELRMileages.NAME}:")
                 _ = self.ELRMileages.fetch_elr(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Electrification
                 print(f"\n{self.Electrification.NAME}:")
                 _ = self.Electrification.get_independent_lines_catalogue(**update_args)
                 _ = self.Electrification.fetch_codes(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Location
                 print(f"\n{self.LocationIdentifiers.NAME}:")
                 _ = self.LocationIdentifiers.fetch_codes(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Line of routes
                 print(f"\n{self.LOR.NAME}:")
@@ -187,19 +322,19 @@ class LineData(_Base):
                 _ = self.LOR.fetch_codes(**update_args)
                 _ = self.LOR.fetch_elr_lor_converter(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Line names
                 print(f"\n{self.LineNames.NAME}:")
                 _ = self.LineNames.fetch_codes(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Track diagrams
                 print(f"\n{self.TrackDiagrams.NAME}:")
                 _ = self.TrackDiagrams.fetch_catalogue(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Bridges
                 print(f"\n{self.Bridges.NAME}:")
@@ -217,6 +352,18 @@ class OtherAssets(_Base):
     #: The name of the data.
     NAME: str = 'Other assets'
 
+    # Relevant classes (each of which is instantiated on first access)
+    SignalBoxes = _Collector('.other_assets', 'SignalBoxes')
+    Tunnels = _Collector('.other_assets', 'Tunnels')
+    Viaducts = _Collector('.other_assets', 'Viaducts')
+    Stations = _Collector('.other_assets', 'Stations')
+    Depots = _Collector('.other_assets', 'Depots')
+    HabdWild = _Collector('.other_assets', 'HabdWild')
+    WaterTroughs = _Collector('.other_assets', 'WaterTroughs')
+    Telegraph = _Collector('.other_assets', 'Telegraph')
+    Buzzer = _Collector('.other_assets', 'Buzzer')
+    Features = _Collector('.other_assets', 'Features')
+
     def __init__(self, update=False, verbose=True, raise_error=False):
         """
         :param update: Whether to check for updates to the catalogue; defaults to ``False``.
@@ -240,6 +387,10 @@ class OtherAssets(_Base):
         :ivar Telegraph Telegraph: An instance of the :class:`~telegraph.Telegraph` class.
         :ivar Buzzer Buzzer: An instance of the :class:`~buzzer.Buzzer` class.
 
+        .. note::
+
+            The instances of the relevant classes are created only when they are first accessed.
+
         **Examples**::
 
             >>> from pyrcs import OtherAssets
@@ -282,19 +433,8 @@ class OtherAssets(_Base):
 
         super().__init__(update=update, verbose=verbose, raise_error=raise_error)
 
-        # Relevant classes
-        self.SignalBoxes = SignalBoxes(**self.cls_init_kwargs)
-        self.Tunnels = Tunnels(**self.cls_init_kwargs)
-        self.Viaducts = Viaducts(**self.cls_init_kwargs)
-        self.Stations = Stations(**self.cls_init_kwargs)
-        self.Depots = Depots(**self.cls_init_kwargs)
-        self.HabdWild = HabdWild(**self.cls_init_kwargs)
-        self.WaterTroughs = WaterTroughs(**self.cls_init_kwargs)
-        self.Telegraph = Telegraph(**self.cls_init_kwargs)
-        self.Buzzer = Buzzer(**self.cls_init_kwargs)
-        self.Features = Features(**self.cls_init_kwargs)
-
-    def update(self, confirmation_required=True, verbose=False, interval=5, init_update=False):
+    def update(self, confirmation_required=True, verbose=False, interval=5, init_update=False,
+               reparse=False, incremental=False):
         """
         Updates the pre-packed data of the `other assets`_.
 
@@ -306,11 +446,23 @@ class OtherAssets(_Base):
         :param verbose: Whether to print relevant information to the console; defaults to ``False``.
         :type verbose: bool | int
         :param interval: A time gap (in seconds) between the updating of different classes,
-            defaults to ``5``
+            defaults to ``5``; with ``incremental=True``, it is skipped after a class of which
+            no page has been collected again.
         :type interval: int or float
         :param init_update: Whether to update the data for each subclass when being instantiated,
             defaults to ``False``
         :type init_update: bool
+        :param reparse: Whether to rebuild the data from the cached raw responses
+            (see :class:`~pyrcs.transport.ResponseCache`) without any network traffic;
+            defaults to ``False``.
+        :type reparse: bool
+        :param incremental: Whether to collect again only the data whose web pages have been
+            updated since it was last collected, by comparing their last update dates
+            (see :func:`~pyrcs._base.incremental_update`); defaults to ``False``.
+        :type incremental: bool
+        :return: When ``incremental=True``, a report of the pages checked, including their stored
+            and remote last update dates and whether they have been collected again.
+        :rtype: pandas.DataFrame | None
 
         **Examples**::
 
@@ -319,7 +471,21 @@ class OtherAssets(_Base):
             >>> oa.update(verbose=True)
         """
 
-        if not self.connected:
+        if reparse:
+            with reparsing():
+                return self.update(
+                    confirmation_required=confirmation_required, verbose=verbose, interval=0,
+                    init_update=init_update, incremental=incremental)
+
+        if incremental:
+            with incremental_update() as report:
+                self.update(
+                    confirmation_required=confirmation_required, verbose=verbose,
+                    interval=interval, init_update=init_update)
+
+            return self._summarise_update(report, verbose=verbose)
+
+        if not (self.connected or is_reparsing()):
             print_instance_connection_error(verbose=verbose)
 
         else:
@@ -329,6 +495,7 @@ class OtherAssets(_Base):
                     self.__init__(update=init_update)
 
                 update_args = {'update': True, 'verbose': verbose}
+                pause = self._make_pause(interval)
 
                 # Signal boxes
                 print(f"\n{self.SignalBoxes.NAME}:")
@@ -338,32 +505,32 @@ class OtherAssets(_Base):
                 _ = self.SignalBoxes.fetch_wr_mas_dates(**update_args)
                 _ = self.SignalBoxes.fetch_bell_codes(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Tunnels
                 print(f"\n{self.Tunnels.NAME}:")
                 _ = self.Tunnels.fetch_codes(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Viaducts
                 print(f"\n{self.Viaducts.NAME}:")
                 _ = self.Viaducts.fetch_codes(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Stations
                 print(f"\n{self.Stations.NAME}:")
                 _ = self.Stations.fetch_catalogue(**update_args)
                 _ = self.Stations.fetch_locations(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Depots
                 print(f"\n{self.Depots.NAME}:")
                 _ = self.Depots.fetch_codes(**update_args)
 
-                time.sleep(interval)
+                pause()
 
                 # Features
                 print(f"\n{self.Features.NAME}:")
@@ -3,6 +3,7 @@ Converts data to a certain format.
 """
 
 import copy
+import functools
 import numbers
 
 import numpy as np
@@ -393,3 +394,416 @@ def kilometer_to_yard(km):
     yards = np.nan if km is None else float(km) * 1093.6132983377079
 
     return yards
+
+
+# == Convert arrays of mileage data ================================================================
+
+
+def _as_1d_array(data):
+    # The values of a sequence (e.g. a list, numpy.ndarray or pandas.Series) as a 1-d array,
+    # in which strings are Python objects
+    if isinstance(data, pd.Series):
+        values = data.to_numpy()
+    else:  # Not to turn e.g. ['0.0396', 10] into an array of strings
+        values = data if isinstance(data, np.ndarray) else np.asarray(data, dtype=object)
+
+    if values.dtype.kind not in 'iuf':
+        values = values.astype(object)
+        # e.g. [396, None, 1760] (as numbers, with NaN for None)
+        if pd.api.types.infer_dtype(values) in {'integer', 'floating', 'mixed-integer-float'}:
+            values = values.astype(np.float64)
+
+    return values.reshape(-1)
+
+
+def _like_input(values, data):
+    # A pandas.Series (with the index and name of the input) if the input is one
+    if isinstance(data, pd.Series):
+        return pd.Series(values, index=data.index, name=data.name)
+
+    return values
+
+
+def _is_blank(values):
+    # None, NaN or '' (for which the scalar converters return a blank value)
+    is_blank = pd.isna(values)
+    if values.dtype == object:
+        is_blank |= values == ''
+
+    return is_blank
+
+
+def _split_mileage_strs(values):
+    # For each string of the usual form of <miles>.<yards> (or <miles>.<chains>), e.g. '-1.0396',
+    # the miles and the yards (or chains) as float() would parse them, e.g. -1.0 and 396.0.
+    # The strings are read as arrays of their characters (i.e. code points), so that both the
+    # checking of the form and the parsing of the digits are done without a loop over the strings
+    n = len(values)
+    is_mileage_str, miles, yards = np.zeros(n, dtype=bool), np.zeros(n), np.zeros(n)
+
+    is_str = ~_is_blank(values)
+    if pd.api.types.infer_dtype(values[is_str]) != 'string':  # Not all the values are strings
+        is_str[is_str] = [isinstance(x, str) for x in values[is_str]]
+    lengths = np.zeros(n, dtype=np.int64)
+    lengths[is_str] = np.fromiter(map(len, values[is_str]), dtype=np.int64, count=is_str.sum())
+    is_candidate = (lengths >= 3) & (lengths <= 14)  # From '0.0' to '-999999.999999'
+    if not is_candidate.any():
+        return is_mileage_str, miles, yards
+
+    lengths = lengths[is_candidate]
+    chars = values[is_candidate].astype(str)
+    # One row for each position of the characters (and a column for each string)
+    chars = np.ascontiguousarray(chars.view(np.uint32).reshape(len(chars), -1).T)
+
+    is_neg = chars[0] == 45  # i.e. '-'
+    is_valid, is_after_dot = np.ones(len(lengths), dtype=bool), np.zeros(len(lengths), dtype=bool)
+    n_dots, n_miles_digits, n_yards_digits, miles_, yards_ = np.zeros((5, len(lengths)), np.int64)
+
+    # Read the digits position by position (i.e. from the left), on either side of the '.'
+    for i, c in enumerate(chars):
+        is_digit, is_dot = (c >= 48) & (c <= 57), c == 46  # i.e. '0'-'9' and '.'
+        is_valid &= is_digit | is_dot | (i >= lengths) | (is_neg if i == 0 else False)
+        n_dots += is_dot
+
+        digit = c.astype(np.int64) - 48
+        is_miles_digit, is_yards_digit = is_digit & ~is_after_dot, is_digit & is_after_dot
+        miles_ = np.where(is_miles_digit, miles_ * 10 + digit, miles_)
+        yards_ = np.where(is_yards_digit, yards_ * 10 + digit, yards_)
+        n_miles_digits += is_miles_digit
+        n_yards_digits += is_yards_digit
+
+        is_after_dot |= is_dot
+
+    is_mileage_str[is_candidate] = is_valid & (n_dots == 1) & (n_miles_digits >= 1) & \
+        (n_miles_digits <= 6) & (n_yards_digits >= 1) & (n_yards_digits <= 6)
+
+    miles[is_candidate] = np.where(is_neg, -miles_, miles_)
+    yards[is_candidate] = yards_
+
+    return is_mileage_str, miles, yards
+
+
+def _mileage_data_as_str(data):
+    # The values as the strings of str(), at the '.' of which mile_chain_to_mileage() and
+    # mileage_to_mile_chain() split them, e.g. 1.05 as '1.05'; integers are not turned into
+    # floats (as by _as_1d_array()), e.g. 395437 as '395437', for which (having no '.') the scalar
+    # converters raise an error
+    if isinstance(data, pd.Series):
+        values = data.to_numpy()
+    else:
+        values = data if isinstance(data, np.ndarray) else np.asarray(data, dtype=object)
+    values = values.reshape(-1)
+
+    if values.dtype.kind in 'iuf':
+        strs = values.astype(str).astype(object)
+        if values.dtype.kind == 'f':
+            strs[np.isnan(values)] = np.nan
+        return strs
+
+    values = values.astype(object)  # A copy, in which the numbers are replaced by strings
+    if pd.api.types.infer_dtype(values) != 'string':
+        is_num = ~_is_blank(values)
+        is_num[is_num] = [not isinstance(x, str) for x in values[is_num]]
+        values[is_num] = [str(x) for x in values[is_num]]
+
+    return values
+
+
+def _round(values, ndigits):
+    # The same as the built-in round() for each value; only the values that are (nearly) halfway
+    # between two roundings, which numpy.round() may round the other way, are rounded one by one
+    rounded = np.round(values, ndigits)
+
+    scaled = values * 10 ** ndigits
+    is_ambiguous = ~(np.abs(scaled) < 1e9) | (
+        np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6)
+    if is_ambiguous.any():
+        rounded[is_ambiguous] = [round(x, ndigits) for x in values[is_ambiguous].tolist()]
+
+    return rounded
+
+
+def _convert_array(data, convert, scalar_func, fill_value, dtype=object):
+    # Convert the values with convert(), which returns whether each value is regular (i.e. of
+    # a form it works with) and the converted regular values; leave the blank values as fill_value
+    # and fall back to the scalar converter for the other (rare) irregular values
+    values = _as_1d_array(data)
+
+    converted = np.full(len(values), fill_value, dtype=dtype)
+
+    is_regular, converted_regular = convert(values)
+    converted[is_regular] = converted_regular
+
+    irregular = ~is_regular & ~_is_blank(values)
+    if irregular.any():
+        converted[irregular] = [scalar_func(x) for x in values[irregular]]
+
+    return _like_input(converted, data)
+
+
+def yards_to_mileages(yards, as_str=True):
+    """
+    Converts an array of yards to mileages.
+
+    This is the array version of :func:`~pyrcs.converter.yard_to_mileage`, with which
+    the results are identical.
+
+    :param yards: The yard data; blank values (``None``, ``NaN`` or ``''``) are allowed.
+    :type yards: list | numpy.ndarray | pandas.Series
+    :param as_str: Whether to return string values; defaults to ``True``.
+    :type as_str: bool
+    :return: The mileages in the form of *<miles>.<yards>*, with ``''`` (or ``NaN`` when
+        ``as_str=False``) for the blank values; a pandas.Series if ``yards`` is one.
+    :rtype: numpy.ndarray | pandas.Series
+
+    **Examples**::
+
+        >>> from pyrcs.converter import yards_to_mileages
+        >>> yards_to_mileages(yards=[396, None, 1760, 12330])
+        array(['0.0396', '', '1.0000', '7.0010'], dtype=object)
+        >>> yards_to_mileages(yards=[396, None, 1760, 12330], as_str=False)
+        array([0.0396,    nan, 1.    , 7.001 ])
+    """
+
+    def _yards_to_mileages(values):
+        if values.dtype == object:  # e.g. strings, which are left to yard_to_mileage()
+            return np.zeros(len(values), dtype=bool), []
+
+        is_regular = np.isfinite(values)
+        yds = np.trunc(values[is_regular]).astype(np.int64)  # As int() does
+
+        miles = np.floor(yds / 1760)
+        yds = yds - (miles * 1760).astype(np.int64)
+        miles[yds == 1760] += 1
+        yds[yds == 1760] = 0
+
+        mileages = miles + _round(yds / (10 ** 4), 4)
+        if as_str:
+            mileages = ['%.4f' % x for x in mileages.tolist()]
+
+        return is_regular, mileages
+
+    mileages = _convert_array(
+        yards, convert=_yards_to_mileages,
+        scalar_func=functools.partial(yard_to_mileage, as_str=as_str),
+        fill_value='' if as_str else np.nan, dtype=object if as_str else np.float64)
+
+    return mileages
+
+
+def mileages_to_yards(mileages):
+    """
+    Converts an array of mileages to yards.
+
+    This is the array version of :func:`~pyrcs.converter.mileage_to_yard`, with which
+    the results are identical, except that blank values (``None``, ``NaN`` or ``''``) give ``NaN``,
+    whereas :func:`~pyrcs.converter.mileage_to_yard` raises an error for them.
+
+    :param mileages: The mileages (used by Network Rail), either numbers or strings in the form of
+        *<miles>.<yards>*; blank values (``None``, ``NaN`` or ``''``) are allowed.
+    :type mileages: list | numpy.ndarray | pandas.Series
+    :return: The corresponding yards, as integers if there is no blank value and otherwise as
+        floats (with ``NaN`` for the blank values); a pandas.Series if ``mileages`` is one.
+    :rtype: numpy.ndarray | pandas.Series
+
+    **Examples**::
+
+        >>> from pyrcs.converter import mileages_to_yards
+        >>> mileages_to_yards(mileages=['0.0396', '1.0396'])
+        array([ 396, 2156])
+        >>> mileages_to_yards(mileages=[0.0396, 1.0396, None])
+        array([ 396., 2156.,   nan])
+    """
+
+    def _mileages_to_yards(values):
+        if values.dtype == object:
+            is_regular, miles, yds = _split_mileage_strs(values)
+            miles, yds = miles[is_regular], yds[is_regular]
+
+        else:  # As the strings of mileage_num_to_str(), e.g. -1.0396 as '-1.0396'
+            is_regular = np.isfinite(values)
+            mileage_nums = np.rint(_round(values[is_regular], 4) * 10 ** 4)
+            miles = np.trunc(mileage_nums / 10 ** 4)
+            yds = np.abs(mileage_nums - miles * 10 ** 4)
+
+        return is_regular, yds + np.trunc(miles * 1760)
+
+    yards = _convert_array(
+        mileages, convert=_mileages_to_yards, scalar_func=mileage_to_yard, fill_value=np.nan,
+        dtype=np.float64)
+
+    if not np.isnan(yards).any():
+        yards = yards.astype(np.int64)
+
+    return yards
+
+
+def mile_chains_to_mileages(mile_chains):
+    """
+    Converts an array of *<miles>.<chains>* to *<miles>.<yards>*.
+
+    This is the array version of :func:`~pyrcs.converter.mile_chain_to_mileage`, with which
+    the results (and the errors, e.g. for integers, which have no ``'.'``) are identical.
+
+    :param mile_chains: Mileage data presented in the form of *<miles>.<chains>*;
+        blank values (``None``, ``NaN`` or ``''``) are allowed.
+    :type mile_chains: list | numpy.ndarray | pandas.Series
+    :return: The corresponding mileages in the form of *<miles>.<yards>*, with ``''`` for
+        the blank values; a pandas.Series if ``mile_chains`` is one.
+    :rtype: numpy.ndarray | pandas.Series
+
+    **Examples**::
+
+        >>> from pyrcs.converter import mile_chains_to_mileages
+        >>> mile_chains_to_mileages(mile_chains=['0.18', None, '84.62'])
+        array(['0.0396', '', '84.1364'], dtype=object)
+    """
+
+    def _mile_chains_to_mileages(values):
+        is_regular, miles, chains = _split_mileage_strs(values)
+        yds = chains[is_regular] * 22.0
+        mileages_ = miles[is_regular] + _round(yds / (10 ** 4), 4)
+        return is_regular, ['%.4f' % x for x in mileages_.tolist()]
+
+    mileages = _convert_array(
+        _mileage_data_as_str(mile_chains), convert=_mile_chains_to_mileages,
+        scalar_func=mile_chain_to_mileage, fill_value='')
+
+    return _like_input(mileages, mile_chains)
+
+
+def mileages_to_mile_chains(mileages):
+    """
+    Converts an array of *<miles>.<yards>* to *<miles>.<chains>*.
+
+    This is the array version of :func:`~pyrcs.converter.mileage_to_mile_chain`, with which
+    the results (and the errors, e.g. for integers, which have no ``'.'``) are identical.
+
+    :param mileages: The mileage data presented in the form of *<miles>.<yards>*;
+        blank values (``None``, ``NaN`` or ``''``) are allowed.
+    :type mileages: list | numpy.ndarray | pandas.Series
+    :return: The corresponding mileages presented in the form of *<miles>.<chains>*, with ``''``
+        for the blank values; a pandas.Series if ``mileages`` is one.
+    :rtype: numpy.ndarray | pandas.Series
+
+    **Examples**::
+
+        >>> from pyrcs.converter import mileages_to_mile_chains
+        >>> mileages_to_mile_chains(mileages=['0.0396', 1.0396, None])
+        array(['0.18', '1.18', ''], dtype=object)
+    """
+
+    def _mileages_to_mile_chains(values):
+        is_regular, miles, yds = _split_mileage_strs(values)
+        chains = yds[is_regular] / 22.0
+        mile_chains_ = miles[is_regular] + _round(chains / (10 ** 2), 2)
+        return is_regular, ['%.2f' % x for x in mile_chains_.tolist()]
+
+    mile_chains = _convert_array(
+        _mileage_data_as_str(mileages), convert=_mileages_to_mile_chains,
+        scalar_func=mileage_to_mile_chain, fill_value='')
+
+    return _like_input(mile_chains, mileages)
+
+
+def mileage_strs_to_nums(mileages):
+    """
+    Converts an array of string-type mileages to their corresponding numerical values.
+
+    This is the array version of :func:`~pyrcs.converter.mileage_str_to_num`, with which
+    the results are identical, except that ``None`` gives ``NaN``, whereas
+    :func:`~pyrcs.converter.mileage_str_to_num` raises an error for it.
+
+    :param mileages: The string-type mileage data in the form of *<miles>.<yards>*;
+        blank values (``None``, ``NaN`` or ``''``) are allowed.
+    :type mileages: list | numpy.ndarray | pandas.Series
+    :return: The corresponding numerical-type mileages, with ``NaN`` for the blank values;
+        a pandas.Series if ``mileages`` is one.
+    :rtype: numpy.ndarray | pandas.Series
+
+    **Examples**::
+
+        >>> from pyrcs.converter import mileage_strs_to_nums
+        >>> mileage_strs_to_nums(mileages=['0.0396', '', '10.1500'])
+        array([ 0.0396,     nan, 10.15  ])
+    """
+
+    def _mileage_strs_to_nums(values):
+        is_regular = ~_is_blank(values)  # float() raises an error for any other irregular value
+        return is_regular, _round(values[is_regular].astype(np.float64), 4)
+
+    mileage_nums = _convert_array(
+        mileages, convert=_mileage_strs_to_nums, scalar_func=mileage_str_to_num,
+        fill_value=np.nan, dtype=np.float64)
+
+    return mileage_nums
+
+
+def shift_mileages_by_yard(mileages, shift_yards, as_numeric=True):
+    """
+    Shifts an array of mileages by specified numbers of yards.
+
+    This is the array version of :func:`~pyrcs.converter.shift_mileage_by_yard`, with which
+    the results are identical, except that blank values (``None``, ``NaN`` or ``''``) give ``NaN``
+    (or ``''``), whereas :func:`~pyrcs.converter.shift_mileage_by_yard` raises an error for them.
+
+    :param mileages: The initial mileages (associated with ELRs); blank values (``None``, ``NaN``
+        or ``''``) are allowed.
+    :type mileages: list | numpy.ndarray | pandas.Series
+    :param shift_yards: The number(s) of yards by which to shift the given mileages.
+    :type shift_yards: int | float | list | numpy.ndarray | pandas.Series
+    :param as_numeric: If ``True``, returns the results as numeric values; defaults to ``True``.
+    :type as_numeric: bool
+    :return: The mileages shifted by the specified numbers of yards, with ``NaN`` (or ``''``
+        when ``as_numeric=False``) for the blank values; a pandas.Series if ``mileages`` is one.
+    :rtype: numpy.ndarray | pandas.Series
+
+    **Examples**::
+
+        >>> from pyrcs.converter import shift_mileages_by_yard
+        >>> shift_mileages_by_yard(mileages=['0.0396', '0.0396', 10], shift_yards=[220, 221, 220])
+        array([ 0.0616,  0.0617, 10.022 ])
+        >>> shift_mileages_by_yard(mileages=['0.0396', None], shift_yards=221, as_numeric=False)
+        array(['0.0617', ''], dtype=object)
+    """
+
+    yards = mileages_to_yards(mileages=mileages) + np.asarray(shift_yards)
+    shifted_mileages = yards_to_mileages(yards=yards)
+
+    if as_numeric:
+        shifted_mileages = mileage_strs_to_nums(mileages=shifted_mileages)
+
+    return shifted_mileages
+
+
+def kilometers_to_yards(km):
+    """
+    Converts an array of distances from kilometres to yards.
+
+    This is the array version of :func:`~pyrcs.converter.kilometer_to_yard`, with which
+    the results are identical, except that ``''`` gives ``NaN``, whereas
+    :func:`~pyrcs.converter.kilometer_to_yard` raises an error for it.
+
+    :param km: The distances in kilometres to convert; blank values (``None``, ``NaN`` or ``''``)
+        are allowed.
+    :type km: list | numpy.ndarray | pandas.Series
+    :return: The equivalent distances in yards, with ``NaN`` for the blank values;
+        a pandas.Series if ``km`` is one.
+    :rtype: numpy.ndarray | pandas.Series
+
+    **Examples**::
+
+        >>> from pyrcs.converter import kilometers_to_yards
+        >>> kilometers_to_yards([1, None, '0.5'])
+        array([1093.61329834,           nan,  546.80664917])
+    """
+
+    def _kilometers_to_yards(values):
+        is_regular = ~_is_blank(values)
+        return is_regular, values[is_regular].astype(np.float64) * 1093.6132983377079
+
+    yards = _convert_array(
+        km, convert=_kilometers_to_yards, scalar_func=kilometer_to_yard, fill_value=np.nan,
+        dtype=np.float64)
+
+    return yards
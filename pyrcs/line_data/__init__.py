@@ -4,13 +4,17 @@ A subpackage for collecting codes of `line data <http://www.railwaycodes.org.uk/
 (See also the :py:class:`~pyrcs.collector.LineData` class.)
 """
 
-from .bridge import Bridges
-from .elec import Electrification
-from .elr_mileage import ELRMileages
-from .line_name import LineNames
-from .loc_id import LocationIdentifiers
-from .lor_code import LOR
-from .trk_diagr import TrackDiagrams
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .bridge import Bridges
+    from .elec import Electrification
+    from .elr_mileage import ELRMileages
+    from .line_name import LineNames
+    from .loc_id import LocationIdentifiers
+    from .lor_code import LOR
+    from .trk_diagr import TrackDiagrams
 
 __all__ = [
     'elr_mileage', 'ELRMileages',
@@ -21,3 +25,30 @@ __all__ = [
     'trk_diagr', 'TrackDiagrams',
     'bridge', 'Bridges',
 ]
+
+# The modules and classes are imported on first access (PEP 562).
+_CLASSES = {
+    'Bridges': 'bridge',
+    'Electrification': 'elec',
+    'ELRMileages': 'elr_mileage',
+    'LineNames': 'line_name',
+    'LocationIdentifiers': 'loc_id',
+    'LOR': 'lor_code',
+    'TrackDiagrams': 'trk_diagr',
+}
+
+
+def __getattr__(name):
+    if name in _CLASSES.values():
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name in _CLASSES:
+        cls = getattr(importlib.import_module(f'.{_CLASSES[name]}', __name__), name)
+        globals()[name] = cls  # Cache it so that this function is bypassed next time
+        return cls
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,7 +10,7 @@ import bs4
 from pyhelpers.ops import split_list_by_size
 
 from .._base import _Base
-from ..parser import _get_last_updated_date
+from ..parser import _get_last_updated_date, get_soup
 from ..utils import homepage_url
 
 
@@ -29,12 +29,15 @@ class Bridges(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: Directory where the data is stored; defaults to ``None``.
         :type data_dir: str | None
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -53,7 +56,7 @@ class Bridges(_Base):
 
         super().__init__(
             data_dir=data_dir, content_type='introduction', data_category="line-data",
-            update=update, verbose=verbose)
+            update=update, verbose=verbose, lazy=lazy)
 
     def _parse_h4_ul_li(self, h4_ul_li):
         h4_ul_li_contents = h4_ul_li.contents
@@ -114,7 +117,7 @@ class Bridges(_Base):
         :rtype: dict
         """
 
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         h4_list = soup.find_all(name='h4')
 
@@ -8,13 +8,12 @@ import os
 import re
 import urllib.parse
 
-import bs4
 import pandas as pd
 from pyhelpers.store import load_data
 
 from .._base import _Base
 from ..parser import _get_last_updated_date, get_heading_text, get_hypertext, get_page_catalogue, \
-    parse_tr
+    get_soup, parse_tr
 from ..utils import cd_data, get_batch_fetch_verbosity, homepage_url
 
 
@@ -259,7 +258,7 @@ class Electrification(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: Name of the data directory; defaults to ``None``.
         :type data_dir: str | None
@@ -267,6 +266,9 @@ class Electrification(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -285,14 +287,14 @@ class Electrification(_Base):
 
         super().__init__(
             data_dir=data_dir, content_type='catalogue', data_category="line-data", update=update,
-            verbose=verbose)
+            verbose=verbose, lazy=lazy)
 
     @staticmethod
     def _confirm_to_collect(data_name):
         return f"To collect section codes for OLE installations: {data_name}\n?"
 
     def _collect_elec_codes(self, source, data_name, parser_func=None, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         # Get data of the specific category
         if parser_func is None:
@@ -3,6 +3,7 @@ Collects data of
 `Engineer's Line References (ELRs) <http://www.railwaycodes.org.uk/elrs/elr0.shtm>`_.
 """
 
+import asyncio
 import functools
 import itertools
 import os
@@ -10,21 +11,22 @@ import re
 import string
 import urllib.parse
 
-import bs4
 import numpy as np
 import pandas as pd
-import requests
 from pyhelpers._cache import _print_failure_message
-from pyhelpers.ops import confirmed, fake_requests_headers, loop_in_pairs
-from pyhelpers.store import load_data
+from pyhelpers.ops import confirmed, loop_in_pairs
 from pyhelpers.text import remove_punctuation
 
+from .. import _patterns
 from .._base import _Base
-from ..converter import kilometer_to_yard, mile_chain_to_mileage, mileage_to_mile_chain, \
-    yard_to_mileage
-from ..parser import _get_last_updated_date, parse_table
-from ..utils import get_collect_verbosity_for_fetch, homepage_url, is_homepage_connectable, \
-    is_str_float, print_instance_connection_error, print_void_collection_message, validate_initial
+from ..converter import kilometer_to_yard, kilometers_to_yards, mile_chain_to_mileage, \
+    mile_chains_to_mileages, mileage_to_mile_chain, mileages_to_mile_chains, yard_to_mileage, \
+    yards_to_mileages
+from ..mileage import _as_mileage_dtype, _mileage_to_str
+from ..parser import _get_last_updated_date, _run_page_parser, get_soup, parse_table
+from ..transport import get_transport, sharing_async_transport
+from ..utils import get_collect_verbosity_for_fetch, homepage_url, is_str_float, \
+    print_instance_connection_error, validate_initial
 
 
 def _parse_non_float_str_mileage(mileage):
@@ -47,20 +49,20 @@ def _parse_non_float_str_mileage(mileage):
             mileage_note.append('')
 
         elif m.startswith('(') and m.endswith(')'):
-            miles_chains.append(re.search(r'\d+\.\d+', m).group(0))
+            miles_chains.append(_patterns.MILES_CHAINS.search(m).group(0))
             mileage_note.append('Not on this route but given for reference')
 
         elif m.startswith('≈') or m.endswith('?'):
             miles_chains.append(m.strip('≈').strip('?'))
             mileage_note.append('Approximate')
 
-        elif re.match(r'\d+\.\d+/\s?\d+\.\d+', m):
+        elif _patterns.ALT_MILES_CHAINS.match(m):
             m1, m2 = map(str.strip, m.split('/'))
             miles_chains.append(m1)
             mileage_note.append(f'{m2} (Alternative)')
 
         elif ' + ' in m or 'private portion' in m:
-            m1 = re.search(r'\d+\.\d+', m).group(0)
+            m1 = _patterns.MILES_CHAINS.search(m).group(0)
             miles_chains.append(m1)
             mileage_note.append(m.replace(m1, '').strip())
 
@@ -69,7 +71,7 @@ def _parse_non_float_str_mileage(mileage):
             mileage_note.append("(See 'Notes')")
 
         else:  # Convert "1,234" → "1.234", and "1 234" → "1.234"
-            miles_chains.append(re.sub(r'[ ,]', '.', m))
+            miles_chains.append(_patterns.MILES_CHAINS_SEP.sub('.', m))
             mileage_note.append('')
 
     return miles_chains, mileage_note
@@ -91,14 +93,14 @@ def _parse_mileages(mileages):
 
     if mileage.str.contains('km', regex=True).any():  # any(mileage.str.match('.*km')):
         if mileage.str.endswith('km').all():  # all(mileage.str.match('.*km')):
-            mileage_ = mileage.str.replace(r'km|\(|\)', '', regex=True).map(
-                lambda x: yard_to_mileage(kilometer_to_yard(km=x.replace('≈', ''))))
-            miles_chains = mileage_.map(mileage_to_mile_chain)  # Warning: Might contain issues!
+            km = mileage.str.replace(r'km|\(|\)|≈', '', regex=True)
+            mileage_ = yards_to_mileages(kilometers_to_yards(km=km))
+            miles_chains = mileages_to_mile_chains(mileage_)  # Warning: Might contain issues!
 
         else:
             # miles_chains = mileage.str.replace(r'/?\d+\.\d+km/?', '', regex=True)
             miles_chains = mileage.where(~mileage.str.contains('km', na=False), '')
-            mileage_ = miles_chains.map(mile_chain_to_mileage)
+            mileage_ = mile_chains_to_mileages(miles_chains)
             mileage = mileage.where(mileage.str.contains('km', na=False), '')
 
         # mileage_note = [x + ' (Approximate)' if x.startswith('≈') else x for x in list(mileage)]
@@ -112,7 +114,7 @@ def _parse_mileages(mileages):
         else:
             miles_chains, mileage_note = _parse_non_float_str_mileage(mileage)
 
-        mileage_ = [mile_chain_to_mileage(m) for m in miles_chains]
+        mileage_ = mile_chains_to_mileages(miles_chains)
 
     parsed_mileage_ = {
         'Mileage': mileage_,
@@ -125,11 +127,9 @@ def _parse_mileages(mileages):
 
 
 def _parse_node(node):
-    pat = re.compile(r'\w+.*( \(\d+\.\d+\))?(/| and \w+)? with ([A-Z]).*(\d)?( \(\d+\.\d+\))?')
-
-    if re.match(pat, node):
-        node_name = [x.group() for x in re.finditer(r'\w+.*(?= with)', node)]
-        conn_node = [x.group() for x in re.finditer(r'(?<= with )[^*]+', node)]
+    if _patterns.NODE_WITH_CONNECTION.match(node):
+        node_name = [x.group() for x in _patterns.NODE_NAME.finditer(node)]
+        conn_node = [x.group() for x in _patterns.CONNECTED_NODE.finditer(node)]
 
     else:
         node_name, conn_node = [node], [None]
@@ -145,7 +145,7 @@ def _parse_node_connection(nodes, col_name='Connection'):
             conn_node_lst.append([None])
             continue
 
-        if re.match(r'[A-Z]{3}\d?( \(\d+\.\d+\))? ?/ ?[A-Z]{3}\d?( \(\d+\.\d+\))?', n):
+        if _patterns.CONNECTED_NODE_PAIR.match(n):
             m = [x.strip() for x in n.split('/')]
         else:
             m = n.split(' and ')
@@ -174,31 +174,25 @@ def _uncouple_elr_mileage(node_x):
     if node_x is None:
         y = ['', '']
     else:
-        # pat0 = re.compile(r'\w+.*(( lines)|( terminal))$')
-        pat1 = re.compile(r'([A-Z]{3}(\d)?$)|((\w\s?)*\w$)')
-        pat2 = re.compile(r'([A-Z]{3}(\d)?$)|(([\w\s&]?)*(\s\(\d+\.\d+\))?$)')
-        # pat3 = re.compile(r'[A-Z]{3}(\d)?(\s\(\d+.\d+\))?\s\[.*?\]$')
-        pat3 = re.compile(r'[A-Z]{3}(\d)?(\s\(\d+.\d+\))?\s\[.*?]$')
-        pat4 = re.compile(r'[A-Z]{3}(\d)?\s\(\d+\.\d+km\)')
-        # if re.match(pat0, node_x):
-        #     y = ['', '']
-        if re.match(pat1, node_x):
+        if _patterns.ELR_OR_NAME.match(node_x):
             y = [node_x, '']
-        elif re.match(pat2, node_x):
-            y = [z[:-1] if re.match(r'\d+.\d+\)', z) else z.strip() for z in node_x.split('(')]
+        elif _patterns.ELR_OR_NAME_WITH_MILEAGE.match(node_x):
+            y = [
+                z[:-1] if _patterns.MILES_CHAINS_IN_BRACKETS.match(z) else z.strip()
+                for z in node_x.split('(')]
             y[0] = '' if len(y[0]) > 4 else y[0]
-        elif re.match(pat3, node_x):
+        elif _patterns.ELR_WITH_NOTE.match(node_x):
             try:
                 y = [
-                    re.search(r'[A-Z]{3}(\d)?', node_x).group(0),
-                    re.search(r'\d+\.\d+', node_x).group(0)]
+                    _patterns.ELR.search(node_x).group(0),
+                    _patterns.MILES_CHAINS.search(node_x).group(0)]
             except AttributeError:
-                y = [re.search(r'[A-Z]{3}(\d)?', node_x).group(0), '']
-        elif re.match(pat4, node_x):
+                y = [_patterns.ELR.search(node_x).group(0), '']
+        elif _patterns.ELR_WITH_KM.match(node_x):
             y = [
-                re.search(r'[A-Z]{3}(\d)?', node_x).group(0),
+                _patterns.ELR.search(node_x).group(0),
                 mileage_to_mile_chain(yard_to_mileage(
-                    kilometer_to_yard(km=re.search(r'\d+\.\d+', node_x).group(0))))]
+                    kilometer_to_yard(km=_patterns.MILES_CHAINS.search(node_x).group(0))))]
         else:
             y = [node_x, ''] if len(node_x) <= 4 else ['', '']
         y[0] = y[0] if len(y[0]) <= 4 else ''
@@ -220,7 +214,7 @@ def _parse_nodes(nodes):
 
     conn_nodes = _parse_node_connection(prep_node, col_name='Connection')
 
-    link_cols = [x for x in conn_nodes.columns if re.match(r'^(Link_\d)', x)]
+    link_cols = [x for x in conn_nodes.columns if _patterns.LINK_COLUMN.match(x)]
     link_nodes = conn_nodes[link_cols].map(_uncouple_elr_mileage)
 
     dat = [
@@ -253,6 +247,35 @@ def _parse_mileage_data(mileage_data):
     return parsed_dat
 
 
+def _parse_elr_page(source, parse_only=None):
+    """
+    Parses a web page of ELRs (for a given initial letter).
+
+    It makes no requests and saves no files, so that it can be run in a worker process
+    (see :func:`~pyrcs.parser.parsing_in_processes`).
+
+    :param source: The response, the parsed document or the raw content of the web page.
+    :type source: requests.Response | ParsedDocument | bytes
+    :param parse_only: Names of the only elements to be parsed (see
+        :func:`~pyrcs.parser.get_soup`); defaults to ``None``.
+    :type parse_only: typing.Iterable[str] | None
+    :return: The data of the ELRs and the date of the last update of the web page.
+    :rtype: tuple[pandas.DataFrame, str | None]
+    """
+
+    # Create a DataFrame of the requested table
+    (columns, records), soup = parse_table(source=source, parse_only=parse_only)
+    data_ = [[x.replace('=', 'See').strip('\xa0') for x in i] for i in records]
+    elrs_codes = pd.DataFrame(data=data_, columns=columns)
+
+    elrs_codes[columns[0]] = elrs_codes[columns[0]].map(lambda x: x.split(' ')[0])
+
+    # Get last update date
+    last_updated_date = _get_last_updated_date(soup=soup, parsed=True)
+
+    return elrs_codes, last_updated_date
+
+
 class ELRMileages(_Base):
     """
     A class for collecting data of
@@ -273,7 +296,11 @@ class ELRMileages(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    # The only elements parsed from a page of ELRs, i.e. the table and
+    # the paragraph of the last update date
+    _PAGE_ELEMENTS = ('thead', 'tbody', 'p')
+
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -281,6 +308,9 @@ class ELRMileages(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -300,7 +330,7 @@ class ELRMileages(_Base):
 
         super().__init__(
             data_dir=data_dir, content_type='catalogue', data_category="line-data", update=update,
-            verbose=verbose)
+            verbose=verbose, lazy=lazy)
 
         self.measure_headers = [' '.join(x) for x in itertools.product(
             *(('Current', 'Later', 'Earlier', 'One', 'Original', 'Former', 'Alternative', 'Usual',
@@ -310,15 +340,8 @@ class ELRMileages(_Base):
     def _collect_elr(self, initial, source, verbose=False):
         initial_ = validate_initial(initial=initial)
 
-        # Create a DataFrame of the requested table
-        (columns, records), soup = parse_table(source=source)
-        data_ = [[x.replace('=', 'See').strip('\xa0') for x in i] for i in records]
-        elrs_codes = pd.DataFrame(data=data_, columns=columns)
-
-        elrs_codes[columns[0]] = elrs_codes[columns[0]].map(lambda x: x.split(' ')[0])
-
-        # Get last update date
-        last_updated_date = _get_last_updated_date(soup=soup, parsed=True)
+        elrs_codes, last_updated_date = _run_page_parser(
+            _parse_elr_page, source, parse_only=self._PAGE_ELEMENTS)
 
         # Update the dict with both the DataFrame and its last updated date
         data = {initial_: elrs_codes, self.KEY_TO_LAST_UPDATED_DATE: last_updated_date}
@@ -390,7 +413,8 @@ class ELRMileages(_Base):
 
         return data
 
-    def fetch_elr(self, initial=None, update=False, dump_dir=None, verbose=False, **kwargs):
+    def fetch_elr(self, initial=None, update=False, dump_dir=None, verbose=False, max_workers=4,
+                  **kwargs):
         """
         Fetches data of ELRs and their associated mileages.
 
@@ -403,6 +427,9 @@ class ELRMileages(_Base):
         :type dump_dir: str | None
         :param verbose: Whether to print relevant information to the console; defaults to ``False``.
         :type verbose: bool | int
+        :param max_workers: Maximum number of initial letters whose data is fetched concurrently
+            when ``initial=None``; defaults to ``4``.
+        :type max_workers: int
         :return: A dictionary containing data for all available ELRs,
             along with the date of the last update.
         :rtype: dict
@@ -444,33 +471,112 @@ class ELRMileages(_Base):
                 update=update, dump_dir=dump_dir, verbose=verbose, **kwargs)
 
         else:
-            verbose_1 = False if (dump_dir or not verbose) else (2 if verbose == 2 else True)
-            verbose_2 = verbose_1 if is_homepage_connectable() else False
-
-            dat_list = [
-                self.fetch_elr(initial=x, update=update, verbose=verbose_2)
-                for x in string.ascii_lowercase]
-
-            if all(d[x] is None for d, x in zip(dat_list, string.ascii_uppercase)):
-                if update:
-                    print_instance_connection_error(verbose=verbose)
-                    print_void_collection_message(data_name=self.KEY, verbose=verbose)
-                dat_list = [
-                    self.fetch_elr(initial=x, update=False, verbose=verbose_1)
-                    for x in string.ascii_lowercase]
-
-            # Select DataFrames only
-            data_ = pd.concat(
-                (item[x] for item, x in zip(dat_list, string.ascii_uppercase)), axis=0,
-                ignore_index=True, sort=False)
-
-            # Get the latest updated date
-            last_updated_dates = (
-                item[self.KEY_TO_LAST_UPDATED_DATE]
-                for item, _ in zip(dat_list, string.ascii_uppercase))
-            latest_update_date = max(d for d in last_updated_dates if d is not None)
-
-            data = {self.KEY: data_, self.KEY_TO_LAST_UPDATED_DATE: latest_update_date}
+            data = self._fetch_merged_initials(
+                self.fetch_elr, merge=self._merge_elr, data_name=self.KEY, update=update,
+                dump_dir=dump_dir, verbose=verbose, max_workers=max_workers)
+
+            if dump_dir:
+                self._save_data_to_file(
+                    data=data, data_name=self.NAME, dump_dir=dump_dir, verbose=verbose)
+
+        return data
+
+    def _merge_elr(self, dat_list):
+        # Select DataFrames only
+        data_ = pd.concat(
+            (item[x] for item, x in zip(dat_list, string.ascii_uppercase)), axis=0,
+            ignore_index=True, sort=False)
+
+        # Get the latest updated date
+        last_updated_dates = (
+            item[self.KEY_TO_LAST_UPDATED_DATE]
+            for item, _ in zip(dat_list, string.ascii_uppercase))
+        latest_update_date = max(d for d in last_updated_dates if d is not None)
+
+        data = {self.KEY: data_, self.KEY_TO_LAST_UPDATED_DATE: latest_update_date}
+
+        return data
+
+    async def acollect_elr(self, initial, confirmation_required=True, verbose=False,
+                           raise_error=False):
+        """
+        Collects Engineer's Line References (ELRs) that begin with a specified initial letter
+        from the source web page asynchronously.
+
+        It is the awaitable counterpart of
+        :meth:`~pyrcs.line_data.elr_mileage.ELRMileages.collect_elr`,
+        which takes the same parameters.
+
+        :return: A dictionary containing ELR data whose names start with the given initial letter,
+            along with the date of the last update.
+        :rtype: dict
+
+        **Examples**::
+
+            >>> from pyrcs.line_data import ELRMileages  # from pyrcs import ELRMileages
+            >>> import asyncio
+            >>> em = ELRMileages()
+            >>> elrs_a_codes = asyncio.run(em.acollect_elr('a', confirmation_required=False))
+            >>> list(elrs_a_codes.keys())
+            ['A', 'Last updated date']
+        """
+
+        initial_ = validate_initial(initial=initial)
+
+        data = await self._acollect_data_from_source(
+            data_name=self.NAME, method=self._collect_elr, initial=initial_,
+            confirmation_required=confirmation_required, verbose=verbose, raise_error=raise_error)
+
+        return data
+
+    async def afetch_elr(self, initial=None, update=False, dump_dir=None, verbose=False,
+                         **kwargs):
+        """
+        Fetches data of ELRs and their associated mileages asynchronously.
+
+        It is the awaitable counterpart of
+        :meth:`~pyrcs.line_data.elr_mileage.ELRMileages.fetch_elr`;
+        when ``initial=None``, the pages of all initial letters are requested concurrently.
+
+        :param initial: The initial letter (e.g. ``'a'``, ``'z'``) of an ELR; defaults to ``None``.
+        :type initial: str | None
+        :param update: Whether to check for updates to the package data; defaults to ``False``.
+        :type update: bool
+        :param dump_dir: Path to a directory where the data file will be saved;
+            defaults to ``None``.
+        :type dump_dir: str | None
+        :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+        :type verbose: bool | int
+        :return: A dictionary containing data for all available ELRs,
+            along with the date of the last update.
+        :rtype: dict
+
+        **Examples**::
+
+            >>> from pyrcs.line_data import ELRMileages  # from pyrcs import ELRMileages
+            >>> import asyncio
+            >>> em = ELRMileages()
+            >>> elrs_codes = asyncio.run(em.afetch_elr())
+            >>> list(elrs_codes.keys())
+            ['ELRs and mileages', 'Last updated date']
+        """
+
+        if initial:
+            args = {
+                'data_name': validate_initial(initial),
+                'method': self.acollect_elr,
+                'sub_dir': "a-z",
+                'initial': initial,
+            }
+            kwargs.update(args)
+
+            data = await self._afetch_data_from_file(
+                update=update, dump_dir=dump_dir, verbose=verbose, **kwargs)
+
+        else:
+            data = await self._afetch_merged_initials(
+                self.afetch_elr, merge=self._merge_elr, data_name=self.KEY, update=update,
+                dump_dir=dump_dir, verbose=verbose)
 
             if dump_dir:
                 self._save_data_to_file(
@@ -764,7 +870,7 @@ class ELRMileages(_Base):
         return mileage_data, notes_data
 
     def _collect_mileage_file(self, source, elr, parsed=True, dump_dir=False, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         line_name = soup.find(name='h3').get_text(strip=True)
 
@@ -960,10 +1066,7 @@ class ELRMileages(_Base):
                     print(message_, end=" ... ")
 
                 try:
-                    url = urllib.parse.urljoin(
-                        homepage_url(),
-                        f'/elrs/_mileages/{target_elr[0]}/{target_elr}.shtm'.lower())
-                    source = requests.get(url=url, headers=fake_requests_headers())
+                    source = get_transport().get(self._mileage_file_url(target_elr))
                     source.raise_for_status()
                 except Exception as e:
                     print_instance_connection_error(verbose=verbose, e=e)
@@ -976,8 +1079,62 @@ class ELRMileages(_Base):
                 except Exception as e:
                     _print_failure_message(e, "Errors:", verbose=verbose, raise_error=raise_error)
 
+    @staticmethod
+    def _mileage_file_url(elr):
+        url = urllib.parse.urljoin(homepage_url(), f'/elrs/_mileages/{elr[0]}/{elr}.shtm'.lower())
+
+        return url
+
+    async def acollect_mileage_file(self, elr, parsed=True, confirmation_required=True,
+                                    dump_dir=False, verbose=False, raise_error=False):
+        """
+        Collects the mileage file for a specific ELR from the source web page asynchronously.
+
+        It is the awaitable counterpart of
+        :meth:`~pyrcs.line_data.elr_mileage.ELRMileages.collect_mileage_file`,
+        which takes the same parameters.
+
+        :return: A dictionary containing the mileage file for the specified ELR.
+        :rtype: dict
+
+        **Examples**::
+
+            >>> from pyrcs.line_data import ELRMileages  # from pyrcs import ELRMileages
+            >>> import asyncio
+            >>> em = ELRMileages()
+            >>> gam_mileage_file = asyncio.run(
+            ...     em.acollect_mileage_file('GAM', confirmation_required=False))
+            >>> list(gam_mileage_file.keys())
+            ['ELR', 'Line', 'Sub-Line', 'Mileage', 'Notes']
+        """
+
+        target_elr = remove_punctuation(elr).upper()
+
+        if target_elr:
+            if confirmed(f'To collect mileage file of "{target_elr}"\n?', confirmation_required):
+                if verbose in {True, 1}:
+                    message_ = "Collecting the mileage file"
+                    if not confirmation_required:
+                        message_ += f' of "{target_elr}"'
+                    print(message_, end=" ... ")
+
+                try:
+                    async with sharing_async_transport() as transport:
+                        source = await transport.get(self._mileage_file_url(target_elr))
+                    source.raise_for_status()
+                except Exception as e:
+                    print_instance_connection_error(verbose=verbose, e=e)
+                    return None
+
+                try:
+                    return await asyncio.to_thread(
+                        self._collect_mileage_file, source=source, elr=target_elr, parsed=parsed,
+                        dump_dir=dump_dir, verbose=verbose)
+                except Exception as e:
+                    _print_failure_message(e, "Errors:", verbose=verbose, raise_error=raise_error)
+
     def fetch_mileage_file(self, elr, update=False, dump_dir=None, verbose=False,
-                           raise_error=False):
+                           raise_error=False, mileage_dtype=False):
         """
         Fetches the mileage file for a specific ELR.
 
@@ -994,6 +1151,10 @@ class ELRMileages(_Base):
         :param raise_error: Whether to raise the provided exception;
             if ``raise_error=False`` (default), the error will be suppressed.
         :type raise_error: bool
+        :param mileage_dtype: Whether to convert the mileages (i.e. the column ``'Mileage'``) to
+            the data type of mileages (see :class:`~pyrcs.mileage.MileageDtype`);
+            defaults to ``False``.
+        :type mileage_dtype: bool
         :return: A dictionary containing the mileage file (codes), line name and
             any additional information or notes.
         :rtype: dict
@@ -1069,7 +1230,7 @@ class ELRMileages(_Base):
             path_to_file = self._cdd("mileage-files", sub_dir, f"{data_name}{ext}", mkdir=False)
 
             if os.path.isfile(path_to_file) and not update:
-                mileage_file = load_data(path_to_file)
+                mileage_file = self._load_cached_data_file(path_to_file)
 
             else:
                 verbose_ = get_collect_verbosity_for_fetch(data_dir=dump_dir, verbose=verbose)
@@ -1082,6 +1243,69 @@ class ELRMileages(_Base):
                     data=mileage_file, data_name=data_name, ext=ext, dump_dir=dump_dir,
                     verbose=verbose)
 
+            if mileage_dtype:
+                mileage_file = _as_mileage_dtype(mileage_file, form='mileage')
+
+            return mileage_file
+
+        except Exception as e:
+            _print_failure_message(e, prefix="Errors:", verbose=verbose, raise_error=raise_error)
+
+    async def afetch_mileage_file(self, elr, update=False, dump_dir=None, verbose=False,
+                                  raise_error=False, mileage_dtype=False):
+        """
+        Fetches the mileage file for a specific ELR asynchronously.
+
+        It is the awaitable counterpart of
+        :meth:`~pyrcs.line_data.elr_mileage.ELRMileages.fetch_mileage_file`,
+        which takes the same parameters. Mileage files of many ELRs can thus be fetched
+        concurrently, e.g. with `asyncio.gather()`_.
+
+        :return: A dictionary containing the mileage file (codes), line name and
+            any additional information or notes.
+        :rtype: dict
+
+        .. _`asyncio.gather()`:
+            https://docs.python.org/3/library/asyncio-task.html#asyncio.gather
+
+        **Examples**::
+
+            >>> from pyrcs.line_data import ELRMileages  # from pyrcs import ELRMileages
+            >>> import asyncio
+            >>> em = ELRMileages()
+            >>> async def fetch_mileage_files(elrs):
+            ...     return await asyncio.gather(*(em.afetch_mileage_file(x) for x in elrs))
+            >>> mileage_files = asyncio.run(fetch_mileage_files(['AAL', 'MLA', 'GAM']))
+            >>> [x['ELR'] for x in mileage_files]
+            ['NAJ3', 'MLA', 'GAM']
+        """
+
+        try:
+            target_elr = remove_punctuation(elr)
+
+            data_name = target_elr.lower()
+            data_name += ("_" if data_name == "prn" else "")
+            sub_dir, ext = data_name[0], ".pkl"
+
+            path_to_file = self._cdd("mileage-files", sub_dir, f"{data_name}{ext}", mkdir=False)
+
+            if os.path.isfile(path_to_file) and not update:
+                mileage_file = self._load_cached_data_file(path_to_file)
+
+            else:
+                verbose_ = get_collect_verbosity_for_fetch(data_dir=dump_dir, verbose=verbose)
+                mileage_file = await self.acollect_mileage_file(
+                    elr=target_elr, parsed=True, confirmation_required=False, dump_dir=None,
+                    verbose=verbose_)
+
+            if dump_dir not in {False, None}:
+                self._save_data_to_file(
+                    data=mileage_file, data_name=data_name, ext=ext, dump_dir=dump_dir,
+                    verbose=verbose)
+
+            if mileage_dtype:
+                mileage_file = _as_mileage_dtype(mileage_file, form='mileage')
+
             return mileage_file
 
         except Exception as e:
@@ -1162,7 +1386,8 @@ class ELRMileages(_Base):
         else:
             start_dest_mileage, end_orig_mileage = '', ''
 
-        return start_dest_mileage, end_orig_mileage
+        # As strings, even if the mileages are of the data type of mileages
+        return _mileage_to_str(start_dest_mileage), _mileage_to_str(end_orig_mileage)
 
     @staticmethod
     def _select_measure(em_dat, key_pat):
@@ -1275,13 +1500,13 @@ class ELRMileages(_Base):
 
                             if conn_dest_mileage and end_orig_mileage:
                                 if not start_dest_mileage:
-                                    start_dest_mileage = start_em[
-                                        start_em[link_col] == conn_elr]['Mileage'].values[0]
+                                    start_dest_mileage = _mileage_to_str(start_em[
+                                        start_em[link_col] == conn_elr]['Mileage'].values[0])
                                 if not conn_orig_mileage:
                                     link_col_conn = conn_em.where(conn_em == start_elr).dropna(
                                         axis=1, how='all').columns[0]
                                     temp = conn_em[conn_em[link_col_conn] == start_elr].Mileage
-                                    conn_orig_mileage = temp.values[0]
+                                    conn_orig_mileage = _mileage_to_str(temp.values[0])
                                 break
 
                             else:
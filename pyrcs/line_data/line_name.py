@@ -29,7 +29,7 @@ class LineNames(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -37,6 +37,9 @@ class LineNames(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -55,7 +58,7 @@ class LineNames(_Base):
 
         super().__init__(
             data_dir=data_dir, content_type='catalogue', data_category="line-data", update=update,
-            verbose=verbose)
+            verbose=verbose, lazy=lazy)
 
     @staticmethod
     def _parse_route(x):
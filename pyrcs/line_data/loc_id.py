@@ -3,25 +3,47 @@ Collects data of
 `CRS, NLC, TIPLOC and STANOX codes <http://www.railwaycodes.org.uk/crs/crs0.shtm>`_.
 """
 
+import asyncio
 import collections
 import re
 import string
 import urllib.parse
 
 import bs4
+import numpy as np
 import pandas as pd
-import requests
 from pyhelpers._cache import _print_failure_message
 from pyhelpers.dirs import validate_dir
-from pyhelpers.ops import fake_requests_headers
 
-from .._base import _Base
-from ..parser import _get_last_updated_date, get_page_catalogue, parse_tr
+from .. import _patterns
+from .._base import _NOT_LOADED, _Base
+from ..parser import ParsedDocument, _get_last_updated_date, _get_lxml_string, _get_lxml_text, \
+    _is_lxml_element, _run_page_parser, get_document, get_page_catalogue, get_soup, iter_tr, \
+    parse_tr, records_to_dataframe, sharing_documents
+from ..profiler import profile_stage
+from ..transport import get_async_transport
 from ..utils import format_confirmation_prompt, get_collect_verbosity_for_fetch, homepage_url, \
-    is_homepage_connectable, print_instance_connection_error, print_void_collection_message, \
     validate_initial
 
 
+_RAW_TEXT_REPLACEMENTS = (('\b-\b', ''), ('\xa0\xa0', ' '), ('&half;', ' and 1/2'))
+
+
+def _normalise_raw_text(x):
+    """
+    Normalises the text of a cell in the (raw) table of location codes.
+
+    This is the same as replacing ``_RAW_TEXT_REPLACEMENTS`` (each only where it is found in
+    the original text, as with :meth:`pandas.DataFrame.replace`) and then ``'\\xa0'`` in
+    the whole table, but can be done as the rows are parsed.
+    """
+
+    for old, new in [(old, new) for old, new in _RAW_TEXT_REPLACEMENTS if old in x]:
+        x = x.replace(old, new)
+
+    return x.replace('\xa0', '')
+
+
 def _parse_raw_location_name(x):
     """
     Parses the location name and extracts any associated note from the raw data.
@@ -69,22 +91,15 @@ def _parse_raw_location_name(x):
         return name.strip(), (sep + note).strip()
 
     # Regex to capture: Name (Note Content) OR Name [Note Content]
-    match = re.search(r'^(.*?)\s*[(\[](.+)[)\]]$', x_, re.DOTALL)
+    match = _patterns.LOC_NAME_WITH_NOTE.search(x_)
 
     if match:
         name_part, note_part = match.groups()
 
-        # Keywords that identify a bracket/parenthesis as a 'Note'
-        note_keywords = [
-            'originally', 'formerly', 'later', 'presumed', 'was', 'reopened',
-            'portion', 'see', 'unknown feature', 'definition unknown', 'now deleted', 'now'
-        ]
-        keyword_pattern = re.compile('|'.join(note_keywords), re.IGNORECASE)
-
-        # Split if it contains a keyword OR if it's the standard format from your docs
-        if keyword_pattern.search(note_part):
+        # Split if it contains a keyword (that identifies a bracket/parenthesis as a 'Note')
+        if _patterns.LOC_NAME_NOTE_KEYWORDS.search(note_part):
             # Use regex to strip any leading/trailing non-alphanumeric noise like ["( or )"]
-            note_part = re.sub(r'^[^a-zA-Z0-9]+|[^a-zA-Z0-9]+$', '', note_part)
+            note_part = _patterns.NOTE_NOISE.sub('', note_part)
             return name_part.strip(), note_part.strip()
 
     return x_, ''
@@ -228,6 +243,62 @@ def _fix_exceptional_cases(data):
     return data
 
 
+def _get_alt_seps(col):
+    """
+    Gets the separator of multiple alternatives in every cell of a code column,
+    i.e. ``'\r\n'``, ``'\r'`` or (otherwise) ``'\n'``, as in :func:`_count_sep`.
+    """
+
+    has_r_n, has_r = col.str.contains('\r\n', regex=False), col.str.contains('\r', regex=False)
+
+    seps = pd.Series('\n', index=col.index, dtype=object)
+    seps[has_r & ~has_r_n] = '\r'
+    seps[has_r_n] = '\r\n'
+
+    return seps
+
+
+def _count_alt_seps(col, seps):
+    """
+    Counts the separators of multiple alternatives in every cell of a code column,
+    as :func:`_count_sep` does for a single cell.
+    """
+
+    counts = pd.Series(0, index=col.index)
+
+    for sep in ['\r\n', '\r', '\n']:
+        mask = seps == sep
+        if mask.any():
+            x = col[mask]
+            if sep == '\n':  # Ad hoc
+                x = x.str.replace('~LO\n', '', regex=False)
+            counts[mask] = x.str.count(sep)
+
+    return counts
+
+
+def _split_alt_codes(col):
+    """
+    Splits every cell of a (padded) code column by its separator of multiple alternatives,
+    as :func:`_split_dat_and_note` does for a single cell.
+    """
+
+    seps = _get_alt_seps(col)
+
+    splits = col.astype(object)
+
+    for sep in ['\r\n', '\r', '\n']:
+        x = col[seps == sep]
+        if sep == '\n':  # Ad hoc
+            x = x.str.replace('~LO\n', '', regex=False)
+            splits[x.index] = x  # As is, if no separator is left
+        x = x[x.str.contains(sep, regex=False)]
+        if not x.empty:
+            splits[x.index] = x.str.split(sep, regex=False)
+
+    return splits
+
+
 def _parse_mult_alt_codes(data):
     """
     Cleanses multiple alternatives for every code column.
@@ -243,44 +314,34 @@ def _parse_mult_alt_codes(data):
 
     code_cols = ['Location', 'CRS', 'NLC', 'TIPLOC', 'STANME', 'STANOX']
 
-    r_n_counts = df[code_cols].map(_count_sep)
-    # # Debugging:
-    # for col in code_col_names:
-    #     for i, x in enumerate(data_[col]):
-    #         try:
-    #             lid._count_sep(x)
-    #         except Exception:
-    #             print(col, i, x)
-    #             break
+    seps = pd.DataFrame({col: _get_alt_seps(df[col]) for col in code_cols})
+
+    r_n_counts = pd.DataFrame({col: _count_alt_seps(df[col], seps[col]) for col in code_cols})
     r_n_counts_ = r_n_counts.mul(-1).add(r_n_counts.max(axis=1), axis='index')
 
+    # Pad every cell with the separators that it lacks compared with the others in the same row,
+    # repeating the (last) location name
     for col in code_cols:
-        for i in df.index:
-            d = r_n_counts_.loc[i, col]
-            val = df.loc[i, col]
-            if d > 0:
-                if '\r\n' in val:
-                    if col == 'Location':
-                        df.loc[i, col] = val + ''.join(['\r\n' + val.split('\r\n')[-1]] * d)
-                    else:
-                        df.loc[i, col] = val + ''.join(['\r\n'] * d)
-                elif '\r' in val:
-                    if col == 'Location':
-                        df.loc[i, col] = val + ''.join(['\r' + val.split('\r')[-1]] * d)
-                    else:
-                        df.loc[i, col] = val + ''.join(['\r'] * d)
-                else:  # e.g. '\n' in dat:
-                    if col == 'Location':
-                        df.loc[i, col] = '\n'.join([val] * (d + 1))
-                    else:
-                        df.loc[i, col] = val + ''.join(['\n'] * d)
+        val, sep, d = df[col], seps[col], r_n_counts_[col]
+
+        if col == 'Location':
+            last = val.copy()
+            for sep_ in ['\r\n', '\r']:
+                mask = sep == sep_
+                if mask.any():
+                    last[mask] = val[mask].str.rsplit(sep_, n=1).str[-1]
+            padded = (val + (sep + last) * d).where(sep != '\n', (val + '\n') * d + val)
+        else:
+            padded = val + sep * d
+
+        df[col] = padded.where(d > 0, val)
 
-    df[code_cols] = df[code_cols].map(_split_dat_and_note)
+    df[code_cols] = pd.DataFrame({col: _split_alt_codes(df[col]) for col in code_cols})
 
     df = df.explode(code_cols, ignore_index=True)
 
-    temp = df.select_dtypes(['object'])
-    df[temp.columns] = temp.apply(lambda x_: x_.str.strip())
+    for col in df.select_dtypes(['object']).columns:
+        df[col] = df[col].str.strip()
 
     return df
 
@@ -309,13 +370,13 @@ def _parse_code_note(x):
             y, note = map(str.strip, x.split('✖', 1))
 
         else:  # Search for notes
-            n1 = re.search(r'(?<=[\[(])[\w,? ]+(?=[)\]])', x)
+            n1 = _patterns.CODE_NOTE.search(x)
 
             if n1:
                 note = n1.group(0)
                 y = x.replace(note, '').strip('[(\')] ')
 
-                n2 = re.search(r'[\w ,]+(?= [\[(\'])', note)  # Remove redundant characters
+                n2 = _patterns.CODE_NOTE_TEXT.search(note)  # Remove redundant characters
                 if n2:
                     note = n2.group(0)
 
@@ -325,6 +386,39 @@ def _parse_code_note(x):
     return y, note
 
 
+def _split_code_notes(col):
+    """
+    Splits every cell of a code column into the code and its note, as :func:`_parse_code_note`
+    does for a single cell.
+
+    Only the (rare) cells with brackets, which may contain a note, are parsed one by one.
+    """
+
+    codes, notes = col.to_numpy(dtype=object, copy=True), np.full(len(col), '', dtype=object)
+
+    is_str = (col.notna() & col.ne('')).to_numpy()  # Empty cells are left as they are
+    has_cross = is_str & col.str.contains('✖', regex=False, na=False).to_numpy()
+
+    if has_cross.any():
+        parts = col[has_cross].str.partition('✖')
+        codes[has_cross] = parts[0].str.strip().to_numpy(dtype=object)
+        notes[has_cross] = parts[2].str.strip().to_numpy(dtype=object)
+
+    has_brackets = col.str.contains('[', regex=False, na=False) | col.str.contains(
+        '(', regex=False, na=False)
+    has_brackets = is_str & ~has_cross & has_brackets.to_numpy()
+
+    others = is_str & ~has_cross & ~has_brackets
+    codes[others] = col[others].str.strip().to_numpy(dtype=object)
+
+    if has_brackets.any():  # Fall back to the scalar parser
+        codes[has_brackets], notes[has_brackets] = zip(*map(_parse_code_note, codes[has_brackets]))
+
+    codes, notes = pd.Series(codes, index=col.index), pd.Series(notes, index=col.index)
+
+    return codes.infer_objects(), notes.infer_objects()
+
+
 def _parse_code_notes(data):
     """
     Gets notes for every code column.
@@ -336,8 +430,7 @@ def _parse_code_notes(data):
     codes_col_names = ['CRS', 'NLC', 'TIPLOC', 'STANME', 'STANOX']
 
     for col in codes_col_names:
-        data[[col, col + '_Note']] = pd.DataFrame(
-            data[col].map(_parse_code_note).to_list(), index=data.index)
+        data[col], data[col + '_Note'] = _split_code_notes(data[col])
     # # Debugging:
     # for col in codes_col_names:
     #     for i, x in enumerate(data[col]):
@@ -363,18 +456,17 @@ def _stanox_note(x):
         stanox, note = '', ''
 
     else:
-        if re.match(r'\d{5}$', x):
+        if _patterns.STANOX.match(x):
             stanox, note = x, ''
 
-        elif re.match(r'\d{5}\*$', x):
+        elif _patterns.PSEUDO_STANOX.match(x):
             stanox, note = x.rstrip('*'), 'Pseudo STANOX'
 
-        elif re.match(r'\d{5} \w.*', x):
-            stanox = re.search(r'\d{5}', x).group()
-            note = re.search(r'(?<= )\w.*', x).group()
+        elif _patterns.STANOX_WITH_NOTE.match(x):
+            stanox, note = _patterns.STANOX_WITH_NOTE.match(x).groups()
 
         else:
-            d = re.search(r'[\w *,]+(?= [\[(\'])', x)
+            d = _patterns.STANOX_TEXT.search(x)
             stanox = d.group().strip() if d is not None else x
 
             # Check for Pseudo STANOX marker before stripping it
@@ -382,7 +474,7 @@ def _stanox_note(x):
             stanox = stanox.rstrip('*')
 
             # Extract notes within brackets/quotes
-            n = re.search(r'(?<=[\[(\'])[\w, ]+.(?=[)\]\'])', x)
+            n = _patterns.STANOX_NOTE.search(x)
 
             if n is not None:
                 note = '; '.join(item for item in [note, n.group()] if item != '')
@@ -393,6 +485,41 @@ def _stanox_note(x):
     return stanox, note
 
 
+def _split_stanox_notes(col):
+    """
+    Splits every cell of the STANOX column into the STANOX and its note, as :func:`_stanox_note`
+    does for a single cell.
+
+    Only the (rare) irregular cells, which match none of the usual forms, are parsed one by one.
+    """
+
+    stanox, notes = col.to_numpy(dtype=object, copy=True), np.full(len(col), '', dtype=object)
+
+    is_empty = (col.isin(['-', '']) | col.isna()).to_numpy()
+    stanox[is_empty] = ''
+
+    is_pseudo = ~is_empty & col.str.match(_patterns.PSEUDO_STANOX.pattern, na=False).to_numpy()
+    stanox[is_pseudo] = col[is_pseudo].str.rstrip('*').to_numpy(dtype=object)
+    notes[is_pseudo] = 'Pseudo STANOX'
+
+    others = ~is_empty & ~is_pseudo & ~col.str.match(_patterns.STANOX.pattern, na=False).to_numpy()
+
+    stanox_notes = col[others].str.extract(_patterns.STANOX_WITH_NOTE.pattern)
+    has_note = others.copy()
+    has_note[others] = stanox_notes[0].notna().to_numpy()
+    stanox_notes = stanox_notes.dropna()
+    stanox[has_note] = stanox_notes[0].to_numpy(dtype=object)
+    notes[has_note] = stanox_notes[1].to_numpy(dtype=object)
+
+    irregular = others & ~has_note
+    if irregular.any():  # Fall back to the scalar parser
+        stanox[irregular], notes[irregular] = zip(*map(_stanox_note, stanox[irregular]))
+
+    stanox, notes = pd.Series(stanox, index=col.index), pd.Series(notes, index=col.index)
+
+    return stanox.infer_objects(), notes.infer_objects()
+
+
 def _parse_stanox_note(data):
     """
     Parses the note for STANOX.
@@ -408,8 +535,7 @@ def _parse_stanox_note(data):
     data[col_name] = data[col_name].str.replace('NANAN', '')
 
     if not data.empty:
-        parsed_dat = data[col_name].map(_stanox_note).to_list()
-        data[[col_name, note_col_name]] = pd.DataFrame(parsed_dat, index=data.index)
+        data[col_name], data[note_col_name] = _split_stanox_notes(data[col_name])
     else:
         # No data is available on the web page for the given 'key_word'
         data[note_col_name] = data[col_name]
@@ -431,32 +557,54 @@ def _fill_location_names(data):
     code_cols = ['CRS', 'NLC', 'TIPLOC', 'STANME', 'STANOX']  # The code columns to be filled
 
     # Standardise empty strings/None to NA so pandas recognises them as 'missing'
-    for col in code_cols:
-        df[col] = df[col].replace(r'^\s*$', pd.NA, regex=True)
+    codes = df[code_cols]
+    is_blank = codes.apply(lambda x: x.str.strip().eq('')).fillna(False).astype(bool)
+    codes = codes.mask(is_blank, pd.NA)
 
-    # Group and fill
-    with pd.option_context('future.no_silent_downcasting', True):
-        # Group by 'Location' and apply forward then backward fill
-        df[code_cols] = df.groupby('Location', sort=False)[code_cols].transform(
-            lambda x: x.ffill().bfill())
+    # Group by 'Location' and apply forward then backward fill (with the built-in grouped fills,
+    # rather than a Python function called once for each of the many locations)
+    location = df['Location']
+    codes = codes.groupby(location, sort=False).ffill()
+    codes = codes.groupby(location, sort=False).bfill()
 
     # Replace any remaining NaNs back with empty strings (optional)
-    df[code_cols] = df[code_cols].astype(object).fillna('')
+    df[code_cols] = codes.astype(object).fillna('')
 
     return df
 
 
+def _split_pre_span_lines(pre_span):
+    # Split the contents of a <pre> element into lines (of strings and tags) in its parse tree,
+    # rather than parsing every line of its markup again
+    lines, line = [], []
+
+    for x in pre_span.contents:
+        if isinstance(x, bs4.Tag):
+            line.append(x)
+        elif type(x) is bs4.NavigableString:  # Skip comments, etc.
+            first, *others = _patterns.LINE_BREAK.split(x)
+            line.append(first)
+            for y in others:
+                lines.append(line)
+                line = [y]
+
+    lines.append(line)
+
+    return [line for line in lines if any(isinstance(x, bs4.Tag) or x.strip() for x in line)]
+
+
 def _parse_note_page_pre_span(pre_span):
-    lines = [line.strip() for line in pre_span.decode_contents().splitlines() if line.strip()]
+    lines = _split_pre_span_lines(pre_span)
 
     data = []
     for line in lines:
-        temp = bs4.BeautifulSoup(line, "html.parser")
-        spans = temp.find_all('span')
+        tags = [x for x in line if isinstance(x, bs4.Tag)]
+        spans = [y for x in tags for y in ([x] if x.name == 'span' else []) + x.find_all('span')]
         texts = [span.get_text(strip=True) for span in spans]
 
         # Remaining text after last span (e.g. "BLU", "EBF")
-        remaining = temp.get_text(strip=True)
+        remaining = ''.join(
+            x.get_text(strip=True) if isinstance(x, bs4.Tag) else x.strip() for x in line)
         for t in texts:
             remaining = remaining.replace(t, '', 1)
         remaining = remaining.strip()
@@ -519,7 +667,7 @@ def _format_structured_note(text):
     max_cols = 0
     for line in lines:
         # Split by tabs or sequences of commas
-        parts = [p.strip() for p in re.split(r'\t+|,+', line)]
+        parts = [p.strip() for p in _patterns.NOTE_ENTRY_SEP.split(line)]
         processed_data.append(parts)
         max_cols = max(max_cols, len(parts))
 
@@ -538,6 +686,87 @@ def _format_structured_note(text):
     return pd.DataFrame(final_data, columns=columns[:max_cols])
 
 
+def _parse_loc_id_page(source, parser='html.parser', parse_only=None):
+    """
+    Parses a web page of CRS, NLC, TIPLOC and STANOX codes (for a given initial letter).
+
+    It makes no requests and saves no files, and both its arguments and its result can be
+    pickled, so that it can be run in a worker process
+    (see :func:`~pyrcs.parser.parsing_in_processes`).
+
+    :param source: The response, the parsed document or the raw content of the web page.
+    :type source: requests.Response | ParsedDocument | bytes
+    :param parser: The parser of the HTML (see :func:`~pyrcs.parser.parse_table`);
+        defaults to ``'html.parser'``.
+    :type parser: str
+    :param parse_only: Names of the only elements to be parsed (see
+        :func:`~pyrcs.parser.get_soup`); defaults to ``None``.
+    :type parse_only: typing.Iterable[str] | None
+    :return: The data of the codes, the (relative) URLs of the linked notes and
+        the date of the last update of the web page.
+    :rtype: tuple[pandas.DataFrame, list[str], str | None]
+    """
+
+    soup = get_soup(source, parser=parser, parse_only=parse_only)
+
+    if _is_lxml_element(soup):
+        thead, tbody = next(soup.iter('thead')), next(soup.iter('tbody'))
+        ths = [_get_lxml_text(th, strip=True) for th in thead.iter('th')]
+        trs = list(tbody.iter('tr'))
+    else:
+        thead, tbody = soup.find('thead'), soup.find('tbody')
+        ths, trs = [th.get_text(strip=True) for th in thead.find_all('th')], tbody.find_all('tr')
+
+    # Normalise the texts of the cells as the rows are parsed,
+    # rather than replacing them in (copies of) the whole table
+    with profile_stage('parse_tr') as stage:
+        rows = iter_tr(trs=trs, ths=ths, sep=None)
+        data = records_to_dataframe(
+            ([_normalise_raw_text(x) for x in row] for row in rows), columns=ths)
+        stage['rows'] = len(data)
+
+    # Parse location names and their corresponding notes
+    with profile_stage('_parse_raw_location_name'):
+        data[['Location', 'Location_Note']] = pd.DataFrame(  # Collect additional info as note
+            data['Location'].map(_parse_raw_location_name).to_list())
+        # # Debugging
+        # for i, x in enumerate(data['Location']):
+        #     try:
+        #         _parse_raw_location_name(x)
+        #     except Exception:
+        #         print(i)
+        #         break
+        data.replace(_amendment_to_location_names(), regex=True, inplace=True)
+
+    # Cleanse multiple alternatives for every code column
+    with profile_stage('_parse_mult_alt_codes') as stage:
+        data = _parse_mult_alt_codes(data=data)
+        stage['rows'] = len(data)
+
+    # Parse note for every code column
+    with profile_stage('_parse_code_notes'):
+        data = _parse_code_notes(data=data)
+
+    # Parse STANOX note
+    with profile_stage('_parse_stanox_note'):
+        data = _parse_stanox_note(data=data)
+
+    # Fills missing or empty code values based on other rows sharing the same 'Location' name.
+    with profile_stage('_fill_location_names'):
+        data = _fill_location_names(data)
+
+    # The links to the notes (of CRS), which are requested later
+    note_pattern = re.compile(r'note', re.I)
+    if _is_lxml_element(soup):
+        note_hrefs = [
+            a.get('href') for a in soup.iter('a')
+            if a.get('href') is not None and note_pattern.search(_get_lxml_string(a) or '')]
+    else:
+        note_hrefs = [a['href'] for a in soup.find_all('a', href=True, string=note_pattern)]
+
+    return data, note_hrefs, _get_last_updated_date(soup=soup)
+
+
 class LocationIdentifiers(_Base):
     """
     A class for collecting data of location identifiers
@@ -566,7 +795,11 @@ class LocationIdentifiers(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    # The only elements parsed from a page of codes, i.e. the table, the links to notes and
+    # the paragraph of the last update date
+    _PAGE_ELEMENTS = ('thead', 'tbody', 'a', 'p')
+
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -574,6 +807,9 @@ class LocationIdentifiers(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -594,15 +830,42 @@ class LocationIdentifiers(_Base):
         # data_cluster = re.sub(r",| codes| and", "", self.NAME.lower()).replace(" ", "-")
         super().__init__(
             data_dir=data_dir, content_type='catalogue', data_category="line-data",
-            data_cluster="crs-nlc-tiploc-stanox", update=update, verbose=verbose)
+            data_cluster="crs-nlc-tiploc-stanox", update=update, verbose=verbose, lazy=lazy)
+
+        self._other_systems_catalogue = _NOT_LOADED
+        if not self.lazy:
+            self._other_systems_catalogue = self._get_other_systems_catalogue()
+
+    def _get_catalogue(self):
+        catalogue = super()._get_catalogue()
 
         # Adds the multiple station codes explanatory note (MSCEN) to the catalogue
         mscen_url = urllib.parse.urljoin(homepage_url(), '/crs/crs2.shtm')
-        self.catalogue.update({self.KEY_TO_MSCEN: mscen_url})
+        catalogue.update({self.KEY_TO_MSCEN: mscen_url})
 
+        return catalogue
+
+    def _get_other_systems_catalogue(self):
         # Retrieve the catalogue for other systems' station codes
         other_systems_url = self.catalogue[self.KEY_TO_OTHER_SYSTEMS]
-        self.other_systems_catalogue = get_page_catalogue(url=other_systems_url)
+
+        return get_page_catalogue(url=other_systems_url)
+
+    @property
+    def other_systems_catalogue(self):
+        """
+        The catalogue of other systems' station codes, which is retrieved on first access
+        if ``lazy=True``.
+        """
+
+        if self._other_systems_catalogue is _NOT_LOADED:
+            self._other_systems_catalogue = self._get_other_systems_catalogue()
+
+        return self._other_systems_catalogue
+
+    @other_systems_catalogue.setter
+    def other_systems_catalogue(self, value):
+        self._other_systems_catalogue = value
 
     @staticmethod
     def _parse_notes_page(source, parser='html.parser'):
@@ -652,7 +915,7 @@ class LocationIdentifiers(_Base):
         if not source or not source.ok:
             return [], None
 
-        soup = bs4.BeautifulSoup(markup=source.content, features=parser)
+        soup = get_soup(source, parser=parser)
         raw_elements = []
 
         # Extract elements from the page
@@ -682,7 +945,7 @@ class LocationIdentifiers(_Base):
 
     # -- CRS, NLC, TIPLOC and STANOX ---------------------------------------------------------------
 
-    def _parse_crs_notes(self, data, initial, soup):
+    def _get_crs_note_urls(self, data, initial, note_hrefs):
         # Identify rows that actually need a note lookup
         mask = data['CRS_Note'].str.contains('see note', case=False, na=False)
         if not mask.any():
@@ -690,19 +953,28 @@ class LocationIdentifiers(_Base):
 
         indices = data.index[mask].tolist()
 
-        # Extract the specific 'note' links from the soup
-        note_links = soup.find_all('a', href=True, string=re.compile(r'note', re.I))
+        note_urls = []
+        for idx, href in zip(indices, note_hrefs):
+            # noinspection PyBroadException
+            try:
+                url = urllib.parse.urljoin(self.catalogue[initial], href)
+            except Exception:
+                url = None
+            note_urls.append((data.at[idx, 'CRS'], url))
 
-        loc_id_notes = {}
-        with requests.Session() as session:  # Using a Session is faster for multiple requests
-            session.headers.update(fake_requests_headers())
+        return note_urls
 
-            for idx, link_tag in zip(indices, note_links):
-                crs_code = data.at[idx, 'CRS']
+    def _parse_crs_notes(self, data, initial, note_hrefs):
+        note_urls = self._get_crs_note_urls(data=data, initial=initial, note_hrefs=note_hrefs)
+        if note_urls is None:
+            return None
+
+        loc_id_notes = {}
+        with sharing_documents():  # A note page linked from several rows is parsed only once
+            for crs_code, url in note_urls:
                 # noinspection PyBroadException
                 try:
-                    url = urllib.parse.urljoin(self.catalogue[initial], link_tag['href'])
-                    response = session.get(url, timeout=10)
+                    response = get_document(url, timeout=10)
 
                     parsed_content, _ = self._parse_notes_page(response)
                     # Get the first element if it's a list
@@ -713,59 +985,84 @@ class LocationIdentifiers(_Base):
 
         return loc_id_notes
 
-    def _collect_loc_id(self, initial, source, verbose=False):
-        initial_ = validate_initial(initial=initial)
-
-        # url = lid.catalogue[initial_]
-        # source = requests.get(url)
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
-
-        thead, tbody = soup.find('thead'), soup.find('tbody')
-        ths, trs = [th.get_text(strip=True) for th in thead.find_all('th')], tbody.find_all('tr')
-
-        dat = parse_tr(trs=trs, ths=ths, sep=None, as_dataframe=True)
-        dat = dat.replace({'\b-\b': '', '\xa0\xa0': ' ', '&half;': ' and 1/2'}, regex=True)
+    async def _aparse_crs_notes(self, data, initial, note_hrefs):
+        note_urls = self._get_crs_note_urls(data=data, initial=initial, note_hrefs=note_hrefs)
+        if note_urls is None:
+            return None
 
-        data = dat.replace({'\xa0': ''}, regex=True)
+        transport = get_async_transport()
 
-        # Parse location names and their corresponding notes
-        data[['Location', 'Location_Note']] = pd.DataFrame(  # Collect additional info as note
-            data['Location'].map(_parse_raw_location_name).to_list())
-        # # Debugging
-        # for i, x in enumerate(data['Location']):
-        #     try:
-        #         _parse_raw_location_name(x)
-        #     except Exception:
-        #         print(i)
-        #         break
-        data.replace(_amendment_to_location_names(), regex=True, inplace=True)
+        async def _get_document(url):
+            # noinspection PyBroadException
+            try:
+                return url, ParsedDocument(await transport.get(url, timeout=10))
+            except Exception:
+                return url, None
 
-        # Cleanse multiple alternatives for every code column
-        data = _parse_mult_alt_codes(data=data)
+        # The note pages are requested on the event loop, and then parsed in a worker thread
+        urls = {url for _, url in note_urls if url}
+        documents = dict(await asyncio.gather(*(_get_document(url) for url in urls)))
 
-        # Parse note for every code column
-        data = _parse_code_notes(data=data)
+        def _parse_notes():
+            loc_id_notes = {}
+            for crs_code, url in note_urls:
+                # noinspection PyBroadException
+                try:
+                    parsed_content, _ = self._parse_notes_page(documents[url])
+                    loc_id_notes[crs_code] = parsed_content[0] if parsed_content else None
+                except Exception:
+                    loc_id_notes[crs_code] = None
 
-        # Parse STANOX note
-        data = _parse_stanox_note(data=data)
+            return loc_id_notes
 
-        # Fills missing or empty code values based on other rows sharing the same 'Location' name.
-        data = _fill_location_names(data)
+        return await asyncio.to_thread(_parse_notes)
 
+    def _make_loc_id_data(self, initial, data, crs_notes, last_updated_date, verbose=False):
         loc_codes = {
-            initial_: data,
-            self.KEY_TO_NOTES: self._parse_crs_notes(data=data, initial=initial_, soup=soup),
-            self.KEY_TO_LAST_UPDATED_DATE: _get_last_updated_date(soup=soup),
+            initial: data,
+            self.KEY_TO_NOTES: crs_notes,
+            self.KEY_TO_LAST_UPDATED_DATE: last_updated_date,
         }
 
         if verbose in {True, 1}:
             print("Done.")
 
-        self._save_data_to_file(data=loc_codes, data_name=initial_, sub_dir="a-z", verbose=verbose)
+        self._save_data_to_file(data=loc_codes, data_name=initial, sub_dir="a-z", verbose=verbose)
 
         return loc_codes
 
-    def collect_loc_id(self, initial, confirmation_required=True, verbose=False, raise_error=False):
+    def _collect_loc_id(self, initial, source, verbose=False, parser='html.parser'):
+        initial_ = validate_initial(initial=initial)
+
+        # url = lid.catalogue[initial_]
+        # source = requests.get(url)
+        data, note_hrefs, last_updated_date = _run_page_parser(
+            _parse_loc_id_page, source, parser=parser, parse_only=self._PAGE_ELEMENTS)
+
+        with profile_stage('crs_notes'):
+            crs_notes = self._parse_crs_notes(data=data, initial=initial_, note_hrefs=note_hrefs)
+
+        return self._make_loc_id_data(
+            initial=initial_, data=data, crs_notes=crs_notes,
+            last_updated_date=last_updated_date, verbose=verbose)
+
+    async def _acollect_loc_id(self, initial, source, verbose=False, parser='html.parser'):
+        initial_ = validate_initial(initial=initial)
+
+        data, note_hrefs, last_updated_date = await asyncio.to_thread(
+            _run_page_parser, _parse_loc_id_page, source, parser=parser,
+            parse_only=self._PAGE_ELEMENTS)
+
+        with profile_stage('crs_notes'):
+            crs_notes = await self._aparse_crs_notes(
+                data=data, initial=initial_, note_hrefs=note_hrefs)
+
+        return await asyncio.to_thread(
+            self._make_loc_id_data, initial=initial_, data=data, crs_notes=crs_notes,
+            last_updated_date=last_updated_date, verbose=verbose)
+
+    def collect_loc_id(self, initial, confirmation_required=True, verbose=False, raise_error=False,
+                       parser='html.parser'):
         """
         Collects `CRS, NLC, TIPLOC, STANME and STANOX codes
         <http://www.railwaycodes.org.uk/crs/crs0.shtm>`_ for a given initial letter.
@@ -781,10 +1078,17 @@ class LocationIdentifiers(_Base):
         :param raise_error: Whether to raise the provided exception;
             if ``raise_error=False`` (default), the error will be suppressed.
         :type raise_error: bool
+        :param parser: The parser of the HTML (see :func:`~pyrcs.parser.parse_table`);
+            with ``parser='lxml.html'``, the table is extracted from an `lxml.html`_ tree,
+            which is faster (requires `lxml`_); defaults to ``'html.parser'``.
+        :type parser: str
         :return: A dictionary containing data of locations whose names start with the given
             initial letter, along with the date of the last update.
         :rtype: dict
 
+        .. _`lxml`: https://lxml.de/
+        .. _`lxml.html`: https://lxml.de/lxmlhtml.html
+
         **Examples**::
 
             >>> from pyrcs.line_data import LocationIdentifiers
@@ -815,11 +1119,12 @@ class LocationIdentifiers(_Base):
         loc_id_data = self._collect_data_from_source(
             data_name=self.NAME, method=self._collect_loc_id, initial=initial_,
             additional_fields=self.KEY_TO_NOTES, confirmation_required=confirmation_required,
-            verbose=verbose, raise_error=raise_error)
+            verbose=verbose, raise_error=raise_error, parser=parser)
 
         return loc_id_data
 
-    def fetch_loc_id(self, initial=None, update=False, dump_dir=None, verbose=False, **kwargs):
+    def fetch_loc_id(self, initial=None, update=False, dump_dir=None, verbose=False, max_workers=4,
+                     **kwargs):
         """
         Fetches data of `CRS, NLC, TIPLOC, STANME and STANOX codes`_.
 
@@ -835,6 +1140,9 @@ class LocationIdentifiers(_Base):
         :type dump_dir: str | None
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param max_workers: Maximum number of initial letters whose data is fetched concurrently
+            when ``initial=None``; defaults to ``4``.
+        :type max_workers: int
         :return: A dictionary containing data of locations whose names start with the given
             initial letter, along with the date of the last update.
         :rtype: dict
@@ -880,34 +1188,113 @@ class LocationIdentifiers(_Base):
                 update=update, dump_dir=dump_dir, verbose=verbose, **kwargs)
 
         else:
-            verbose_1 = get_collect_verbosity_for_fetch(data_dir=dump_dir, verbose=verbose)
+            # Get every data table (merged)
+            loc_id_data = self._fetch_merged_initials(
+                self.fetch_loc_id, merge=self._merge_loc_id, data_name=self.KEY, update=update,
+                dump_dir=dump_dir, verbose=verbose, max_workers=max_workers)
 
-            # Get every data table
-            verbose_2 = verbose_1 if is_homepage_connectable() else False
-            dat_list = [
-                self.fetch_loc_id(initial=x, update=update, verbose=verbose_2)
-                for x in string.ascii_lowercase]
+        return loc_id_data
+
+    def _merge_loc_id(self, dat_list):
+        # Select DataFrames only
+        data = pd.concat(
+            (item[x] for item, x in zip(dat_list, string.ascii_uppercase)), ignore_index=True)
+
+        # Get the latest updated date
+        last_updated_dates = (
+            item[self.KEY_TO_LAST_UPDATED_DATE]
+            for item, _ in zip(dat_list, string.ascii_uppercase))
+        latest_update_date = max(d for d in last_updated_dates if d is not None)
+
+        loc_id_data = {self.KEY: data, self.KEY_TO_LAST_UPDATED_DATE: latest_update_date}
 
-            if all(d[x] is None for d, x in zip(dat_list, string.ascii_uppercase)):
-                if update:
-                    print_instance_connection_error(verbose=verbose)
-                    print_void_collection_message(data_name=self.KEY, verbose=verbose)
+        return loc_id_data
+
+    async def acollect_loc_id(self, initial, confirmation_required=True, verbose=False,
+                              raise_error=False, parser='html.parser'):
+        """
+        Collects `CRS, NLC, TIPLOC, STANME and STANOX codes
+        <http://www.railwaycodes.org.uk/crs/crs0.shtm>`_ for a given initial letter
+        asynchronously.
 
-                dat_list = [
-                    self.fetch_loc_id(initial=x, update=False, verbose=verbose_1)
-                    for x in string.ascii_lowercase]
+        It is the awaitable counterpart of
+        :meth:`~pyrcs.line_data.loc_id.LocationIdentifiers.collect_loc_id`,
+        which takes the same parameters.
 
-            # Select DataFrames only
-            data = pd.concat(
-                (item[x] for item, x in zip(dat_list, string.ascii_uppercase)), ignore_index=True)
+        :return: A dictionary containing data of locations whose names start with the given
+            initial letter, along with the date of the last update.
+        :rtype: dict
 
-            # Get the latest updated date
-            last_updated_dates = (
-                item[self.KEY_TO_LAST_UPDATED_DATE]
-                for item, _ in zip(dat_list, string.ascii_uppercase))
-            latest_update_date = max(d for d in last_updated_dates if d is not None)
+        **Examples**::
+
+            >>> from pyrcs.line_data import LocationIdentifiers
+            >>> # from pyrcs import LocationIdentifiers
+            >>> import asyncio
+            >>> lid = LocationIdentifiers()
+            >>> loc_a_codes = asyncio.run(lid.acollect_loc_id('a', confirmation_required=False))
+            >>> list(loc_a_codes.keys())
+            ['A', 'Additional notes', 'Last updated date']
+        """
 
-            loc_id_data = {self.KEY: data, self.KEY_TO_LAST_UPDATED_DATE: latest_update_date}
+        initial_ = validate_initial(initial=initial)
+
+        loc_id_data = await self._acollect_data_from_source(
+            data_name=self.NAME, method=self._acollect_loc_id, initial=initial_,
+            additional_fields=self.KEY_TO_NOTES, confirmation_required=confirmation_required,
+            verbose=verbose, raise_error=raise_error, parser=parser)
+
+        return loc_id_data
+
+    async def afetch_loc_id(self, initial=None, update=False, dump_dir=None, verbose=False,
+                            **kwargs):
+        """
+        Fetches data of `CRS, NLC, TIPLOC, STANME and STANOX codes
+        <http://www.railwaycodes.org.uk/crs/crs0.shtm>`_ asynchronously.
+
+        It is the awaitable counterpart of
+        :meth:`~pyrcs.line_data.loc_id.LocationIdentifiers.fetch_loc_id`; when ``initial=None``,
+        the pages of all initial letters are requested concurrently.
+
+        :param initial: The initial letter (e.g. ``'a'``, ``'z'``) of a location name.
+        :type initial: str
+        :param update: Whether to check for updates to the package data; defaults to ``False``.
+        :type update: bool
+        :param dump_dir: Path to a directory where the data file will be saved;
+            defaults to ``None``.
+        :type dump_dir: str | None
+        :param verbose: Whether to print relevant information to the console; defaults to ``True``.
+        :type verbose: bool | int
+        :return: A dictionary containing data of locations whose names start with the given
+            initial letter, along with the date of the last update.
+        :rtype: dict
+
+        **Examples**::
+
+            >>> from pyrcs.line_data import LocationIdentifiers
+            >>> # from pyrcs import LocationIdentifiers
+            >>> import asyncio
+            >>> lid = LocationIdentifiers()
+            >>> loc_codes = asyncio.run(lid.afetch_loc_id())
+            >>> list(loc_codes.keys())
+            ['Location ID', 'Last updated date']
+        """
+
+        if initial:
+            args = {
+                'data_name': validate_initial(initial),
+                'method': self.acollect_loc_id,
+                'sub_dir': "a-z",
+                'initial': initial,
+            }
+            kwargs.update(args)
+
+            loc_id_data = await self._afetch_data_from_file(
+                update=update, dump_dir=dump_dir, verbose=verbose, **kwargs)
+
+        else:
+            loc_id_data = await self._afetch_merged_initials(
+                self.afetch_loc_id, merge=self._merge_loc_id, data_name=self.KEY, update=update,
+                dump_dir=dump_dir, verbose=verbose)
 
         return loc_id_data
 
@@ -945,7 +1332,7 @@ class LocationIdentifiers(_Base):
         return tbl
 
     def _collect_other_systems_codes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         other_systems_codes = collections.defaultdict(dict)
 
@@ -7,13 +7,12 @@ import os
 import re
 import urllib.parse
 
-import bs4
 import pandas as pd
 from pyhelpers.ops import remove_dict_keys, update_dict_keys
 from pyhelpers.text import find_similar_str
 
 from .._base import _Base
-from ..parser import _get_last_updated_date, parse_tr
+from ..parser import _get_last_updated_date, get_soup, parse_tr
 from ..utils import get_batch_fetch_verbosity, homepage_url, print_instance_connection_error, \
     print_void_collection_message
 
@@ -46,7 +45,7 @@ class LOR(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -54,6 +53,9 @@ class LOR(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -73,7 +75,7 @@ class LOR(_Base):
 
         super().__init__(
             data_dir=data_dir, content_type='catalogue', data_category="line-data",
-            update=update, verbose=verbose)
+            update=update, verbose=verbose, lazy=lazy)
 
         self.valid_prefixes = self.get_keys_to_prefixes(prefixes_only=True)
 
@@ -148,7 +150,7 @@ class LOR(_Base):
         return url
 
     def _parse_keys_to_prefixes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
         span_tags = soup.find_all(name='span', attrs={'class': 'tab2'})
 
         data = [
@@ -263,7 +265,7 @@ class LOR(_Base):
         return keys_to_prefixes
 
     def _parse_page_urls(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         links = soup.find_all(
             name='a', href=re.compile('^pride|elrmapping'),
@@ -412,7 +414,7 @@ class LOR(_Base):
         # prefix = prefix.upper()
         # assert prefix in self.valid_prefixes, f"`prefix` must be one of {self.valid_prefixes}"
 
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         h3, table = soup.find_all(name='h3'), soup.find_all(name='table')
         if len(h3) == 0:
@@ -657,7 +659,7 @@ class LOR(_Base):
     # == ELR/LOR converter =========================================================================
 
     def _collect_elr_lor_converter(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         thead, tbody = soup.find_all('thead')[0], soup.find_all('tbody')[0]
         ths = thead.find_all('th')
@@ -4,12 +4,11 @@ Collects British `railway track diagrams <http://www.railwaycodes.org.uk/track/d
 
 import urllib.parse
 
-import bs4
 import pandas as pd
 from pyhelpers._cache import _print_failure_message
 
 from .._base import _Base
-from ..parser import _get_last_updated_date
+from ..parser import _get_last_updated_date, get_soup
 from ..utils import cd_data, homepage_url
 
 
@@ -30,7 +29,7 @@ class TrackDiagrams(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -38,6 +37,9 @@ class TrackDiagrams(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -55,15 +57,16 @@ class TrackDiagrams(_Base):
         """
 
         super().__init__(
-            data_dir=data_dir, data_category="line-data", update=update, verbose=verbose)
+            data_dir=data_dir, data_category="line-data", update=update, verbose=verbose, lazy=lazy)
 
-        self.catalogue = self.fetch_catalogue(update=update, verbose=(verbose == 2 or False))
+    def _get_catalogue(self):
+        return self.fetch_catalogue(update=self._update, verbose=(self._verbose == 2 or False))
 
     def _collect_catalogue(self, source, verbose=False):
         track_diagrams_catalogue_ = {}
 
         try:
-            soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+            soup = get_soup(source)
 
             h3 = soup.find('h3', string=True, attrs={'class': None})
             while h3:
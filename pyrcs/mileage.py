@@ -0,0 +1,877 @@
+"""
+Provides a data type of mileages, which are stored as whole numbers (int64) of yards.
+
+A column of mileages of this type (i.e. ``'mileage'``; see :class:`~pyrcs.mileage.MileageDtype`)
+is compact, sorts and compares as distances rather than as strings, and can be shifted by
+a number of yards, while it can always be formatted back to the usual textual forms
+*<miles>.<yards>* (e.g. ``'0.0396'``) and *<miles>.<chains>* (e.g. ``'0.18'``).
+"""
+
+import functools
+import numbers
+import operator
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray, ExtensionDtype, register_extension_dtype, take
+from pandas.api.indexers import check_array_indexer
+
+from . import _patterns
+from .converter import _as_1d_array, _is_blank, _mileage_data_as_str, _round, _split_mileage_strs
+
+#: The number of yards in a mile.
+YARDS_PER_MILE = 1760
+#: The number of yards in a chain.
+YARDS_PER_CHAIN = 22
+
+
+# == Scalar ========================================================================================
+
+
+@functools.total_ordering
+class Mileage:
+    """
+    A mileage, i.e. a distance (in whole yards) along an ELR.
+
+    It is the scalar type of :class:`~pyrcs.mileage.MileageArray`.
+
+    **Examples**::
+
+        >>> from pyrcs.mileage import Mileage
+        >>> m = Mileage.from_mileage('1.0396')
+        >>> m
+        Mileage('1.0396')
+        >>> m.yards
+        2156
+        >>> m.to_mile_chain()
+        '1.18'
+        >>> m + 220
+        Mileage('1.0616')
+        >>> m - Mileage.from_mile_chain('0.18')
+        1760
+    """
+
+    __slots__ = ('yards',)
+
+    def __init__(self, yards):
+        """
+        :param yards: The mileage in (whole) yards.
+        :type yards: int
+
+        :ivar int yards: The mileage in yards.
+        """
+
+        if isinstance(yards, (float, np.floating)) and not float(yards).is_integer():
+            raise ValueError(f"A mileage must be a whole number of yards, not {yards!r}.")
+
+        self.yards = int(yards)
+
+    @classmethod
+    def from_mileage(cls, mileage):
+        """
+        Creates a mileage from the form of *<miles>.<yards>*.
+
+        :param mileage: A mileage in the form of *<miles>.<yards>*, e.g. ``'0.0396'``.
+        :type mileage: str | float
+        :return: The mileage.
+        :rtype: Mileage
+        """
+
+        return MileageArray.from_mileages([mileage])[0]
+
+    @classmethod
+    def from_mile_chain(cls, mile_chain):
+        """
+        Creates a mileage from the form of *<miles>.<chains>*.
+
+        :param mile_chain: A mileage in the form of *<miles>.<chains>*, e.g. ``'0.18'``.
+        :type mile_chain: str | float
+        :return: The mileage.
+        :rtype: Mileage
+        """
+
+        return MileageArray.from_mile_chains([mile_chain])[0]
+
+    def to_mileage(self):
+        """
+        Formats the mileage in the form of *<miles>.<yards>*.
+
+        :return: The mileage in the form of *<miles>.<yards>*, e.g. ``'0.0396'``.
+        :rtype: str
+        """
+
+        miles, yards = divmod(abs(self.yards), YARDS_PER_MILE)
+
+        return f"{'-' if self.yards < 0 else ''}{miles}.{yards:04d}"
+
+    def to_mile_chain(self):
+        """
+        Formats the mileage (to the nearest chain) in the form of *<miles>.<chains>*.
+
+        :return: The mileage in the form of *<miles>.<chains>*, e.g. ``'0.18'``.
+        :rtype: str
+        """
+
+        return MileageArray(np.array([self.yards])).to_mile_chains()[0]
+
+    def __str__(self):
+        return self.to_mileage()
+
+    def __repr__(self):
+        return f"{type(self).__name__}('{self}')"
+
+    def __hash__(self):
+        return hash((type(self), self.yards))
+
+    def __eq__(self, other):
+        if isinstance(other, Mileage):
+            return self.yards == other.yards
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, Mileage):
+            return self.yards < other.yards
+        return NotImplemented
+
+    def __add__(self, other):
+        if isinstance(other, numbers.Integral):
+            return type(self)(self.yards + int(other))
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Mileage):
+            return self.yards - other.yards
+        if isinstance(other, numbers.Integral):
+            return type(self)(self.yards - int(other))
+        return NotImplemented
+
+    def __int__(self):
+        return self.yards
+
+
+# == Data type =====================================================================================
+
+
+@register_extension_dtype
+class MileageDtype(ExtensionDtype):
+    """
+    The data type (``'mileage'``) of mileages, which are stored as whole numbers of yards.
+
+    **Examples**::
+
+        >>> from pyrcs.mileage import MileageDtype
+        >>> import pandas as pd
+        >>> pd.Series(['0.0396', '1.0000', None], dtype='mileage')
+        0    0.0396
+        1    1.0000
+        2      <NA>
+        dtype: mileage
+    """
+
+    name = 'mileage'
+    type = Mileage
+    kind = 'O'
+    na_value = pd.NA
+
+    @classmethod
+    def construct_array_type(cls):
+        """
+        Returns the array type associated with this data type.
+
+        :return: The array type of mileages.
+        :rtype: type[MileageArray]
+        """
+
+        return MileageArray
+
+    def __repr__(self):
+        return self.name
+
+    def __from_arrow__(self, array):
+        # The yards (as int64) from Parquet or Feather (see MileageArray.__arrow_array__())
+        import pyarrow
+
+        chunks = array.chunks if isinstance(array, pyarrow.ChunkedArray) else [array]
+        arrays = [
+            MileageArray(x.fill_null(0).to_numpy(zero_copy_only=False), x.is_null().to_numpy(
+                zero_copy_only=False)) for x in chunks]
+
+        return MileageArray._concat_same_type(arrays) if arrays else MileageArray([])
+
+
+def _text_to_yards(text):
+    # e.g. '11m 43ch' or '24.458km' (to the nearest yard), or NaN for the other values
+    if isinstance(text, str):
+        if match := _patterns.MILEAGE_TEXT_MILES_CHAINS.match(text):
+            return (int(match[1]) * 80 + int(match[2])) * YARDS_PER_CHAIN
+        if match := _patterns.MILEAGE_TEXT_KM.match(text):
+            return round(float(match[1]) * 1093.6132983377079)
+
+    return np.nan
+
+
+def _raise_or_coerce(values, is_invalid, errors, form):
+    # Raise an error for the (first) invalid value, or leave the invalid values as missing values
+    if errors not in {'raise', 'coerce'}:
+        raise ValueError("`errors` must be one of {'raise', 'coerce'}.")
+
+    if errors == 'raise' and is_invalid.any():
+        raise ValueError(f"{values[is_invalid][0]!r} is not a mileage {form}.")
+
+
+class MileageArray(ExtensionArray):
+    """
+    An array of mileages, which are stored as whole numbers (int64) of yards, with a mask of
+    the missing values.
+
+    **Examples**::
+
+        >>> from pyrcs.mileage import MileageArray
+        >>> import pandas as pd
+        >>> mileages = MileageArray.from_mile_chains(['0.18', '84.62', ''])
+        >>> mileages
+        <MileageArray>
+        ['0.0396', '84.1364', <NA>]
+        Length: 3, dtype: mileage
+        >>> mileages.to_mileages()
+        array(['0.0396', '84.1364', ''], dtype=object)
+        >>> mileages.to_yards()
+        <IntegerArray>
+        [396, 149204, <NA>]
+        Length: 3, dtype: Int64
+        >>> s = pd.Series(mileages)
+        >>> s.sort_values(ascending=False)
+        1    84.1364
+        0     0.0396
+        2        <NA>
+        dtype: mileage
+        >>> s[s > '1.0000']
+        1    84.1364
+        dtype: mileage
+        >>> s + 220
+        0     0.0616
+        1    84.1584
+        2       <NA>
+        dtype: mileage
+    """
+
+    _dtype = MileageDtype()
+
+    def __init__(self, yards, mask=None, copy=False):
+        """
+        :param yards: The mileages in yards.
+        :type yards: numpy.ndarray
+        :param mask: Whether each mileage is missing; defaults to ``None`` (i.e. none is missing).
+        :type mask: numpy.ndarray | None
+        :param copy: Whether to copy ``yards`` and ``mask``; defaults to ``False``.
+        :type copy: bool
+        """
+
+        yards = np.array(yards, dtype=np.int64, copy=copy or None).reshape(-1)
+        if mask is None:
+            mask = np.zeros(len(yards), dtype=bool)
+        else:
+            mask = np.array(mask, dtype=bool, copy=copy or None).reshape(-1)
+
+        if len(mask) != len(yards):
+            raise ValueError("`yards` and `mask` must be of the same length.")
+
+        self._yards, self._mask = yards, mask
+
+    # -- Constructors ------------------------------------------------------------------------------
+
+    @classmethod
+    def from_yards(cls, yards, errors='raise'):
+        """
+        Creates an array of mileages from (whole) numbers of yards.
+
+        :param yards: The mileages in yards; blank values (``None``, ``NaN`` or ``''``) are
+            taken as missing values.
+        :type yards: list | numpy.ndarray | pandas.Series
+        :param errors: Whether to raise an error for (``'raise'``, default) or to leave as missing
+            values (``'coerce'``) the values that are not whole numbers.
+        :type errors: str
+        :return: The array of mileages.
+        :rtype: MileageArray
+
+        **Examples**::
+
+            >>> from pyrcs.mileage import MileageArray
+            >>> MileageArray.from_yards([396, 2156, None])
+            <MileageArray>
+            ['0.0396', '1.0396', <NA>]
+            Length: 3, dtype: mileage
+        """
+
+        values = _as_1d_array(yards)
+        if values.dtype.kind in 'iu':
+            return cls(values)
+
+        is_blank = _is_blank(values)
+        numbers_ = np.asarray(pd.to_numeric(
+            np.where(is_blank, np.nan, values), errors='coerce'), dtype=np.float64)
+
+        is_invalid = ~is_blank & ~(np.isfinite(numbers_) & (numbers_ == np.trunc(numbers_)))
+        _raise_or_coerce(values, is_invalid, errors, form="in yards")
+
+        mask = is_blank | is_invalid
+
+        return cls(np.where(mask, 0, numbers_), mask)
+
+    @classmethod
+    def _from_miles_and_minor(cls, data, miles, minor, is_valid, minor_unit, errors, form):
+        # The mileages of which the miles (signed, as float(), e.g. -0.0) and the yards or chains
+        # (i.e. `minor`, in units of `minor_unit` yards) are parsed
+        is_blank = _is_blank(data)
+        is_valid &= minor * minor_unit < YARDS_PER_MILE
+
+        is_invalid = ~is_blank & ~is_valid
+        _raise_or_coerce(data, is_invalid, errors, form=form)
+
+        is_neg = np.signbit(miles)
+        if (is_zero := is_valid & ~is_neg & (miles == 0)).any():  # e.g. '-0.0220'
+            is_neg[is_zero] = [isinstance(x, str) and x.startswith('-') for x in data[is_zero]]
+
+        mask = ~is_valid
+        yards = np.abs(miles) * YARDS_PER_MILE + minor * minor_unit
+        yards = np.where(is_neg, -yards, yards)
+
+        return cls(np.where(mask, 0, yards), mask)
+
+    @classmethod
+    def from_mileages(cls, mileages, errors='raise'):
+        """
+        Creates an array of mileages from the form of *<miles>.<yards>*.
+
+        :param mileages: The mileages, either strings in the form of *<miles>.<yards>*
+            (e.g. ``'0.0396'``) or numbers (e.g. ``0.0396``); blank values (``None``, ``NaN`` or
+            ``''``) are taken as missing values.
+        :type mileages: list | numpy.ndarray | pandas.Series
+        :param errors: Whether to raise an error for (``'raise'``, default) or to leave as missing
+            values (``'coerce'``) the values that are not of the form.
+        :type errors: str
+        :return: The array of mileages.
+        :rtype: MileageArray
+
+        **Examples**::
+
+            >>> from pyrcs.mileage import MileageArray
+            >>> MileageArray.from_mileages(['0.0396', 1.0396, '-0.0220', None])
+            <MileageArray>
+            ['0.0396', '1.0396', '-0.0220', <NA>]
+            Length: 4, dtype: mileage
+        """
+
+        values = _as_1d_array(mileages)
+
+        if values.dtype == object:
+            is_valid, miles, yards = _split_mileage_strs(values)
+            is_number = ~is_valid & ~_is_blank(values)
+            is_number[is_number] = [isinstance(x, numbers.Real) for x in values[is_number]]
+        else:
+            is_valid, miles, yards = np.zeros((3, len(values)))
+            is_valid, is_number = is_valid.astype(bool), np.isfinite(values)
+
+        if is_number.any():  # As the strings of mileage_num_to_str(), e.g. -1.0396 as '-1.0396'
+            numbers_ = values[is_number].astype(np.float64)
+            mileage_nums = np.rint(_round(np.abs(numbers_), 4) * 10 ** 4)
+            miles_ = np.trunc(mileage_nums / 10 ** 4)
+            yards[is_number] = mileage_nums - miles_ * 10 ** 4
+            miles[is_number] = np.where(np.signbit(numbers_), -miles_, miles_)
+            is_valid |= is_number
+
+        return cls._from_miles_and_minor(
+            values, miles, yards, is_valid, minor_unit=1, errors=errors,
+            form="of the form <miles>.<yards>")
+
+    @classmethod
+    def from_mile_chains(cls, mile_chains, errors='raise'):
+        """
+        Creates an array of mileages from the form of *<miles>.<chains>*.
+
+        :param mile_chains: The mileages, either strings in the form of *<miles>.<chains>*
+            (e.g. ``'0.18'``) or numbers (e.g. ``0.18``); blank values (``None``, ``NaN`` or
+            ``''``) are taken as missing values.
+        :type mile_chains: list | numpy.ndarray | pandas.Series
+        :param errors: Whether to raise an error for (``'raise'``, default) or to leave as missing
+            values (``'coerce'``) the values that are not of the form.
+        :type errors: str
+        :return: The array of mileages.
+        :rtype: MileageArray
+
+        **Examples**::
+
+            >>> from pyrcs.mileage import MileageArray
+            >>> MileageArray.from_mile_chains(['0.18', 84.62, None])
+            <MileageArray>
+            ['0.0396', '84.1364', <NA>]
+            Length: 3, dtype: mileage
+        """
+
+        # Numbers as the strings of str(), as for mile_chain_to_mileage()
+        values = _mileage_data_as_str(mile_chains)
+
+        is_valid, miles, chains = _split_mileage_strs(values)
+        if (is_number := ~is_valid & ~_is_blank(values)).any():  # e.g. 0.18 in ['0.10', 0.18]
+            is_number[is_number] = [isinstance(x, numbers.Real) for x in values[is_number]]
+            values = values.copy()
+            values[is_number] = [str(x) for x in values[is_number]]
+            is_valid[is_number], miles[is_number], chains[is_number] = _split_mileage_strs(
+                values[is_number])
+
+        return cls._from_miles_and_minor(
+            values, miles, chains, is_valid, minor_unit=YARDS_PER_CHAIN, errors=errors,
+            form="of the form <miles>.<chains>")
+
+    @classmethod
+    def from_text(cls, text, errors='raise'):
+        """
+        Creates an array of mileages from the text of mileages in miles and chains
+        (e.g. ``'11m 43ch'``) or in kilometres (e.g. ``'24.458km'``).
+
+        Such text is given in the tables of e.g. railway station locations and HABDs.
+        The mileages in kilometres are rounded to the nearest yard.
+
+        :param text: The text of the mileages; blank values (``None``, ``NaN`` or ``''``) are
+            taken as missing values.
+        :type text: list | numpy.ndarray | pandas.Series
+        :param errors: Whether to raise an error for (``'raise'``, default) or to leave as missing
+            values (``'coerce'``) the values that are not of either form.
+        :type errors: str
+        :return: The array of mileages.
+        :rtype: MileageArray
+
+        **Examples**::
+
+            >>> from pyrcs.mileage import MileageArray
+            >>> MileageArray.from_text(['11m 43ch', '24.458km', ''])
+            <MileageArray>
+            ['11.0946', '15.0348', <NA>]
+            Length: 3, dtype: mileage
+        """
+
+        values = _as_1d_array(text)
+
+        # The same text (e.g. of the mileage of a station on several ELRs) is parsed only once
+        codes, uniques = pd.factorize(values)
+        yards = np.array([_text_to_yards(x) for x in uniques] + [np.nan])[codes]  # -1 for NaN
+
+        is_blank = _is_blank(values)
+        is_valid = ~np.isnan(yards)
+
+        is_invalid = ~is_blank & ~is_valid
+        _raise_or_coerce(values, is_invalid, errors, form="in miles and chains or kilometres")
+
+        mask = ~is_valid
+
+        return cls(np.where(mask, 0, yards), mask)
+
+    # -- Formatters --------------------------------------------------------------------------------
+
+    def to_yards(self):
+        """
+        Converts the mileages to yards.
+
+        :return: The mileages in yards.
+        :rtype: pandas.arrays.IntegerArray
+        """
+
+        return pd.arrays.IntegerArray(self._yards.copy(), self._mask.copy())
+
+    def _format(self, miles, minor, width, na_value):
+        # e.g. '-1.0396'
+        strs = np.full(len(self), na_value, dtype=object)
+
+        valid = ~self._mask
+        strs[valid] = [
+            f'{m}.{x:0{width}d}' for m, x in zip(miles[valid].tolist(), minor[valid].tolist())]
+
+        is_neg = valid & (self._yards < 0)
+        strs[is_neg] = ['-' + x for x in strs[is_neg]]
+
+        return strs
+
+    def to_mileages(self, na_value=''):
+        """
+        Formats the mileages in the form of *<miles>.<yards>*.
+
+        :param na_value: The value for the missing values; defaults to ``''``.
+        :type na_value: typing.Any
+        :return: The mileages in the form of *<miles>.<yards>*, e.g. ``'0.0396'``.
+        :rtype: numpy.ndarray
+        """
+
+        miles, yards = np.divmod(np.abs(self._yards), YARDS_PER_MILE)
+
+        return self._format(miles, yards, width=4, na_value=na_value)
+
+    def to_mile_chains(self, na_value=''):
+        """
+        Formats the mileages (to the nearest chain) in the form of *<miles>.<chains>*.
+
+        :param na_value: The value for the missing values; defaults to ``''``.
+        :type na_value: typing.Any
+        :return: The mileages in the form of *<miles>.<chains>*, e.g. ``'0.18'``.
+        :rtype: numpy.ndarray
+        """
+
+        chains = (np.abs(self._yards) + YARDS_PER_CHAIN // 2) // YARDS_PER_CHAIN
+        miles, chains = np.divmod(chains, YARDS_PER_MILE // YARDS_PER_CHAIN)
+
+        return self._format(miles, chains, width=2, na_value=na_value)
+
+    # -- The interface of pandas.api.extensions.ExtensionArray -------------------------------------
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        # Mileages (or missing values), yards (as numbers) or strings of the form <miles>.<yards>
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+
+        values = _as_1d_array(scalars)
+        if values.dtype != object:
+            return cls.from_yards(values)
+
+        is_mileage = np.array([isinstance(x, Mileage) for x in values], dtype=bool)
+        is_str = np.array([isinstance(x, str) for x in values], dtype=bool)
+        is_na = ~is_mileage & pd.isna(values)
+        is_other = ~(is_mileage | is_str | is_na)
+
+        yards, mask = np.zeros(len(values), dtype=np.int64), is_na.copy()
+        yards[is_mileage] = [x.yards for x in values[is_mileage]]
+        for is_, from_ in [(is_str, cls.from_mileages), (is_other, cls.from_yards)]:
+            if is_.any():
+                array = from_(values[is_])
+                yards[is_], mask[is_] = array._yards, array._mask
+
+        return cls(yards, mask)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, *, dtype=None, copy=False):
+        return cls.from_mileages(strings)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(values, values == np.iinfo(np.int64).min)
+
+    def _values_for_factorize(self):
+        na_value = np.iinfo(np.int64).min
+        return np.where(self._mask, na_value, self._yards), na_value
+
+    def _values_for_argsort(self):
+        return self._yards
+
+    def __getitem__(self, item):
+        if pd.api.types.is_integer(item):
+            return self._dtype.na_value if self._mask[item] else Mileage(self._yards[item])
+
+        item = check_array_indexer(self, item)
+
+        return type(self)(self._yards[item], self._mask[item])
+
+    def __setitem__(self, key, value):
+        key = check_array_indexer(self, key)
+
+        if pd.api.types.is_scalar(value) or isinstance(value, Mileage):
+            value = [value]
+        value = self._from_sequence(value)
+
+        self._yards[key], self._mask[key] = value._yards, value._mask
+
+    def __len__(self):
+        return len(self._yards)
+
+    def __iter__(self):
+        na_value = self._dtype.na_value
+        for yards, is_na in zip(self._yards.tolist(), self._mask.tolist()):
+            yield na_value if is_na else Mileage(yards)
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(list(self), dtype=object if dtype is None else dtype)
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def nbytes(self):
+        return self._yards.nbytes + self._mask.nbytes
+
+    def isna(self):
+        return self._mask.copy()
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        if allow_fill and fill_value is not None and fill_value is not pd.NA:
+            fill = self._from_sequence([fill_value])
+            fill_yards, fill_mask = fill._yards[0], fill._mask[0]
+        else:
+            fill_yards, fill_mask = 0, True
+
+        yards = take(self._yards, indices, allow_fill=allow_fill, fill_value=fill_yards)
+        mask = take(self._mask, indices, allow_fill=allow_fill, fill_value=fill_mask)
+
+        return type(self)(yards, mask)
+
+    def copy(self):
+        return type(self)(self._yards, self._mask, copy=True)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls(np.concatenate([x._yards for x in to_concat]),
+                   np.concatenate([x._mask for x in to_concat]))
+
+    def __arrow_array__(self, type=None):
+        # The yards (as int64) for Parquet or Feather (see MileageDtype.__from_arrow__())
+        import pyarrow
+
+        return pyarrow.array(self._yards, mask=self._mask, type=type or pyarrow.int64())
+
+    def value_counts(self, dropna=True):
+        counts = pd.Series(self._yards[~self._mask]).value_counts(sort=False)
+        mileages, counts = type(self)(counts.index.to_numpy()), counts.to_numpy()
+
+        if not dropna and self._mask.any():
+            mileages = self._concat_same_type([mileages, type(self)([0], [True])])
+            counts = np.append(counts, self._mask.sum())
+
+        return pd.Series(counts, index=pd.Index(mileages), name='count')
+
+    def _formatter(self, boxed=False):
+        if boxed:
+            return str
+        return lambda x: repr(str(x)) if isinstance(x, Mileage) else str(x)
+
+    def _reduce(self, name, *, skipna=True, keepdims=False, **kwargs):
+        if name not in {'min', 'max'}:
+            raise TypeError(f"'{type(self).__name__}' does not support reduction '{name}'.")
+
+        if self._mask.all() or (not skipna and self._mask.any()):
+            result = self._dtype.na_value
+        else:
+            result = Mileage(getattr(self._yards[~self._mask], name)())
+
+        return self._from_sequence([result]) if keepdims else result
+
+    # -- Comparison and arithmetic -----------------------------------------------------------------
+
+    def _operand(self, other):
+        # The yards and the mask of the other operand, or None if it is not (an array of) mileages
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+
+        if not isinstance(other, MileageArray):
+            try:
+                if pd.api.types.is_scalar(other) or isinstance(other, Mileage):
+                    if not isinstance(other, (Mileage, str)) and other is not pd.NA:
+                        return None
+                    other = self._from_sequence([other])
+                else:
+                    other = self._from_sequence(other)
+            except (TypeError, ValueError):
+                return None
+
+        return other._yards, other._mask
+
+    def _compare(self, other, op):
+        operand = self._operand(other)
+        if operand is NotImplemented:
+            return NotImplemented
+
+        if operand is None:
+            if op not in {operator.eq, operator.ne}:
+                raise TypeError(
+                    f"'{op.__name__}' is not supported between mileages and {type(other).__name__}")
+            result = np.full(len(self), op is operator.ne)
+            return pd.arrays.BooleanArray(result, self._mask.copy())
+
+        other_yards, other_mask = operand
+
+        return pd.arrays.BooleanArray(op(self._yards, other_yards), self._mask | other_mask)
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    @staticmethod
+    def _shift_operand(other):
+        # The yards (and the mask) of a shift, i.e. (an array of) whole numbers of yards
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+
+        if isinstance(other, pd.arrays.IntegerArray):
+            return other.to_numpy(dtype=np.int64, na_value=0), other.isna()
+
+        if isinstance(other, (numbers.Integral, list, np.ndarray)):
+            yards = np.asarray(other)
+            if yards.dtype.kind in 'iu':
+                return yards.astype(np.int64), False
+
+        return None
+
+    def __add__(self, other):
+        shift = self._shift_operand(other)
+        if shift is NotImplemented or shift is None:
+            return NotImplemented
+
+        yards, mask = shift
+
+        return type(self)(self._yards + yards, self._mask | mask)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        shift = self._shift_operand(other)
+        if shift is NotImplemented:
+            return NotImplemented
+
+        if shift is not None:
+            yards, mask = shift
+            return type(self)(self._yards - yards, self._mask | mask)
+
+        operand = self._operand(other)
+        if operand is NotImplemented or operand is None or isinstance(other, str):
+            return NotImplemented
+
+        # The distances (in yards) between the mileages
+        other_yards, other_mask = operand
+        mask = self._mask | other_mask
+
+        return pd.arrays.IntegerArray(np.where(mask, 0, self._yards - other_yards), mask)
+
+    def __rsub__(self, other):
+        if isinstance(other, Mileage):
+            return (self - other) * -1
+        return NotImplemented
+
+
+# == Conversion ====================================================================================
+
+_FROM_FORMS = {
+    'yard': MileageArray.from_yards,
+    'mileage': MileageArray.from_mileages,
+    'mile_chain': MileageArray.from_mile_chains,
+    'text': MileageArray.from_text,
+}
+
+
+def to_mileage(data, form='mileage', errors='raise'):
+    """
+    Converts data of mileages to the data type of mileages (i.e. ``'mileage'``).
+
+    :param data: The data of mileages.
+    :type data: list | numpy.ndarray | pandas.Series
+    :param form: The form of the data, one of ``'mileage'`` (*<miles>.<yards>*, default),
+        ``'mile_chain'`` (*<miles>.<chains>*), ``'yard'`` (yards) and ``'text'`` (e.g.
+        ``'11m 43ch'`` or ``'24.458km'``).
+    :type form: str
+    :param errors: Whether to raise an error for (``'raise'``, default) or to leave as missing
+        values (``'coerce'``) the values that are not of the form.
+    :type errors: str
+    :return: The mileages; a pandas.Series if ``data`` is one.
+    :rtype: MileageArray | pandas.Series
+
+    **Examples**::
+
+        >>> from pyrcs.mileage import to_mileage
+        >>> import pandas as pd
+        >>> to_mileage(pd.Series(['0.18', '84.62']), form='mile_chain')
+        0     0.0396
+        1    84.1364
+        dtype: mileage
+    """
+
+    if form not in _FROM_FORMS:
+        raise ValueError(f"`form` must be one of {set(_FROM_FORMS)}.")
+
+    mileages = _FROM_FORMS[form](data, errors=errors)
+
+    if isinstance(data, pd.Series):
+        return pd.Series(mileages, index=data.index, name=data.name)
+
+    return mileages
+
+
+def format_mileage(data, form='mileage', na_value=''):
+    """
+    Formats mileages (of the data type of mileages) in a textual form.
+
+    :param data: The mileages.
+    :type data: MileageArray | pandas.Series
+    :param form: The form, either ``'mileage'`` (*<miles>.<yards>*, default) or ``'mile_chain'``
+        (*<miles>.<chains>*).
+    :type form: str
+    :param na_value: The value for the missing values; defaults to ``''``.
+    :type na_value: typing.Any
+    :return: The formatted mileages; a pandas.Series if ``data`` is one.
+    :rtype: numpy.ndarray | pandas.Series
+
+    **Examples**::
+
+        >>> from pyrcs.mileage import format_mileage, to_mileage
+        >>> format_mileage(to_mileage(['0.0396', '84.1364']), form='mile_chain')
+        array(['0.18', '84.62'], dtype=object)
+    """
+
+    if form not in {'mileage', 'mile_chain'}:
+        raise ValueError("`form` must be one of {'mileage', 'mile_chain'}.")
+
+    mileages = data.array if isinstance(data, pd.Series) else data
+    if not isinstance(mileages, MileageArray):
+        mileages = MileageArray._from_sequence(mileages)
+
+    if form == 'mileage':
+        strs = mileages.to_mileages(na_value=na_value)
+    else:
+        strs = mileages.to_mile_chains(na_value=na_value)
+
+    if isinstance(data, pd.Series):
+        return pd.Series(strs, index=data.index, name=data.name)
+
+    return strs
+
+
+def _as_mileage_dtype(data, form='mileage'):
+    """
+    Converts the ``'Mileage'`` columns of (the dataframes in) the fetched data to the data type of
+    mileages; the values that are not of the form are left as missing values.
+
+    :param data: The fetched data, e.g. a dictionary of dataframes.
+    :type data: pandas.DataFrame | dict | typing.Any
+    :param form: The form of the mileages (see :func:`~pyrcs.mileage.to_mileage`);
+        defaults to ``'mileage'``.
+    :type form: str
+    :return: A copy of the data, in which the mileages are of the data type of mileages.
+    :rtype: pandas.DataFrame | dict | typing.Any
+    """
+
+    if isinstance(data, pd.DataFrame) and 'Mileage' in data.columns:
+        return data.assign(Mileage=to_mileage(data['Mileage'], form=form, errors='coerce'))
+
+    if isinstance(data, dict):
+        return {k: _as_mileage_dtype(v, form=form) for k, v in data.items()}
+
+    return data
+
+
+def _mileage_to_str(mileage):
+    # A mileage (of any type) as in the form of <miles>.<yards> (and a missing value as '')
+    if isinstance(mileage, Mileage):
+        return mileage.to_mileage()
+
+    return '' if pd.isna(mileage) else mileage
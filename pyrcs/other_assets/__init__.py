@@ -5,16 +5,20 @@ A subpackage for collecting codes of
 (See also the :py:class:`~pyrcs.collector.OtherAssets` class.)
 """
 
-from .buzzer import Buzzer
-from .depot import Depots
-from .feature import Features
-from .habd_wild import HabdWild
-from .sig_box import SignalBoxes
-from .station import Stations
-from .telegraph import Telegraph
-from .trough import WaterTroughs
-from .tunnel import Tunnels
-from .viaduct import Viaducts
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .buzzer import Buzzer
+    from .depot import Depots
+    from .feature import Features
+    from .habd_wild import HabdWild
+    from .sig_box import SignalBoxes
+    from .station import Stations
+    from .telegraph import Telegraph
+    from .trough import WaterTroughs
+    from .tunnel import Tunnels
+    from .viaduct import Viaducts
 
 __all__ = [
     'buzzer', 'Buzzer',
@@ -28,3 +32,33 @@ __all__ = [
     'tunnel', 'Tunnels',
     'viaduct', 'Viaducts',
 ]
+
+# The modules and classes are imported on first access (PEP 562).
+_CLASSES = {
+    'Buzzer': 'buzzer',
+    'Depots': 'depot',
+    'Features': 'feature',
+    'HabdWild': 'habd_wild',
+    'SignalBoxes': 'sig_box',
+    'Stations': 'station',
+    'Telegraph': 'telegraph',
+    'WaterTroughs': 'trough',
+    'Tunnels': 'tunnel',
+    'Viaducts': 'viaduct',
+}
+
+
+def __getattr__(name):
+    if name in _CLASSES.values():
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name in _CLASSES:
+        cls = getattr(importlib.import_module(f'.{_CLASSES[name]}', __name__), name)
+        globals()[name] = cls  # Cache it so that this function is bypassed next time
+        return cls
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
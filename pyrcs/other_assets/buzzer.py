@@ -24,7 +24,7 @@ class Buzzer(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -32,6 +32,9 @@ class Buzzer(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -47,7 +50,8 @@ class Buzzer(_Base):
         """
 
         super().__init__(
-            data_dir=data_dir, data_category="other-assets", update=update, verbose=verbose)
+            data_dir=data_dir, data_category="other-assets", update=update, verbose=verbose,
+            lazy=lazy)
 
     def _collect_codes(self, source, verbose=False):
         codes_dat, soup = parse_table(source=source, parser='html.parser', as_dataframe=True)
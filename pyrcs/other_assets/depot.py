@@ -6,11 +6,10 @@ import itertools
 import re
 import urllib.parse
 
-import bs4
 import pandas as pd
 
 from .._base import _Base
-from ..parser import _get_last_updated_date, parse_tr
+from ..parser import _get_last_updated_date, get_soup, parse_tr
 from ..utils import get_batch_fetch_verbosity, homepage_url
 
 
@@ -40,7 +39,7 @@ class Depots(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -48,6 +47,9 @@ class Depots(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -66,10 +68,10 @@ class Depots(_Base):
 
         super().__init__(
             data_dir=data_dir, content_type='catalogue', data_category="other-assets",
-            update=update, verbose=verbose)
+            update=update, verbose=verbose, lazy=lazy)
 
     def _collect_tops_codes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         thead, tbody = soup.find('thead'), soup.find('tbody')
         ths = [th.text for th in thead.find_all(name='th')]
@@ -203,7 +205,7 @@ class Depots(_Base):
         return _region_name
 
     def _collect_pre_tops_codes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         thead, tbody = soup.find('thead'), soup.find('tbody')
 
@@ -336,7 +338,7 @@ class Depots(_Base):
         return four_digit_pre_tops_codes_data
 
     def _collect_1950_system_codes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         thead, tbody = soup.find('thead'), soup.find('tbody')
 
@@ -461,7 +463,7 @@ class Depots(_Base):
         return system_1950_data
 
     def _collect_gwr_codes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         theads, tbodies = soup.find_all(name='thead'), soup.find_all(name='tbody')
 
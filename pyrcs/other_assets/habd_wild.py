@@ -6,10 +6,10 @@ Collects codes of `HABD and WILD`_.
 
 import urllib.parse
 
-import bs4
 
 from .._base import _Base
-from ..parser import _get_last_updated_date, parse_tr
+from ..mileage import _as_mileage_dtype
+from ..parser import _get_last_updated_date, get_soup, parse_tr
 from ..utils import homepage_url
 
 
@@ -33,7 +33,7 @@ class HabdWild(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -41,6 +41,9 @@ class HabdWild(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -56,7 +59,8 @@ class HabdWild(_Base):
         """
 
         super().__init__(
-            data_dir=data_dir, data_category="other-assets", update=update, verbose=verbose)
+            data_dir=data_dir, data_category="other-assets", update=update, verbose=verbose,
+            lazy=lazy)
 
     def _collect_codes(self, source, verbose=False):
         try:
@@ -64,7 +68,7 @@ class HabdWild(_Base):
         except ValueError:
             sub_keys = [self.KEY + ' 1', self.KEY + ' 2']
 
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         codes_list = []
         for h3 in soup.find_all('h3'):
@@ -163,7 +167,8 @@ class HabdWild(_Base):
 
         return habds_and_wilds_codes
 
-    def fetch_codes(self, update=False, dump_dir=None, verbose=False, **kwargs):
+    def fetch_codes(self, update=False, dump_dir=None, verbose=False, mileage_dtype=False,
+                    **kwargs):
         """
         Fetches codes of `HABDs and WILDs`_.
 
@@ -176,6 +181,10 @@ class HabdWild(_Base):
         :type dump_dir: str | None
         :param verbose: Whether to print relevant information to the console; defaults to ``False``.
         :type verbose: bool | int
+        :param mileage_dtype: Whether to convert the mileages (i.e. the column ``'Mileage'``, e.g.
+            ``'74m 51ch'``) to the data type of mileages (see :class:`~pyrcs.mileage.MileageDtype`);
+            defaults to ``False``.
+        :type mileage_dtype: bool
         :return: A dictionary containing the codes of HABDs and WILDs and
             the date they were last updated.
         :rtype: dict
@@ -230,4 +239,7 @@ class HabdWild(_Base):
         habds_and_wilds_codes = self._fetch_data_from_file(
             update=update, dump_dir=dump_dir, verbose=verbose, **kwargs)
 
+        if mileage_dtype:
+            habds_and_wilds_codes = _as_mileage_dtype(habds_and_wilds_codes, form='text')
+
         return habds_and_wilds_codes
@@ -6,13 +6,11 @@ import collections
 import string
 import urllib.parse
 
-import bs4
 import pandas as pd
 
 from .._base import _Base
-from ..parser import _get_last_updated_date, parse_tr
-from ..utils import get_collect_verbosity_for_fetch, homepage_url, is_homepage_connectable, \
-    print_instance_connection_error, print_void_collection_message, validate_initial
+from ..parser import _get_last_updated_date, get_soup, parse_tr
+from ..utils import homepage_url, validate_initial
 
 
 class SignalBoxes(_Base):
@@ -42,7 +40,7 @@ class SignalBoxes(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -50,6 +48,9 @@ class SignalBoxes(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -68,12 +69,12 @@ class SignalBoxes(_Base):
 
         super().__init__(
             data_dir=data_dir, content_type='catalogue', data_category="other-assets",
-            update=update, verbose=verbose)
+            update=update, verbose=verbose, lazy=lazy)
 
     def _collect_prefix_codes(self, initial, source, verbose=False):
         initial_ = validate_initial(initial=initial)
 
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
         thead, tbody = soup.find('thead'), soup.find('tbody')
 
         ths = [th.get_text(strip=True) for th in thead.find_all('th')]
@@ -146,7 +147,7 @@ class SignalBoxes(_Base):
         return signal_box_prefix_codes
 
     def fetch_prefix_codes(self, initial=None, update=False, dump_dir=None, verbose=False,
-                           **kwargs):
+                           max_workers=4, **kwargs):
         """
         Fetches data of `signal box prefix codes`_.
 
@@ -162,6 +163,9 @@ class SignalBoxes(_Base):
         :type dump_dir: str | None
         :param verbose: Whether to print relevant information to the console; defaults to ``False``.
         :type verbose: bool | int
+        :param max_workers: Maximum number of initial letters whose data is fetched concurrently
+            when ``initial=None``; defaults to ``4``.
+        :type max_workers: int
         :return: A dictionary containing the data of signal box prefix codes and
             the date whey they were last updated.
         :rtype: dict
@@ -203,37 +207,119 @@ class SignalBoxes(_Base):
                 update=update, dump_dir=dump_dir, verbose=verbose, **kwargs)
 
         else:
+            # Get every data table
+            signal_box_prefix_codes = self._fetch_merged_initials(
+                self.fetch_prefix_codes, merge=self._merge_prefix_codes,
+                data_name=self.KEY.lower(), update=update, dump_dir=dump_dir, verbose=verbose,
+                max_workers=max_workers)
 
-            verbose_1 = get_collect_verbosity_for_fetch(data_dir=dump_dir, verbose=verbose)
-            verbose_2 = verbose_1 if is_homepage_connectable() else False
+        if dump_dir:
+            self._save_data_to_file(
+                data=signal_box_prefix_codes, data_name=self.KEY, dump_dir=dump_dir,
+                verbose=verbose)
 
-            # Get every data table
-            data = [
-                self.fetch_prefix_codes(initial=x, update=update, verbose=verbose_2)
-                for x in string.ascii_lowercase]
-
-            if all(d[x] is None for d, x in zip(data, string.ascii_uppercase)):
-                if update:
-                    print_instance_connection_error(verbose=verbose)
-                    print_void_collection_message(data_name=self.KEY.lower(), verbose=verbose)
-
-                data = [
-                    self.fetch_prefix_codes(initial=x, update=False, verbose=verbose_1)
-                    for x in string.ascii_lowercase]
-
-            # Select DataFrames only
-            signal_boxes_codes_ = (item[x] for item, x in zip(data, string.ascii_uppercase))
-            signal_boxes_codes = pd.concat(signal_boxes_codes_, ignore_index=True)
-
-            # Get the latest updated date
-            last_updated_dates = (item[self.KEY_TO_LAST_UPDATED_DATE] for item in data)
-            latest_update_date = max(d for d in last_updated_dates if d is not None)
-
-            # Create a dict to include all information
-            signal_box_prefix_codes = {
-                self.KEY: signal_boxes_codes,
-                self.KEY_TO_LAST_UPDATED_DATE: latest_update_date
+        return signal_box_prefix_codes
+
+    def _merge_prefix_codes(self, data):
+        # Select DataFrames only
+        signal_boxes_codes_ = (item[x] for item, x in zip(data, string.ascii_uppercase))
+        signal_boxes_codes = pd.concat(signal_boxes_codes_, ignore_index=True)
+
+        # Get the latest updated date
+        last_updated_dates = (item[self.KEY_TO_LAST_UPDATED_DATE] for item in data)
+        latest_update_date = max(d for d in last_updated_dates if d is not None)
+
+        # Create a dict to include all information
+        signal_box_prefix_codes = {
+            self.KEY: signal_boxes_codes,
+            self.KEY_TO_LAST_UPDATED_DATE: latest_update_date
+        }
+
+        return signal_box_prefix_codes
+
+    async def acollect_prefix_codes(self, initial, confirmation_required=True, verbose=False,
+                                    raise_error=False):
+        """
+        Collects `signal box prefix codes
+        <http://www.railwaycodes.org.uk/signal/signal_boxes0.shtm>`_ for a given initial letter
+        from the source web page asynchronously.
+
+        It is the awaitable counterpart of
+        :meth:`~pyrcs.other_assets.sig_box.SignalBoxes.collect_prefix_codes`,
+        which takes the same parameters.
+
+        :return: A dictionary containing data of signal box prefix codes whose initial letters are
+            the specified ``initial`` and the date of when the data was last updated.
+        :rtype: dict
+
+        **Examples**::
+
+            >>> from pyrcs.other_assets import SignalBoxes  # from pyrcs import SignalBoxes
+            >>> import asyncio
+            >>> sb = SignalBoxes()
+            >>> sb_a_codes = asyncio.run(sb.acollect_prefix_codes('a', confirmation_required=False))
+            >>> list(sb_a_codes.keys())
+            ['A', 'Last updated date']
+        """
+
+        initial_ = validate_initial(initial=initial)
+
+        signal_box_prefix_codes = await self._acollect_data_from_source(
+            data_name=self.NAME.lower(), method=self._collect_prefix_codes, initial=initial_,
+            confirmation_required=confirmation_required, verbose=verbose, raise_error=raise_error)
+
+        return signal_box_prefix_codes
+
+    async def afetch_prefix_codes(self, initial=None, update=False, dump_dir=None, verbose=False,
+                                  **kwargs):
+        """
+        Fetches data of `signal box prefix codes
+        <http://www.railwaycodes.org.uk/signal/signal_boxes0.shtm>`_ asynchronously.
+
+        It is the awaitable counterpart of
+        :meth:`~pyrcs.other_assets.sig_box.SignalBoxes.fetch_prefix_codes`;
+        when ``initial=None``, the pages of all initial letters are requested concurrently.
+
+        :param initial: The initial letter (e.g. ``'a'``, ``'z'``) of signal box prefix code;
+            defaults to ``None``.
+        :type initial: str
+        :param update: Whether to check for updates to the package data; defaults to ``False``.
+        :type update: bool
+        :param dump_dir: The path to a directory where the data file will be saved;
+            defaults to ``None``.
+        :type dump_dir: str | None
+        :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+        :type verbose: bool | int
+        :return: A dictionary containing the data of signal box prefix codes and
+            the date whey they were last updated.
+        :rtype: dict
+
+        **Examples**::
+
+            >>> from pyrcs.other_assets import SignalBoxes  # from pyrcs import SignalBoxes
+            >>> import asyncio
+            >>> sb = SignalBoxes()
+            >>> sb_prefix_codes = asyncio.run(sb.afetch_prefix_codes())
+            >>> list(sb_prefix_codes.keys())
+            ['Signal boxes', 'Last updated date']
+        """
+
+        if initial:
+            args = {
+                'data_name': validate_initial(initial),
+                'method': self.acollect_prefix_codes,
+                'sub_dir': "a-z",
+                'initial': initial,
             }
+            kwargs.update(args)
+
+            signal_box_prefix_codes = await self._afetch_data_from_file(
+                update=update, dump_dir=dump_dir, verbose=verbose, **kwargs)
+
+        else:
+            signal_box_prefix_codes = await self._afetch_merged_initials(
+                self.afetch_prefix_codes, merge=self._merge_prefix_codes,
+                data_name=self.KEY.lower(), update=update, dump_dir=dump_dir, verbose=verbose)
 
         if dump_dir:
             self._save_data_to_file(
@@ -243,7 +329,7 @@ class SignalBoxes(_Base):
         return signal_box_prefix_codes
 
     def _collect_non_national_rail_codes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         non_national_rail_codes = {}
 
@@ -439,7 +525,7 @@ class SignalBoxes(_Base):
         return non_national_rail_codes_data
 
     def _collect_ireland_codes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         thead, tbody = soup.find('thead'), soup.find('tbody')
 
@@ -580,7 +666,7 @@ class SignalBoxes(_Base):
         return tbl
 
     def _collect_wr_mas_dates(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         ths = [th.text for th in soup.find('thead').find_all('th')]
 
@@ -724,7 +810,7 @@ class SignalBoxes(_Base):
         return wr_mas_dates_data
 
     def _collect_bell_codes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         bell_codes_ = {}
         h3s = soup.find_all('h3')
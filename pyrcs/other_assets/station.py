@@ -2,18 +2,18 @@
 Collects `railway station data <http://www.railwaycodes.org.uk/stations/station0.shtm>`_.
 """
 
-import re
 import string
 import urllib.parse
 
-import bs4
 import pandas as pd
 from pyhelpers.text import remove_punctuation
 
+from .. import _patterns
 from .._base import _Base
-from ..parser import _get_last_updated_date, get_catalogue, parse_tr
-from ..utils import cd_data, get_collect_verbosity_for_fetch, homepage_url, is_homepage_connectable, \
-    print_instance_connection_error, print_void_collection_message, validate_initial
+from ..mileage import _as_mileage_dtype
+from ..parser import _get_last_updated_date, _get_lxml_text, _is_lxml_element, _run_page_parser, \
+    get_catalogue, get_soup, parse_tr
+from ..utils import cd_data, homepage_url, validate_initial
 
 
 def _split_elr_mileage_column(dat):
@@ -100,7 +100,7 @@ def _parse_coordinates_columns(dat):
     ll_col_names = ['Degrees Longitude', 'Degrees Latitude']
 
     dat[ll_col_names] = dat[ll_col_names].map(
-        lambda x: None if x.strip() == '' else float(re.sub(r'(c\.)|≈', '', x)))
+        lambda x: None if x.strip() == '' else float(_patterns.APPROXIMATE_COORDINATE.sub('', x)))
 
     return dat
 
@@ -134,7 +134,7 @@ def _parse_station_column(dat):
     stn_note_ = pd.Series('', index=dat.index)
     for i, x in enumerate(temp1[stn_col_name]):
         if '[' in x and ']' in x:
-            y = re.search(r' \[(.*)](✖.*)?', x).group(0)  # Station Note
+            y = _patterns.STATION_NOTE.search(x).group(0)  # Station Note
             dat.loc[i, stn_col_name] = str(x).replace(y, '').strip()
             if '✖' in y:
                 stn_note_[i] = '; '.join([y_.strip(' []') for y_ in y.split('✖')])
@@ -173,7 +173,7 @@ def _parse_owner_and_operator(x):
         y, y_ = x.replace(' / and / ', ' &&& '), ''
 
     elif ' / ' in x or '\r' in x:
-        x_ = re.split(r' / |\r', x)
+        x_ = _patterns.OWNER_OPERATOR_SEP.split(x)
 
         # y - Owners or operators; y_ - Former owners or operators
         if len(x_) > 1:
@@ -219,6 +219,72 @@ def _parse_owner_and_operator_columns(dat):
     return dat
 
 
+def _parse_locations_page(source, station_names_errata=None, parser='html.parser',
+                          parse_only=None):
+    """
+    Parses a web page of railway station locations (for a given initial letter).
+
+    It makes no requests and saves no files, so that it can be run in a worker process
+    (see :func:`~pyrcs.parser.parsing_in_processes`).
+
+    :param source: The response, the parsed document or the raw content of the web page.
+    :type source: requests.Response | ParsedDocument | bytes
+    :param station_names_errata: Replacements (of regular expressions) to amend station names;
+        defaults to ``None``.
+    :type station_names_errata: dict | None
+    :param parser: The parser of the HTML (see :func:`~pyrcs.parser.parse_table`);
+        defaults to ``'html.parser'``.
+    :type parser: str
+    :param parse_only: Names of the only elements to be parsed (see
+        :func:`~pyrcs.parser.get_soup`); defaults to ``None``.
+    :type parse_only: typing.Iterable[str] | None
+    :return: The data of the station locations and the date of the last update of the web page.
+    :rtype: tuple[pandas.DataFrame, str | None]
+    """
+
+    soup = get_soup(source, parser=parser, parse_only=parse_only)
+
+    # Create a DataFrame of the requested table
+    if _is_lxml_element(soup):
+        thead, tbody = next(soup.iter('thead')), next(soup.iter('tbody'))
+        trs = list(tbody.iter('tr'))
+        ths = [
+            _patterns.TH_LINE_BREAK.sub(' ', _get_lxml_text(h)).strip() for h in thead.iter('th')]
+    else:
+        thead, tbody = soup.find('thead'), soup.find('tbody')
+        trs = tbody.find_all(name='tr')
+        ths = [_patterns.TH_LINE_BREAK.sub(' ', h.text).strip() for h in thead.find_all('th')]
+    dat_ = parse_tr(trs=trs, ths=ths, as_dataframe=True)
+
+    dat = dat_.copy()
+
+    parser_funcs = [
+        _split_elr_mileage_column,
+        _check_row_spans,
+        _parse_coordinates_columns,
+        _parse_station_column,
+        _parse_owner_and_operator_columns,
+    ]
+    for parser_func in parser_funcs:
+        dat = parser_func(dat)
+
+    # # Debugging
+    # for parser_func in parser_funcs:
+    #     try:
+    #         dat_ = parser_func(dat_)
+    #     except Exception:
+    #         print(parser_func)
+    #         break
+
+    # Explode by ELR and Mileage
+    dat = dat.explode(column=['ELR', 'Mileage'], ignore_index=True)
+
+    if station_names_errata:
+        dat['Station'] = dat['Station'].replace(station_names_errata, regex=True)
+
+    return dat.sort_values('Station', ignore_index=True), _get_last_updated_date(soup=soup)
+
+
 class Stations(_Base):
     """
     A class for collecting
@@ -238,7 +304,11 @@ class Stations(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    # The only elements parsed from a page of station data, i.e. the table and
+    # the paragraph of the last update date
+    _PAGE_ELEMENTS = ('thead', 'tbody', 'p')
+
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -246,6 +316,9 @@ class Stations(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -263,9 +336,8 @@ class Stations(_Base):
         """
 
         super().__init__(
-            data_dir=data_dir, data_category="other-assets", update=update, verbose=verbose)
-
-        self.catalogue = self.fetch_catalogue(update=update, verbose=False)
+            data_dir=data_dir, data_category="other-assets", update=update, verbose=verbose,
+            lazy=lazy)
 
         self.station_names_errata = {
                 "-By-": "-by-",
@@ -282,8 +354,14 @@ class Stations(_Base):
                 "-Y-": "-y-",
             }
 
+    def _get_catalogue(self):
+        return self.fetch_catalogue(update=self._update, verbose=False)
+
+    def _get_url_by_initial(self, initial):
+        return self.catalogue[self.KEY_TO_STN].get(initial)
+
     def _collect_catalogue(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.text, features='html.parser')
+        soup = get_soup(source)
 
         cold_soup = soup.find_all('nav')[1]
 
@@ -399,47 +477,14 @@ class Stations(_Base):
 
         return catalogue
 
-    def _collect_locations(self, initial, source, verbose=False):
+    def _collect_locations(self, initial, source, verbose=False, parser='html.parser'):
         initial_ = validate_initial(initial)
 
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
-        thead, tbody = soup.find('thead'), soup.find('tbody')
+        dat, last_updated_date = _run_page_parser(
+            _parse_locations_page, source, station_names_errata=self.station_names_errata,
+            parser=parser, parse_only=self._PAGE_ELEMENTS)
 
-        # Create a DataFrame of the requested table
-        trs = tbody.find_all(name='tr')
-        ths = [re.sub(r'\n?\r+\n?', ' ', h.text).strip() for h in thead.find_all('th')]
-        dat_ = parse_tr(trs=trs, ths=ths, as_dataframe=True)
-
-        dat = dat_.copy()
-
-        parser_funcs = [
-            _split_elr_mileage_column,
-            _check_row_spans,
-            _parse_coordinates_columns,
-            _parse_station_column,
-            _parse_owner_and_operator_columns,
-        ]
-        for parser_func in parser_funcs:
-            dat = parser_func(dat)
-
-        # # Debugging
-        # for parser_func in parser_funcs:
-        #     try:
-        #         dat_ = parser_func(dat_)
-        #     except Exception:
-        #         print(parser_func)
-        #         break
-
-        # Explode by ELR and Mileage
-        dat = dat.explode(column=['ELR', 'Mileage'], ignore_index=True)
-
-        # dat['Station'].replace(self.station_names_errata, regex=True, inplace=True)
-        dat['Station'] = dat['Station'].replace(self.station_names_errata, regex=True)
-
-        data = {
-            initial_: dat.sort_values('Station', ignore_index=True),
-            self.KEY_TO_LAST_UPDATED_DATE: _get_last_updated_date(soup=soup)
-        }
+        data = {initial_: dat, self.KEY_TO_LAST_UPDATED_DATE: last_updated_date}
 
         if verbose in {True, 1}:
             print("Done.")
@@ -449,7 +494,7 @@ class Stations(_Base):
         return data
 
     def collect_locations(self, initial, confirmation_required=True, verbose=False,
-                          raise_error=False):
+                          raise_error=False, parser='html.parser'):
         """
         Collects data of `railway station locations
         <http://www.railwaycodes.org.uk/stations/station0.shtm>`_
@@ -466,10 +511,17 @@ class Stations(_Base):
         :param raise_error: Whether to raise the provided exception;
             if ``raise_error=False`` (default), the error will be suppressed.
         :type raise_error: bool
+        :param parser: The parser of the HTML (see :func:`~pyrcs.parser.parse_table`);
+            with ``parser='lxml.html'``, the table is extracted from an `lxml.html`_ tree,
+            which is faster (requires `lxml`_); defaults to ``'html.parser'``.
+        :type parser: str
         :return: A dictionary containing the data of railway station locations whose initial letters
             are the given ``initial`` and date of when the data was last updated.
         :rtype: dict
 
+        .. _`lxml`: https://lxml.de/
+        .. _`lxml.html`: https://lxml.de/lxmlhtml.html
+
         **Examples**::
 
             >>> from pyrcs.other_assets import Stations  # from pyrcs import Stations
@@ -519,11 +571,13 @@ class Stations(_Base):
         data = self._collect_data_from_source(
             data_name=self.KEY_TO_STN.lower(), method=self._collect_locations, initial=initial_,
             url=self.catalogue[self.KEY_TO_STN].get(initial_),
-            confirmation_required=confirmation_required, verbose=verbose, raise_error=raise_error)
+            confirmation_required=confirmation_required, verbose=verbose, raise_error=raise_error,
+            parser=parser)
 
         return data
 
-    def fetch_locations(self, initial=None, update=False, dump_dir=None, verbose=False, **kwargs):
+    def fetch_locations(self, initial=None, update=False, dump_dir=None, verbose=False,
+                        max_workers=4, mileage_dtype=False, **kwargs):
         """
         Fetches data of `railway station locations`_ (mileages, operators and grid coordinates).
 
@@ -539,6 +593,13 @@ class Stations(_Base):
         :type dump_dir: str | None
         :param verbose: Whether to print relevant information to the console; defaults to ``False``.
         :type verbose: bool | int
+        :param max_workers: Maximum number of initial letters whose data is fetched concurrently
+            when ``initial=None``; defaults to ``4``.
+        :type max_workers: int
+        :param mileage_dtype: Whether to convert the mileages (i.e. the column ``'Mileage'``, e.g.
+            ``'11m 43ch'`` or ``'24.458km'``) to the data type of mileages
+            (see :class:`~pyrcs.mileage.MileageDtype`); defaults to ``False``.
+        :type mileage_dtype: bool
         :return: A dictionary containing the data of railway station locations and
             the date of when the data was last updated.
         :rtype: dict
@@ -602,44 +663,140 @@ class Stations(_Base):
                 update=update, dump_dir=dump_dir, verbose=verbose, **kwargs)
 
         else:
-            verbose_1 = get_collect_verbosity_for_fetch(data_dir=dump_dir, verbose=verbose)
-            verbose_2 = verbose_1 if is_homepage_connectable() else False
+            railway_station_data = self._fetch_merged_initials(
+                self.fetch_locations, merge=self._merge_locations, data_name=self.KEY_TO_STN,
+                update=update, dump_dir=dump_dir, verbose=verbose, max_workers=max_workers)
+
+        if dump_dir is not None:
+            self._save_data_to_file(
+                data=railway_station_data, data_name=self.KEY_TO_STN, dump_dir=dump_dir,
+                verbose=verbose)
+
+        if mileage_dtype:
+            railway_station_data = _as_mileage_dtype(railway_station_data, form='text')
+
+        return railway_station_data
+
+    def _merge_locations(self, data_sets):
+        stn_dat_tbl_ = (item[x] for item, x in zip(data_sets, string.ascii_uppercase))
+        stn_dat_tbl = sorted(
+            [x for x in stn_dat_tbl_ if x is not None], key=lambda x: x.shape[1], reverse=True)
+        stn_data = pd.concat(stn_dat_tbl, axis=0, ignore_index=True, sort=False)
+
+        stn_data = stn_data.where(pd.notna(stn_data), None)
+        stn_data.sort_values(['Station'], inplace=True)
+
+        stn_data.index = range(len(stn_data))
+
+        last_updated_dates = (d[self.KEY_TO_LAST_UPDATED_DATE] for d in data_sets)
+        latest_update_date = max(d for d in last_updated_dates if d is not None)
+
+        railway_station_data = {
+            self.KEY_TO_STN: stn_data,
+            self.KEY_TO_LAST_UPDATED_DATE: latest_update_date,
+        }
+
+        return railway_station_data
+
+    async def acollect_locations(self, initial, confirmation_required=True, verbose=False,
+                                 raise_error=False, parser='html.parser'):
+        """
+        Collects data of `railway station locations
+        <http://www.railwaycodes.org.uk/stations/station0.shtm>`_
+        (mileages, operators and grid coordinates) for a given initial letter asynchronously.
+
+        It is the awaitable counterpart of
+        :meth:`~pyrcs.other_assets.station.Stations.collect_locations`,
+        which takes the same parameters.
+
+        :return: A dictionary containing the data of railway station locations whose initial letters
+            are the given ``initial`` and date of when the data was last updated.
+        :rtype: dict
+
+        **Examples**::
 
-            data_sets = [
-                self.fetch_locations(initial=x, update=update, verbose=verbose_2)
-                for x in string.ascii_lowercase]
+            >>> from pyrcs.other_assets import Stations  # from pyrcs import Stations
+            >>> import asyncio
+            >>> stn = Stations()
+            >>> stn_loc_a_codes = asyncio.run(
+            ...     stn.acollect_locations('a', confirmation_required=False))
+            >>> list(stn_loc_a_codes.keys())
+            ['A', 'Last updated date']
+        """
 
-            if all(d[x] is None for d, x in zip(data_sets, string.ascii_uppercase)):
-                if update:
-                    print_instance_connection_error(verbose=verbose)
-                    print_void_collection_message(data_name=self.KEY_TO_STN, verbose=verbose)
+        initial_ = validate_initial(initial=initial)
 
-                data_sets = [
-                    self.fetch_locations(x, update=False, verbose=verbose_1)
-                    for x in string.ascii_lowercase
-                ]
+        catalogue = await self._aget_catalogue()
 
-            stn_dat_tbl_ = (item[x] for item, x in zip(data_sets, string.ascii_uppercase))
-            stn_dat_tbl = sorted(
-                [x for x in stn_dat_tbl_ if x is not None], key=lambda x: x.shape[1], reverse=True)
-            stn_data = pd.concat(stn_dat_tbl, axis=0, ignore_index=True, sort=False)
+        data = await self._acollect_data_from_source(
+            data_name=self.KEY_TO_STN.lower(), method=self._collect_locations, initial=initial_,
+            url=catalogue[self.KEY_TO_STN].get(initial_),
+            confirmation_required=confirmation_required, verbose=verbose, raise_error=raise_error,
+            parser=parser)
 
-            stn_data = stn_data.where(pd.notna(stn_data), None)
-            stn_data.sort_values(['Station'], inplace=True)
+        return data
+
+    async def afetch_locations(self, initial=None, update=False, dump_dir=None, verbose=False,
+                               mileage_dtype=False, **kwargs):
+        """
+        Fetches data of `railway station locations
+        <http://www.railwaycodes.org.uk/stations/station0.shtm>`_
+        (mileages, operators and grid coordinates) asynchronously.
+
+        It is the awaitable counterpart of
+        :meth:`~pyrcs.other_assets.station.Stations.fetch_locations`;
+        when ``initial=None``, the pages of all initial letters are requested concurrently.
+
+        :param initial: The initial letter (e.g. ``'a'``, ``'z'``) of railway station names.
+        :type initial: str
+        :param update: Whether to check for updates to the package data; defaults to ``False``.
+        :type update: bool
+        :param dump_dir: The path to a directory where the data file will be saved;
+            defaults to ``None``.
+        :type dump_dir: str | None
+        :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+        :type verbose: bool | int
+        :param mileage_dtype: Whether to convert the mileages (i.e. the column ``'Mileage'``, e.g.
+            ``'11m 43ch'`` or ``'24.458km'``) to the data type of mileages
+            (see :class:`~pyrcs.mileage.MileageDtype`); defaults to ``False``.
+        :type mileage_dtype: bool
+        :return: A dictionary containing the data of railway station locations and
+            the date of when the data was last updated.
+        :rtype: dict
 
-            stn_data.index = range(len(stn_data))
+        **Examples**::
 
-            last_updated_dates = (d[self.KEY_TO_LAST_UPDATED_DATE] for d in data_sets)
-            latest_update_date = max(d for d in last_updated_dates if d is not None)
+            >>> from pyrcs.other_assets import Stations  # from pyrcs import Stations
+            >>> import asyncio
+            >>> stn = Stations()
+            >>> stn_loc_codes = asyncio.run(stn.afetch_locations())
+            >>> list(stn_loc_codes.keys())
+            ['Mileages, operators and grid coordinates', 'Last updated date']
+        """
 
-            railway_station_data = {
-                self.KEY_TO_STN: stn_data,
-                self.KEY_TO_LAST_UPDATED_DATE: latest_update_date,
+        if initial:
+            args = {
+                'data_name': validate_initial(initial),
+                'method': self.acollect_locations,
+                'sub_dir': "a-z",
+                'initial': initial,
             }
+            kwargs.update(args)
+
+            railway_station_data = await self._afetch_data_from_file(
+                update=update, dump_dir=dump_dir, verbose=verbose, **kwargs)
+
+        else:
+            railway_station_data = await self._afetch_merged_initials(
+                self.afetch_locations, merge=self._merge_locations, data_name=self.KEY_TO_STN,
+                update=update, dump_dir=dump_dir, verbose=verbose)
 
         if dump_dir is not None:
             self._save_data_to_file(
                 data=railway_station_data, data_name=self.KEY_TO_STN, dump_dir=dump_dir,
                 verbose=verbose)
 
+        if mileage_dtype:
+            railway_station_data = _as_mileage_dtype(railway_station_data, form='text')
+
         return railway_station_data
@@ -4,10 +4,9 @@ Collects `telegraph codes <http://www.railwaycodes.org.uk/misc/telegraph.shtm>`_
 
 import urllib.parse
 
-import bs4
 
 from .._base import _Base
-from ..parser import _get_last_updated_date, parse_tr
+from ..parser import _get_last_updated_date, get_soup, parse_tr
 from ..utils import homepage_url
 
 
@@ -39,7 +38,7 @@ class Telegraph(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -47,6 +46,9 @@ class Telegraph(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -62,10 +64,11 @@ class Telegraph(_Base):
         """
 
         super().__init__(
-            data_dir=data_dir, data_category="other-assets", update=update, verbose=verbose)
+            data_dir=data_dir, data_category="other-assets", update=update, verbose=verbose,
+            lazy=lazy)
 
     def _collect_codes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         h3s = soup.find_all('h3')
 
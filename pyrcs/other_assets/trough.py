@@ -5,12 +5,12 @@ Collects codes of `water troughs <http://www.railwaycodes.org.uk/misc/troughs.sh
 import re
 import urllib.parse
 
-import bs4
 import numpy as np
 import unicodedata
 
 from .._base import _Base
-from ..parser import _get_last_updated_date, parse_tr
+from ..mileage import _as_mileage_dtype
+from ..parser import _get_last_updated_date, get_soup, parse_tr
 from ..utils import homepage_url
 
 
@@ -64,7 +64,7 @@ class WaterTroughs(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -72,6 +72,9 @@ class WaterTroughs(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -87,10 +90,11 @@ class WaterTroughs(_Base):
         """
 
         super().__init__(
-            data_dir=data_dir, data_category="other-assets", update=update, verbose=verbose)
+            data_dir=data_dir, data_category="other-assets", update=update, verbose=verbose,
+            lazy=lazy)
 
     def _collect_codes(self, source, verbose=False):
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         ths = [th.text.strip() for th in soup.find('thead').find_all('th')]
         trs = soup.find('tbody').find_all('tr')
@@ -167,7 +171,8 @@ class WaterTroughs(_Base):
 
         return water_troughs_codes
 
-    def fetch_codes(self, update=False, dump_dir=None, verbose=False, **kwargs):
+    def fetch_codes(self, update=False, dump_dir=None, verbose=False, mileage_dtype=False,
+                    **kwargs):
         """
         Fetches codes of `water troughs locations`_.
 
@@ -180,6 +185,10 @@ class WaterTroughs(_Base):
         :type dump_dir: str | None
         :param verbose: Whether to print relevant information to the console; defaults to ``False``.
         :type verbose: bool | int
+        :param mileage_dtype: Whether to convert the mileages (i.e. the column ``'Mileage'``, e.g.
+            ``'74m 51ch'``) to the data type of mileages (see :class:`~pyrcs.mileage.MileageDtype`);
+            defaults to ``False``.
+        :type mileage_dtype: bool
         :return: A dictionary containing the codes of water trough locations and
             the date they were last updated.
         :rtype: dict
@@ -218,4 +227,7 @@ class WaterTroughs(_Base):
         troughs_locations_codes = self._fetch_data_from_file(
             update=update, dump_dir=dump_dir, verbose=verbose, **kwargs)
 
+        if mileage_dtype:
+            troughs_locations_codes = _as_mileage_dtype(troughs_locations_codes, form='text')
+
         return troughs_locations_codes
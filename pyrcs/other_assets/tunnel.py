@@ -6,12 +6,12 @@ import itertools
 import re
 import urllib.parse
 
-import bs4
 import numpy as np
 import pandas as pd
 
+from .. import _patterns
 from .._base import _Base
-from ..parser import _get_last_updated_date, parse_tr
+from ..parser import _get_last_updated_date, get_soup, parse_tr
 from ..utils import homepage_url, is_homepage_connectable, print_instance_connection_error, \
     print_void_collection_message, validate_page_name
 
@@ -33,7 +33,7 @@ class Tunnels(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -41,6 +41,9 @@ class Tunnels(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -59,7 +62,7 @@ class Tunnels(_Base):
 
         super().__init__(
             data_dir=data_dir, content_type='catalogue', data_category="other-assets",
-            update=update, verbose=verbose)
+            update=update, verbose=verbose, lazy=lazy)
 
         self.page_range = range(1, 5)
 
@@ -98,11 +101,11 @@ class Tunnels(_Base):
         if x == '':
             length, note = np.nan, 'Unavailable'
 
-        elif re.match(r'[Uu]nknown', x):
+        elif _patterns.UNKNOWN_LENGTH.match(x):
             length, note = np.nan, 'Unknown'
 
-        elif re.match(r'\d+m \d+yd?(- | to )?.*\d+m \d+yd?.*', x):
-            miles_a, yards_a, miles_b, yards_b = re.findall(r'\d+', x)
+        elif _patterns.LENGTH_RANGE.match(x):
+            miles_a, yards_a, miles_b, yards_b = _patterns.DIGITS.findall(x)
             length_a = float(miles_a) * 1609.344 + float(yards_a) * 0.9144
             # from measurement.measures import Distance
             # Distance(mi=miles_a).m + Distance(yd=yards_a).m
@@ -112,25 +115,26 @@ class Tunnels(_Base):
             note = '-'.join([str(round(length_a, 2)), str(round(length_b, 2))]) + ' metres'
 
         else:
-            if re.match(r'(formerly )?c?≈?\d+m ?\d+(?:yd?|ch)', x):
-                miles, yards = re.findall(r'\d+', x)
-                if re.match(r'.*\d+ch$', x):  # "yards" is "chains"
+            if _patterns.LENGTH_MILES_YARDS.match(x):
+                miles, yards = _patterns.DIGITS.findall(x)
+                if _patterns.LENGTH_IN_CHAINS.match(x):  # "yards" is "chains"
                     yards = float(yards) * 22  # measurement.measures.Distance(chain=yards).yd
 
-                if re.match(r'^c.*|^≈', x):
+                if _patterns.APPROXIMATE_LENGTH.match(x):
                     note = 'Approximate'
-                elif re.match(r'\d+y$', x):
-                    note = re.search(r'(?<=\dy).*$', x).group(0)
-                elif re.match(r'^(formerly).*', x):
+                elif _patterns.LENGTH_IN_YARDS.match(x):
+                    note = _patterns.LENGTH_IN_YARDS_NOTE.search(x).group(0)
+                elif _patterns.FORMER_LENGTH.match(x):
                     note = 'Formerly'
-                elif re.match(r'.*(?:yd?|ch)\s*(.+)$', x):
-                    note = re.search(r'(?:yd?|ch)\s*(.+)$', x).group(1)
+                elif _patterns.LENGTH_WITH_NOTE.match(x):
+                    note = _patterns.LENGTH_NOTE.search(x).group(1)
                 else:
                     note = ''
 
-            elif re.match(r'\d+\.\d+km(\r)? .*(\[\')?\(\d+m \d+yd?\).*', x):
-                miles, yards = re.findall(r'\d+', re.search(r'(?<=\()\d+.*(?=\))', x).group(0))
-                note = re.search(r'.+(?= (\[\')?\()', x.replace('\r', '')).group(0)
+            elif _patterns.LENGTH_KM_MILES_YARDS.match(x):
+                miles, yards = _patterns.DIGITS.findall(
+                    _patterns.LENGTH_IN_BRACKETS.search(x).group(0))
+                note = _patterns.LENGTH_KM_NOTE.search(x.replace('\r', '')).group(0)
 
             else:
                 miles, yards = 0, 0
@@ -147,7 +151,7 @@ class Tunnels(_Base):
     def _collect_codes(self, page_no, source, verbose=False):
         page_name = validate_page_name(self, page_no, valid_page_no=self.page_range)
 
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = get_soup(source)
 
         theads, tbodies = soup.find_all('thead'), soup.find_all('tbody')
 
@@ -378,7 +382,7 @@ class Tunnels(_Base):
 
         else:
             verbose_1 = False if (dump_dir or not verbose) else (2 if verbose == 2 else True)
-            verbose_2 = verbose_1 if is_homepage_connectable() else False
+            verbose_2 = verbose_1 if not update or is_homepage_connectable() else False
 
             codes_on_pages = [
                 self.fetch_codes(x, update=update, verbose=verbose_2) for x in self.page_range]
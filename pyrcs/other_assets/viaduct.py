@@ -29,7 +29,7 @@ class Viaducts(_Base):
     #: The key used to reference the last updated date in the data.
     KEY_TO_LAST_UPDATED_DATE: str = 'Last updated date'
 
-    def __init__(self, data_dir=None, update=False, verbose=True):
+    def __init__(self, data_dir=None, update=False, verbose=True, lazy=False):
         """
         :param data_dir: The name of the directory for storing the data; defaults to ``None``.
         :type data_dir: str | None
@@ -37,6 +37,9 @@ class Viaducts(_Base):
         :type update: bool
         :param verbose: Whether to print relevant information to the console; defaults to ``True``.
         :type verbose: bool | int
+        :param lazy: Whether to defer web requests (e.g. for the catalogue) until the data
+            is first accessed; defaults to ``False``.
+        :type lazy: bool
 
         :ivar dict catalogue: The catalogue of the data.
         :ivar str last_updated_date: The date when the data was last updated.
@@ -55,7 +58,7 @@ class Viaducts(_Base):
 
         super().__init__(
             data_dir=data_dir, content_type='catalogue', data_category="other-assets",
-            update=update, verbose=verbose)
+            update=update, verbose=verbose, lazy=lazy)
 
         self.page_range = range(1, 7)
 
@@ -204,7 +207,7 @@ class Viaducts(_Base):
 
         else:
             verbose_1 = False if (dump_dir or not verbose) else (2 if verbose == 2 else True)
-            verbose_2 = verbose_1 if is_homepage_connectable() else False
+            verbose_2 = verbose_1 if not update or is_homepage_connectable() else False
 
             codes_on_pages = [
                 self.fetch_codes(page_no=page_no, update=update, verbose=verbose_2)
@@ -4,9 +4,16 @@ Parses web-page contents.
 
 import calendar
 import collections
+import concurrent.futures
+import contextlib
+import contextvars
 import copy
+import functools
+import itertools
+import multiprocessing
 import os
 import re
+import threading
 import urllib.parse
 
 import bs4
@@ -14,16 +21,453 @@ import dateutil.parser
 import pandas as pd
 import requests
 from pyhelpers._cache import _print_failure_message
-from pyhelpers.ops import confirmed, fake_requests_headers, update_dict_keys
+from pyhelpers.ops import confirmed, update_dict_keys
 from pyhelpers.store import load_data, save_data
 from pyhelpers.text import find_similar_str
 
+try:
+    import lxml.html
+except ImportError:  # lxml is optional; see parse_table
+    lxml = None
+
+from . import _patterns
+from .profiler import profile_stage
+from .transport import get_transport
 from .utils import cd_data, homepage_url, print_instance_connection_error
 
+# The documents shared within `sharing_documents()` and the parses counted in `counting_parses()`
+_shared_documents = contextvars.ContextVar('shared_documents', default=None)
+_parse_counts = contextvars.ContextVar('parse_counts', default=None)
+_parse_counts_lock = threading.Lock()
+# The pool of worker processes (and its size) within `parsing_in_processes()`
+_parse_pool = contextvars.ContextVar('parse_pool', default=None)
+
+
+# == Parsed documents ==============================================================================
+
+
+class ParsedDocument:
+    """
+    A web page whose HTML is parsed at most once, so that a single parse tree is shared by
+    the extraction of its catalogue, tables, notes and last update date.
+
+    Apart from the parse tree, it behaves as the response of the web page
+    (i.e. `requests.Response`_), and can therefore be passed on wherever a response is expected.
+
+    .. _`requests.Response`: https://requests.readthedocs.io/en/latest/api/#requests.Response
+
+    **Examples**::
+
+        >>> from pyrcs.parser import ParsedDocument, _get_last_updated_date, parse_table
+        >>> from pyrcs.transport import get_transport
+        >>> url = 'http://www.railwaycodes.org.uk/elrs/elra.shtm'
+        >>> doc = ParsedDocument(get_transport().get(url))
+        >>> (columns_dat, records_dat), soup = parse_table(doc)
+        >>> soup is doc.soup  # The page has been parsed only once
+        True
+        >>> _get_last_updated_date(doc.soup)
+        '2025-06-14'
+    """
+
+    def __init__(self, source, parser='html.parser'):
+        """
+        :param source: The response of a web page.
+        :type source: requests.Response
+        :param parser: The default parser of the HTML (see :func:`~pyrcs.parser.parse_table`);
+            defaults to ``'html.parser'``.
+        :type parser: str
+
+        :ivar requests.Response source: The response of the web page.
+        :ivar str parser: The default parser of the HTML.
+        """
+
+        self.source = source
+        self.parser = parser
+
+        self._soups = {}
+
+    def __getattr__(self, name):
+        if name == 'source':  # Not yet set, e.g. while unpickling
+            raise AttributeError(name)
+
+        return getattr(self.source, name)
+
+    def get_soup(self, parser=None, parse_only=None):
+        """
+        Gets the parse tree of the web page, which is parsed on first access only.
+
+        :param parser: The parser of the HTML; defaults to the default parser of the document.
+        :type parser: str | None
+        :param parse_only: Names of the only elements to be parsed (see
+            :func:`~pyrcs.parser.get_soup`); defaults to ``None`` (i.e. the whole page).
+            If the whole page has already been parsed, its parse tree is returned instead.
+        :type parse_only: typing.Iterable[str] | None
+        :return: The parse tree of the web page.
+        :rtype: bs4.BeautifulSoup | lxml.html.HtmlElement
+        """
+
+        parser = parser or self.parser
+        if parse_only is not None and parser != 'lxml.html':
+            parse_only = tuple(sorted(set(parse_only)))
+        else:
+            parse_only = None
+
+        if (parser, None) in self._soups:
+            return self._soups[(parser, None)]
+
+        if (parser, parse_only) not in self._soups:
+            self._soups[(parser, parse_only)] = _parse_markup(
+                self.source, parser=parser, parse_only=parse_only)
+
+        return self._soups[(parser, parse_only)]
+
+    @property
+    def soup(self):
+        """
+        The parse tree of the web page with the default parser of the document.
+        """
+
+        return self.get_soup()
+
+
+def _count_parse(url):
+    parse_counts = _parse_counts.get()
+    if parse_counts is not None:
+        with _parse_counts_lock:
+            parse_counts[url] += 1
+
+
+def _get_declared_encoding(source):
+    # The encoding declared in the headers of a response, if any; without one, `source.encoding`
+    # is ISO-8859-1 for any text, whatever the actual encoding of the page
+    content_type = source.headers.get('Content-Type') or ''
+    return source.encoding if 'charset' in content_type.lower() else None
+
+
+def _detect_encoding(content, encoding=None):
+    """
+    Detects the encoding of a web page as `bs4`_ does, with the encoding declared in the headers
+    of its response (if any) ranked below the one declared in the page (e.g. by ``<meta charset>``).
+
+    .. _`bs4`: https://www.crummy.com/software/BeautifulSoup/bs4/doc/
+    """
+
+    declared_encoding = bs4.dammit.EncodingDetector.find_declared_encoding(content, is_html=True)
+
+    return bs4.UnicodeDammit(
+        content, known_definite_encodings=[declared_encoding] if declared_encoding else [],
+        user_encodings=[encoding] if encoding else [], is_html=True).original_encoding
+
+
+def _parse_markup(source, parser='html.parser', parse_only=None):
+    if isinstance(source, bytes):  # The raw content of a web page
+        content, encoding = source, None
+    else:
+        content, encoding = source.content, _get_declared_encoding(source)
+        _count_parse(source.url)
+
+    if parser == 'lxml.html':
+        if lxml is None:
+            raise ImportError("`parser='lxml.html'` requires the package 'lxml' to be installed.")
+
+        with profile_stage('parse_html'):
+            # lxml would otherwise decode a page without <meta charset> as Latin-1
+            html_parser = lxml.html.HTMLParser(encoding=_detect_encoding(content, encoding))
+            return lxml.html.document_fromstring(
+                _preserve_carriage_returns(content), parser=html_parser)
+
+    if parse_only is not None:
+        parse_only = bs4.SoupStrainer(name=list(parse_only))
+
+    with profile_stage('parse_html'):
+        return bs4.BeautifulSoup(markup=content, features=parser, parse_only=parse_only)
+
+
+def get_soup(source, parser=None, parse_only=None):
+    """
+    Gets the parse tree of a web page.
+
+    A :class:`~pyrcs.parser.ParsedDocument` is parsed only once, whereas a response is parsed
+    every time.
+
+    With ``parse_only``, only the elements of the given names (with all their contents) are
+    built into the parse tree (see `bs4.SoupStrainer`_), which takes less time and memory for
+    large pages of which only some parts are needed, e.g. the tables and the last update date.
+
+    :param source: The response, the parsed document or the raw content of a web page.
+    :type source: requests.Response | ParsedDocument | bytes
+    :param parser: The parser of the HTML (see :func:`~pyrcs.parser.parse_table`);
+        defaults to the default parser of ``source`` if it is a parsed document,
+        or ``'html.parser'`` otherwise.
+    :type parser: str | None
+    :param parse_only: Names of the only elements to be parsed, e.g. ``('thead', 'tbody', 'p')``;
+        defaults to ``None`` (i.e. the whole page). It is ignored with ``parser='lxml.html'``.
+    :type parse_only: typing.Iterable[str] | None
+    :return: The parse tree of the web page.
+    :rtype: bs4.BeautifulSoup | lxml.html.HtmlElement
+
+    .. _`bs4.SoupStrainer`:
+        https://www.crummy.com/software/BeautifulSoup/bs4/doc/#parsing-only-part-of-a-document
+
+    **Examples**::
+
+        >>> from pyrcs.parser import get_soup
+        >>> from pyrcs.transport import get_transport
+        >>> source = get_transport().get('http://www.railwaycodes.org.uk/elrs/elra.shtm')
+        >>> soup = get_soup(source)
+        >>> soup.find('h1').text
+        "Engineer's Line References (ELRs): A"
+        >>> soup = get_soup(source, parse_only=('thead', 'tbody', 'p'))
+        >>> soup.find('h1') is None
+        True
+    """
+
+    if isinstance(source, ParsedDocument):
+        return source.get_soup(parser, parse_only=parse_only)
+
+    return _parse_markup(source, parser=parser or 'html.parser', parse_only=parse_only)
+
+
+@contextlib.contextmanager
+def sharing_documents():
+    """
+    Shares the parsed document of each web page requested with
+    :func:`~pyrcs.parser.get_document` within the context, so that every web page is requested
+    and parsed only once.
+
+    :return: A dictionary that maps the URL of each requested web page to its parsed document.
+    :rtype: typing.Generator[dict, None, None]
+
+    **Examples**::
+
+        >>> from pyrcs.parser import get_document, sharing_documents
+        >>> url = 'http://www.railwaycodes.org.uk/elrs/elr0.shtm'
+        >>> with sharing_documents():
+        ...     doc = get_document(url)
+        ...     get_document(url) is doc
+        True
+    """
+
+    documents = _shared_documents.get()
+
+    if documents is not None:  # Already shared in an outer context
+        yield documents
+        return
+
+    documents = {}
+    token = _shared_documents.set(documents)
+
+    try:
+        yield documents
+    finally:
+        _shared_documents.reset(token)
+
+
+def get_document(url, parser='html.parser', **kwargs):
+    """
+    Requests a web page through the shared transport and wraps its response in
+    a parsed document.
+
+    Within :func:`~pyrcs.parser.sharing_documents`, a web page that has already been requested
+    is not requested (or parsed) again.
+
+    :param url: URL of the web page.
+    :type url: str
+    :param parser: The default parser of the HTML (see :func:`~pyrcs.parser.parse_table`);
+        defaults to ``'html.parser'``.
+    :type parser: str
+    :param kwargs: [Optional] Additional parameters passed to the ``get`` method of
+        the shared transport (see :func:`~pyrcs.transport.get_transport`).
+    :return: The parsed document of the web page.
+    :rtype: ParsedDocument
+
+    **Examples**::
+
+        >>> from pyrcs.parser import get_document
+        >>> doc = get_document('http://www.railwaycodes.org.uk/elrs/elra.shtm')
+        >>> doc.status_code
+        200
+    """
+
+    documents = _shared_documents.get()
+
+    if documents is not None and url in documents:
+        return documents[url]
+
+    document = ParsedDocument(get_transport().get(url, **kwargs), parser=parser)
+
+    if documents is not None:
+        documents[url] = document
+
+    return document
+
+
+@contextlib.contextmanager
+def counting_parses():
+    """
+    Counts how many times each web page is parsed within the context.
+
+    :return: A counter that maps the URL of each parsed web page to the number of its parses.
+    :rtype: typing.Generator[collections.Counter, None, None]
+
+    **Examples**::
+
+        >>> from pyrcs.parser import counting_parses
+        >>> from pyrcs.line_data import ELRMileages
+        >>> with counting_parses() as parse_counts:
+        ...     em = ELRMileages(update=True, verbose=False)
+        >>> parse_counts
+        Counter({'http://www.railwaycodes.org.uk/elrs/elr0.shtm': 1})
+    """
+
+    outer_parse_counts = _parse_counts.get()
+
+    parse_counts = collections.Counter()
+    token = _parse_counts.set(parse_counts)
+
+    try:
+        yield parse_counts
+    finally:
+        _parse_counts.reset(token)
+
+        if outer_parse_counts is not None:  # The pages are also parsed in the outer context
+            with _parse_counts_lock:
+                outer_parse_counts.update(parse_counts)
+
+
+@contextlib.contextmanager
+def parsing_in_processes(max_workers=None):
+    """
+    Parses the web pages of the data organised by initial letters (A-Z) in a pool of worker
+    processes within the context.
+
+    Parsing these pages is CPU-bound, so that it is run one page after another (because of the
+    GIL) even though the pages are requested concurrently (see e.g.
+    :meth:`~pyrcs.line_data.loc_id.LocationIdentifiers.fetch_loc_id`). Within the context, the
+    content of each page (with the headers of its response) is instead sent to a worker process,
+    where it is decoded as it would be in the current process and parsed into the data,
+    while the requests and the saving of the data remain in the current process.
+
+    As the worker processes are spawned (rather than forked), a script that parses in processes
+    should guard its entry point with ``if __name__ == '__main__':``.
+
+    :param max_workers: Number of worker processes;
+        defaults to ``None`` (i.e. the number of processors on the machine).
+    :type max_workers: int | None
+    :return: The pool of worker processes.
+    :rtype: typing.Generator[concurrent.futures.ProcessPoolExecutor, None, None]
+
+    **Examples**::
+
+        >>> from pyrcs.parser import parsing_in_processes
+        >>> from pyrcs.line_data import LocationIdentifiers
+        >>> lid = LocationIdentifiers()
+        >>> with parsing_in_processes():
+        ...     loc_codes = lid.fetch_loc_id(update=True, verbose=True)
+    """
+
+    parse_pool = _parse_pool.get()
+
+    if parse_pool is not None:  # Already parsing in processes in an outer context
+        yield parse_pool[0]
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+
+    # Forking a process while the pages are being requested by other threads is unsafe
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+    token = _parse_pool.set((executor, max_workers))
+
+    try:
+        yield executor
+    finally:
+        _parse_pool.reset(token)
+        executor.shutdown()
+
+
+def _count_parse_workers():
+    """
+    Gets the number of worker processes within :func:`~pyrcs.parser.parsing_in_processes`.
+
+    :return: The number of worker processes, or ``0`` outside the context.
+    :rtype: int
+    """
+
+    parse_pool = _parse_pool.get()
+
+    return 0 if parse_pool is None else parse_pool[1]
+
+
+def _detach_response(source):
+    """
+    Copies the content, the headers and the encoding of a response (or a parsed document) to
+    a new response without its request and connection, which can be sent to a worker process,
+    so that the page is decoded there as it is in the current process.
+    """
+
+    source_ = requests.Response()
+
+    source_.status_code, source_.url = source.status_code, source.url
+    source_.headers, source_.encoding = source.headers, source.encoding
+    source_._content, source_._content_consumed = source.content, True
+
+    return source_
+
+
+def _run_page_parser(func, source, **kwargs):
+    """
+    Runs a function that parses a web page, in a worker process if within
+    :func:`~pyrcs.parser.parsing_in_processes`.
+
+    :param func: A (module-level) function that takes the web page (i.e. its response,
+        parsed document or raw content) as the first argument and has no side effects;
+        both its arguments and its result must be picklable.
+    :type func: typing.Callable
+    :param source: The response, the parsed document or the raw content of the web page.
+    :type source: requests.Response | ParsedDocument | bytes
+    :param kwargs: [Optional] Additional parameters passed to ``func``.
+    :return: The result of ``func``.
+    """
+
+    parse_pool = _parse_pool.get()
+
+    with profile_stage('parse_page'):
+        # A document that has already been parsed is not parsed again
+        if parse_pool is None or (isinstance(source, ParsedDocument) and source._soups):
+            return func(source, **kwargs)
+
+        if not isinstance(source, bytes):
+            source = _detach_response(source)
+            _count_parse(source.url)  # The page is parsed (once) in the worker process
+
+        executor, _ = parse_pool
+
+        return executor.submit(func, source, **kwargs).result()
+
 
 # == Preprocess contents ===========================================================================
 
 
+def _format_td_span_text(td_text, td_class, has_child_span):
+    if td_class == ['r']:
+        if td_text == 'no CRS?':
+            td_text = f'\t\t / [{td_text}]'
+        elif '\n ' in td_text:
+            td_text = ' '.join(
+                [f'\t\t{y}' if y.startswith('(') and y.endswith(')') else f' / [{y}]'
+                 for y in td_text.split('\n ')])
+        elif '(' not in td_text and ')' not in td_text:
+            td_text = f'\t\t / [{td_text}]'
+        else:
+            td_text = f'\t\t{td_text}'
+
+    elif not td_class and has_child_span:
+        td_text = f'\t\t{td_text}'
+
+    return td_text
+
+
 def _parse_other_tags_in_td_contents(x):
     if isinstance(x, str):
         td_text = x.strip(' ')
@@ -38,90 +482,382 @@ def _parse_other_tags_in_td_contents(x):
             td_text = f'"{td_text}"'
 
         elif tag_name in {'span', 'a'}:
-            td_class, td_class_child = x.get('class'), x.find('span')
-
-            if td_class == ['r']:
-                if td_text == 'no CRS?':
-                    td_text = f'\t\t / [{td_text}]'
-                elif '\n ' in td_text:
-                    td_text = ' '.join(
-                        [f'\t\t{y}' if y.startswith('(') and y.endswith(')') else f' / [{y}]'
-                         for y in td_text.split('\n ')])
-                elif '(' not in td_text and ')' not in td_text:
-                    td_text = f'\t\t / [{td_text}]'
-                else:
-                    td_text = f'\t\t{td_text}'
-
-            elif not td_class and td_class_child:
-                td_text = f'\t\t{td_text}'
+            td_text = _format_td_span_text(
+                td_text, td_class=x.get('class'), has_child_span=x.find('span') is not None)
 
     return td_text
 
 
+def _join_td_text(text_, sep):
+    text = ' '.join(sorted([x for x in text_ if x.strip(' ')], key=lambda x: '\t\t' in x))
+
+    if sep:
+        text = _patterns.TD_LINE_BREAK.sub(sep, text)
+
+    return text
+
+
+def _get_td_spans(td):
+    rowspan, colspan = td.get('rowspan'), td.get('colspan')
+
+    if rowspan is None and colspan is None:
+        return None
+
+    return int(rowspan or 1), int(colspan or 1)
+
+
 def _prep_records(trs, ths, sep=' / '):
     ths_len = len(ths)
 
-    records = []
-    row_spanned = []
-
-    for no, tr in enumerate(trs):
-        data = []
+    for tr in trs:
+        texts, spans = [], []
         tds = tr.find_all(name='td')
 
         if len(tds) != ths_len:
             tds = tds[:ths_len]
 
-        for td_no, td in enumerate(tds):
+        for td in tds:
             if td.find('td'):
                 text_ = [''] if td.find('a') is None else td.find('a').contents + ["\t\t / "]
             else:
                 text_ = [_parse_other_tags_in_td_contents(x) for x in td.contents]
             # _move_element_to_end(text_, char='\t\t')
-            text = ' '.join(sorted([x for x in text_ if x.strip(' ')], key=lambda x: '\t\t' in x))
+            text = _join_td_text(text_, sep=sep)
 
-            if sep:
-                old_sep = re.compile(r'/?\r?\n')
-                if len(re.findall(old_sep, text)) > 0:
-                    text = re.sub(r'/?\r?\n', sep, text)
+            td_spans = _get_td_spans(td)
+            if td_spans is not None:
+                spans.append((len(texts), *td_spans))
 
-            if td.has_attr('rowspan'):
-                row_spanned.append((no, int(td['rowspan']), td_no, text))
+            texts.append(text)
 
-            data.append(text)
+        yield texts, spans
 
-        records.append(data)
 
-    return records, row_spanned
+# -- lxml ------------------------------------------------------------------------------------------
 
 
-def _check_row_spanned(records, row_spanned):
-    if row_spanned:
-        records_ = records.copy()
+def _is_lxml_element(x):
+    return lxml is not None and isinstance(x, lxml.etree.ElementBase)
+
+
+def _get_lxml_text(elem, strip=False):
+    """
+    Equivalent of ``bs4.Tag.get_text()`` (or ``bs4.Tag.get_text(strip=True)``)
+    for an element of an `lxml.html`_ tree.
+
+    .. _`lxml.html`: https://lxml.de/lxmlhtml.html
+    """
+
+    if strip:
+        return ''.join(x.strip() for x in elem.itertext() if x.strip())
+
+    return elem.text_content()
+
+
+def _get_lxml_string(elem):
+    """
+    Equivalent of ``bs4.Tag.string`` for an element of an `lxml.html`_ tree, i.e. its only
+    string (or the only string of its only child), or ``None``.
+
+    .. _`lxml.html`: https://lxml.de/lxmlhtml.html
+    """
+
+    contents = list(_iter_lxml_contents(elem))
+
+    if len(contents) != 1:
+        return None
+
+    return contents[0] if isinstance(contents[0], str) else _get_lxml_string(contents[0])
+
+
+def _iter_lxml_contents(elem):
+    """
+    Equivalent of ``bs4.Tag.contents`` for an element of an `lxml.html`_ tree;
+    the text of a comment is yielded as a string, as ``bs4.Comment`` is a subclass of ``str``.
+
+    .. _`lxml.html`: https://lxml.de/lxmlhtml.html
+    """
 
-        row_spanned_dict = collections.defaultdict(list)
-        for i, *to_repeat in row_spanned:
-            row_spanned_dict[i].append(to_repeat)
+    if elem.text:
+        yield elem.text
 
-        for i, to_repeat in row_spanned_dict.items():
-            for no_spans, idx, dat in to_repeat:
-                for j in range(1, no_spans):
-                    k = i + j
-                    # if (dat in records[i]) and (dat != '\xa0'): # and (idx < len(records[i]) - 1):
-                    #     idx += np.abs(records[i].index(dat) - idx, dtype='int64')
-                    k_len = len(records_[k])
-                    if k_len < len(records_[i]):
-                        if k_len == idx:
-                            records_[k].insert(idx, dat)
-                        elif k_len > idx:
-                            if records_[k][idx] != '':
-                                records_[k].insert(idx, dat)
-                            else:  # records[k][idx] == '':
-                                records_[k][idx] = dat
+    for child in elem:
+        if isinstance(child, lxml.html.HtmlComment):
+            yield child.text
+        elif isinstance(child, lxml.etree.ElementBase):
+            yield child
 
+        if child.tail:
+            yield child.tail
+
+
+def _parse_other_tags_in_lxml_td_contents(x):
+    if isinstance(x, str):
+        td_text = x.strip(' ')
+
+    else:
+        tag_name, td_text = x.tag, x.text_content()
+
+        if tag_name == 'em':
+            td_text = f'[{td_text}]'
+
+        elif tag_name == 'q':
+            td_text = f'"{td_text}"'
+
+        elif tag_name in {'span', 'a'}:
+            td_class = x.get('class')
+            td_text = _format_td_span_text(
+                td_text, td_class=td_class.split() if td_class is not None else None,
+                has_child_span=x.find('.//span') is not None)
+
+    return td_text
+
+
+def _prep_lxml_records(trs, ths, sep=' / '):
+    ths_len = len(ths)
+
+    for tr in trs:
+        texts, spans = [], []
+        tds = list(tr.iter('td'))[:ths_len]
+
+        for td in tds:
+            if td.find('.//td') is not None:
+                a = td.find('.//a')
+                text_ = [''] if a is None else [
+                    x if isinstance(x, str) else _get_lxml_text(x) for x in _iter_lxml_contents(a)
+                ] + ["\t\t / "]
+            else:
+                text_ = [_parse_other_tags_in_lxml_td_contents(x) for x in _iter_lxml_contents(td)]
+            text = _join_td_text(text_, sep=sep)
+
+            td_spans = _get_td_spans(td)
+            if td_spans is not None:
+                spans.append((len(texts), *td_spans))
+
+            texts.append(text)
+
+        yield texts, spans
+
+
+def _preserve_carriage_returns(markup):
+    """
+    Escapes carriage returns in the text of an HTML document, which `lxml`_ would otherwise
+    normalise to line feeds (unlike ``'html.parser'``).
+
+    .. _`lxml`: https://lxml.de/
+    """
+
+    if b'\r' in markup:
+        markup = re.sub(
+            rb'>[^<>]*\r[^<>]*<', lambda m: m.group().replace(b'\r', b'&#13;'), markup)
+
+    return markup
+
+
+def _assemble_records(rows, n_columns):
+    """
+    Assembles the cells of the rows of a table into a dense grid of records, in one pass;
+    the records are yielded one at a time.
+
+    A cell spanning multiple rows (and/or columns) fills every slot it covers; the other slots
+    it covers in its own row (i.e. when ``colspan`` > 1) and any gaps are filled with ``'\\xa0'``
+    (as are the missing cells at the end of a short row). Empty rows (i.e. without any cells,
+    including spanned ones) are skipped.
+
+    :param rows: Texts of the cells of each row, with the ``(index, rowspan, colspan)`` of
+        the cells having a ``rowspan`` and/or ``colspan`` attribute.
+    :type rows: typing.Iterable[tuple[list[str], list[tuple[int, int, int]]]]
+    :param n_columns: Number of the columns of the table.
+    :type n_columns: int
+    :return: Records of the table.
+    :rtype: typing.Generator[list[str], None, None]
+    """
+
+    spanned = {}  # Column index -> (number of further rows spanned, text)
+
+    for texts, spans in rows:
+        if not spanned and not spans:  # i.e. the row is as it is
+            if not texts:
+                continue
+            record = texts
+
+        elif not spans:  # i.e. only the cells spanned from the rows above are to be filled
+            record = texts
+
+            # A row that is already complete (e.g. a spanned cell has been repeated in the raw
+            # data) is taken as it is
+            if len(texts) + len(spanned) <= n_columns:
+                for col in sorted(spanned):
+                    if col <= len(record):
+                        record.insert(col, spanned[col][1])
+                    else:
+                        record.extend(['\xa0'] * (col - len(record)) + [spanned[col][1]])
+
+            spanned = {col: (n - 1, text) for col, (n, text) in spanned.items() if n > 1}
+
+        else:
+            spans = {i: (rowspan, colspan) for i, rowspan, colspan in spans}
+
+            width = len(texts) + sum(colspan - 1 for _, colspan in spans.values())
+            fill_spanned = width + len(spanned) <= n_columns
+
+            record, new_spanned = [], {}
+
+            for i, text in enumerate(texts):
+                if fill_spanned:
+                    while len(record) in spanned:
+                        record.append(spanned[len(record)][1])
+
+                if i in spans:
+                    rowspan, colspan = spans[i]
+                    if rowspan > 1:
+                        new_spanned.update(
+                            (len(record) + j, (rowspan - 1, text if j == 0 else '\xa0'))
+                            for j in range(colspan))
+                    record.extend([text] + ['\xa0'] * (colspan - 1))
+
+                else:
+                    record.append(text)
+
+            if fill_spanned:
+                for col in sorted(spanned):
+                    if col >= len(record):
+                        record.extend(['\xa0'] * (col - len(record)) + [spanned[col][1]])
+
+            spanned = {col: (n - 1, text) for col, (n, text) in spanned.items() if n > 1}
+            spanned.update(new_spanned)
+
+        n = n_columns - len(record)
+        if n > 0:
+            record.extend(['\xa0'] * n)
+        elif n < 0 and record[2] == '\xa0':
+            del record[2]
+
+        yield record
+
+
+def _get_column_names(ths):
+    if isinstance(ths, bs4.Tag):
+        column_names = [th.get_text(strip=True) for th in ths.find_all('th')]
+    elif _is_lxml_element(ths):
+        column_names = [_get_lxml_text(th, strip=True) for th in ths.iter('th')]
+    elif all(isinstance(x, bs4.Tag) for x in ths):
+        column_names = [th.get_text(strip=True) for th in ths]
+    elif all(_is_lxml_element(x) for x in ths):
+        column_names = [_get_lxml_text(th, strip=True) for th in ths]
     else:
-        records_ = records
+        column_names = copy.copy(ths)
+
+    return column_names
+
+
+def iter_tr(trs, ths, sep=' / '):
+    # noinspection PyUnresolvedReferences
+    """
+    Parses a list of HTML ``<tr>`` elements and yields the rows of a table one at a time.
 
-    return records_
+    This is the streaming counterpart of :func:`~pyrcs.parser.parse_tr`: every row is parsed and
+    normalised (e.g. with the spanned cells filled in) only when it is requested, so that
+    the rows can be filtered, transformed or written somewhere as they come, without holding
+    all the records of a (large) table in memory at once.
+    See also :func:`~pyrcs.parser.records_to_dataframe`.
+
+    :param trs: The content of ``<tr>`` tags from a web page table, either as `bs4`_ tags or as
+        elements of an `lxml.html`_ tree (see :func:`~pyrcs.parser.parse_table`).
+    :type trs: bs4.ResultSet | list
+    :param ths: A list of column names (typically from ``<th>`` tags) for the table.
+    :type ths: list | bs4.element.Tag | lxml.html.HtmlElement
+    :param sep: The separator to replace any separators found in the raw data;
+        defaults to ``' / '``.
+    :type sep: str | None
+    :return: The rows of the table, each of which is a list of the texts of the cells.
+    :rtype: typing.Generator[list[str], None, None]
+
+    .. _`bs4`: https://www.crummy.com/software/BeautifulSoup/bs4/doc/
+    .. _`lxml.html`: https://lxml.de/lxmlhtml.html
+
+    **Examples**::
+
+        >>> from pyrcs.parser import iter_tr
+        >>> import requests
+        >>> import bs4
+        >>> example_url = 'http://www.railwaycodes.org.uk/elrs/elra.shtm'
+        >>> source = requests.get(example_url)
+        >>> parsed_text = bs4.BeautifulSoup(source.content, 'html.parser')
+        >>> ths_dat = [th.text for th in parsed_text.find_all('th')]
+        >>> trs_dat = parsed_text.find_all(name='tr')
+        >>> rows = iter_tr(trs=trs_dat, ths=ths_dat)
+        >>> next(rows)
+        ['AAL',
+         'Ashendon and Aynho Line',
+         '0.00 - 18.29',
+         'Ashendon Junction',
+         'Now NAJ3']
+        >>> sum(1 for row in rows if row[4].startswith('Now ')) > 0
+        True
+    """
+
+    trs = list(trs)
+
+    if trs and _is_lxml_element(trs[0]):
+        rows = _prep_lxml_records(trs=trs, ths=ths, sep=sep)
+    else:
+        rows = _prep_records(trs=trs, ths=ths, sep=sep)
+
+    yield from _assemble_records(rows, n_columns=len(_get_column_names(ths)))
+
+
+def records_to_dataframe(records, columns, chunk_size=10000):
+    """
+    Builds a dataframe from an iterable of records (e.g. the rows yielded by
+    :func:`~pyrcs.parser.iter_tr`) column by column.
+
+    The records are consumed in chunks of ``chunk_size``, each of which is transposed and
+    appended to the columns, so that the records do not have to be all materialised first.
+
+    :param records: The records (i.e. rows) of a table, each of which is a list of values.
+    :type records: typing.Iterable[list]
+    :param columns: The column names of the table.
+    :type columns: list
+    :param chunk_size: The number of records to consume at a time; defaults to ``10000``.
+    :type chunk_size: int
+    :return: The data of the table.
+    :rtype: pandas.DataFrame
+    :raises ValueError: If a record does not have as many values as the columns.
+
+    **Examples**::
+
+        >>> from pyrcs.parser import records_to_dataframe
+        >>> rows = ([f'A{i}', f'B{i}'] for i in range(3))
+        >>> records_to_dataframe(rows, columns=['A', 'B'])
+            A   B
+        0  A0  B0
+        1  A1  B1
+        2  A2  B2
+    """
+
+    records, columns = iter(records), list(columns)
+    n_columns = len(columns)
+
+    data, n_records = [[] for _ in range(n_columns)], 0
+
+    while chunk := list(itertools.islice(records, chunk_size)):
+        for record in chunk:
+            if len(record) != n_columns:
+                raise ValueError(
+                    f"{n_columns} columns passed, passed data had {len(record)} columns")
+
+        for values, column_values in zip(data, zip(*chunk)):
+            values.extend(column_values)
+        n_records += len(chunk)
+
+    if n_records == 0:
+        return pd.DataFrame(data=[], columns=columns)
+
+    dataframe = pd.DataFrame(dict(enumerate(data)), columns=range(n_columns))
+    dataframe.columns = columns
+
+    return dataframe
 
 
 def parse_tr(trs, ths, sep=' / ', as_dataframe=False):
@@ -131,14 +867,15 @@ def parse_tr(trs, ths, sep=' / ', as_dataframe=False):
 
     This function processes the rows from a table (``<tr>`` tags) and assigns them to corresponding
     column headers (``<th>`` tags). It can return the data either as a list of lists or as a
-    dataframe.
+    dataframe. To parse the rows one at a time instead, see :func:`~pyrcs.parser.iter_tr`.
 
     See also [`PT-1 <https://stackoverflow.com/questions/28763891/>`_].
 
-    :param trs: The content of ``<tr>`` tags from a web page table.
+    :param trs: The content of ``<tr>`` tags from a web page table, either as `bs4`_ tags or as
+        elements of an `lxml.html`_ tree (see :func:`~pyrcs.parser.parse_table`).
     :type trs: bs4.ResultSet | list
     :param ths: A list of column names (typically from ``<th>`` tags) for the table.
-    :type ths: list | bs4.element.Tag
+    :type ths: list | bs4.element.Tag | lxml.html.HtmlElement
     :param sep: The separator to replace any separators found in the raw data;
         defaults to ``' / '``.
     :type sep: str | None
@@ -148,6 +885,9 @@ def parse_tr(trs, ths, sep=' / ', as_dataframe=False):
         or a dataframe if ``as_dataframe`` is ``True``.
     :rtype: pandas.DataFrame | list[list]
 
+    .. _`bs4`: https://www.crummy.com/software/BeautifulSoup/bs4/doc/
+    .. _`lxml.html`: https://lxml.de/lxmlhtml.html
+
     **Examples**::
 
         >>> from pyrcs.parser import parse_tr
@@ -171,58 +911,52 @@ def parse_tr(trs, ths, sep=' / ', as_dataframe=False):
          'Now NAJ3']
     """
 
-    records, row_spanned = _prep_records(trs=trs, ths=ths, sep=sep)
-
-    records = _check_row_spanned(records, row_spanned)
-
-    if isinstance(ths, bs4.Tag):
-        column_names = [th.get_text(strip=True) for th in ths.find_all('th')]
-    elif all(isinstance(x, bs4.Tag) for x in ths):
-        column_names = [th.get_text(strip=True) for th in ths]
-    else:
-        column_names = copy.copy(ths)
-
-    n_columns = len(column_names)
-    empty_rows = []
-
-    for k, record in enumerate(records):
-        n = n_columns - len(record)
-        if n == n_columns:
-            empty_rows.append(k)
-        elif n > 0:
-            record.extend(['\xa0'] * n)
-        elif n < 0 and record[2] == '\xa0':
-            del record[2]
+    with profile_stage('parse_tr') as stage:
+        records = iter_tr(trs=trs, ths=ths, sep=sep)
 
-    if len(empty_rows) > 0:
-        for k in empty_rows:
-            del records[k]
+        if as_dataframe:
+            records = records_to_dataframe(records, columns=_get_column_names(ths))
+        else:
+            records = list(records)
 
-    if as_dataframe:
-        records = pd.DataFrame(data=records, columns=column_names)
+        stage['rows'] = len(records)
 
     return records
 
 
-def parse_table(source, parser='html.parser', as_dataframe=False):
+def parse_table(source, parser='html.parser', as_dataframe=False, parse_only=None):
     """
     Parses HTML ``<tr>`` elements to create a table from the given source.
 
     This function extracts data from the ``<thead>`` and ``<tbody>`` elements of an HTML table
     and processes it into a list of lists (rows of the table) or a dataframe.
 
-    :param source: The response object containing the HTML table from a requested URL.
-    :type source: requests.Response
+    :param source: The response object containing the HTML table from a requested URL,
+        or its parsed document (see :class:`~pyrcs.parser.ParsedDocument`).
+    :type source: requests.Response | ParsedDocument
     :param parser: The parser to use for processing the HTML;
-        options are ``'html.parser'`` (default), ``'html5lib'`` or ``'lxml'``.
+        options are ``'html.parser'`` (default), ``'html5lib'``, ``'lxml'`` or ``'lxml.html'``.
+        With ``'lxml.html'``, the rows are extracted directly from an `lxml.html`_ tree rather than
+        through `bs4.BeautifulSoup`_, which is considerably faster for large tables
+        (requires `lxml`_).
     :type parser: str
     :param as_dataframe: If ``True``, the parsed data is returned as a dataframe.
         If ``False``, it returns a list of lists and column names; defaults to ``False``.
     :type as_dataframe: bool
+    :param parse_only: Names of the only elements to be parsed (see :func:`~pyrcs.parser.get_soup`),
+        which should include ``'thead'`` and ``'tbody'``; defaults to ``None``.
+    :type parse_only: typing.Iterable[str] | None
     :return: A tuple containing a list of column names and a list of lists representing
         rows of the table; if ``as_dataframe=True``, returns a dataframe.
+        Either is returned together with the parsed document, which is an `lxml.html`_ element
+        when ``parser='lxml.html'``.
     :rtype: tuple[list, list] | pandas.DataFrame | list
 
+    .. _`lxml`: https://lxml.de/
+    .. _`lxml.html`: https://lxml.de/lxmlhtml.html
+    .. _`bs4.BeautifulSoup`:
+        https://www.crummy.com/software/BeautifulSoup/bs4/doc/index.html
+
     **Examples**::
 
         >>> from pyrcs.parser import parse_table
@@ -243,15 +977,23 @@ def parse_table(source, parser='html.parser', as_dataframe=False):
          'Now NAJ3']
     """
 
-    soup = bs4.BeautifulSoup(markup=source.content, features=parser)
+    soup = get_soup(source, parser=parser, parse_only=parse_only)
 
-    theads, tbodies = soup.find_all(name='thead'), soup.find_all(name='tbody')
+    if _is_lxml_element(soup):
+        theads, tbodies = soup.iter('thead'), soup.iter('tbody')
+        ths_trs = [
+            ([_get_lxml_text(th, strip=True) for th in thead.iter('th')], list(tbody.iter('tr')))
+            for thead, tbody in zip(theads, tbodies)]
 
-    tables = []
-    for thead, tbody in zip(theads, tbodies):
-        ths = [th.get_text(strip=True) for th in thead.find_all(name='th')]
-        trs = tbody.find_all(name='tr')
+    else:
+        theads, tbodies = soup.find_all(name='thead'), soup.find_all(name='tbody')
+        ths_trs = [
+            ([th.get_text(strip=True) for th in thead.find_all(name='th')],
+             tbody.find_all(name='tr'))
+            for thead, tbody in zip(theads, tbodies)]
 
+    tables = []
+    for ths, trs in ths_trs:
         if as_dataframe:
             dat = parse_tr(trs=trs, ths=ths, as_dataframe=as_dataframe)
         else:
@@ -416,7 +1158,7 @@ def _get_site_map(source, parser='html.parser'):
     Parses the site map from the given HTML source and returns a structured dictionary.
     """
 
-    soup = bs4.BeautifulSoup(markup=source.content, features=parser)
+    soup = get_soup(source, parser=parser)
     site_map = {}
 
     h3s = soup.find_all('h3', attrs={"class": "site"})
@@ -494,7 +1236,7 @@ def get_site_map(update=False, confirmation_required=True, verbose=False, raise_
 
             try:
                 url = urllib.parse.urljoin(homepage_url(), '/misc/sitemap.shtm')
-                source = requests.get(url=url, headers=fake_requests_headers())
+                source = get_transport().get(url)
                 source.raise_for_status()
             except Exception as e:
                 print_instance_connection_error(
@@ -525,10 +1267,17 @@ def get_site_map(update=False, confirmation_required=True, verbose=False, raise_
 
 def _get_last_updated_date(soup, parsed=True, as_date_type=False):
     # Find 'Last update date'
-    update_tag = soup.find(name='p', attrs={'class': 'update'})
+    if _is_lxml_element(soup):  # e.g. as returned by parse_table(..., parser='lxml.html')
+        update_tags = soup.xpath(
+            '//p[contains(concat(" ", normalize-space(@class), " "), " update ")]')
+        update_tag = update_tags[0] if update_tags else None
+        get_text = functools.partial(_get_lxml_text, strip=True)
+    else:
+        update_tag = soup.find(name='p', attrs={'class': 'update'})
+        get_text = functools.partial(bs4.Tag.get_text, strip=True)
 
     if update_tag is not None:
-        last_updated_date = update_tag.get_text(strip=True)
+        last_updated_date = get_text(update_tag)
         # Decide whether to convert the date's format
         if parsed:
             # Convert the date to "yyyy-mm-dd" format
@@ -583,17 +1332,14 @@ def get_last_updated_date(url, parsed=True, as_date_type=False, verbose=False, r
     """
 
     try:  # Request to get connected to the given url
-        source = requests.get(url=url, headers=fake_requests_headers())
+        source = get_document(url)
         source.raise_for_status()
     except Exception as e:
         _print_failure_message(e, verbose=verbose, raise_error=raise_error)
 
     else:
-        # Parse the text scraped from the requested web page
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
-
         last_updated_date = _get_last_updated_date(
-            soup=soup, parsed=parsed, as_date_type=as_date_type)
+            soup=source.soup, parsed=parsed, as_date_type=as_date_type)
 
         if last_updated_date is None and verbose:
             print('Information of the last update date not available.')
@@ -601,6 +1347,67 @@ def get_last_updated_date(url, parsed=True, as_date_type=False, verbose=False, r
         return last_updated_date
 
 
+def peek_last_updated_date(url, chunk_size=8192, verbose=False, raise_error=False):
+    """
+    Gets the last update date of a specified web page cheaply.
+
+    Unlike :func:`~pyrcs.parser.get_last_updated_date`, this function streams the web page and
+    stops reading it as soon as the date has been found, and extracts the date without parsing
+    the whole page.
+
+    :param url: The URL of the web page for which the last update date is requested.
+    :type url: str
+    :param chunk_size: The number of bytes of the web page read at a time; defaults to ``8192``.
+    :type chunk_size: int
+    :param verbose: Whether to print relevant information to the console; defaults to ``False``.
+    :type verbose: bool | int
+    :param raise_error: Whether to raise the provided exception;
+        if ``raise_error=False`` (default), the error will be suppressed.
+    :type raise_error: bool
+    :return: The last update date (in the format of ``YYYY-MM-DD``) of the specified web page,
+        or ``None`` if this information is not available.
+    :rtype: str | None
+
+    **Examples**::
+
+        >>> from pyrcs.parser import peek_last_updated_date
+        >>> peek_last_updated_date(url='http://www.railwaycodes.org.uk/crs/CRSa.shtm')
+        '2025-06-14'
+    """
+
+    update_tag_pat = re.compile(
+        rb'<p[^>]*\bclass=["\']?update\b[^>]*>.*?</p>', flags=re.IGNORECASE | re.DOTALL)
+
+    try:
+        source = get_transport().get(url, stream=True)
+
+        try:
+            source.raise_for_status()
+
+            content, update_tag = b'', None
+            for chunk in source.iter_content(chunk_size=chunk_size):
+                content += chunk
+                # Search only the tail in which a newly completed tag may be found
+                update_tag = update_tag_pat.search(content, max(0, len(content) - 2 * chunk_size))
+                if update_tag:
+                    break
+
+        finally:
+            source.close()
+
+    except Exception as e:
+        _print_failure_message(e, verbose=verbose, raise_error=raise_error)
+        return None
+
+    if update_tag is None:
+        last_updated_date = None
+    else:
+        soup = bs4.BeautifulSoup(markup=update_tag.group(0), features='html.parser')
+        last_updated_date = _get_last_updated_date(soup=soup)
+
+    return last_updated_date
+
+
 def get_financial_year(date):
     """
     Gets the financial year of a given date.
@@ -628,7 +1435,7 @@ def get_financial_year(date):
 
 
 def _parse_introduction(source, delimiter='\n'):
-    soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+    soup = get_soup(source)
 
     intro_h3 = [h3 for h3 in soup.find_all('h3') if h3.get_text(strip=True).startswith('Intro')][0]
 
@@ -687,7 +1494,7 @@ def get_introduction(url, delimiter='\n', update=False, verbose=False, raise_err
         return load_data(path_to_file)
 
     try:
-        source = requests.get(url=url, headers=fake_requests_headers())
+        source = get_document(url)
     except Exception as e:
         print_instance_connection_error(
             update=update, verbose=True if update else verbose, e=e, raise_error=raise_error)
@@ -709,12 +1516,12 @@ def _parse_catalogue(source, url):
     """
     Extracts a catalogue of links from the provided ``BeautifulSoup4`` object.
 
-    :param source: HTML content.
+    :param source: HTML content (or its parsed document).
     :param url: Base (page) URL to resolve relative links.
     :return: Typically, a dictionary mapping link text to absolute URLs.
     """
 
-    soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+    soup = get_soup(source)
 
     # Try to find the primary container, fallback to alternative
     cold_soup = soup.find(name='div', attrs={'class': 'fixed'}) or soup.find(name='h1')
@@ -785,7 +1592,7 @@ def get_catalogue(url, update=False, json_it=True, verbose=False, raise_error=Fa
         return load_data(path_to_file)
 
     try:
-        source = requests.get(url=url, headers=fake_requests_headers())
+        source = get_document(url)
         source.raise_for_status()
     except Exception as e:
         _print_failure_message(e=e, verbose=verbose, raise_error=raise_error)
@@ -848,7 +1655,7 @@ def get_category_menu(name, update=False, confirmation_required=True, verbose=Fa
 
     if confirmed("To collect/update category menu?", confirmation_required=confirmation_required):
         try:
-            source = requests.get(url=homepage_url(), headers=fake_requests_headers())
+            source = get_document(homepage_url())
             source.raise_for_status()
         except Exception as e:
             print_instance_connection_error(
@@ -856,7 +1663,7 @@ def get_category_menu(name, update=False, confirmation_required=True, verbose=Fa
             return None
 
         try:
-            soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+            soup = source.soup
 
             drop_btn_ = soup.select(f'button:-soup-contains("{name}")')
             drop_btn = drop_btn_[0]
@@ -899,7 +1706,7 @@ def get_heading_text(heading_tag, elem_tag_name='em'):
         >>> from pyrcs.line_data import Electrification
         >>> elec = Electrification()
         >>> url = elec.catalogue[elec.KEY_TO_INDEPENDENT_LINES]
-        >>> source = requests.get(url=url, headers=fake_requests_headers())
+        >>> source = get_transport().get(url)
         >>> soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
         >>> h3 = soup.find('h3')
         >>> h3_text = get_heading_text(heading_tag=h3, elem_tag_name='em')
@@ -973,14 +1780,14 @@ def get_page_catalogue(url, head_tag_name='nav', head_tag_txt='Jump to:', featur
     """
 
     try:
-        source = requests.get(url=url, headers=fake_requests_headers())
+        source = get_document(url)
         source.raise_for_status()
     except Exception as e:
         print_instance_connection_error(verbose=verbose, e=e, raise_error=raise_error)
         return None
 
     try:
-        soup = bs4.BeautifulSoup(markup=source.content, features='html.parser')
+        soup = source.soup
 
         page_catalogue = pd.DataFrame({'Feature': [], 'URL': [], 'Heading': []})
 
@@ -0,0 +1,303 @@
+"""
+Profiles the stages of the collection of data, e.g. requesting and parsing web pages,
+cleansing the parsed tables and saving the data.
+"""
+
+import contextlib
+import contextvars
+import json
+import threading
+import time
+import tracemalloc
+
+import pandas as pd
+
+# The profile of the current context (see `profiling()`), the name of the dataset being collected
+# and the stage being run (see `profile_stage()`)
+_profile = contextvars.ContextVar('profile', default=None)
+_dataset = contextvars.ContextVar('dataset', default=None)
+_stage = contextvars.ContextVar('stage', default=None)
+
+
+class Profile:
+    """
+    A record of the stages run in the collection of data (see :func:`~pyrcs.profiler.profiling`).
+
+    Each stage is recorded as a dictionary of:
+
+    - ``'dataset'``: the name of the dataset being collected (if any), e.g.
+      ``'CRS, NLC, TIPLOC and STANOX codes (A)'``;
+    - ``'stage'``: the name of the stage, e.g. ``'request'`` or ``'parse_html'``;
+    - ``'parent'``: the name of the stage within which it is run (if any);
+    - ``'start'``: the time (in seconds) at which it starts, since the profiling started;
+    - ``'time'``: the wall time (in seconds) it takes;
+    - ``'bytes'``: the number of bytes downloaded or saved (if any);
+    - ``'rows'``: the number of rows of data produced (if any);
+    - ``'allocated'``: the net size (in bytes) of memory allocated by the stage, if allocations
+      are traced (it is approximate when stages are run concurrently).
+    """
+
+    def __init__(self, trace_allocations=False, callback=None):
+        """
+        :param trace_allocations: Whether to trace memory allocations (with `tracemalloc`_),
+            which slows down the collection considerably; defaults to ``False``.
+        :type trace_allocations: bool
+        :param callback: A function that is called with each record as soon as the stage ends;
+            defaults to ``None``.
+        :type callback: typing.Callable | None
+
+        :ivar list records: The records of the stages, in the order in which they end.
+        :ivar bool trace_allocations: Whether to trace memory allocations.
+
+        .. _`tracemalloc`: https://docs.python.org/3/library/tracemalloc.html
+        """
+
+        self.trace_allocations = trace_allocations
+        self.callback = callback
+
+        self.records = []
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def add(self, record):
+        """
+        Adds the record of a stage.
+
+        :param record: The record of a stage.
+        :type record: dict
+        """
+
+        with self._lock:
+            self.records.append(record)
+
+        if self.callback is not None:
+            self.callback(record)
+
+    def summarise(self):
+        """
+        Summarises the records by dataset and stage.
+
+        :return: The number of runs and the total wall time, bytes, rows and allocated memory
+            of each stage for each dataset, in the order in which they are first recorded.
+        :rtype: list[dict]
+        """
+
+        summary = {}
+
+        for record in self.records:
+            key = record['dataset'], record['stage']
+            if key not in summary:
+                summary[key] = {'dataset': key[0], 'stage': key[1], 'count': 0, 'time': 0.0}
+
+            total = summary[key]
+            total['count'] += 1
+            total['time'] += record['time']
+            for k in ('bytes', 'rows', 'allocated'):
+                if k in record:
+                    total[k] = total.get(k, 0) + record[k]
+
+        return list(summary.values())
+
+    def to_dict(self):
+        """
+        Exports the profile as a dictionary.
+
+        :return: The records of the stages and their summary (see
+            :meth:`~pyrcs.profiler.Profile.summarise`).
+        :rtype: dict
+        """
+
+        return {'records': list(self.records), 'summary': self.summarise()}
+
+    def to_json(self, path_to_file=None, indent=4):
+        """
+        Exports the profile as JSON.
+
+        :param path_to_file: Pathname of a JSON file to which the profile is written;
+            defaults to ``None``.
+        :type path_to_file: str | os.PathLike | None
+        :param indent: Indentation of the JSON; defaults to ``4``.
+        :type indent: int | None
+        :return: The JSON of the profile (see :meth:`~pyrcs.profiler.Profile.to_dict`).
+        :rtype: str
+        """
+
+        profile_json = json.dumps(self.to_dict(), indent=indent)
+
+        if path_to_file is not None:
+            with open(path_to_file, mode='w', encoding='utf-8') as f:
+                f.write(profile_json)
+
+        return profile_json
+
+    def to_dataframe(self, summary=False):
+        """
+        Exports the records (or their summary) as a dataframe.
+
+        :param summary: Whether to export the summary of the records (see
+            :meth:`~pyrcs.profiler.Profile.summarise`); defaults to ``False``.
+        :type summary: bool
+        :return: The records (or their summary), one per row.
+        :rtype: pandas.DataFrame
+        """
+
+        return pd.DataFrame(self.summarise() if summary else self.records)
+
+
+@contextlib.contextmanager
+def profiling(trace_allocations=False, callback=None):
+    """
+    Profiles the stages of the collection of data within the context.
+
+    Outside the context, the stages are not profiled, at (almost) no cost.
+
+    The stages run in worker processes (see :func:`~pyrcs.parser.parsing_in_processes`) are
+    not recorded individually, but as a whole, i.e. as the stage ``'parse_page'``.
+
+    :param trace_allocations: Whether to trace memory allocations; defaults to ``False``.
+    :type trace_allocations: bool
+    :param callback: A function that is called with the record of each stage as soon as
+        the stage ends; defaults to ``None``.
+    :type callback: typing.Callable | None
+    :return: The profile, to which the record of each stage is added.
+    :rtype: typing.Generator[Profile, None, None]
+
+    **Examples**::
+
+        >>> from pyrcs.profiler import profiling
+        >>> from pyrcs.line_data import LocationIdentifiers
+        >>> lid = LocationIdentifiers()
+        >>> with profiling() as profile:
+        ...     loc_a_codes = lid.collect_loc_id('a', confirmation_required=False)
+        >>> profile.to_dataframe(summary=True)[['stage', 'count', 'time', 'rows']]
+                               stage  count      time    rows
+        0                    request      1  0.431152     NaN
+        1                 parse_html      1  0.623370     NaN
+        2                   parse_tr      1  0.254627  4817.0
+        3   _parse_raw_location_name      1  0.069098     NaN
+        4      _parse_mult_alt_codes      1  0.074513  4914.0
+        5          _parse_code_notes      1  0.018290     NaN
+        6         _parse_stanox_note      1  0.006125     NaN
+        7       _fill_location_names      1  1.906873     NaN
+        8                 parse_page      1  2.950402     NaN
+        9                  crs_notes      1  0.908436     NaN
+        10                 save_data      1  0.035101     NaN
+        11                   collect      1  4.327273  4914.0
+        >>> profile_json = profile.to_json()
+    """
+
+    outer_profile = _profile.get()
+
+    profile = Profile(trace_allocations=trace_allocations, callback=callback)
+    token = _profile.set(profile)
+
+    started_tracing = trace_allocations and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    try:
+        yield profile
+    finally:
+        _profile.reset(token)
+
+        if started_tracing:
+            tracemalloc.stop()
+
+        if outer_profile is not None:  # The stages are also run in the outer context
+            for record in profile.records:
+                outer_profile.add(record)
+
+
+def is_profiling():
+    """
+    Checks whether the stages of the collection of data are being profiled
+    (see :func:`~pyrcs.profiler.profiling`).
+
+    :return: Whether the current context is within :func:`~pyrcs.profiler.profiling`.
+    :rtype: bool
+    """
+
+    return _profile.get() is not None
+
+
+@contextlib.contextmanager
+def profile_stage(stage, dataset=None):
+    """
+    Profiles a stage of the collection of data, if within :func:`~pyrcs.profiler.profiling`.
+
+    The numbers of bytes and rows of the stage are recorded by setting ``'bytes'`` and ``'rows'``
+    in the dictionary yielded.
+
+    :param stage: Name of the stage.
+    :type stage: str
+    :param dataset: Name of the dataset collected in the stage (and in the stages run within it);
+        defaults to ``None`` (i.e. the dataset of the stage within which it is run).
+    :type dataset: str | None
+    :return: A dictionary in which the numbers of bytes and rows of the stage may be set.
+    :rtype: typing.Generator[dict, None, None]
+
+    **Examples**::
+
+        >>> from pyrcs.profiler import profile_stage, profiling
+        >>> with profiling() as profile:
+        ...     with profile_stage('example', dataset='Example data') as stage:
+        ...         stage['rows'] = 10
+        >>> profile.records[0]['rows']
+        10
+    """
+
+    profile = _profile.get()
+
+    if profile is None:
+        yield {}
+        return
+
+    record = {
+        'dataset': dataset or _dataset.get(), 'stage': stage, 'parent': _stage.get(),
+        'start': time.perf_counter() - profile._start,
+    }
+
+    tokens = [_stage.set(stage)]
+    if dataset is not None:
+        tokens.append(_dataset.set(dataset))
+
+    tracing = profile.trace_allocations and tracemalloc.is_tracing()
+    traced_memory = tracemalloc.get_traced_memory()[0] if tracing else 0
+
+    metrics = {}
+
+    try:
+        yield metrics
+
+    finally:
+        record['time'] = time.perf_counter() - profile._start - record['start']
+        if tracing:
+            record['allocated'] = tracemalloc.get_traced_memory()[0] - traced_memory
+        record.update((k, metrics[k]) for k in ('bytes', 'rows') if k in metrics)
+
+        for token in reversed(tokens):
+            token.var.reset(token)
+
+        profile.add(record)
+
+
+def _count_rows(data):
+    """
+    Counts the rows of (the dataframes in) the collected data.
+
+    :param data: The collected data.
+    :type data: pandas.DataFrame | dict | list | None
+    :return: The total number of rows of the dataframes in the data.
+    :rtype: int
+    """
+
+    if isinstance(data, pd.DataFrame):
+        return len(data)
+
+    if isinstance(data, dict):
+        return sum(_count_rows(x) for x in data.values())
+
+    if isinstance(data, (list, tuple)):
+        return sum(_count_rows(x) for x in data)
+
+    return 0
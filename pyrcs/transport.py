@@ -0,0 +1,959 @@
+"""
+Provides shared, connection-pooled HTTP transports for requesting web pages.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import threading
+import urllib.parse
+
+import requests
+import requests.adapters
+import requests.structures
+import requests.utils
+import urllib3.util
+from pyhelpers.ops import fake_requests_headers
+
+from .profiler import is_profiling, profile_stage
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; see AsyncHTTPTransport
+    httpx = None
+
+
+class HTTPTransport:
+    """
+    A connection-pooled HTTP transport, through which all web pages are requested.
+
+    It wraps a `requests.Session`_ whose connections are kept alive and reused for requests to
+    the same host, with configurable pool size, timeouts, retries and headers.
+
+    .. _`requests.Session`: https://requests.readthedocs.io/en/latest/api/#requests.Session
+    """
+
+    def __init__(self, pool_connections=4, pool_maxsize=10, timeout=30, max_retries=2,
+                 backoff_factor=0.5, headers=None, max_connections_per_host=4):
+        """
+        :param pool_connections: Number of connection pools (i.e. hosts) to cache;
+            defaults to ``4``.
+        :type pool_connections: int
+        :param pool_maxsize: Maximum number of connections to keep in each pool;
+            defaults to ``10``.
+        :type pool_maxsize: int
+        :param timeout: Default timeout (in seconds) of a request, which may be a tuple of
+            ``(connect timeout, read timeout)``; defaults to ``30``.
+        :type timeout: int | float | tuple
+        :param max_retries: Maximum number of retries for a failed request (due to connection
+            errors or a status code of 429, 500, 502, 503 or 504); defaults to ``2``.
+        :type max_retries: int
+        :param backoff_factor: Backoff factor applied between retries; defaults to ``0.5``.
+        :type backoff_factor: float
+        :param headers: HTTP headers sent with every request;
+            when ``headers=None`` (default), fake browser headers are used.
+        :type headers: dict | None
+        :param max_connections_per_host: Maximum number of requests to the same host that may be
+            in flight at the same time (as a politeness limit when requests are sent
+            concurrently); defaults to ``4``.
+        :type max_connections_per_host: int
+
+        :ivar requests.Session session: The underlying session.
+        :ivar int | float | tuple timeout: Default timeout of a request.
+        :ivar int max_connections_per_host: Maximum number of concurrent requests to a host.
+
+        **Examples**::
+
+            >>> from pyrcs.transport import HTTPTransport
+            >>> transport = HTTPTransport(pool_maxsize=20, timeout=(5, 30))
+            >>> transport.timeout
+            (5, 30)
+            >>> source = transport.get('http://www.railwaycodes.org.uk/')
+            >>> source.status_code
+            200
+            >>> transport.close()
+        """
+
+        self.timeout = timeout
+        self.max_connections_per_host = max_connections_per_host
+
+        self._host_semaphores = {}
+        self._host_semaphores_lock = threading.Lock()
+
+        retry = urllib3.util.Retry(
+            total=max_retries, backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504), allowed_methods=('GET', 'HEAD'),
+            raise_on_status=False)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update(fake_requests_headers() if headers is None else headers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _get_host_semaphore(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+
+        with self._host_semaphores_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(
+                    self.max_connections_per_host)
+
+            return self._host_semaphores[host]
+
+    def get(self, url, timeout=None, **kwargs):
+        """
+        Sends a GET request.
+
+        :param url: URL of the web page.
+        :type url: str
+        :param timeout: Timeout (in seconds) of the request;
+            when ``timeout=None`` (default), the default timeout of the transport is used.
+        :type timeout: int | float | tuple | None
+        :param kwargs: [Optional] Additional parameters for the method `requests.Session.get()`_.
+        :return: The response.
+        :rtype: requests.Response
+
+        .. _`requests.Session.get()`:
+            https://requests.readthedocs.io/en/latest/api/#requests.Session.get
+        """
+
+        if _response_cache is not None and _response_cache.reparse:
+            return _response_cache.load(url, raise_error=True)
+
+        source = None if kwargs.get('stream') else _pop_modified_page(url)
+        if source is not None:  # It has just been requested by is_page_modified()
+            _record_validators(url, source)
+            return source
+
+        timeout_ = self.timeout if timeout is None else timeout
+
+        with profile_stage('request') as stage:
+            # Limit the number of concurrent requests to the host
+            with self._get_host_semaphore(url):
+                response = self.session.get(url, timeout=timeout_, **kwargs)
+
+            if is_profiling() and not kwargs.get('stream'):
+                stage['bytes'] = len(response.content)
+
+        if not kwargs.get('stream'):  # The content of a streamed response may be read partially
+            _record_validators(url, response)
+
+            if _response_cache is not None:
+                _response_cache.store(url, response)
+
+        return response
+
+    def close(self):
+        """
+        Closes the underlying session and its pooled connections.
+        """
+
+        self.session.close()
+
+
+class AsyncHTTPTransport:
+    """
+    An asynchronous HTTP transport for requesting web pages from within an event loop.
+
+    Requests are sent with `httpx.AsyncClient`_ if `httpx`_ is installed; otherwise, each request
+    is sent by the shared (synchronous) transport (see :func:`~pyrcs.transport.get_transport`)
+    in a worker thread. Either way, the responses are returned as `requests.Response`_ objects,
+    so that they can be passed to the same parsing functions as in the synchronous API.
+
+    Used as an asynchronous context manager (``async with AsyncHTTPTransport():``), it is shared
+    by all asynchronous fetch paths within the scope and closed when the scope is left.
+
+    .. _`httpx.AsyncClient`: https://www.python-httpx.org/async/
+    .. _`httpx`: https://www.python-httpx.org/
+    .. _`requests.Response`: https://requests.readthedocs.io/en/latest/api/#requests.Response
+    """
+
+    def __init__(self, max_connections=10, timeout=30, max_retries=2, headers=None,
+                 max_connections_per_host=4):
+        """
+        :param max_connections: Maximum number of connections to keep in the pool;
+            defaults to ``10``.
+        :type max_connections: int
+        :param timeout: Default timeout (in seconds) of a request, which may be a tuple of
+            ``(connect timeout, read timeout)``; defaults to ``30``.
+        :type timeout: int | float | tuple
+        :param max_retries: Maximum number of retries for a request that failed to connect;
+            defaults to ``2``.
+        :type max_retries: int
+        :param headers: HTTP headers sent with every request;
+            when ``headers=None`` (default), fake browser headers are used.
+        :type headers: dict | None
+        :param max_connections_per_host: Maximum number of requests to the same host that may be
+            in flight at the same time; defaults to ``4``.
+        :type max_connections_per_host: int
+
+        :ivar int | float | tuple timeout: Default timeout of a request.
+        :ivar int max_connections_per_host: Maximum number of concurrent requests to a host.
+
+        **Examples**::
+
+            >>> from pyrcs.transport import AsyncHTTPTransport
+            >>> import asyncio
+            >>> async def main():
+            ...     async with AsyncHTTPTransport() as transport:  # Closed when the scope is left
+            ...         return await transport.get('http://www.railwaycodes.org.uk/')
+            >>> source = asyncio.run(main())
+            >>> source.status_code
+            200
+        """
+
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.headers = fake_requests_headers() if headers is None else headers
+        self.max_connections_per_host = max_connections_per_host
+
+        self._client = None  # It is created in the running event loop on first use
+        self._host_semaphores = {}
+        self._scope_tokens = []
+
+    async def __aenter__(self):
+        # Within the scope, the transport is shared by all asynchronous fetch paths
+        self._scope_tokens.append(_scoped_async_transport.set(self))
+        return self
+
+    async def __aexit__(self, *exc_info):
+        _scoped_async_transport.reset(self._scope_tokens.pop())
+        await self.aclose()
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers, follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.max_connections),
+                transport=httpx.AsyncHTTPTransport(retries=self.max_retries))
+
+        return self._client
+
+    def _get_host_semaphore(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+
+        return self._host_semaphores[host]
+
+    @staticmethod
+    def _to_requests_response(response):
+        source = requests.Response()
+
+        source.status_code = response.status_code
+        source.reason = response.reason_phrase
+        source.url = str(response.url)
+        source.headers = requests.structures.CaseInsensitiveDict(response.headers)
+        source.encoding = requests.utils.get_encoding_from_headers(source.headers)
+        source._content, source._content_consumed = response.content, True
+
+        return source
+
+    async def get(self, url, timeout=None, **kwargs):
+        """
+        Sends a GET request asynchronously.
+
+        :param url: URL of the web page.
+        :type url: str
+        :param timeout: Timeout (in seconds) of the request;
+            when ``timeout=None`` (default), the default timeout of the transport is used.
+        :type timeout: int | float | tuple | None
+        :param kwargs: [Optional] Additional parameters for the request.
+        :return: The response.
+        :rtype: requests.Response
+        :raises requests.RequestException: If the request fails.
+        """
+
+        if _response_cache is not None and _response_cache.reparse:
+            return _response_cache.load(url, raise_error=True)
+
+        source = _pop_modified_page(url)
+        if source is not None:
+            _record_validators(url, source)
+            return source
+
+        timeout_ = self.timeout if timeout is None else timeout
+
+        async with self._get_host_semaphore(url):
+            if httpx is None:
+                return await asyncio.to_thread(
+                    get_transport().get, url, timeout=timeout_, **kwargs)
+
+            if isinstance(timeout_, tuple):
+                timeout_ = httpx.Timeout(timeout_[1], connect=timeout_[0])
+
+            with profile_stage('request') as stage:
+                try:
+                    response = await self._get_client().get(url, timeout=timeout_, **kwargs)
+                except httpx.TimeoutException as e:
+                    raise requests.Timeout(e) from e
+                except httpx.HTTPError as e:
+                    raise requests.ConnectionError(e) from e
+
+                if is_profiling():
+                    stage['bytes'] = len(response.content)
+
+        source = self._to_requests_response(response)
+
+        _record_validators(url, source)
+
+        if _response_cache is not None:
+            _response_cache.store(url, source)
+
+        return source
+
+    async def aclose(self):
+        """
+        Closes the underlying client and its pooled connections.
+        """
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class ResponseCache:
+    """
+    An on-disk, compressed cache of the raw responses of web pages, keyed by URL.
+
+    When it is set by :func:`~pyrcs.transport.set_response_cache`, every successful response
+    received by the shared transports is stored in the cache, together with its headers and the
+    time it was fetched. In the *reparse* mode, the transports serve the cached responses instead
+    of sending any requests, so that all the data can be rebuilt (e.g. after a fix to a parser)
+    from the cached web pages without any network traffic.
+    """
+
+    def __init__(self, cache_dir, reparse=False):
+        """
+        :param cache_dir: The directory where the responses are cached.
+        :type cache_dir: str | os.PathLike
+        :param reparse: Whether to serve the cached responses instead of requesting the web pages;
+            defaults to ``False``.
+        :type reparse: bool
+
+        :ivar str cache_dir: The directory where the responses are cached.
+        :ivar bool reparse: Whether the cached responses are served instead of requesting the
+            web pages.
+
+        **Examples**::
+
+            >>> from pyrcs.transport import ResponseCache, get_transport, set_response_cache
+            >>> import tempfile
+            >>> cache = ResponseCache(cache_dir=tempfile.mkdtemp())
+            >>> set_response_cache(cache)
+            >>> source = get_transport().get('http://www.railwaycodes.org.uk/')
+            >>> 'http://www.railwaycodes.org.uk/' in cache
+            True
+            >>> with cache.reparsing():  # No request is sent
+            ...     source_ = get_transport().get('http://www.railwaycodes.org.uk/')
+            >>> source_.content == source.content
+            True
+            >>> set_response_cache()
+        """
+
+        self.cache_dir = os.fspath(cache_dir)
+        self.reparse = reparse
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def __contains__(self, url):
+        return os.path.isfile(self._get_pathnames(url)[1])
+
+    def _get_pathnames(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+        path_to_content = os.path.join(self.cache_dir, f"{key}.html.gz")
+        path_to_metadata = os.path.join(self.cache_dir, f"{key}.json")
+
+        return path_to_content, path_to_metadata
+
+    @contextlib.contextmanager
+    def reparsing(self):
+        """
+        Serves the cached responses instead of requesting the web pages within the context.
+        """
+
+        reparse = self.reparse
+        self.reparse = True
+
+        try:
+            yield self
+        finally:
+            self.reparse = reparse
+
+    def store(self, url, source):
+        """
+        Stores the response of a web page in the cache.
+
+        Only successful (i.e. ``200 OK``) responses are stored.
+
+        :param url: URL of the web page.
+        :type url: str
+        :param source: The response.
+        :type source: requests.Response
+        """
+
+        if source.status_code != 200:
+            return None
+
+        path_to_content, path_to_metadata = self._get_pathnames(url)
+
+        metadata = {
+            'URL': url,
+            'Fetched at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'Headers': dict(source.headers),
+        }
+
+        with gzip.open(path_to_content, mode='wb') as f:
+            f.write(source.content)
+
+        # The metadata is written last, so that a URL is cached only once the content is complete
+        with open(path_to_metadata, mode='w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=4)
+
+    def load(self, url, raise_error=False):
+        """
+        Loads the cached response of a web page.
+
+        :param url: URL of the web page.
+        :type url: str
+        :param raise_error: Whether to raise an error if no response of the web page is cached;
+            defaults to ``False``.
+        :type raise_error: bool
+        :return: The cached response, or ``None`` if it is not available.
+        :rtype: requests.Response | None
+        :raises requests.ConnectionError: If no response of the web page is cached
+            and ``raise_error=True``.
+        """
+
+        path_to_content, path_to_metadata = self._get_pathnames(url)
+
+        try:
+            with open(path_to_metadata, mode='r', encoding='utf-8') as f:
+                metadata = json.load(f)
+            with gzip.open(path_to_content, mode='rb') as f:
+                content = f.read()
+
+        except (OSError, ValueError) as e:
+            if raise_error:
+                raise requests.ConnectionError(f'No cached response of "{url}".') from e
+            return None
+
+        source = requests.Response()
+
+        source.status_code = 200
+        source.reason = 'OK'
+        source.url = metadata['URL']
+        source.headers = requests.structures.CaseInsensitiveDict(metadata['Headers'])
+        source.encoding = requests.utils.get_encoding_from_headers(source.headers)
+        source._content, source._content_consumed = content, True
+
+        return source
+
+    def get_fetch_time(self, url):
+        """
+        Gets the time when the cached response of a web page was fetched.
+
+        :param url: URL of the web page.
+        :type url: str
+        :return: The (UTC) time when the response was fetched, or ``None`` if it is not cached.
+        :rtype: datetime.datetime | None
+        """
+
+        try:
+            with open(self._get_pathnames(url)[1], mode='r', encoding='utf-8') as f:
+                fetched_at = datetime.datetime.fromisoformat(json.load(f)['Fetched at'])
+        except (OSError, ValueError, KeyError):
+            fetched_at = None
+
+        return fetched_at
+
+    def urls(self):
+        """
+        Gets the URLs of all the cached web pages.
+
+        :return: A list of the URLs.
+        :rtype: list[str]
+        """
+
+        urls = []
+
+        for filename in sorted(os.listdir(self.cache_dir)):
+            if filename.endswith(".json"):
+                with open(os.path.join(self.cache_dir, filename), mode='r', encoding='utf-8') as f:
+                    urls.append(json.load(f)['URL'])
+
+        return urls
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+_response_cache = None
+
+_async_transport = None
+
+#: Asynchronous transport of the current scope (see `AsyncHTTPTransport.__aenter__()`).
+_scoped_async_transport = contextvars.ContextVar('scoped_async_transport', default=None)
+
+
+def get_transport():
+    """
+    Gets the HTTP transport shared by all fetch paths of the package.
+
+    It is created with the default settings on first use, unless one has been set by
+    :func:`~pyrcs.transport.set_transport`.
+
+    :return: The shared HTTP transport.
+    :rtype: HTTPTransport
+
+    **Examples**::
+
+        >>> from pyrcs.transport import get_transport
+        >>> transport = get_transport()
+        >>> transport is get_transport()
+        True
+    """
+
+    global _transport
+
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport()
+
+    return _transport
+
+
+def set_transport(transport=None):
+    """
+    Sets (injects) the HTTP transport shared by all fetch paths of the package.
+
+    :param transport: An HTTP transport (e.g. an instance of :class:`HTTPTransport` with custom
+        settings, or any object with a compatible ``get(url, timeout=None, **kwargs)`` method);
+        when ``transport=None`` (default), the default transport is restored on next use.
+    :type transport: HTTPTransport | None
+
+    **Examples**::
+
+        >>> from pyrcs.transport import HTTPTransport, get_transport, set_transport
+        >>> set_transport(HTTPTransport(pool_maxsize=20, max_retries=5))
+        >>> get_transport().session.get_adapter('http://').max_retries.total
+        5
+        >>> set_transport()  # Restore the default transport
+    """
+
+    global _transport
+
+    with _transport_lock:
+        _transport = transport
+
+
+def get_response_cache():
+    """
+    Gets the cache of raw responses used by the shared transports.
+
+    :return: The cache of raw responses, or ``None`` if no responses are cached (default).
+    :rtype: ResponseCache | None
+    """
+
+    return _response_cache
+
+
+def set_response_cache(cache=None):
+    """
+    Sets the cache of raw responses used by the shared transports.
+
+    :param cache: A cache of raw responses; when ``cache=None`` (default), responses are no longer
+        cached.
+    :type cache: ResponseCache | None
+
+    **Examples**::
+
+        >>> from pyrcs.transport import ResponseCache, get_response_cache, set_response_cache
+        >>> set_response_cache(ResponseCache(cache_dir="pyrcs-cache"))
+        >>> get_response_cache().cache_dir
+        'pyrcs-cache'
+        >>> set_response_cache()
+    """
+
+    global _response_cache
+
+    _response_cache = cache
+
+
+def is_reparsing():
+    """
+    Checks whether the data is being rebuilt from the cached responses (without any network
+    traffic).
+
+    :return: Whether the shared transports serve the cached responses.
+    :rtype: bool
+    """
+
+    return _response_cache is not None and _response_cache.reparse
+
+
+@contextlib.contextmanager
+def reparsing():
+    """
+    Rebuilds the data from the cached raw responses (without any network traffic) within
+    the context.
+
+    :raises ValueError: If no cache of raw responses has been set
+        (see :func:`~pyrcs.transport.set_response_cache`).
+
+    **Examples**::
+
+        >>> from pyrcs.transport import ResponseCache, reparsing, set_response_cache
+        >>> from pyrcs.line_data import LocationIdentifiers
+        >>> set_response_cache(ResponseCache(cache_dir="pyrcs-cache"))
+        >>> lid = LocationIdentifiers()
+        >>> loc_a_codes = lid.fetch_loc_id('a', update=True)  # Cache the web page
+        >>> with reparsing():  # Rebuild the data from the cached web page
+        ...     loc_a_codes = lid.fetch_loc_id('a', update=True)
+        >>> set_response_cache()
+    """
+
+    if _response_cache is None:
+        raise ValueError(
+            "No cache of raw responses has been set. See `pyrcs.transport.set_response_cache()`.")
+
+    with _response_cache.reparsing():
+        yield _response_cache
+
+
+def get_async_transport():
+    """
+    Gets the asynchronous HTTP transport shared by all asynchronous fetch paths of the package.
+
+    Unless one has been set by :func:`~pyrcs.transport.set_async_transport`, it is the transport
+    of the innermost ``async with AsyncHTTPTransport()`` scope, which is closed when the scope is
+    left. The asynchronous fetch paths of the package open such a scope
+    (see :func:`~pyrcs.transport.sharing_async_transport`) if none is open.
+
+    :return: The shared asynchronous HTTP transport.
+    :rtype: AsyncHTTPTransport
+    :raises RuntimeError: If no transport has been set and no scope is open.
+
+    **Examples**::
+
+        >>> from pyrcs.transport import AsyncHTTPTransport, get_async_transport
+        >>> import asyncio
+        >>> async def main():
+        ...     async with AsyncHTTPTransport() as transport:
+        ...         return get_async_transport() is transport
+        >>> asyncio.run(main())
+        True
+    """
+
+    if _async_transport is not None:
+        return _async_transport
+
+    transport = _scoped_async_transport.get()
+
+    if transport is None:
+        raise RuntimeError(
+            "No asynchronous transport is open. "
+            "Use `async with AsyncHTTPTransport():` or `pyrcs.transport.set_async_transport()`.")
+
+    return transport
+
+
+@contextlib.asynccontextmanager
+async def sharing_async_transport():
+    """
+    Shares an asynchronous HTTP transport within the context.
+
+    The transport that has been set (see :func:`~pyrcs.transport.set_async_transport`) or opened
+    in an outer scope is reused; otherwise, a new one is opened for the context and closed when
+    the context is left.
+
+    :return: The shared asynchronous HTTP transport.
+    :rtype: typing.AsyncGenerator[AsyncHTTPTransport, None]
+
+    **Examples**::
+
+        >>> from pyrcs.transport import get_async_transport, sharing_async_transport
+        >>> import asyncio
+        >>> async def main():
+        ...     async with sharing_async_transport() as transport:
+        ...         async with sharing_async_transport() as transport_:
+        ...             return transport_ is transport is get_async_transport()
+        >>> asyncio.run(main())
+        True
+    """
+
+    transport = _async_transport or _scoped_async_transport.get()
+
+    if transport is not None:
+        yield transport
+        return
+
+    async with AsyncHTTPTransport() as transport:
+        yield transport
+
+
+def set_async_transport(transport=None):
+    """
+    Sets (injects) the asynchronous HTTP transport shared by all asynchronous fetch paths.
+
+    :param transport: An asynchronous HTTP transport (e.g. an instance of
+        :class:`AsyncHTTPTransport` with custom settings), which is to be closed by the caller;
+        when ``transport=None`` (default), the transport of the current scope is used instead
+        (see :func:`~pyrcs.transport.get_async_transport`).
+    :type transport: AsyncHTTPTransport | None
+    """
+
+    global _async_transport
+
+    _async_transport = transport
+
+
+# == Conditional requests ==========================================================================
+
+#: Validators of the web pages requested in the current context (see `recording_validators()`).
+_page_validators = contextvars.ContextVar('page_validators', default=None)
+
+#: Responses of the modified web pages to be reused (see `reusing_modified_pages()`).
+_modified_pages = contextvars.ContextVar('modified_pages', default=None)
+
+
+def _make_validators(source):
+    validators = {
+        'ETag': source.headers.get('ETag'),
+        'Last-Modified': source.headers.get('Last-Modified'),
+        'SHA-256': hashlib.sha256(source.content).hexdigest(),
+    }
+
+    return validators
+
+
+def _record_validators(url, source):
+    page_validators = _page_validators.get()
+
+    if page_validators is not None and source.status_code == 200:
+        page_validators[url] = _make_validators(source)
+
+
+def _make_conditional_headers(validators):
+    headers = {}
+
+    if validators.get('ETag'):
+        headers['If-None-Match'] = validators['ETag']
+    if validators.get('Last-Modified'):
+        headers['If-Modified-Since'] = validators['Last-Modified']
+
+    return headers
+
+
+def _is_modified(source, validators):
+    if source.status_code == 304:
+        return False
+
+    source.raise_for_status()
+
+    return hashlib.sha256(source.content).hexdigest() != validators.get('SHA-256')
+
+
+def _keep_modified_page(url, source):
+    modified_pages = _modified_pages.get()
+
+    if modified_pages is not None:
+        modified_pages[url] = source
+
+
+def _pop_modified_page(url):
+    modified_pages = _modified_pages.get()
+
+    return None if modified_pages is None else modified_pages.pop(url, None)
+
+
+@contextlib.contextmanager
+def recording_validators():
+    """
+    Records the validators (ETag, Last-Modified and body hash) of every web page that is
+    successfully requested through the shared transports within the context.
+
+    :return: A dictionary that maps the URL of each requested web page to its validators.
+    :rtype: typing.Generator[dict, None, None]
+
+    **Examples**::
+
+        >>> from pyrcs.transport import get_transport, recording_validators
+        >>> with recording_validators() as page_validators:
+        ...     _ = get_transport().get('http://www.railwaycodes.org.uk/')
+        >>> list(page_validators.keys())
+        ['http://www.railwaycodes.org.uk/']
+        >>> list(page_validators['http://www.railwaycodes.org.uk/'].keys())
+        ['ETag', 'Last-Modified', 'SHA-256']
+    """
+
+    outer_page_validators = _page_validators.get()
+
+    page_validators = {}
+    token = _page_validators.set(page_validators)
+
+    try:
+        yield page_validators
+    finally:
+        _page_validators.reset(token)
+
+        if outer_page_validators is not None:  # The pages are also requested in the outer context
+            outer_page_validators.update(page_validators)
+
+
+@contextlib.contextmanager
+def reusing_modified_pages():
+    """
+    Keeps the response of every web page found modified by
+    :func:`~pyrcs.transport.is_page_modified` within the context, so that the next request for
+    the page through the shared transports (e.g. by the collection of the data) gets the response
+    instead of downloading the page again.
+
+    **Examples**::
+
+        >>> from pyrcs.transport import get_transport, is_page_modified, reusing_modified_pages
+        >>> url = 'http://www.railwaycodes.org.uk/'
+        >>> with reusing_modified_pages():
+        ...     if is_page_modified(url, {'SHA-256': ''}):
+        ...         source = get_transport().get(url)  # The page is not requested again
+        >>> source.status_code
+        200
+    """
+
+    token = _modified_pages.set({})
+
+    try:
+        yield
+    finally:
+        _modified_pages.reset(token)
+
+
+def get_validators_pathname(path_to_file):
+    """
+    Gets the pathname of the file of validators stored next to a data file.
+
+    :param path_to_file: Pathname of a data file (e.g. a pickle file).
+    :type path_to_file: str | os.PathLike
+    :return: Pathname of the file of validators.
+    :rtype: str
+
+    **Examples**::
+
+        >>> from pyrcs.transport import get_validators_pathname
+        >>> get_validators_pathname('pyrcs/data/line-data/crs-nlc-tiploc-stanox/a-z/a.pkl')
+        'pyrcs/data/line-data/crs-nlc-tiploc-stanox/a-z/a.validators.json'
+    """
+
+    return os.path.splitext(path_to_file)[0] + ".validators.json"
+
+
+def load_validators(path_to_file):
+    """
+    Loads the validators of the web pages from which a data file was collected.
+
+    :param path_to_file: Pathname of the data file.
+    :type path_to_file: str | os.PathLike
+    :return: A dictionary that maps the URL of each web page to its validators,
+        or ``None`` if no (valid) validators are stored.
+    :rtype: dict | None
+    """
+
+    try:
+        with open(get_validators_pathname(path_to_file), mode='r', encoding='utf-8') as f:
+            validators = json.load(f)
+    except (OSError, ValueError):
+        validators = None
+
+    return validators or None
+
+
+def save_validators(path_to_file, validators):
+    """
+    Saves the validators of the web pages from which a data file was collected next to the file.
+
+    :param path_to_file: Pathname of the data file.
+    :type path_to_file: str | os.PathLike
+    :param validators: A dictionary that maps the URL of each web page to its validators
+        (as recorded by :func:`~pyrcs.transport.recording_validators`).
+    :type validators: dict
+    """
+
+    with open(get_validators_pathname(path_to_file), mode='w', encoding='utf-8') as f:
+        json.dump(validators, f, indent=4)
+
+
+def is_page_modified(url, validators):
+    """
+    Checks whether a web page has been modified, by sending a conditional GET request
+    (with ``If-None-Match`` and/or ``If-Modified-Since``) through the shared transport.
+
+    The page is considered unmodified if the server responds with ``304 Not Modified``,
+    or if the body of the response has the same hash as the one in the validators.
+    Within :func:`~pyrcs.transport.reusing_modified_pages`, the response of a modified page is
+    kept for the next request for the page.
+
+    :param url: URL of the web page.
+    :type url: str
+    :param validators: Validators of the web page when it was last requested.
+    :type validators: dict
+    :return: Whether the web page has been modified.
+    :rtype: bool
+    :raises requests.RequestException: If the request fails.
+    """
+
+    if is_reparsing():  # The data is to be rebuilt from the cached responses
+        return True
+
+    source = get_transport().get(url, headers=_make_conditional_headers(validators))
+
+    if _is_modified(source, validators):
+        _keep_modified_page(url, source)
+        return True
+
+    return False
+
+
+async def ais_page_modified(url, validators):
+    """
+    Checks whether a web page has been modified asynchronously.
+
+    It is the awaitable counterpart of :func:`~pyrcs.transport.is_page_modified`,
+    which sends the request through the shared asynchronous transport.
+
+    :param url: URL of the web page.
+    :type url: str
+    :param validators: Validators of the web page when it was last requested.
+    :type validators: dict
+    :return: Whether the web page has been modified.
+    :rtype: bool
+    :raises requests.RequestException: If the request fails.
+    """
+
+    if is_reparsing():
+        return True
+
+    async with sharing_async_transport() as transport:
+        source = await transport.get(url, headers=_make_conditional_headers(validators))
+
+    if _is_modified(source, validators):
+        _keep_modified_page(url, source)
+        return True
+
+    return False
@@ -13,6 +13,8 @@ from pyhelpers._cache import _format_error_message, _print_failure_message
 from pyhelpers.ops import confirmed, is_url_connectable
 from pyhelpers.store import load_data, save_data
 
+from .transport import is_reparsing
+
 
 # == Specify address of web pages ==================================================================
 
@@ -41,6 +43,9 @@ def is_homepage_connectable():
     """
     Checks and returns whether the Railway Codes website is reacheable.
 
+    When the data is being rebuilt from the cached raw responses
+    (see :class:`~pyrcs.transport.ResponseCache`), the website is deemed reachable.
+
     :return: Whether the Railway Codes website is reacheable.
     :rtype: bool
 
@@ -51,6 +56,9 @@ def is_homepage_connectable():
         True
     """
 
+    if is_reparsing():  # The web pages are served from the cache of raw responses
+        return True
+
     url = homepage_url()
 
     rslt = is_url_connectable(url=url)
@@ -416,6 +424,28 @@ def print_void_collection_message(data_name, verbose):
         print(f"No data of \"{data_name.title()}\" has been freshly collected.")
 
 
+def print_unmodified_source_message(data_name, verbose):
+    """
+    Prints a message when the source web page(s) of the data have not been modified since
+    the data was last collected, so that the existing data is kept.
+
+    :param data_name: Name of the data being collected.
+    :type data_name: str
+    :param verbose: Whether to print relevant information to the console.
+    :type verbose: bool | int
+
+    **Examples**::
+
+        >>> from pyrcs.utils import print_unmodified_source_message
+        >>> print_unmodified_source_message(data_name="Railway Codes", verbose=True)
+        The source of "Railway Codes" has not been modified. The existing data is kept.
+    """
+
+    if verbose:
+        print(f"The source of \"{data_name.title()}\" has not been modified. "
+              f"The existing data is kept.")
+
+
 # == Save and retrieve pre-packed data =============================================================
 
 
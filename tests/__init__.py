@@ -7,6 +7,7 @@ __all__ = [
     'test_depot',
     'test_elec',
     'test_elr_mileage',
+    'test_init',
     'test_feature',
     'test_line_name',
     'test_loc_id',
@@ -14,6 +15,7 @@ __all__ = [
     'test_parser',
     'test_sig_box',
     'test_station',
+    'test_transport',
     'test_trk_diagr',
     'test_tunnel',
     'test_utils',
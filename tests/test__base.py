@@ -2,16 +2,48 @@
 Test the module :py:mod:`pyrcs._base`.
 """
 
+import asyncio
+import functools
+import hashlib
 import inspect
+import os
+import socket
+import string
+import threading
 import typing
 
 import pandas as pd
 import pytest
+import requests
 
-from pyrcs._base import _Base
+from pyrcs import transport
+from pyrcs._base import _Base, incremental_update
+from pyrcs.transport import get_transport, load_validators
 from pyrcs.utils import format_confirmation_prompt
 
 
+def _mock_response(content=b'<html></html>'):
+    source = requests.Response()
+    source.status_code, source._content = 200, content
+    return source
+
+
+def _block_sockets(monkeypatch):
+    """Makes every connection fail, and returns the record of the attempts."""
+
+    attempts = []
+
+    def _connect(*args, **_kwargs):
+        attempts.append(args)
+        raise OSError("No connection should be made.")
+
+    for name in ('gethostbyname', 'getaddrinfo', 'create_connection'):
+        monkeypatch.setattr(socket, name, _connect)
+    monkeypatch.setattr(socket.socket, 'connect', _connect)
+
+    return attempts
+
+
 @pytest.fixture(scope='class')
 def _b():
     return _Base()
@@ -25,6 +57,26 @@ class TestBase:
         assert _b_test.catalogue is None
         assert _b_test.introduction is None
 
+    def test__init__lazy(self, monkeypatch):
+        def _no_request(*_args, **_kwargs):
+            raise AssertionError("No request should be made at instantiation.")
+
+        monkeypatch.setattr('pyrcs._base.print_connection_warning', _no_request)
+        monkeypatch.setattr('pyrcs._base.get_catalogue', _no_request)
+        monkeypatch.setattr('pyrcs._base.get_last_updated_date', _no_request)
+
+        _b_test = _Base(content_type='catalogue', lazy=True)
+        assert _b_test.lazy is True
+
+        monkeypatch.setattr('pyrcs._base.get_catalogue', lambda **_kwargs: {'A': 'test-url'})
+        monkeypatch.setattr('pyrcs._base.get_last_updated_date', lambda **_kwargs: '2024-01-01')
+        assert _b_test.catalogue == {'A': 'test-url'}
+        assert _b_test.introduction is None
+        assert _b_test.last_updated_date == '2024-01-01'
+
+        _b_test.catalogue = {'B': 'test-url'}
+        assert _b_test.catalogue == {'B': 'test-url'}
+
     def test__setup_data_dir(self, _b, tmp_path):
         data_dir, _ = _b._setup_data_dir(data_dir=tmp_path, category="line-data")
         assert data_dir == _b.data_dir
@@ -129,6 +181,70 @@ class TestBase:
                 assert f'"{data_name}" not found in `.catalogue`' in out
             assert data is None
 
+    def test__acollect_data_from_source(self, monkeypatch):
+        class MockTransport:
+            @staticmethod
+            async def get(url, **_kwargs):
+                if 'invalid' in url:
+                    raise requests.ConnectionError("Failed to connect.")
+                source = requests.Response()
+                source.status_code, source._content = 200, url.encode()
+                return source
+
+        monkeypatch.setattr('pyrcs._base.get_async_transport', lambda: MockTransport())
+
+        _b_test = _Base(lazy=True)
+        _b_test.catalogue = {'A': 'https://test.url/a', 'B': 'https://invalid.url/b'}
+
+        def method(source, initial, verbose=False):
+            return {initial: source.content.decode(), 'verbose': verbose}
+
+        data = asyncio.run(_b_test._acollect_data_from_source(
+            'test_data_name', method=method, initial='A', confirmation_required=False))
+        assert data == {'A': 'https://test.url/a', 'verbose': False}
+
+        data = asyncio.run(_b_test._acollect_data_from_source(
+            'test_data_name', method=method, initial='B', confirmation_required=False))
+        assert data == {'B': None, _b_test.KEY_TO_LAST_UPDATED_DATE: None}
+
+        with pytest.raises(requests.ConnectionError):
+            asyncio.run(_b_test._acollect_data_from_source(
+                'test_data_name', method=method, initial='B', confirmation_required=False,
+                verbose=True, raise_error=True))
+
+    def test__acollect_data_from_source_lazy(self, monkeypatch):
+        class MockTransport:
+            @staticmethod
+            async def get(url, **_kwargs):
+                source = requests.Response()
+                source.status_code, source._content = 200, url.encode()
+                return source
+
+        monkeypatch.setattr('pyrcs._base.get_async_transport', lambda: MockTransport())
+
+        _b_test = _Base(lazy=True)
+        threads = []
+
+        def mock_get_catalogue():
+            threads.append(threading.get_ident())
+            return {'A': 'https://test.url/a'}
+
+        monkeypatch.setattr(_b_test, '_get_catalogue', mock_get_catalogue)
+
+        async def method(source, initial, verbose=False):  # A coroutine function is awaited
+            return {initial: source.content.decode(), 'thread': threading.get_ident()}
+
+        async def main():
+            data_ = await _b_test._acollect_data_from_source(
+                'test_data_name', method=method, initial='A', confirmation_required=False)
+            return data_, threading.get_ident()
+
+        data, loop_thread = asyncio.run(main())
+        assert data == {'A': 'https://test.url/a', 'thread': loop_thread}
+        # The catalogue is retrieved (only once) in a worker thread, not on the event loop
+        assert len(threads) == 1 and threads[0] != loop_thread
+        assert _b_test.catalogue == {'A': 'https://test.url/a'} and len(threads) == 1
+
     @pytest.mark.parametrize('ext', ["pickle", None])
     def test__save_data_to_file(self, _b, ext, tmp_path, capfd):
         data_name = "test_data_name"
@@ -157,6 +273,321 @@ class TestBase:
             if verbose:
                 assert "Error: '_Base' object has no attribute 'test_method'." in out
 
+    def test__fetch_data_from_file_conditional(self, tmp_path, monkeypatch):
+        modified = [False]
+        monkeypatch.setattr('pyrcs._base.is_page_modified', lambda *_args: modified[0])
+
+        _b_test = _Base(data_dir=tmp_path, lazy=True)
+        calls = []
+
+        def mock_collect(confirmation_required=False, verbose=False):
+            calls.append(confirmation_required)
+            get_transport().get('https://test.url/a')
+            data = {'A': len(calls)}
+            _b_test._save_data_to_file(data, data_name='a', verbose=verbose)
+            return data
+
+        monkeypatch.setattr(
+            'pyrcs.transport.HTTPTransport.get',
+            lambda _self, url, **_kwargs: transport._record_validators(url, _mock_response()))
+
+        data = _b_test._fetch_data_from_file('a', mock_collect, update=True)
+        assert data == {'A': 1}
+        path_to_file = _b_test._make_file_pathname('a')
+        assert list(load_validators(path_to_file)) == ['https://test.url/a']
+
+        data = _b_test._fetch_data_from_file('a', mock_collect, update=True)
+        assert data == {'A': 1} and len(calls) == 1  # Unmodified; the existing data is kept
+
+        modified[0] = True
+        data = _b_test._fetch_data_from_file('a', mock_collect, update=True)
+        assert data == {'A': 2} and len(calls) == 2
+
+    def test__fetch_data_from_file_modified(self, tmp_path, monkeypatch):
+        from pyrcs.transport import AsyncHTTPTransport, HTTPTransport, set_async_transport, \
+            set_transport
+
+        requests_sent = []
+
+        def mock_get(_self, url, **kwargs):
+            requests_sent.append((url, kwargs.get('headers')))
+            return _mock_response(content=f'{len(requests_sent)}'.encode())
+
+        monkeypatch.setattr(requests.Session, 'get', mock_get)
+        monkeypatch.setattr('pyrcs.transport.httpx', None)
+        set_transport(HTTPTransport())
+        set_async_transport(AsyncHTTPTransport())
+
+        _b_test = _Base(data_dir=tmp_path, lazy=True)
+
+        def mock_collect(confirmation_required=False, verbose=False):
+            data = {'A': get_transport().get('https://test.url/a').text}
+            _b_test._save_data_to_file(data, data_name='a', verbose=verbose)
+            return data
+
+        async def mock_acollect(confirmation_required=False, verbose=False):
+            source = await transport.get_async_transport().get('https://test.url/a')
+            data = {'A': source.text}
+            _b_test._save_data_to_file(data, data_name='a', verbose=verbose)
+            return data
+
+        try:
+            assert _b_test._fetch_data_from_file('a', mock_collect, update=True) == {'A': '1'}
+            assert len(requests_sent) == 1
+
+            # The page is modified (by its hash); the response of the conditional request is reused
+            assert _b_test._fetch_data_from_file('a', mock_collect, update=True) == {'A': '2'}
+            assert len(requests_sent) == 2 and requests_sent[1][1] is not None
+            path_to_file = _b_test._make_file_pathname('a')
+            validators = load_validators(path_to_file)['https://test.url/a']
+            assert validators['SHA-256'] == hashlib.sha256(b'2').hexdigest()
+
+            data = asyncio.run(_b_test._afetch_data_from_file('a', mock_acollect, update=True))
+            assert data == {'A': '3'} and len(requests_sent) == 3
+
+        finally:
+            set_transport()
+            set_async_transport()
+
+    def test__fetch_data_from_file_columnar(self, tmp_path):
+        pytest.importorskip('pyarrow')
+
+        _b_test = _Base(data_dir=tmp_path, lazy=True)
+        calls = []
+
+        def mock_collect(confirmation_required=False, verbose=False):
+            calls.append(confirmation_required)
+            data = {'A': pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}), 'Last updated date': ''}
+            _b_test._save_data_to_file(data, data_name='a', verbose=verbose)  # As a pickle
+            return data
+
+        data = _b_test._fetch_data_from_file('a', mock_collect, ext=".parquet")
+        assert len(calls) == 1 and data['A'].shape == (2, 2)
+
+        # The Parquet files are made from the pickle file when the data is first loaded from them
+        data = _b_test._fetch_data_from_file('a', mock_collect, ext=".parquet", columns=['b'])
+        assert len(calls) == 1 and data['A'].columns.tolist() == ['b']
+        assert os.path.isfile(_b_test._make_file_pathname('a', ext=".parquet.json"))
+
+        data = _b_test._fetch_data_from_file('a', mock_collect, ext=".pkl", columns=['b'])
+        assert data['A'].columns.tolist() == ['b']
+
+    def test__fetch_data_from_file_cached(self, tmp_path, monkeypatch):
+        from pyrcs.cache import DataCache
+
+        monkeypatch.setattr('pyrcs._base.data_cache', DataCache())
+        monkeypatch.setattr('pyrcs._base._Base._is_source_modified', lambda *_args: False)
+
+        _b_test = _Base(data_dir=tmp_path, lazy=True)
+        _b_test._save_data_to_file({'A': pd.DataFrame({'a': [1, 2]})}, data_name='a')
+
+        loads = []
+        load_data_file = _b_test._load_data_file
+        monkeypatch.setattr(
+            _b_test, '_load_data_file', lambda *args, **kwargs: loads.append(args) or
+            load_data_file(*args, **kwargs))
+
+        data = _b_test._fetch_data_from_file('a', lambda **_kwargs: None)
+        data['A'].loc[0, 'a'] = 0
+        data = _b_test._fetch_data_from_file('a', lambda **_kwargs: None)
+        assert data['A']['a'].tolist() == [1, 2] and len(loads) == 1
+
+        # The cached data is dropped when the data is updated or the file is modified
+        _b_test._fetch_data_from_file('a', lambda **_kwargs: None, update=True)
+        assert len(loads) == 2
+
+        _b_test._save_data_to_file({'A': pd.DataFrame({'a': [3]})}, data_name='a')
+        path_to_file = _b_test._make_file_pathname('a')
+        os.utime(path_to_file, ns=(0, os.stat(path_to_file).st_mtime_ns + 1))
+        data = _b_test._fetch_data_from_file('a', lambda **_kwargs: None)
+        assert data['A']['a'].tolist() == [3] and len(loads) == 3
+
+    def test__fetch_data_from_file_incrementally(self, tmp_path, monkeypatch):
+        from pyrcs.transport import save_validators
+
+        remote_dates = {'https://test.url/a': '2024-01-01'}
+        monkeypatch.setattr('pyrcs._base.peek_last_updated_date', remote_dates.get)
+
+        _b_test = _Base(data_dir=tmp_path, lazy=True)
+        calls = []
+
+        def mock_collect(confirmation_required=False, verbose=False):
+            calls.append(_b_test.KEY)
+            data = {'A': len(calls), _b_test.KEY_TO_LAST_UPDATED_DATE: '2024-02-01'}
+            _b_test._save_data_to_file(data, data_name='a', verbose=verbose)
+            return data
+
+        with incremental_update() as report:  # The data is collected for the first time
+            data = _b_test._fetch_data_from_file('a', mock_collect, update=True)
+        assert data['A'] == 1 and [x['Updated'] for x in report] == [True]
+
+        path_to_file = _b_test._make_file_pathname('a')
+        save_validators(path_to_file, {'https://test.url/a': {'SHA-256': ''}})
+
+        with incremental_update() as report:  # The web page has not been updated since
+            data = _b_test._fetch_data_from_file('a', mock_collect, update=True)
+        assert data['A'] == 1 and len(calls) == 1
+        assert report == [{
+            'Data': 'a', 'Initial': None, 'Stored date': '2024-02-01',
+            'Remote date': '2024-01-01', 'Updated': False}]
+
+        remote_dates['https://test.url/a'] = '2024-03-01'
+        with incremental_update() as report:
+            data = _b_test._fetch_data_from_file('a', mock_collect, update=True)
+        assert data['A'] == 2 and len(calls) == 2
+        assert [(x['Remote date'], x['Updated']) for x in report] == [('2024-03-01', True)]
+
+    @pytest.mark.parametrize('max_workers', [1, 4])
+    def test__map_initials(self, max_workers):
+        data = _Base._map_initials(
+            lambda initial, **kwargs: (initial, kwargs), max_workers=max_workers, update=False)
+        assert [x[0] for x in data] == list(string.ascii_lowercase)
+        assert all(x[1] == {'update': False} for x in data)
+
+    @pytest.mark.parametrize('update', [False, True])
+    def test__fetch_by_initials(self, _b, update, monkeypatch):
+        if update:
+            monkeypatch.setattr('pyrcs._base.is_homepage_connectable', lambda: False)
+        else:  # The stored data is read with no requests
+            attempts = _block_sockets(monkeypatch)
+
+        calls = []
+
+        def mock_fetch(initial, update=False, verbose=False):
+            calls.append((initial, update))
+            letter = initial.upper()
+            return {letter: None if update else letter, _b.KEY_TO_LAST_UPDATED_DATE: None}
+
+        data = _b._fetch_by_initials(mock_fetch, data_name='test_data_name', update=update)
+        assert [d[x] for d, x in zip(data, string.ascii_uppercase)] == list(string.ascii_uppercase)
+        assert len(calls) == (52 if update else 26)
+        assert update or not attempts
+
+    @pytest.mark.parametrize('update', [False, True])
+    def test__afetch_by_initials(self, update, monkeypatch):
+        if update:
+            monkeypatch.setattr('pyrcs._base.is_homepage_connectable', lambda: False)
+        else:
+            attempts = _block_sockets(monkeypatch)
+
+        _b_test = _Base(lazy=True)
+        calls = []
+
+        async def mock_fetch(initial, update=False, verbose=False):
+            calls.append((initial, update))
+            letter = initial.upper()
+            return {letter: None if update else letter, _b_test.KEY_TO_LAST_UPDATED_DATE: None}
+
+        data = asyncio.run(
+            _b_test._afetch_by_initials(mock_fetch, data_name='test_data_name', update=update))
+        assert [d[x] for d, x in zip(data, string.ascii_uppercase)] == list(string.ascii_uppercase)
+        assert len(calls) == (52 if update else 26)
+        assert update or not attempts
+
+    def test__fetch_by_initials_incrementally(self, tmp_path, monkeypatch):
+        monkeypatch.setattr('pyrcs._base.is_homepage_connectable', lambda: False)
+        monkeypatch.setattr(
+            'pyrcs._base.peek_last_updated_date',
+            lambda url: '2024-02-01' if url.endswith('a') else '2024-01-01')
+
+        _b_test = _Base(data_dir=tmp_path, lazy=True)
+        _b_test.catalogue = {x: f'https://test.url/{x.lower()}' for x in string.ascii_uppercase}
+
+        calls = []
+
+        def mock_fetch(initial, update=False, verbose=False):
+            calls.append((initial, update))
+            data = {initial.upper(): initial, _b_test.KEY_TO_LAST_UPDATED_DATE: '2024-01-01'}
+            _b_test._save_data_to_file(data, data_name=initial, sub_dir="a-z")
+            return data
+
+        for x in string.ascii_lowercase[:-1]:  # The data of 'z' is not stored
+            mock_fetch(x)
+        calls.clear()
+
+        with incremental_update() as report:
+            data = _b_test._fetch_by_initials(
+                mock_fetch, data_name='test_data_name', update=True, max_workers=4)
+
+        assert [d[x] for d, x in zip(data, string.ascii_uppercase)] == list(string.ascii_lowercase)
+        # Only the updated page and the page not stored are collected
+        assert sorted(x for x in calls if x[1]) == [('a', True), ('z', True)]
+        assert ('z', False) not in calls
+        assert len(report) == 26
+        assert sorted(x['Initial'] for x in report if x['Updated']) == ['A', 'Z']
+
+    def test__fetch_merged_initials(self, tmp_path, monkeypatch):
+        from pyrcs.cache import DataCache
+
+        attempts = _block_sockets(monkeypatch)
+        data_cache = DataCache()
+        monkeypatch.setattr('pyrcs._base.data_cache', data_cache)
+
+        _b_test = _Base(data_dir=tmp_path, lazy=True)
+        calls = []
+
+        def mock_fetch(initial, update=False, verbose=False):
+            calls.append((initial, update))
+            return _b_test._fetch_data_from_file(
+                initial, lambda **_kwargs: None, sub_dir="a-z", update=update)
+
+        def mock_merge(data_sets):
+            data = pd.concat([d[x] for d, x in zip(data_sets, string.ascii_uppercase)])
+            return {'Data': data.reset_index(drop=True)}
+
+        for x in string.ascii_uppercase:
+            _b_test._save_data_to_file(
+                {x: pd.DataFrame({'Code': [x]})}, data_name=x, sub_dir="a-z")
+
+        data = _b_test._fetch_merged_initials(mock_fetch, mock_merge, data_name='test_data_name')
+        assert data['Data']['Code'].tolist() == list(string.ascii_uppercase)
+        assert len(calls) == 26
+
+        # Reading the data writes nothing; the merged data is kept in memory instead
+        path_to_merged = _b_test._make_file_pathname('all-initials', sub_dir="a-z")
+        assert not os.path.exists(path_to_merged)
+
+        # The merged data is loaded in one go until the data of any initial letter is modified
+        data_ = _b_test._fetch_merged_initials(mock_fetch, mock_merge, data_name='test_data_name')
+        assert data_['Data'].equals(data['Data']) and len(calls) == 26
+
+        _b_test._save_data_to_file(
+            {'A': pd.DataFrame({'Code': ['A1']})}, data_name='a', sub_dir="a-z")
+        path_to_a = _b_test._make_file_pathname('a', sub_dir="a-z")
+        os.utime(path_to_a, ns=(0, os.stat(path_to_a).st_mtime_ns + 1))
+
+        data = _b_test._fetch_merged_initials(mock_fetch, mock_merge, data_name='test_data_name')
+        assert data['Data']['Code'].iloc[0] == 'A1' and len(calls) == 52
+        assert not attempts
+
+        # An update writes the data files of the initial letters, and then the merged data
+        def mock_collect(initial, **_kwargs):
+            data_ = {initial.upper(): pd.DataFrame({'Code': [initial.upper() + '2']})}
+            _b_test._save_data_to_file(data_, data_name=initial, sub_dir="a-z")
+            return data_
+
+        def mock_update(initial, update=False, verbose=False):
+            calls.append((initial, update))
+            return _b_test._fetch_data_from_file(
+                initial, functools.partial(mock_collect, initial), sub_dir="a-z", update=update)
+
+        for x in string.ascii_lowercase:
+            path_to_x = _b_test._make_file_pathname(x, sub_dir="a-z")
+            os.utime(path_to_x, ns=(0, os.stat(path_to_x).st_mtime_ns - 10 ** 9))
+
+        monkeypatch.setattr('pyrcs._base.is_homepage_connectable', lambda: False)
+        data = _b_test._fetch_merged_initials(
+            mock_update, mock_merge, data_name='test_data_name', update=True)
+        assert data['Data']['Code'].iloc[0] == 'A2' and len(calls) == 78
+
+        merged = pd.read_pickle(path_to_merged)
+        assert merged['Modification times'] == _b_test._get_initials_mtimes()
+        assert merged['Data']['Data'].equals(data['Data'])
+
+        data_cache.invalidate()  # The merged data is then loaded from the file
+        data_ = _b_test._fetch_merged_initials(mock_fetch, mock_merge, data_name='test_data_name')
+        assert data_['Data'].equals(data['Data']) and len(calls) == 78
+
 
 if __name__ == '__main__':
     pytest.main()
@@ -0,0 +1,25 @@
+"""
+Test the module :py:mod:`pyrcs._patterns`.
+"""
+
+import re
+
+import pytest
+
+from pyrcs import _patterns
+
+
+def test_patterns():
+    patterns = {k: v for k, v in vars(_patterns).items() if k.isupper()}
+    assert patterns and all(isinstance(v, re.Pattern) for v in patterns.values())
+
+    assert _patterns.LOC_NAME_WITH_NOTE.search('Ayr [unknown feature]').groups() == (
+        'Ayr', 'unknown feature')
+    assert _patterns.LOC_NAME_NOTE_KEYWORDS.search('Formerly Abercynon South')
+    assert _patterns.STANOX_WITH_NOTE.match('12345 Main Line').groups() == ('12345', 'Main Line')
+    assert _patterns.TD_LINE_BREAK.sub(' / ', 'A/\r\nB\nC') == 'A / B / C'
+    assert _patterns.DIGITS.findall('0.325km (0m 356y)') == ['0', '325', '0', '356']
+
+
+if __name__ == '__main__':
+    pytest.main()
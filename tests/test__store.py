@@ -0,0 +1,66 @@
+"""
+Test the module :py:mod:`pyrcs._store`.
+"""
+
+import datetime
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.mark.parametrize('ext', [".parquet", ".feather"])
+def test_save_columnar(ext, tmp_path, capfd):
+    from pyrcs._store import load_columnar, save_columnar, stored_pathname
+
+    codes = pd.DataFrame({'Location': ['Aber', None], 'CRS': ['ABE', ''], 'STANOX': [1, 2]})
+    notes = pd.DataFrame({'Note': [['a', 'b'], 'c']})  # Not stored the same in Arrow
+    data = {
+        'A': codes, 'Notes': (notes, 'see notes'), 'Last updated date': '2024-01-01',
+        'Date': datetime.date(2024, 1, 1), 1: None,
+    }
+
+    path_to_file = os.path.join(tmp_path, "a" + ext)
+    save_columnar(data, path_to_file, verbose=True)
+    out, _ = capfd.readouterr()
+    assert f'Saving "{os.path.relpath(path_to_file)}" ... Done.' in out
+    assert os.path.isfile(stored_pathname(path_to_file))
+    assert sorted(os.listdir(tmp_path)) == sorted(["a.0" + ext, "a.1.pkl", "a" + ext + ".json"])
+
+    data_ = load_columnar(path_to_file)
+    assert list(data_) == list(data) and data_['A'].equals(codes)
+    assert data_['Notes'][0].equals(notes) and data_['Notes'][1] == 'see notes'
+    assert data_['Date'] == data['Date'] and data_[1] is None
+
+    data_ = load_columnar(path_to_file, columns=['CRS'])
+    assert data_['A'].columns.tolist() == ['CRS'] and data_['Notes'][0].shape == (2, 0)
+
+    save_columnar({'A': codes}, path_to_file)  # The files no longer used are removed
+    assert sorted(os.listdir(tmp_path)) == sorted(["a.0" + ext, "a" + ext + ".json"])
+
+
+def test_save_columnar_mileage(tmp_path):
+    from pyrcs._store import load_columnar, save_columnar
+    from pyrcs.mileage import to_mileage
+
+    mileages = pd.DataFrame({'Mileage': to_mileage(['0.0396', None]), 'ELR': ['AAM', 'AAM']})
+
+    path_to_file = os.path.join(tmp_path, "aam.parquet")
+    save_columnar(mileages, path_to_file)
+    assert load_columnar(path_to_file).equals(mileages)
+
+
+def test_select_columns():
+    from pyrcs._store import select_columns
+
+    data = {'A': pd.DataFrame({'a': [1], 'b': [2]}), 'Last updated date': '2024-01-01'}
+    assert select_columns(data) is data
+
+    data_ = select_columns(data, columns=['b', 'c'])
+    assert data_['A'].columns.tolist() == ['b'] and data_['Last updated date'] == '2024-01-01'
+
+
+if __name__ == '__main__':
+    pytest.main()
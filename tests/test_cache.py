@@ -0,0 +1,62 @@
+"""
+Test the module :py:mod:`pyrcs.cache`.
+"""
+
+import pandas as pd
+import pytest
+
+from pyrcs.cache import DataCache
+
+
+class TestDataCache:
+
+    def test_get_put(self):
+        cache = DataCache()
+        data = {'A': pd.DataFrame({'Code': ['A1', 'A2']}), 'Last updated date': '2024-01-01'}
+
+        assert cache.get(('Test', 'a.pkl'), mtime=1) is None
+        assert cache.put(('Test', 'a.pkl'), data, mtime=1)
+
+        data_ = cache.get(('Test', 'a.pkl'), mtime=1)
+        assert data_['A'].equals(data['A']) and data_['A'] is not data['A']
+
+        # The cached data cannot be modified through the data returned
+        data_['A'].loc[0, 'Code'] = 'B1'
+        assert cache.get(('Test', 'a.pkl'), mtime=1)['A']['Code'].tolist() == ['A1', 'A2']
+
+        assert cache.get(('Test', 'a.pkl'), mtime=2) is None  # The file has been modified
+        assert cache.info()[:4] == (2, 2, 0, 0)
+
+    def test_eviction(self):
+        dat = pd.DataFrame({'Code': range(1000)})
+        cache = DataCache(max_size=int(dat.memory_usage(index=True).sum()) * 2)
+
+        for x in 'abc':
+            cache.put(('Test', x), dat, mtime=1)
+            cache.get(('Test', 'a'), mtime=1)  # 'a' is the most recently used
+
+        assert cache.get(('Test', 'b'), mtime=1) is None
+        assert cache.get(('Test', 'a'), mtime=1) is not None
+        assert cache.info().evictions == 1
+
+        assert not cache.put(('Test', 'd'), pd.concat([dat] * 3), mtime=1)  # Too large
+        assert cache.info().entries == 2
+
+        cache.resize(0)
+        assert cache.info().entries == 0 and cache.info().evictions == 1
+
+    def test_invalidate(self):
+        cache = DataCache()
+        cache.put(('Test', 'a.pkl', None), [1], mtime=1)
+        cache.put(('Test', 'a.pkl', ('Code',)), [2], mtime=1)
+        cache.put(('Test', 'b.pkl', None), [3], mtime=1)
+
+        cache.invalidate(('Test', 'a.pkl'))
+        assert cache.info().entries == 1
+
+        cache.invalidate()
+        assert cache.info().entries == 0 and cache.info().size == 0
+
+
+if __name__ == '__main__':
+    pytest.main()
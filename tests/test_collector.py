@@ -2,11 +2,15 @@
 Test the module :py:mod:`pyrcs.collector`.
 """
 
+import concurrent.futures
+import time
 import unittest.mock
 
 import pytest
 
+from pyrcs._base import incremental_update
 from pyrcs.collector import LineData, OtherAssets, _Base
+from pyrcs.transport import ResponseCache, set_response_cache
 
 
 class TestCollectorBase:
@@ -21,6 +25,47 @@ class TestCollectorBase:
         mock_warning.assert_called_once_with(verbose=True)
 
 
+def test_line_data_lazy_collectors(monkeypatch):
+    monkeypatch.setattr('pyrcs.collector.is_homepage_connectable', lambda: False)
+    monkeypatch.setattr('pyrcs.collector.print_connection_warning', lambda **_kwargs: None)
+    monkeypatch.setattr('pyrcs.collector.get_category_menu', lambda *a, **k: {})
+
+    mock_class = unittest.mock.MagicMock(side_effect=lambda **_kwargs: object())
+    monkeypatch.setattr('pyrcs.line_data.LocationIdentifiers', mock_class)
+
+    ld = LineData(verbose=False)
+    mock_class.assert_not_called()
+
+    lid = ld.LocationIdentifiers
+    assert ld.LocationIdentifiers is lid
+    mock_class.assert_called_once_with(update=False, verbose=False)
+
+    ld.__init__(update=True, verbose=False)
+    assert ld.LocationIdentifiers is not lid
+    mock_class.assert_called_with(update=True, verbose=False)
+
+
+def test_line_data_lazy_collectors_threads(monkeypatch):
+    monkeypatch.setattr('pyrcs.collector.is_homepage_connectable', lambda: False)
+    monkeypatch.setattr('pyrcs.collector.print_connection_warning', lambda **_kwargs: None)
+    monkeypatch.setattr('pyrcs.collector.get_category_menu', lambda *a, **k: {})
+
+    def mock_init(**_kwargs):
+        time.sleep(0.05)  # So that the threads access the collector at the same time
+        return object()
+
+    mock_class = unittest.mock.MagicMock(side_effect=mock_init)
+    monkeypatch.setattr('pyrcs.line_data.ELRMileages', mock_class)
+
+    ld = LineData(verbose=False)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        collectors = list(executor.map(lambda _: ld.ELRMileages, range(4)))
+
+    assert all(x is collectors[0] for x in collectors)
+    mock_class.assert_called_once_with(update=False, verbose=False)
+
+
 def test_line_data_update_no_connection(monkeypatch, capfd):
     # 1. Mock the connection check to return False
     # Note: Patch this in the module where _Base is defined
@@ -34,13 +79,13 @@ def test_line_data_update_no_connection(monkeypatch, capfd):
     def mock_class(**_kwargs):
         return None
 
-    monkeypatch.setattr('pyrcs.collector.ELRMileages', mock_class)
-    monkeypatch.setattr('pyrcs.collector.Electrification', mock_class)
-    monkeypatch.setattr('pyrcs.collector.LocationIdentifiers', mock_class)
-    monkeypatch.setattr('pyrcs.collector.LOR', mock_class)
-    monkeypatch.setattr('pyrcs.collector.LineNames', mock_class)
-    monkeypatch.setattr('pyrcs.collector.TrackDiagrams', mock_class)
-    monkeypatch.setattr('pyrcs.collector.Bridges', mock_class)
+    monkeypatch.setattr('pyrcs.line_data.ELRMileages', mock_class)
+    monkeypatch.setattr('pyrcs.line_data.Electrification', mock_class)
+    monkeypatch.setattr('pyrcs.line_data.LocationIdentifiers', mock_class)
+    monkeypatch.setattr('pyrcs.line_data.LOR', mock_class)
+    monkeypatch.setattr('pyrcs.line_data.LineNames', mock_class)
+    monkeypatch.setattr('pyrcs.line_data.TrackDiagrams', mock_class)
+    monkeypatch.setattr('pyrcs.line_data.Bridges', mock_class)
 
     # 4. Initialize LineData
     # Because is_homepage_connectable is False, self.connected will be False
@@ -69,16 +114,16 @@ def test_other_assets_update_no_connection(monkeypatch, capfd):
     def mock_class(**_kwargs):
         return None
 
-    monkeypatch.setattr('pyrcs.collector.SignalBoxes', mock_class)
-    monkeypatch.setattr('pyrcs.collector.Tunnels', mock_class)
-    monkeypatch.setattr('pyrcs.collector.Viaducts', mock_class)
-    monkeypatch.setattr('pyrcs.collector.Stations', mock_class)
-    monkeypatch.setattr('pyrcs.collector.Depots', mock_class)
-    monkeypatch.setattr('pyrcs.collector.HabdWild', mock_class)
-    monkeypatch.setattr('pyrcs.collector.WaterTroughs', mock_class)
-    monkeypatch.setattr('pyrcs.collector.Telegraph', mock_class)
-    monkeypatch.setattr('pyrcs.collector.Buzzer', mock_class)
-    monkeypatch.setattr('pyrcs.collector.Features', mock_class)
+    monkeypatch.setattr('pyrcs.other_assets.SignalBoxes', mock_class)
+    monkeypatch.setattr('pyrcs.other_assets.Tunnels', mock_class)
+    monkeypatch.setattr('pyrcs.other_assets.Viaducts', mock_class)
+    monkeypatch.setattr('pyrcs.other_assets.Stations', mock_class)
+    monkeypatch.setattr('pyrcs.other_assets.Depots', mock_class)
+    monkeypatch.setattr('pyrcs.other_assets.HabdWild', mock_class)
+    monkeypatch.setattr('pyrcs.other_assets.WaterTroughs', mock_class)
+    monkeypatch.setattr('pyrcs.other_assets.Telegraph', mock_class)
+    monkeypatch.setattr('pyrcs.other_assets.Buzzer', mock_class)
+    monkeypatch.setattr('pyrcs.other_assets.Features', mock_class)
 
     # 4. Initialize LineData
     # Because is_homepage_connectable is False, self.connected will be False
@@ -94,5 +139,68 @@ def test_other_assets_update_no_connection(monkeypatch, capfd):
     assert "The Internet connection is not available" in out
 
 
+def test_line_data_update_reparse(monkeypatch, tmp_path):
+    monkeypatch.setattr('pyrcs.collector.is_homepage_connectable', lambda: False)
+    monkeypatch.setattr('pyrcs.collector.print_connection_warning', lambda **_kwargs: None)
+    monkeypatch.setattr('pyrcs.collector.get_category_menu', lambda *a, **k: {})
+
+    mock_class = unittest.mock.MagicMock()
+    for name in ['ELRMileages', 'Electrification', 'LocationIdentifiers', 'LOR', 'LineNames',
+                 'TrackDiagrams', 'Bridges']:
+        monkeypatch.setattr(f'pyrcs.line_data.{name}', mock_class)
+
+    ld = LineData(verbose=False)
+
+    with pytest.raises(ValueError, match='No cache of raw responses'):
+        ld.update(confirmation_required=False, reparse=True)
+
+    set_response_cache(ResponseCache(cache_dir=tmp_path))
+    ld.update(confirmation_required=False, interval=60, reparse=True)  # No sleeping
+    set_response_cache()
+
+    mock_class.return_value.fetch_elr.assert_called_once_with(update=True, verbose=False)
+
+
+def test_summarise_update(capfd):
+    report = [
+        {'Data': 'Location ID', 'Initial': 'B', 'Stored date': '2024-01-01',
+         'Remote date': '2024-02-01', 'Updated': True},
+        {'Data': 'Location ID', 'Initial': 'A', 'Stored date': '2024-01-01',
+         'Remote date': '2024-01-01', 'Updated': False},
+        {'Data': 'Bridges', 'Initial': None, 'Stored date': '2024-01-01',
+         'Remote date': '2024-02-01', 'Updated': True},
+    ]
+
+    update_report = _Base._summarise_update(report, verbose=True)
+    assert update_report['Initial'].to_list() == [None, 'A', 'B']
+    out, _ = capfd.readouterr()
+    assert "  Bridges\n" in out and "Location ID: B" in out
+
+    update_report = _Base._summarise_update([], verbose=True)
+    assert update_report.empty
+    out, _ = capfd.readouterr()
+    assert "No pages have been updated." in out
+
+
+def test_make_pause(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr('pyrcs.collector.time.sleep', sleeps.append)
+
+    _Base._make_pause(5)()
+    assert sleeps == [5]  # Not an incremental update
+
+    with incremental_update() as report:
+        pause = _Base._make_pause(5)
+
+        report.append({'Data': 'Bridges', 'Initial': None, 'Updated': False})
+        pause()
+        assert sleeps == [5]  # No page has been collected again
+
+        report.append({'Data': 'Location ID', 'Initial': 'A', 'Updated': True})
+        pause()
+        pause()
+        assert sleeps == [5, 5]
+
+
 if __name__ == '__main__':
     pytest.main()
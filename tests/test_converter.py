@@ -2,6 +2,8 @@
 Test the module :py:mod:`pyrcs.converter`.
 """
 
+import numpy as np
+import pandas as pd
 import pytest
 
 
@@ -150,5 +152,114 @@ def test_kilometer_to_yard():
     assert rslt == 1093.6132983377079
 
 
+def test_yards_to_mileages():
+    from pyrcs.converter import yard_to_mileage, yards_to_mileages
+
+    yards = [396, None, 1760, 12330, 0, -1, 396.9]
+
+    mileage_dat = yards_to_mileages(yards=yards)
+    assert mileage_dat.tolist() == [yard_to_mileage(x) for x in yards]
+
+    mileage_dat = yards_to_mileages(yards=pd.Series(yards, index=list('abcdefg')), as_str=False)
+    assert mileage_dat.index.tolist() == list('abcdefg')
+    assert mileage_dat.equals(pd.Series([yard_to_mileage(x, as_str=False) for x in yards],
+                                        index=list('abcdefg')))
+
+
+def test_mileages_to_yards():
+    from pyrcs.converter import mileage_to_yard, mileages_to_yards
+
+    mileages = ['0.0396', '1.0396', '-1.0396', '0.396', 0.0396, 1.0396, 10]
+
+    yards_dat = mileages_to_yards(mileages=mileages)
+    assert yards_dat.dtype == np.int64
+    assert yards_dat.tolist() == [mileage_to_yard(x) for x in mileages]
+
+    yards_dat = mileages_to_yards(mileages=np.array([0.0396, np.nan]))
+    assert yards_dat[0] == 396 and np.isnan(yards_dat[1])
+
+    with pytest.raises(ValueError):  # As mileage_to_yard('10') does
+        mileages_to_yards(mileages=['10'])
+
+    # Unlike mileage_to_yard(), which raises an error for blank values
+    assert np.isnan(mileages_to_yards(mileages=['', None, np.nan])).all()
+    with pytest.raises(ValueError):
+        mileage_to_yard('')
+
+
+def test_mile_chains_to_mileages():
+    from pyrcs.converter import mile_chain_to_mileage, mile_chains_to_mileages
+
+    mile_chains = ['0.18', None, '84.62', '-1.18', '1.1', '', np.nan, 0.18, 1.1]
+
+    mileage_data = mile_chains_to_mileages(mile_chains=mile_chains)
+    assert mileage_data.tolist() == [mile_chain_to_mileage(x) for x in mile_chains]
+
+    # Integers have no '.', for which mile_chain_to_mileage() raises an error, too
+    for mile_chains in [[395437], np.array([395437]), ['0.18', 395437]]:
+        with pytest.raises(ValueError):
+            mile_chains_to_mileages(mile_chains=mile_chains)
+    with pytest.raises(ValueError):
+        mile_chain_to_mileage(395437)
+
+
+def test_mileages_to_mile_chains():
+    from pyrcs.converter import mileage_to_mile_chain, mileages_to_mile_chains
+
+    # Including '0.0011' (i.e. 0.5 chain), which numpy.round() would round to 0.00
+    mileages = ['0.0396', 1.0396, None, '0.0011', '1.0055', '12.12345', '']
+
+    mile_chain_data = mileages_to_mile_chains(mileages=mileages)
+    assert mile_chain_data.tolist() == [mileage_to_mile_chain(x) for x in mileages]
+
+    for mileages in [[395437], pd.Series([395437])]:
+        with pytest.raises(ValueError):  # As mileage_to_mile_chain(395437) does
+            mileages_to_mile_chains(mileages=mileages)
+    with pytest.raises(ValueError):
+        mileage_to_mile_chain(395437)
+
+
+def test_mileage_strs_to_nums():
+    from pyrcs.converter import mileage_str_to_num, mileage_strs_to_nums
+
+    mileage_num = mileage_strs_to_nums(mileages=['0.0396', '', '10.1500', '0.00005'])
+    assert mileage_num[[0, 2, 3]].tolist() == [
+        mileage_str_to_num(x) for x in ['0.0396', '10.1500', '0.00005']]
+    assert np.isnan(mileage_num[1])
+
+    # Unlike mileage_str_to_num(), which raises an error for None
+    assert np.isnan(mileage_strs_to_nums(mileages=[None])).all()
+    with pytest.raises(TypeError):
+        mileage_str_to_num(None)
+
+
+def test_shift_mileages_by_yard():
+    from pyrcs.converter import shift_mileage_by_yard, shift_mileages_by_yard
+
+    mileages, shift_yards = ['0.0396', '0.0396', 10], [220, 221, 220]
+
+    n_mileage = shift_mileages_by_yard(mileages=mileages, shift_yards=shift_yards)
+    assert n_mileage.tolist() == [
+        shift_mileage_by_yard(m, y) for m, y in zip(mileages, shift_yards)]
+
+    n_mileage = shift_mileages_by_yard(mileages=['0.0396', None], shift_yards=221, as_numeric=False)
+    assert n_mileage.tolist() == ['0.0617', '']
+    with pytest.raises(AttributeError):  # Unlike shift_mileage_by_yard() for blank values
+        shift_mileage_by_yard(None, 221)
+
+
+def test_kilometers_to_yards():
+    from pyrcs.converter import kilometer_to_yard, kilometers_to_yards
+
+    rslt = kilometers_to_yards([1, None, '0.5'])
+    assert rslt[0] == kilometer_to_yard(1) and rslt[2] == kilometer_to_yard('0.5')
+    assert np.isnan(rslt[1])
+
+    # Unlike kilometer_to_yard(), which raises an error for ''
+    assert np.isnan(kilometers_to_yards([''])).all()
+    with pytest.raises(ValueError):
+        kilometer_to_yard('')
+
+
 if __name__ == '__main__':
     pytest.main()
@@ -0,0 +1,46 @@
+"""
+Test the package initialisation :py:mod:`pyrcs`.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_modules(statement):
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    return subprocess.run(
+        [sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout.split()
+
+
+@pytest.mark.parametrize('heavy_module', ['pandas', 'numpy', 'bs4', 'requests', 'pyhelpers'])
+def test_import_is_lazy(heavy_module):
+    assert heavy_module not in _loaded_modules("import pyrcs")
+
+
+def test_converter_import():
+    loaded_modules = _loaded_modules("import pyrcs; pyrcs.converter.mileage_to_yard('0.0396')")
+    assert 'pyrcs.converter' in loaded_modules
+    assert 'bs4' not in loaded_modules and 'requests' not in loaded_modules
+
+
+def test_collector_import():
+    loaded_modules = _loaded_modules("import pyrcs.collector")
+    assert 'pyrcs.line_data.loc_id' not in loaded_modules
+    assert 'pyrcs.other_assets.station' not in loaded_modules
+
+
+def test_getattr():
+    import pyrcs
+
+    assert pyrcs.LocationIdentifiers is pyrcs.line_data.loc_id.LocationIdentifiers
+    assert pyrcs.Stations is pyrcs.other_assets.Stations
+    assert set(pyrcs.__all__).issubset(dir(pyrcs))
+
+    with pytest.raises(AttributeError, match="has no attribute 'NonExistent'"):
+        _ = pyrcs.NonExistent
+
+
+if __name__ == '__main__':
+    pytest.main()
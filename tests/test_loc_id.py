@@ -2,14 +2,50 @@
 Test the module :py:mod:`pyrcs.line_data.loc_id`.
 """
 
+import asyncio
+import socket
+import string
 from unittest.mock import MagicMock, patch
 
 import bs4
 import pandas as pd
 import pytest
+import requests
 
 from pyrcs.line_data.loc_id import LocationIdentifiers
 
+# A (shortened) page of CRS, NLC, TIPLOC and STANOX codes
+_CRS_PAGE = (
+    '<html><head><title>CRS codes: A</title></head>'
+    '<body><h1>CRS, NLC, TIPLOC and STANOX codes: A</h1>'
+    '<p>See the <a href="crs2.shtm">explanatory note</a>.</p>'
+    '<table><thead><tr><th>Location</th><th>CRS</th><th>NLC</th><th>TIPLOC</th><th>STANME</th>'
+    '<th>STANOX</th></tr></thead><tbody>'
+    '<tr><td>Abbey Wood <span class="r">(Bexley)</span></td><td>ABW</td><td>512400</td>'
+    '<td>ABWD</td><td>ABBEYWOOD</td><td>88321</td></tr>'
+    '<tr><td rowspan="2">Aberdeen</td><td>ABD</td><td>886600</td><td>ABRDEEN</td>'
+    '<td>ABERDEEN</td><td>08000</td></tr>'
+    '<tr><td>&nbsp;</td><td>886601</td><td>ABRDNFD<br>ABRDNSD</td><td>ABERDEEN&nbsp;</td>'
+    '<td>08003</td></tr>'
+    '<tr><td>Aberdovey / Aberdyfi <span class="r">✖Welsh name</span></td><td>AVY</td>'
+    '<td>252900</td><td>ABDOVEY</td><td>ABERDOVEY</td><td>75013</td></tr>'
+    '<tr><td>Ashburys</td><td>ABY <a href="crs2.shtm#ABY">note</a></td><td>280100</td>'
+    '<td>ASHBRYS</td><td>ASHBURYS</td><td>35007</td></tr>'
+    '<tr><td>Accrington Café – siding</td><td></td><td>&nbsp;</td><td>ACCRSDG</td><td></td>'
+    '<td>38012</td></tr>'
+    '</tbody></table><p class="update">Last updated: 1 May 2024</p></body></html>'
+).encode('utf-8')
+
+
+def test__normalise_raw_text():
+    from pyrcs.line_data.loc_id import _normalise_raw_text
+
+    assert _normalise_raw_text('Abbey\xa0\xa0Wood\xa0') == 'Abbey Wood'
+    assert _normalise_raw_text('5&half; miles') == '5 and 1/2 miles'
+    assert _normalise_raw_text('\b-\b') == ''
+    # As with pandas.DataFrame.replace(), only what is found in the original text is replaced
+    assert _normalise_raw_text('\xa0\b-\b\xa0') == ''
+
 
 def test__parse_raw_location_name():
     from pyrcs.line_data.loc_id import _parse_raw_location_name
@@ -88,6 +124,19 @@ def test__parse_code_note():
     assert _parse_code_note('12345') == ('12345', '')  # Test no note
 
 
+def test__parse_code_notes():
+    from pyrcs.line_data.loc_id import _parse_code_note, _parse_code_notes
+
+    codes = ['860260✖Earlier code', '860260 [Old Code]', 'ABC (Note)', ' 12345 ', '', 'X (a (b)']
+    df = pd.DataFrame({col: codes for col in ['CRS', 'NLC', 'TIPLOC', 'STANME', 'STANOX']})
+    _parse_code_notes(df)
+
+    # The same as parsing the codes one by one
+    expected = [_parse_code_note(x) for x in codes]
+    assert list(zip(df['CRS'], df['CRS_Note'])) == expected
+    assert list(zip(df['STANOX'], df['STANOX_Note'])) == expected
+
+
 def test__stanox_note():
     from pyrcs.line_data.loc_id import _stanox_note
 
@@ -184,8 +233,28 @@ def test__parse_mult_alt_codes():
         assert res_dirty.loc[0, 'CRS'] == 'PAD'
 
 
+def test__parse_mult_alt_codes_ad_hoc():
+    from pyrcs.line_data.loc_id import _parse_mult_alt_codes
+
+    df = pd.DataFrame({
+        'Location': ['Loc A\r\nLoc B', 'Loc C'],
+        'CRS': ['AAA', 'CCC~LO\nDDD'],
+        'NLC': ['1\r\n2', '3'],
+        'TIPLOC': ['T1', 'T3\nT4'],
+        'STANME': ['S1\r\nS2', ''],
+        'STANOX': ['11\r\n12', '33'],
+        'Other': [' x ', ' y '],
+    })
+    res = _parse_mult_alt_codes(df)
+
+    assert res['Location'].to_list() == ['Loc A', 'Loc B', 'Loc C', 'Loc C']
+    assert res['CRS'].to_list() == ['AAA', '', 'CCCDDD', '']
+    assert res['TIPLOC'].to_list() == ['T1', '', 'T3', 'T4']
+    assert res['STANOX'].to_list() == ['11', '12', '33', '']
+
+
 def test__parse_stanox_note():
-    from pyrcs.line_data.loc_id import _parse_stanox_note
+    from pyrcs.line_data.loc_id import _parse_stanox_note, _stanox_note
 
     df = pd.DataFrame({'STANOX': ['12345', '67890*', '55555 Additional Info']})
 
@@ -196,6 +265,50 @@ def test__parse_stanox_note():
     assert result.loc[1, 'STANOX_Note'] == 'Pseudo STANOX'
     assert result.loc[2, 'STANOX_Note'] == 'Additional Info'
 
+    stanox = ['12345', '12345*', '12345 Main Line', '12345* (formerly 54321)', '-', '', '1234']
+    df = pd.DataFrame({'STANOX': stanox})
+    result = _parse_stanox_note(df)
+
+    # The same as parsing the STANOX one by one
+    assert list(zip(result['STANOX'], result['STANOX_Note'])) == [_stanox_note(x) for x in stanox]
+
+
+def test__fill_location_names():
+    from pyrcs.line_data.loc_id import _fill_location_names
+
+    df = pd.DataFrame({
+        'Location': ['Leeds', 'York', 'Leeds', 'Leeds', 'Ayr'],
+        'CRS': ['LDS', 'YRK', '', ' ', ''],
+        'NLC': ['', '', '848700', '', None],
+        'TIPLOC': ['', 'YORK', '', 'LEEDS', ''],
+        'STANME': ['', '', '', '', ''],
+        'STANOX': ['17132', ' ', '', '', '04311'],
+    })
+
+    result = _fill_location_names(df)
+
+    assert result['CRS'].to_list() == ['LDS', 'YRK', 'LDS', 'LDS', '']
+    assert result['NLC'].to_list() == ['848700', '', '848700', '848700', '']
+    assert result['TIPLOC'].to_list() == ['LEEDS', 'YORK', 'LEEDS', 'LEEDS', '']
+    assert result['STANME'].to_list() == [''] * 5
+    assert result['STANOX'].to_list() == ['17132', '', '17132', '17132', '04311']
+    # The input is not changed
+    assert df.loc[2, 'CRS'] == ''
+
+
+def test__parse_note_page_pre_span():
+    from pyrcs.line_data.loc_id import _parse_note_page_pre_span
+
+    pre = bs4.BeautifulSoup(
+        '<pre><span>Bletchley</span>  <span>BLY</span> BLU\n\n'
+        '<span>London St Pancras</span> <span>STP</span> SPL SPX\n</pre>',
+        'html.parser').pre
+
+    dat = _parse_note_page_pre_span(pre)
+    assert dat.columns.to_list() == ['location_name', 'CRS1', 'CRS2']
+    assert dat.values.tolist() == [
+        ['Bletchley', 'BLY', 'BLU'], ['London St Pancras', 'STP', 'SPL SPX']]
+
 
 def test__format_structured_note():
     """
@@ -228,6 +341,25 @@ def test__format_structured_note():
     assert _format_structured_note("NoTabsHere").empty
 
 
+def test__parse_loc_id_page_lxml():
+    from pyrcs.line_data.loc_id import _parse_loc_id_page
+
+    pytest.importorskip('lxml')
+
+    source = requests.Response()
+    source._content = _CRS_PAGE
+    source.headers['Content-Type'] = 'text/html'
+
+    data, note_hrefs, last_updated_date = _parse_loc_id_page(
+        source, parse_only=LocationIdentifiers._PAGE_ELEMENTS)
+    data_, note_hrefs_, last_updated_date_ = _parse_loc_id_page(source, parser='lxml.html')
+
+    pd.testing.assert_frame_equal(data, data_)
+    assert note_hrefs == note_hrefs_ == ['crs2.shtm', 'crs2.shtm#ABY']
+    assert last_updated_date == last_updated_date_ == '2024-05-01'
+    assert data['Location'].iloc[-1] == 'Accrington Café – siding'
+
+
 @pytest.fixture(scope='class')
 def lid():
     return LocationIdentifiers()
@@ -235,6 +367,52 @@ def lid():
 
 class TestLocationIdentifiers:
 
+    def test_other_systems_catalogue(self, monkeypatch):
+        lid_ = LocationIdentifiers(lazy=True)
+        lid_.catalogue = {lid_.KEY_TO_OTHER_SYSTEMS: 'https://test.url/other-systems'}
+
+        mock_get_page_catalogue = MagicMock(return_value=None)  # e.g. the page cannot be reached
+        monkeypatch.setattr(
+            'pyrcs.line_data.loc_id.get_page_catalogue', mock_get_page_catalogue)
+
+        assert lid_.other_systems_catalogue is None
+        assert lid_.other_systems_catalogue is None
+        mock_get_page_catalogue.assert_called_once_with(url='https://test.url/other-systems')
+
+    def test_collect_loc_id_parser(self, monkeypatch):
+        lid_ = LocationIdentifiers(lazy=True)
+        mock_collect = MagicMock(return_value={})
+        monkeypatch.setattr(lid_, '_collect_data_from_source', mock_collect)
+
+        lid_.collect_loc_id('a', confirmation_required=False, parser='lxml.html')
+        assert mock_collect.call_args.kwargs['parser'] == 'lxml.html'
+
+    def test_fetch_loc_id_lazy(self, tmp_path, monkeypatch):
+        attempts = []
+
+        def _connect(*args, **_kwargs):
+            attempts.append(args)
+            raise OSError("No connection should be made.")
+
+        for name in ('gethostbyname', 'getaddrinfo', 'create_connection'):
+            monkeypatch.setattr(socket, name, _connect)
+        monkeypatch.setattr(socket.socket, 'connect', _connect)
+
+        lid_ = LocationIdentifiers(data_dir=tmp_path, lazy=True)
+        for x in string.ascii_uppercase:
+            data = {
+                x: pd.DataFrame({'Location': [x], 'CRS': [x * 3]}),
+                lid_.KEY_TO_NOTES: None,
+                lid_.KEY_TO_LAST_UPDATED_DATE: '2024-01-01',
+            }
+            lid_._save_data_to_file(data, data_name=x.lower(), sub_dir="a-z")
+
+        # The stored data is read with no requests (not even to check the connection)
+        loc_id_data = lid_.fetch_loc_id()
+        assert loc_id_data[lid_.KEY]['CRS'].tolist() == [x * 3 for x in string.ascii_uppercase]
+        assert lid_.fetch_loc_id(initial='a')['A']['Location'].tolist() == ['A']
+        assert not attempts
+
     def test__parse_notes_page(self, lid):
         """
         Test parsing logic for HTML responses containing <p> and <pre> tags.
@@ -283,14 +461,8 @@ class TestLocationIdentifiers:
             'CRS_Note': ['Standard', 'see note (1)', 'see note (2)']
         })
 
-        # Setup mock soup - HTML with <a> tags containing 'note' (case insensitive)
-        html_content = b"""
-        <html>
-            <a href="note1.shtm">Note 1</a>
-            <a href="note2.shtm">Note 2</a>
-        </html>
-        """
-        soup = bs4.BeautifulSoup(html_content, 'html.parser')
+        # Setup the links to the notes, as parsed from the page (see _parse_loc_id_page)
+        note_hrefs = ['note1.shtm', 'note2.shtm']
 
         # Mock dependencies
         lid.catalogue.update({'AA': 'http://example.com/'})
@@ -313,7 +485,7 @@ class TestLocationIdentifiers:
                 mock_parse.side_effect = [([parsed_note_1], None), ([parsed_note_2], None)]
 
                 # 4. Execute the method
-                result = lid._parse_crs_notes(data, 'AA', soup)
+                result = lid._parse_crs_notes(data, 'AA', note_hrefs)
 
                 # 5. Assertions
                 assert result is not None
@@ -328,6 +500,37 @@ class TestLocationIdentifiers:
                 expected_url1 = 'http://example.com/note1.shtm'
                 assert mock_get.call_args_list[0][0][0] == expected_url1
 
+    def test__aparse_crs_notes(self, monkeypatch):
+        class MockTransport:
+            @staticmethod
+            async def get(url, **_kwargs):
+                source = requests.Response()
+                source.status_code, source.url = 200, url
+                source._content = f'<html><body><p>Note on {url}.</p></body></html>'.encode()
+                return source
+
+        def mock_get_transport():
+            raise AssertionError("No blocking request should be made.")
+
+        monkeypatch.setattr('pyrcs.line_data.loc_id.get_async_transport', MockTransport)
+        monkeypatch.setattr('pyrcs.parser.get_transport', mock_get_transport)
+
+        lid_ = LocationIdentifiers(lazy=True)
+        lid_.catalogue = {'A': 'http://example.com/crs/crsa.shtm'}
+
+        data = pd.DataFrame({
+            'CRS': ['XYZ', 'ABC', 'DEF'],
+            'CRS_Note': ['Standard', 'see note (1)', 'see note (2)'],
+        })
+        note_hrefs = ['crs2.shtm#ABC', 'crs2.shtm#DEF']
+
+        # The note pages are requested through the asynchronous transport only
+        result = asyncio.run(lid_._aparse_crs_notes(data, 'A', note_hrefs))
+        assert result == {
+            'ABC': 'Note on http://example.com/crs/crs2.shtm#ABC.',
+            'DEF': 'Note on http://example.com/crs/crs2.shtm#DEF.',
+        }
+
     def test_fetch_loc_id_fallback_condition(self, lid):
         # 1. Define the side effect with a guard for initial=None
         def side_effect(initial=None, update=False, **kwargs):
@@ -0,0 +1,96 @@
+"""
+Test the module :py:mod:`pyrcs.mileage`.
+"""
+
+import pandas as pd
+import pytest
+
+
+def test_mileage():
+    from pyrcs.mileage import Mileage
+
+    mileage = Mileage.from_mileage('1.0396')
+    assert mileage.yards == 2156 and str(mileage) == '1.0396'
+    assert repr(mileage) == "Mileage('1.0396')"
+    assert mileage.to_mile_chain() == '1.18'
+
+    assert mileage + 220 == Mileage(2376)
+    assert mileage - Mileage.from_mile_chain('0.18') == 1760
+    assert Mileage(396) < mileage and len({Mileage(396), Mileage(396)}) == 1
+
+    with pytest.raises(ValueError):
+        Mileage(396.5)
+
+
+def test_mileage_array():
+    from pyrcs.converter import mile_chain_to_mileage, mileage_to_yard
+    from pyrcs.mileage import MileageArray
+
+    mileages = ['0.0396', '1.0000', '', None, '-0.0220']
+    arr = MileageArray.from_mileages(mileages)
+    assert arr.isna().tolist() == [False, False, True, True, False]
+    assert arr.to_yards().tolist() == [mileage_to_yard('0.0396'), 1760, pd.NA, pd.NA, -220]
+    assert arr.to_mileages().tolist() == ['0.0396', '1.0000', '', '', '-0.0220']
+
+    mile_chains = ['0.18', '84.62', 1.05]
+    arr = MileageArray.from_mile_chains(mile_chains)
+    assert arr.to_mileages().tolist() == [mile_chain_to_mileage(x) for x in mile_chains]
+    assert arr.to_mile_chains().tolist() == ['0.18', '84.62', '1.05']
+
+    arr = MileageArray.from_text(['11m 43ch', '24.458km', 'unknown'], errors='coerce')
+    assert arr.to_mile_chains(na_value=None).tolist() == ['11.43', '15.16', None]
+
+    assert MileageArray.from_yards([396, None]).to_mileages().tolist() == ['0.0396', '']
+
+    with pytest.raises(ValueError, match="'0.1800' is not a mileage"):
+        MileageArray.from_mileages(['0.1800'])
+    with pytest.raises(ValueError, match="'0.99' is not a mileage"):
+        MileageArray.from_mile_chains(['0.99'])
+
+
+def test_mileage_dtype():
+    from pyrcs.mileage import Mileage, to_mileage
+
+    s = pd.Series(['84.1364', '0.0396', None, '1.0000'], dtype='mileage')
+    assert str(s.dtype) == 'mileage' and s[0] == Mileage(149204)
+
+    assert s.sort_values().index.tolist() == [1, 3, 0, 2]
+    assert s.min() == Mileage(396) and s.max() == Mileage(149204)
+    assert s[s > '1.0000'].index.tolist() == [0]
+    assert (s == 'not a mileage').fillna(False).tolist() == [False] * 4
+    with pytest.raises(TypeError):
+        _ = s < 1
+
+    assert (s + 220).iloc[1] == Mileage(616)
+    assert (s - s.iloc[1]).tolist() == [148808, 0, pd.NA, 1364]
+
+    s_ = to_mileage(pd.Series(['0.18', '84.62'], index=[5, 6]), form='mile_chain')
+    assert s_.index.tolist() == [5, 6] and s_.isin(s).tolist() == [True, True]
+
+    dat = pd.DataFrame({'Mileage': s, 'ELR': ['A', 'B', 'C', 'A']})
+    assert dat.groupby('ELR')['Mileage'].max().tolist() == [Mileage(149204), Mileage(396), pd.NA]
+    assert pd.concat([dat, dat])['Mileage'].drop_duplicates().tolist() == s.tolist()
+
+
+def test_format_mileage():
+    from pyrcs.mileage import format_mileage, to_mileage
+
+    s = to_mileage(pd.Series(['0.0396', None]))
+    assert format_mileage(s).tolist() == ['0.0396', '']
+    assert format_mileage(s, form='mile_chain', na_value=None).tolist() == ['0.18', None]
+
+
+def test__as_mileage_dtype():
+    from pyrcs.mileage import _as_mileage_dtype
+
+    dat = pd.DataFrame({'ELR': ['NKL', 'XRS'], 'Mileage': ['11m 43ch', '24.458km']})
+    data = {'Stations': dat, 'Last updated date': '2024-01-01'}
+
+    data_ = _as_mileage_dtype(data, form='text')
+    assert str(data_['Stations']['Mileage'].dtype) == 'mileage'
+    assert data_['Last updated date'] == data['Last updated date']
+    assert dat['Mileage'].dtype == object  # The data is not modified
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -3,6 +3,7 @@ Test parser.py
 """
 
 import datetime
+import typing
 
 import bs4
 import pandas as pd
@@ -10,6 +11,140 @@ import pytest
 import requests
 
 
+def test_parsed_document(monkeypatch):
+    from pyrcs.parser import ParsedDocument, _get_last_updated_date, counting_parses, \
+        get_catalogue, get_document, get_last_updated_date, parse_table, sharing_documents
+
+    content = (
+        b'<html><body><div class="fixed"><a href="a.shtm">A</a></div>'
+        b'<table><thead><tr><th>ELR</th></tr></thead><tbody><tr><td>AAL</td></tr></tbody></table>'
+        b'<p class="update">Last update: 1 May 2024</p></body></html>')
+    url = 'http://www.railwaycodes.org.uk/elrs/elra.shtm'
+
+    requested_urls = []
+
+    class MockTransport:
+        @staticmethod
+        def get(url_, **_kwargs):
+            requested_urls.append(url_)
+            source = requests.Response()
+            source.status_code, source._content, source.url = 200, content, url_
+            return source
+
+    monkeypatch.setattr('pyrcs.parser.get_transport', lambda: MockTransport())
+
+    with counting_parses() as parse_counts:
+        doc = get_document(url)
+        assert isinstance(doc, ParsedDocument)
+        assert doc.status_code == 200  # It behaves as the response
+
+        (columns, records), soup = parse_table(doc)
+        assert soup is doc.soup
+        assert (columns, records) == (['ELR'], [['AAL']])
+        assert _get_last_updated_date(doc.soup) == '2024-05-01'
+
+    assert parse_counts == {url: 1}
+
+    requested_urls.clear()
+
+    with counting_parses() as parse_counts, sharing_documents():
+        catalogue = get_catalogue(url, update=True, json_it=False)
+        last_updated_date = get_last_updated_date(url)
+
+    assert catalogue == {'A': 'http://www.railwaycodes.org.uk/elrs/a.shtm'}
+    assert last_updated_date == '2024-05-01'
+    assert requested_urls == [url]
+    assert parse_counts == {url: 1}
+
+
+def test_get_soup_parse_only():
+    from pyrcs.parser import ParsedDocument, _get_last_updated_date, counting_parses, get_soup, \
+        parse_table
+
+    source = requests.Response()
+    source.status_code, source._content = 200, (
+        b'<html><body><h1>Title</h1><nav><a href="a.shtm">A</a></nav>'
+        b'<table><thead><tr><th>ELR</th></tr></thead>'
+        b'<tbody><tr><td>AAL <a href="n.shtm">note</a></td></tr></tbody></table>'
+        b'<p>Text</p><p class="update">Last update: 1 May 2024</p></body></html>')
+    parse_only = ('thead', 'tbody', 'p')
+
+    soup = get_soup(source, parse_only=parse_only)
+    assert soup.find('h1') is None and soup.find('nav') is None
+    assert _get_last_updated_date(soup) == '2024-05-01'
+    assert parse_table(source, parse_only=parse_only)[0] == parse_table(source)[0]
+
+    doc = ParsedDocument(source)
+    with counting_parses() as parse_counts:
+        assert doc.get_soup(parse_only=parse_only) is doc.get_soup(parse_only=reversed(parse_only))
+        soup = doc.soup
+        assert doc.get_soup(parse_only=parse_only) is soup  # The whole page has been parsed
+    assert sum(parse_counts.values()) == 2
+
+
+def test_parsing_in_processes():
+    from pyrcs.line_data.elr_mileage import _parse_elr_page
+    from pyrcs.parser import _count_parse_workers, _run_page_parser, counting_parses, \
+        parsing_in_processes
+
+    source = requests.Response()
+    source.status_code, source.url, source._content = 200, 'elra.shtm', (
+        b'<html><body><table><thead><tr><th>ELR</th><th>Line name</th></tr></thead>'
+        b'<tbody><tr><td>AAL</td><td>Ashendon and Aynho Line</td></tr>'
+        b'<tr><td>ABC</td><td>=ABD</td></tr></tbody></table>'
+        b'<p class="update">Last update: 1 May 2024</p></body></html>')
+
+    elrs_codes, last_updated_date = _run_page_parser(_parse_elr_page, source)
+    assert elrs_codes['Line name'].to_list() == ['Ashendon and Aynho Line', 'SeeABD']
+    assert last_updated_date == '2024-05-01'
+    assert _count_parse_workers() == 0
+
+    with counting_parses() as parse_counts, parsing_in_processes(max_workers=2) as executor:
+        assert _count_parse_workers() == 2
+        with parsing_in_processes() as executor_:  # The pool of the outer context is reused
+            assert executor_ is executor
+
+        # The page is parsed in a worker process
+        elrs_codes_, last_updated_date_ = _run_page_parser(_parse_elr_page, source)
+
+    assert elrs_codes_.equals(elrs_codes) and last_updated_date_ == last_updated_date
+    assert parse_counts == {'elra.shtm': 1}
+    assert _count_parse_workers() == 0
+
+
+def test_parsing_in_processes_encoding():
+    from pyrcs.other_assets.station import _parse_locations_page
+    from pyrcs.parser import ParsedDocument, _run_page_parser, parsing_in_processes
+
+    pytest.importorskip('lxml')
+
+    source = requests.Response()
+    source.status_code, source.url, source._content = 200, 'station1.shtm', (
+        '<html><body><table><thead><tr><th>Station</th><th>ELR</th><th>Mileage</th>'
+        '<th>Status</th><th>Degrees Longitude</th><th>Degrees Latitude</th>'
+        '<th>Grid Reference</th><th>Owner</th><th>Operator</th></tr></thead><tbody>'
+        '<tr><td>Aber<span class="r">(ABE)</span></td><td>CAR</td><td>8m 69ch</td><td>Open</td>'
+        '<td>-3.243</td><td>51.575</td><td>ST155875</td><td>Network Rail</td>'
+        '<td>Transport for Wales – Trafnidiaeth Cymru</td></tr></tbody></table>'
+        '<p class="update">Last update: 1 May 2024</p></body></html>').encode('utf-8')
+    # The charset in the headers is taken by lxml for a page without <meta charset>
+    source.headers['Content-Type'] = 'text/html; charset=ISO-8859-1'
+    source.encoding = 'ISO-8859-1'
+
+    results = [
+        _run_page_parser(_parse_locations_page, x, parser='lxml.html')
+        for x in (source, ParsedDocument(source))]
+
+    with parsing_in_processes(max_workers=1):
+        results_ = [
+            _run_page_parser(_parse_locations_page, x, parser='lxml.html')
+            for x in (source, ParsedDocument(source))]
+
+    for (dat, last_updated_date), (dat_, last_updated_date_) in zip(results, results_):
+        pd.testing.assert_frame_equal(dat, dat_)
+        assert last_updated_date == last_updated_date_ == '2024-05-01'
+
+
 def test_parse_tr():
     from pyrcs.parser import parse_tr
 
@@ -41,6 +176,131 @@ def test_parse_table():
         'AAL', 'Ashendon and Aynho Line', '0.00 - 18.29', 'Ashendon Junction', 'Now NAJ3']
 
 
+def test_parse_table_lxml():
+    from pyrcs.parser import _get_last_updated_date, parse_table
+
+    pytest.importorskip('lxml')
+
+    source = requests.Response()
+    source._content = (
+        b'<html><body><table><thead><tr><th>Location</th><th>CRS<br>code</th><th>Notes</th>'
+        b'</tr></thead><tbody>'
+        b'<tr><td rowspan="2">Abbey Wood <em>(Bexley)</em></td><td>ABW</td>'
+        b'<td>Line 1\r\nLine 2 <q>quoted</q></td></tr>'
+        b'<tr><td><span class="r">no CRS?</span></td><td><!-- comment -->&nbsp;</td></tr>'
+        b'<tr><td>Aber</td><td>ABE <span class="r">(ABR)</span></td>'
+        b'<td><a href="#">Link <span>x</span></a> tail</td></tr>'
+        b'</tbody></table><p class="update">Last update: 1 May 2024</p></body></html>')
+
+    for as_dataframe in (False, True):
+        tables, soup = parse_table(source, as_dataframe=as_dataframe)
+        tables_, soup_ = parse_table(source, parser='lxml.html', as_dataframe=as_dataframe)
+
+        if as_dataframe:
+            pd.testing.assert_frame_equal(tables, tables_)
+        else:
+            assert tables == tables_
+        assert _get_last_updated_date(soup) == _get_last_updated_date(soup_) == '2024-05-01'
+
+    (columns, records), _ = parse_table(source, parser='lxml.html')
+    assert columns == ['Location', 'CRScode', 'Notes']
+    assert records[1] == ['Abbey Wood [(Bexley)]', '\t\t / [no CRS?]', 'comment \xa0']
+
+
+@pytest.mark.parametrize('content_type', [None, 'text/html', 'text/html; charset=UTF-8'])
+def test_parse_table_lxml_encoding(content_type):
+    from pyrcs.parser import parse_table
+
+    pytest.importorskip('lxml')
+
+    source = requests.Response()
+    source._content = (  # No <meta charset>
+        '<html><body><table><thead><tr><th>Location</th><th>Notes</th></tr></thead><tbody>'
+        '<tr><td>Bishop’s Stortford</td><td>Café – closed</td></tr>'
+        '</tbody></table></body></html>').encode('utf-8')
+    if content_type:
+        source.headers['Content-Type'] = content_type
+        source.encoding = requests.utils.get_encoding_from_headers(source.headers)
+
+    (columns, records), _ = parse_table(source)
+    (columns_, records_), _ = parse_table(source, parser='lxml.html')
+    assert columns_ == columns
+    assert records_ == records == [['Bishop’s Stortford', 'Café – closed']]
+
+
+def test_get_soup_encoding():
+    from pyrcs.parser import get_soup
+
+    pytest.importorskip('lxml')
+
+    source = requests.Response()
+    source._content = (
+        '<html><head><meta charset="utf-8"></head><body><p>Café – x</p></body></html>'
+    ).encode('utf-8')
+    source.headers['Content-Type'] = 'text/html; charset=ISO-8859-1'  # Disagrees with the page
+    source.encoding = requests.utils.get_encoding_from_headers(source.headers)
+
+    # The encoding declared in the page is ranked above the one in the headers
+    assert get_soup(source).find('p').text == 'Café – x'
+    assert get_soup(source.content).find('p').text == 'Café – x'
+    assert get_soup(source, parser='lxml.html').find('.//p').text_content() == 'Café – x'
+
+
+def test_parse_tr_spans():
+    from pyrcs.parser import parse_tr
+
+    markup = (
+        '<table><tr><td rowspan="2">A1</td><td>B1</td><td rowspan="3">C1</td><td>D1</td></tr>'
+        '<tr><td rowspan="2">B2</td><td>D2</td></tr>'
+        '<tr><td>A3</td><td>D3</td></tr>'
+        '<tr></tr><tr></tr>'  # Empty rows
+        '<tr><td colspan="2">A6</td><td rowspan="2">C6</td><td>D6</td></tr>'
+        '<tr></tr>'  # A row of only spanned cells
+        '<tr><td>A8</td><td>B8</td><td>C8</td><td rowspan="5">D8</td></tr>'
+        '</table>')
+    expected = [
+        ['A1', 'B1', 'C1', 'D1'],
+        ['A1', 'B2', 'C1', 'D2'],
+        ['A3', 'B2', 'C1', 'D3'],
+        ['A6', '\xa0', 'C6', 'D6'],
+        ['\xa0', '\xa0', 'C6', '\xa0'],
+        ['A8', 'B8', 'C8', 'D8'],
+    ]
+
+    trs = bs4.BeautifulSoup(markup=markup, features='html.parser').find_all('tr')
+    assert parse_tr(trs=trs, ths=['A', 'B', 'C', 'D']) == expected
+
+    lxml_html = pytest.importorskip('lxml.html')
+    trs = list(lxml_html.fromstring(markup).iter('tr'))
+    assert parse_tr(trs=trs, ths=['A', 'B', 'C', 'D']) == expected
+
+
+def test_iter_tr():
+    from pyrcs.parser import iter_tr, parse_tr, records_to_dataframe
+
+    markup = (
+        '<table><tr><th>A</th><th>B</th></tr>'
+        '<tr><td rowspan="2">A1</td><td>B1</td></tr><tr><td>B2</td></tr>'
+        '<tr><td>A3</td></tr></table>')
+    trs = bs4.BeautifulSoup(markup=markup, features='html.parser').find_all('tr')
+
+    rows = iter_tr(trs=trs, ths=['A', 'B'])
+    assert isinstance(rows, typing.Generator)
+    assert next(rows) == ['A1', 'B1']
+    assert list(rows) == [['A1', 'B2'], ['A3', '\xa0']]
+
+    tbl = records_to_dataframe(iter_tr(trs=trs, ths=['A', 'B']), columns=['A', 'B'], chunk_size=2)
+    pd.testing.assert_frame_equal(tbl, parse_tr(trs=trs, ths=['A', 'B'], as_dataframe=True))
+    pd.testing.assert_frame_equal(
+        tbl, pd.DataFrame([['A1', 'B1'], ['A1', 'B2'], ['A3', '\xa0']], columns=['A', 'B']))
+
+    tbl = records_to_dataframe([], columns=['A', 'A'])
+    assert tbl.empty and tbl.columns.to_list() == ['A', 'A']
+
+    with pytest.raises(ValueError, match='2 columns passed, passed data had 3 columns'):
+        records_to_dataframe([['A1', 'B1', 'C1']], columns=['A', 'B'])
+
+
 def test_parse_date():
     from pyrcs.parser import parse_date
 
@@ -113,6 +373,44 @@ def test_get_last_updated_date(as_date_type, monkeypatch, capsys):
         assert last_updated_date is None
 
 
+def test_peek_last_updated_date(monkeypatch):
+    from pyrcs.parser import peek_last_updated_date
+
+    content = b'<html><body>' + b'<p>Text</p>' * 1000 + \
+        b'<p class="update">Last update: 1 May 2024</p>' + b'<p>Text</p>' * 1000
+
+    chunks_read = []
+
+    class MockResponse:
+        @staticmethod
+        def raise_for_status():
+            pass
+
+        @staticmethod
+        def iter_content(chunk_size):
+            for i in range(0, len(content), chunk_size):
+                chunks_read.append(i)
+                yield content[i:i + chunk_size]
+
+        def close(self):
+            pass
+
+    class MockTransport:
+        @staticmethod
+        def get(_url, **kwargs):
+            assert kwargs == {'stream': True}
+            return MockResponse()
+
+    monkeypatch.setattr('pyrcs.parser.get_transport', lambda: MockTransport())
+
+    url = 'http://www.railwaycodes.org.uk/crs/CRSa.shtm'
+    assert peek_last_updated_date(url, chunk_size=1024) == '2024-05-01'
+    assert len(chunks_read) < len(content) // 1024  # Stops reading once the date is found
+
+    content = b'<html><body><p>Text</p></body></html>'
+    assert peek_last_updated_date(url) is None
+
+
 def test_get_financial_year():
     from pyrcs.parser import get_financial_year
 
@@ -0,0 +1,90 @@
+"""
+Test the module :py:mod:`pyrcs.profiler`.
+"""
+
+import json
+
+import pandas as pd
+import pytest
+import requests
+
+from pyrcs._base import _Base
+from pyrcs.parser import parse_table
+from pyrcs.profiler import Profile, profile_stage, profiling
+
+
+def test_profile_stage():
+    with profile_stage('example') as stage:  # Not profiled outside the context
+        stage['rows'] = 1
+
+    records = []
+
+    with profiling(trace_allocations=True, callback=records.append) as profile:
+        with profile_stage('outer', dataset='Example data') as stage:
+            with profile_stage('inner') as stage_:
+                stage_['bytes'] = 10
+                _ = [0] * 100000
+            stage['rows'] = 2
+
+        with profiling() as inner_profile:  # Also recorded in the outer context
+            with profile_stage('outer'):
+                pass
+
+    assert isinstance(profile, Profile) and records == profile.records
+    assert len(inner_profile.records) == 1
+
+    inner, outer, outer_ = profile.records
+    assert inner['dataset'] == outer['dataset'] == 'Example data' and outer_['dataset'] is None
+    assert (inner['stage'], inner['parent'], inner['bytes']) == ('inner', 'outer', 10)
+    assert (outer['parent'], outer['rows']) == (None, 2)
+    assert 0 <= outer['start'] <= inner['start'] and inner['time'] <= outer['time']
+    assert inner['allocated'] > 0 and 'allocated' not in outer_
+
+    summary = profile.summarise()
+    assert [(x['dataset'], x['stage'], x['count']) for x in summary] == [
+        ('Example data', 'inner', 1), ('Example data', 'outer', 1), (None, 'outer', 1)]
+
+    profile_dict = json.loads(profile.to_json())
+    assert profile_dict == json.loads(json.dumps(profile.to_dict()))
+    assert len(profile_dict['records']) == 3
+    assert profile.to_dataframe(summary=True).shape[0] == 3
+
+
+def test_profiling_collection(monkeypatch, tmp_path):
+    content = (
+        b'<html><body><table><thead><tr><th>ELR</th></tr></thead>'
+        b'<tbody><tr><td>AAL</td></tr><tr><td>ABC</td></tr></tbody></table></body></html>')
+
+    class MockTransport:
+        @staticmethod
+        def get(url_, **_kwargs):
+            source = requests.Response()
+            source.status_code, source._content, source.url = 200, content, url_
+            return source
+
+    monkeypatch.setattr('pyrcs.parser.get_transport', lambda: MockTransport())
+
+    _b = _Base(lazy=True)
+    _b.catalogue = {'A': 'http://www.railwaycodes.org.uk/elrs/elra.shtm'}
+
+    def _collect(source, verbose=False):
+        (columns, records), _ = parse_table(source)
+        data = pd.DataFrame(records, columns=columns)
+        _b._save_data_to_file(data, data_name="A", ext=".csv", dump_dir=tmp_path, verbose=verbose)
+        return data
+
+    with profiling() as profile:
+        data = _b._collect_data_from_source(
+            "ELRs", method=_collect, initial='A', confirmation_required=False, raise_error=True)
+
+    assert data['ELR'].to_list() == ['AAL', 'ABC']
+
+    records = {x['stage']: x for x in profile.records}
+    assert list(records) == ['parse_html', 'parse_tr', 'save_data', 'collect']
+    assert all(x['dataset'] == 'ELRs (A)' for x in records.values())
+    assert records['parse_tr']['rows'] == records['collect']['rows'] == 2
+    assert records['save_data']['bytes'] == (tmp_path / "a.csv").stat().st_size
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -2,11 +2,52 @@
 Test the module :py:mod:`pyrcs.other_assets.station`.
 """
 
+from unittest.mock import MagicMock
+
 import pandas as pd
 import pytest
+import requests
 
 from pyrcs.other_assets.station import Stations
 
+# A (shortened) page of railway station locations
+_STATION_PAGE = (
+    '<html><body><h1>Railway stations: A</h1>'
+    '<table><thead><tr><th>Station</th><th>ELR</th><th>Mileage</th><th>Status</th>'
+    '<th>Degrees\r\nLongitude</th><th>Degrees\r\nLatitude</th><th>Grid Reference</th>'
+    '<th>Owner</th><th>Operator</th></tr></thead><tbody>'
+    '<tr><td rowspan="2">Abbey Wood<span class="r">(ABW)</span></td><td>NKL</td>'
+    '<td>11m 43ch</td><td rowspan="2">Open</td><td rowspan="2">0.121</td>'
+    '<td rowspan="2">51.491</td><td rowspan="2">TQ473790</td><td rowspan="2">Network Rail</td>'
+    '<td rowspan="2">London &amp; South Eastern Railway<br>Southeastern from 2006</td></tr>'
+    '<tr><td>XRS</td><td>24.458km</td></tr>'
+    '<tr><td>Aber<span class="r">(ABE)</span></td><td>CAR</td><td>8m 69ch</td><td>Open</td>'
+    '<td>-3.243</td><td>51.575</td><td>ST155875</td><td>Network Rail</td>'
+    '<td>Transport for Wales – Trafnidiaeth Cymru</td></tr>'
+    '<tr><td>Heathrow Junction [sometimes referred to as Heathrow Interchange]'
+    '<span class="r">no CRS?</span></td><td>MLN1</td><td>12m 01ch</td><td>Closed</td>'
+    '<td></td><td></td><td></td><td>BAA</td><td>Heathrow Express</td></tr>'
+    '</tbody></table><p class="update">Last updated: 2 May 2024</p></body></html>'
+).encode('utf-8')
+
+
+def test__parse_locations_page_lxml():
+    from pyrcs.other_assets.station import _parse_locations_page
+
+    pytest.importorskip('lxml')
+
+    source = requests.Response()
+    source._content = _STATION_PAGE
+    source.headers['Content-Type'] = 'text/html'
+
+    dat, last_updated_date = _parse_locations_page(
+        source, parse_only=Stations._PAGE_ELEMENTS)
+    dat_, last_updated_date_ = _parse_locations_page(source, parser='lxml.html')
+
+    pd.testing.assert_frame_equal(dat, dat_)
+    assert last_updated_date == last_updated_date_ == '2024-05-02'
+    assert dat['ELR'].tolist() == ['NKL', 'XRS', 'CAR', 'MLN1']
+
 
 @pytest.fixture(scope='class')
 def stn():
@@ -20,6 +61,15 @@ class TestStations:
         stn_data_cat = stn.fetch_catalogue(update=update, verbose=True)
         assert isinstance(stn_data_cat, dict)
 
+    def test_collect_locations_parser(self, monkeypatch):
+        stn_ = Stations(lazy=True)
+        stn_.catalogue = {stn_.KEY_TO_STN: {'A': 'https://test.url/a'}}
+        mock_collect = MagicMock(return_value={})
+        monkeypatch.setattr(stn_, '_collect_data_from_source', mock_collect)
+
+        stn_.collect_locations('a', confirmation_required=False, parser='lxml.html')
+        assert mock_collect.call_args.kwargs['parser'] == 'lxml.html'
+
     def test_fetch_locations(self, stn):
         stn_locations_a = stn.collect_locations(
             initial='a', confirmation_required=False, verbose=True)
@@ -63,6 +113,21 @@ class TestStations:
         assert isinstance(result[stn.KEY_TO_STN], pd.DataFrame)
         assert result[stn.KEY_TO_LAST_UPDATED_DATE] == ''
 
+    def test_fetch_locations_mileage_dtype(self, stn, monkeypatch):
+        dummy_df = pd.DataFrame(
+            {'Station': ['Abbey Wood'] * 2, 'ELR': ['NKL', 'XRS'], 'Mileage': ['11m 43ch', '']})
+
+        def mock_fetch_from_file(**_kwargs):
+            return {'A': dummy_df, stn.KEY_TO_LAST_UPDATED_DATE: ''}
+
+        monkeypatch.setattr(stn, '_fetch_data_from_file', mock_fetch_from_file)
+
+        result = stn.fetch_locations(initial='a', mileage_dtype=True)
+        mileages = result['A']['Mileage']
+        assert str(mileages.dtype) == 'mileage'
+        assert mileages.array.to_mileages().tolist() == ['11.0946', '']
+        assert dummy_df['Mileage'].tolist() == ['11m 43ch', '']
+
 
 if __name__ == '__main__':
     pytest.main()
@@ -0,0 +1,331 @@
+"""
+Test the module :py:mod:`pyrcs.transport`.
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import threading
+import time
+
+import pytest
+import requests
+
+from pyrcs.transport import AsyncHTTPTransport, HTTPTransport, ResponseCache, \
+    get_async_transport, get_response_cache, get_transport, get_validators_pathname, \
+    is_page_modified, is_reparsing, load_validators, recording_validators, reparsing, \
+    save_validators, set_async_transport, set_response_cache, set_transport, \
+    sharing_async_transport
+
+
+class TestHTTPTransport:
+
+    def test__init__(self):
+        transport = HTTPTransport(
+            pool_maxsize=20, timeout=(5, 30), max_retries=5, headers={'User-Agent': 'pyrcs'})
+
+        assert isinstance(transport.session, requests.Session)
+        assert transport.timeout == (5, 30)
+        assert transport.session.headers['User-Agent'] == 'pyrcs'
+
+        adapter = transport.session.get_adapter('http://www.railwaycodes.org.uk/')
+        assert adapter.max_retries.total == 5
+        assert adapter._pool_maxsize == 20
+
+        transport.close()
+
+    def test_get(self, monkeypatch):
+        calls = []
+
+        def mock_get(_self, url, **kwargs):
+            calls.append((url, kwargs))
+
+        monkeypatch.setattr(requests.Session, 'get', mock_get)
+
+        with HTTPTransport(timeout=10) as transport:
+            transport.get('http://www.railwaycodes.org.uk/')
+            transport.get('http://www.railwaycodes.org.uk/', timeout=3)
+
+        assert calls[0] == ('http://www.railwaycodes.org.uk/', {'timeout': 10})
+        assert calls[1] == ('http://www.railwaycodes.org.uk/', {'timeout': 3})
+
+    def test_max_connections_per_host(self, monkeypatch):
+        in_flight, max_in_flight = [0], [0]
+        lock = threading.Lock()
+
+        def mock_get(_self, _url, **_kwargs):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+
+        monkeypatch.setattr(requests.Session, 'get', mock_get)
+
+        transport = HTTPTransport(max_connections_per_host=2)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(transport.get, ['http://www.railwaycodes.org.uk/'] * 16))
+
+        assert max_in_flight[0] <= 2
+
+
+class TestAsyncHTTPTransport:
+
+    def test_get(self, monkeypatch):
+        httpx = pytest.importorskip('httpx')
+
+        def handler(request):
+            if request.url.path == '/timeout':
+                raise httpx.ReadTimeout("Timed out.", request=request)
+            return httpx.Response(
+                200, content=b'<html></html>', headers={'Content-Type': 'text/html'})
+
+        transport = AsyncHTTPTransport()
+        monkeypatch.setattr(
+            transport, '_get_client',
+            lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        source = asyncio.run(transport.get('http://www.railwaycodes.org.uk/'))
+        assert isinstance(source, requests.Response)
+        assert source.status_code == 200
+        assert source.content == b'<html></html>'
+        assert source.encoding == 'ISO-8859-1'  # The same as returned by requests
+
+        with pytest.raises(requests.Timeout):
+            asyncio.run(transport.get('http://www.railwaycodes.org.uk/timeout'))
+
+    def test_get_without_httpx(self, monkeypatch):
+        calls = []
+
+        class MockTransport:
+            @staticmethod
+            def get(url, **kwargs):
+                calls.append((url, kwargs))
+                return requests.Response()
+
+        monkeypatch.setattr('pyrcs.transport.httpx', None)
+        monkeypatch.setattr('pyrcs.transport.get_transport', lambda: MockTransport())
+
+        source = asyncio.run(AsyncHTTPTransport(timeout=10).get('http://www.railwaycodes.org.uk/'))
+        assert isinstance(source, requests.Response)
+        assert calls == [('http://www.railwaycodes.org.uk/', {'timeout': 10})]
+
+    def test_max_connections_per_host(self, monkeypatch):
+        in_flight, max_in_flight = [0], [0]
+        lock = threading.Lock()
+
+        class MockTransport:
+            @staticmethod
+            def get(_url, **_kwargs):
+                with lock:
+                    in_flight[0] += 1
+                    max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+                time.sleep(0.01)
+                with lock:
+                    in_flight[0] -= 1
+
+        monkeypatch.setattr('pyrcs.transport.httpx', None)
+        monkeypatch.setattr('pyrcs.transport.get_transport', lambda: MockTransport())
+
+        async def main():
+            transport = AsyncHTTPTransport(max_connections_per_host=2)
+            await asyncio.gather(
+                *(transport.get('http://www.railwaycodes.org.uk/') for _ in range(16)))
+
+        asyncio.run(main())
+
+        assert max_in_flight[0] <= 2
+
+
+class TestResponseCache:
+
+    def test_store_and_load(self, tmp_path):
+        cache = ResponseCache(cache_dir=tmp_path)
+        url = 'http://www.railwaycodes.org.uk/'
+
+        assert url not in cache
+        assert cache.load(url) is None
+        with pytest.raises(requests.ConnectionError, match='No cached response'):
+            cache.load(url, raise_error=True)
+
+        cache.store(url + '404', _mock_response(status_code=404))
+        cache.store(url, _mock_response(headers={'Content-Type': 'text/html; charset=utf-8'}))
+        assert url in cache and cache.urls() == [url]
+        assert cache.get_fetch_time(url) is not None
+
+        source = cache.load(url)
+        assert source.status_code == 200
+        assert source.content == b'<html></html>'
+        assert source.encoding == 'utf-8'
+
+    def test_reparsing(self, tmp_path, monkeypatch):
+        calls = []
+
+        def mock_get(_self, url, **_kwargs):
+            calls.append(url)
+            return _mock_response(content=url.encode())
+
+        monkeypatch.setattr(requests.Session, 'get', mock_get)
+
+        with pytest.raises(ValueError, match='No cache of raw responses'):
+            with reparsing():
+                pass
+
+        cache = ResponseCache(cache_dir=tmp_path)
+        set_response_cache(cache)
+        assert get_response_cache() is cache
+
+        transport = HTTPTransport()
+        transport.get('http://www.railwaycodes.org.uk/a')
+        assert calls == ['http://www.railwaycodes.org.uk/a']
+
+        with reparsing():
+            assert is_reparsing()
+            source = transport.get('http://www.railwaycodes.org.uk/a')
+            assert source.content == b'http://www.railwaycodes.org.uk/a'
+            assert asyncio.run(AsyncHTTPTransport().get('http://www.railwaycodes.org.uk/a'))
+            with pytest.raises(requests.ConnectionError):
+                transport.get('http://www.railwaycodes.org.uk/b')
+
+        assert not is_reparsing()
+        assert calls == ['http://www.railwaycodes.org.uk/a']  # No request sent when reparsing
+
+        set_response_cache()
+        assert get_response_cache() is None
+
+
+def test_get_transport():
+    transport = get_transport()
+    assert isinstance(transport, HTTPTransport)
+    assert get_transport() is transport
+
+
+def test_set_transport():
+    custom_transport = HTTPTransport(max_retries=0)
+
+    set_transport(custom_transport)
+    assert get_transport() is custom_transport
+
+    set_transport()
+    assert get_transport() is not custom_transport
+
+
+def test_get_async_transport():
+    async def main():
+        async with AsyncHTTPTransport() as transport:
+            return transport, get_async_transport(), get_async_transport()
+
+    async def main_():
+        return get_async_transport()
+
+    transport, transport_1, transport_2 = asyncio.run(main())
+    assert transport_1 is transport_2 is transport
+
+    with pytest.raises(RuntimeError):  # Outside any scope
+        asyncio.run(main_())
+
+
+def test_get_async_transport_closed():
+    closed = []
+
+    class MockClient:
+        @staticmethod
+        async def aclose():
+            closed.append(True)
+
+    async def main():
+        async with sharing_async_transport() as transport:
+            transport._client = MockClient()  # As created by the first request
+            async with sharing_async_transport() as transport_:  # The outer transport is reused
+                assert transport_ is transport
+            assert not closed
+        # No task is left pending (e.g. for `asyncio.gather(*asyncio.all_tasks())`)
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        return transport
+
+    transport = asyncio.run(main())
+    assert closed == [True] and transport._client is None  # Closed when the scope is left
+
+    # Also with an event loop that is not run by asyncio.run()
+    closed.clear()
+    loop = asyncio.new_event_loop()
+    try:
+        transport = loop.run_until_complete(main())
+        assert closed == [True] and transport._client is None
+    finally:
+        loop.close()
+
+
+def test_set_async_transport():
+    custom_transport = AsyncHTTPTransport(max_retries=0)
+
+    set_async_transport(custom_transport)
+    assert get_async_transport() is custom_transport
+
+    set_async_transport()
+    with pytest.raises(RuntimeError):  # No running event loop
+        get_async_transport()
+
+
+def _mock_response(status_code=200, content=b'<html></html>', headers=None):
+    source = requests.Response()
+    source.status_code, source._content = status_code, content
+    source.headers.update(headers or {})
+    return source
+
+
+def test_recording_validators(monkeypatch):
+    headers = {'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+    monkeypatch.setattr(
+        requests.Session, 'get', lambda *_args, **_kwargs: _mock_response(headers=headers))
+
+    transport = HTTPTransport()
+    transport.get('http://www.railwaycodes.org.uk/a')  # Not recorded
+
+    with recording_validators() as page_validators:
+        transport.get('http://www.railwaycodes.org.uk/b')
+        with recording_validators() as inner_page_validators:
+            transport.get('http://www.railwaycodes.org.uk/c')
+
+    assert list(inner_page_validators) == ['http://www.railwaycodes.org.uk/c']
+    assert list(page_validators) == [
+        'http://www.railwaycodes.org.uk/b', 'http://www.railwaycodes.org.uk/c']
+    assert page_validators['http://www.railwaycodes.org.uk/b']['ETag'] == '"abc"'
+
+
+def test_save_and_load_validators(tmp_path):
+    path_to_file = str(tmp_path / "a.pkl")
+    assert get_validators_pathname(path_to_file) == str(tmp_path / "a.validators.json")
+    assert load_validators(path_to_file) is None
+
+    validators = {'http://www.railwaycodes.org.uk/': {'ETag': '"abc"', 'SHA-256': '123'}}
+    save_validators(path_to_file, validators)
+    assert load_validators(path_to_file) == validators
+
+
+@pytest.mark.parametrize('status_code', [200, 304])
+def test_is_page_modified(status_code, monkeypatch):
+    calls = []
+
+    def mock_get(_self, url, **kwargs):
+        calls.append(kwargs['headers'])
+        return _mock_response(status_code=status_code, content=b'new' if 'new' in url else b'')
+
+    monkeypatch.setattr(requests.Session, 'get', mock_get)
+    set_transport(HTTPTransport())
+
+    source = _mock_response(content=b'', headers={'ETag': '"abc"'})
+    validators = {
+        'ETag': '"abc"', 'Last-Modified': None, 'SHA-256': hashlib.sha256(b'').hexdigest()}
+
+    assert is_page_modified('http://www.railwaycodes.org.uk/', validators) is False
+    assert calls[0] == {'If-None-Match': source.headers['ETag']}
+    modified = is_page_modified('http://www.railwaycodes.org.uk/new', validators)
+    assert modified is (status_code == 200)
+
+    set_transport()
+
+
+if __name__ == '__main__':
+    pytest.main()